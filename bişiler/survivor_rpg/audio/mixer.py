@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Audio/Mixer.py - Yazılım ses mikseri
+
+Çözülmüş (decoded) sesler bellekte float32 tampon olarak tutulur. Aktif
+voice'lar her blokta tek çıkış akışına karıştırılır: kazançlar (ana ses,
+voice kazancı, dinleyiciye uzaklık) tüm voice'lar için NumPy ile toplu
+hesaplanır, her voice için maliyet tek bir dilim toplamadır (slice-add).
+
+Karıştırma oyun döngüsünden bağımsız bir mikser thread'inde yapılır:
+thread halka tamponu (AudioRingBuffer) hedef gecikmeye kadar doldurur,
+ses kartı geri çağrısı (ayrı thread) yalnızca bu tampondan okur. Böylece
+takılmalar, düşük fps ve duraklatma sesi kesmez. Müzik akışı
+(audio.music) bağlıysa hazır örnekleri aynı bloğa eklenir. Çıkış için
+sounddevice gerekir (opsiyonel); yoksa SoundManager klip tabanlı
+çalmaya geri döner.
+"""
+
+import threading
+import time
+import wave
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import sounddevice
+except (ImportError, OSError):  # PortAudio yoksa OSError
+    sounddevice = None
+
+
+def decode_wav(path: str, sample_rate: int) -> np.ndarray:
+    """16-bit mono/stereo WAV'ı mikser hızında mono float32 diziye çöz"""
+    with wave.open(path, 'rb') as wav_file:
+        channels = wav_file.getnchannels()
+        rate = wav_file.getframerate()
+        if wav_file.getsampwidth() != 2:
+            raise ValueError(f"Yalnızca 16-bit WAV destekleniyor: {path}")
+        samples = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype='<i2')
+    
+    signal = samples.astype(np.float32) / 32768.0
+    if channels > 1:
+        signal = signal.reshape(-1, channels).mean(axis=1)
+    if rate != sample_rate and signal.size:
+        # Doğrusal yeniden örnekleme
+        count = int(signal.size * sample_rate / rate)
+        positions = np.arange(count) * (rate / sample_rate)
+        signal = np.interp(positions, np.arange(signal.size), signal).astype(np.float32)
+    return signal
+
+
+class AudioRingBuffer:
+    """Tek üretici / tek tüketici halka tamponu (varsayılan int16)"""
+    
+    def __init__(self, capacity: int, dtype=np.int16):
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=dtype)
+        self._read = 0
+        self._count = 0
+        self._lock = threading.Lock()
+        self.underruns = 0  # Tüketici boş tampona denk geldi
+    
+    @property
+    def available(self) -> int:
+        """Okunmayı bekleyen örnek sayısı"""
+        return self._count
+    
+    def write(self, samples: np.ndarray) -> int:
+        """Sığan kadarını yaz, yazılan sayıyı döndür"""
+        with self._lock:
+            count = min(samples.size, self.capacity - self._count)
+            start = (self._read + self._count) % self.capacity
+            first = min(count, self.capacity - start)
+            self._data[start:start + first] = samples[:first]
+            self._data[:count - first] = samples[first:count]
+            self._count += count
+        return count
+    
+    def read(self, out: np.ndarray) -> int:
+        """out'u doldur (eksik kısım sessizlik), okunan sayıyı döndür"""
+        with self._lock:
+            count = min(out.size, self._count)
+            first = min(count, self.capacity - self._read)
+            out[:first] = self._data[self._read:self._read + first]
+            out[first:count] = self._data[:count - first]
+            self._read = (self._read + count) % self.capacity
+            self._count -= count
+        if count < out.size:
+            out[count:] = 0
+            self.underruns += 1
+        return count
+    
+    def clear(self):
+        """Tamponu boşalt"""
+        with self._lock:
+            self._read = 0
+            self._count = 0
+
+
+class MixerVoice:
+    """Karıştırılmakta olan ses"""
+    
+    __slots__ = ('buffer', 'cursor', 'gain', 'position')
+    
+    def __init__(self, buffer: np.ndarray, gain: float,
+                 position: Optional[Tuple[float, float]] = None):
+        self.buffer = buffer
+        self.cursor = 0
+        self.gain = gain
+        self.position = position
+
+
+class SoftwareMixer:
+    """N voice'u tek mono akışa karıştırır"""
+    
+    def __init__(self, sample_rate: int = 22050, latency: float = 0.05,
+                 max_distance: float = 500.0):
+        self.sample_rate = sample_rate
+        self.max_distance = max_distance
+        self.master_gain = 1.0
+        self.listener_pos = (0.0, 0.0)
+        
+        # Ses adı -> varyasyon tamponları
+        self.buffers: Dict[str, List[np.ndarray]] = {}
+        # (ses adı, slot) -> voice
+        self.voices: Dict[Tuple[str, int], MixerVoice] = {}
+        
+        # Halka tampon: hedef gecikme kadar önden karıştırılır
+        self.target_frames = int(sample_rate * latency)
+        self.ring = AudioRingBuffer(self.target_frames * 4)
+        self.stream = None
+        self._lock = threading.Lock()  # Voice'lar oyun ve mikser thread'leri arasında
+        self._thread: Optional[threading.Thread] = None
+        self._running = threading.Event()
+        
+        # Müzik akışı (audio.music.MusicStream) ve kazancı
+        self.music = None
+        self.music_gain = 0.0
+        
+        self.mixed_frames = 0
+        self.clipped = 0  # Taşan (kırpılan) örnekler
+    
+    # Tamponlar
+    def load(self, name: str, paths: List[str], volume: float = 1.0):
+        """Sesin varyasyonlarını çözüp belleğe al (volume tampona işlenir)"""
+        self.buffers[name] = [decode_wav(path, self.sample_rate) * np.float32(volume)
+                              for path in paths]
+    
+    def has_sound(self, name: str) -> bool:
+        return name in self.buffers
+    
+    # Voice'lar
+    def play(self, name: str, slot: int, gain: float,
+             position: Optional[Tuple[float, float]] = None, variant: int = 0):
+        """Slot'ta sesin variant'ını baştan başlat (slot'taki eski voice biter)"""
+        variants = self.buffers.get(name)
+        if not variants:
+            return
+        voice = MixerVoice(variants[variant % len(variants)], gain, position)
+        with self._lock:
+            self.voices[(name, slot)] = voice
+    
+    def stop(self, name: str, slot: int):
+        """Slot'taki voice'u durdur"""
+        with self._lock:
+            self.voices.pop((name, slot), None)
+    
+    def stop_all(self):
+        """Tüm voice'ları durdur"""
+        with self._lock:
+            self.voices.clear()
+        self.ring.clear()
+    
+    def _gains(self, voices: List[MixerVoice]) -> np.ndarray:
+        """Tüm voice'ların bu bloktaki kazancı (toplu uzaklık zayıflatması)"""
+        gains = np.fromiter((voice.gain for voice in voices), dtype=np.float32, count=len(voices))
+        positions = np.array([voice.position if voice.position is not None else (np.nan, np.nan)
+                              for voice in voices], dtype=np.float32)
+        distance = np.hypot(positions[:, 0] - self.listener_pos[0],
+                            positions[:, 1] - self.listener_pos[1])
+        attenuation = np.where(np.isnan(distance), 1.0,
+                               np.clip(1.0 - distance / self.max_distance, 0.0, 1.0))
+        return gains * attenuation * self.master_gain
+    
+    def mix(self, frames: int) -> np.ndarray:
+        """Aktif voice'ları frames örneklik int16 bloğa karıştır"""
+        out = np.zeros(frames, dtype=np.float32)
+        with self._lock:
+            items = list(self.voices.items())
+        if items:
+            gains = self._gains([voice for _, voice in items])
+            finished = []
+            for (key, voice), gain in zip(items, gains):
+                chunk = voice.buffer[voice.cursor:voice.cursor + frames]
+                if gain > 0.0:
+                    out[:chunk.size] += chunk * gain
+                voice.cursor += chunk.size
+                if voice.cursor >= voice.buffer.size:
+                    finished.append((key, voice))
+            with self._lock:
+                for key, voice in finished:
+                    # Bu arada slot'ta yeni ses başladıysa dokunma
+                    if self.voices.get(key) is voice:
+                        del self.voices[key]
+        music = self.music
+        if music is not None:
+            music.mix_into(out, self.music_gain * self.master_gain)
+        
+        self.clipped += int(np.count_nonzero(np.abs(out) > 1.0))
+        self.mixed_frames += frames
+        return (np.clip(out, -1.0, 1.0) * 32767).astype(np.int16)
+    
+    def pump(self) -> int:
+        """Halka tamponu hedef gecikmeye kadar doldur (mikser thread'inde)"""
+        missing = self.target_frames - self.ring.available
+        if missing <= 0:
+            return 0
+        return self.ring.write(self.mix(missing))
+    
+    def _run(self):
+        """Mikser thread'i: tamponu gecikmenin dörtte biri aralıklarla doldur"""
+        interval = self.target_frames / self.sample_rate / 4
+        while self._running.is_set():
+            self.pump()
+            time.sleep(interval)
+    
+    # Çıkış akışı
+    def _callback(self, outdata, frames, time_info, status):
+        """Ses kartı geri çağrısı: yalnızca halka tampondan okur"""
+        self.ring.read(outdata[:, 0])
+    
+    def start(self) -> bool:
+        """Çıkış akışını aç (sounddevice yoksa False)"""
+        if sounddevice is None:
+            return False
+        try:
+            self.stream = sounddevice.OutputStream(
+                samplerate=self.sample_rate, channels=1, dtype='int16',
+                blocksize=self.target_frames // 2, callback=self._callback)
+            self.stream.start()
+        except Exception:
+            self.stream = None
+            return False
+    
+        self.pump()
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, name='audio-mix', daemon=True)
+        self._thread.start()
+        return True
+    
+    def close(self):
+        """Mikser thread'ini durdur, çıkış akışını kapat"""
+        self._running.clear()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self.stream:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Sayaçlar (profilleyici için)"""
+        return {
+            'voices': len(self.voices),
+            'buffered': self.ring.available,
+            'underruns': self.ring.underruns,
+            'clipped': self.clipped,
+        }
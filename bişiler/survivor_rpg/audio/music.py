@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Audio/Music.py - Desen tabanlı procedural müzik
+
+MusicSequencer müziği 16'lık adımlar halinde, adım adım üretir: her adımda
+desenlerdeki notalar bir bar uzunluğundaki kuyruk tamponuna eklenir ve
+tamponun ilk adımı çıktı olur. Tam parça hiçbir zaman belleğe alınmaz;
+bellek kullanımı parça ne kadar uzun çalarsa çalsın sabittir.
+
+Katmanlar (bas, pad, davul, arpej) yoğunluğa göre kademeli açılır;
+yoğunluk oyun süresi ve düşman sayısından hesaplanır (music_intensity).
+
+MusicStream üretimi arka plan thread'inde yapar ve sınırlı bir halka
+tampona yazar. Tampon doluysa thread bekler; okuyucu (mikser) hiçbir
+zaman beklemez, veri yetişmezse o blok sessiz kalır.
+
+Mikser yoksa (Android, sounddevice kurulu değil) render_loop() akor
+yürüyüşünün bir turunu sabit yoğunlukta kesintisiz bir döngü olarak
+üretir; SoundManager bunu WAV olarak önbelleğe yazıp klip olarak çalar.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from . import synth
+from .mixer import AudioRingBuffer
+
+STEPS_PER_BAR = 16
+ROOT_FREQUENCY = 220.0  # A3
+
+MINOR = (0, 3, 7)
+MAJOR = (0, 4, 7)
+# Akor yürüyüşü (bar başına): Am - F - C - G
+PROGRESSION = ((0, MINOR), (-4, MAJOR), (3, MAJOR), (-2, MAJOR))
+
+# Desenler (adım başına); None = sus
+BASS_PATTERN = (0, None, None, 0, None, None, 0, None, 0, None, None, 0, None, None, 7, None)
+ARP_PATTERN = (0, 1, 2, 1) * 4   # Akor tonu indeksi
+KICK_STEPS = (0, 4, 8, 12)
+HAT_STEPS = (2, 6, 10, 14)
+
+# Katman -> açıldığı yoğunluk eşiği
+LAYERS = (('bass', 0.0), ('pad', 0.2), ('drums', 0.45), ('arp', 0.7))
+LAYER_FADE = 1.0 / STEPS_PER_BAR  # Adım başına kazanç değişimi (bir barda tam)
+
+# Parçalar: ad -> (tempo BPM, akor yürüyüşü transpozu)
+MUSIC_TRACKS = {
+    'combat': (120.0, 0),
+    'menu': (84.0, -5),
+}
+LOOP_INTENSITY = 0.5  # Döngü yedeğinin sabit yoğunluğu (bas, pad, davul)
+
+
+def music_intensity(game_time: float, enemy_count: int) -> float:
+    """Oyun durumundan müzik yoğunluğu (0-1)"""
+    return float(np.clip(game_time / 600.0 + enemy_count / 120.0, 0.0, 1.0))
+
+
+def _frequency(semitones: int) -> float:
+    """Kök notaya göre yarım ton"""
+    return ROOT_FREQUENCY * 2.0 ** (semitones / 12.0)
+
+
+class MusicSequencer:
+    """Desenleri adım adım sese çevirir (sabit bellek)"""
+    
+    def __init__(self, sample_rate: int = 22050, bpm: float = 120.0, transpose: int = 0):
+        self.sample_rate = sample_rate
+        self.transpose = transpose
+        self.step_samples = int(sample_rate * 60.0 / bpm / 4)
+        self.position = 0  # Toplam adım
+        
+        # Çalmakta olan notaların kalanı (bir bar)
+        self.tail = np.zeros(self.step_samples * STEPS_PER_BAR, dtype=np.float32)
+        
+        # Yoğunluk oyun thread'inden yazılır, katman kazançları ona yaklaşır
+        self.intensity = 0.0
+        self.layer_gains: Dict[str, float] = {name: 0.0 for name, _ in LAYERS}
+        
+        # Nota dalga biçimleri; desenler sonlu olduğu için sınırlı
+        self._notes: Dict[Tuple, np.ndarray] = {}
+        self._rng = np.random.default_rng(0)
+    
+    def set_intensity(self, intensity: float):
+        """Hedef yoğunluk (0-1)"""
+        self.intensity = min(1.0, max(0.0, intensity))
+    
+    # Nota sentezi
+    def _note(self, kind: str, semitones: int = 0, chord: Tuple[int, ...] = ()) -> np.ndarray:
+        """Notanın dalga biçimi (ilk kullanımda üretilir)"""
+        key = (kind, semitones, chord)
+        note = self._notes.get(key)
+        if note is None:
+            note = self._render_note(kind, semitones, chord)
+            note = note[:self.tail.size].astype(np.float32)
+            self._notes[key] = note
+        return note
+    
+    def _render_note(self, kind: str, semitones: int, chord: Tuple[int, ...]) -> np.ndarray:
+        rate = self.sample_rate
+        step = self.step_samples / rate
+        if kind == 'bass':
+            signal = synth.oscillator(_frequency(semitones - 12), step * 2, rate, 'saw')
+            signal = synth.lowpass(signal, 600.0, rate)
+            return signal * synth.adsr(signal.size, rate, 0.005, 0.08, 0.6, 0.05) * 0.3
+        if kind == 'pad':
+            duration = step * STEPS_PER_BAR
+            signal = sum(synth.oscillator(_frequency(semitones + tone), duration, rate, 'triangle')
+                         for tone in chord) / 3.0
+            return signal * synth.adsr(signal.size, rate, 0.4, 0.5, 0.6, 0.5) * 0.25
+        if kind == 'arp':
+            signal = synth.oscillator(_frequency(semitones + 12), step, rate, 'square')
+            signal = synth.lowpass(signal, 3000.0, rate)
+            return signal * synth.adsr(signal.size, rate, 0.002, 0.05, 0.3, 0.03) * 0.08
+        if kind == 'kick':
+            t = synth.time_axis(0.25, rate)
+            signal = synth.oscillator(40.0 + 80.0 * np.exp(-t * 30.0), 0.25, rate)
+            return signal * np.exp(-t * 12.0) * 0.5
+        if kind == 'hat':
+            signal = synth.highpass(synth.noise(0.05, rate, self._rng), 6000.0, rate)
+            return signal * np.exp(-synth.time_axis(0.05, rate) * 80.0) * 0.12
+        raise ValueError(f"Bilinmeyen nota türü: {kind}")
+    
+    def _add(self, note: np.ndarray, gain: float):
+        """Notayı kuyruğun başından itibaren ekle"""
+        if gain > 0.0:
+            self.tail[:note.size] += note * gain
+    
+    # Üretim
+    def _update_gains(self):
+        """Katman kazançlarını hedef yoğunluğa doğru kaydır"""
+        for name, threshold in LAYERS:
+            target = 1.0 if self.intensity >= threshold else 0.0
+            gain = self.layer_gains[name]
+            self.layer_gains[name] = min(target, gain + LAYER_FADE) if target > gain \
+                else max(target, gain - LAYER_FADE)
+    
+    def render_step(self) -> np.ndarray:
+        """Sonraki adımın örnekleri (float32, -1..1)"""
+        step = self.position % STEPS_PER_BAR
+        bar = self.position // STEPS_PER_BAR
+        root, chord = PROGRESSION[bar % len(PROGRESSION)]
+        root += self.transpose
+        self._update_gains()
+        gains = self.layer_gains
+        
+        if BASS_PATTERN[step] is not None:
+            self._add(self._note('bass', root + BASS_PATTERN[step]), gains['bass'])
+        if step == 0:
+            self._add(self._note('pad', root, chord), gains['pad'])
+        if step in KICK_STEPS:
+            self._add(self._note('kick'), gains['drums'])
+        if step in HAT_STEPS:
+            self._add(self._note('hat'), gains['drums'])
+        self._add(self._note('arp', root + chord[ARP_PATTERN[step]]), gains['arp'])
+        
+        # İlk adımı ver, kuyruğu kaydır
+        count = self.step_samples
+        out = self.tail[:count].copy()
+        self.tail[:-count] = self.tail[count:]
+        self.tail[-count:] = 0.0
+        self.position += 1
+        return out
+
+
+def render_loop(sample_rate: int, bpm: float, transpose: int = 0,
+                intensity: float = LOOP_INTENSITY) -> np.ndarray:
+    """Akor yürüyüşünün bir turu, başa sarınca kesintisiz (float32)"""
+    sequencer = MusicSequencer(sample_rate, bpm, transpose)
+    sequencer.set_intensity(intensity)
+    steps = STEPS_PER_BAR * len(PROGRESSION)
+    # Isınma turu: katmanlar açılır, önceki turdan taşan notalar kuyruğa
+    # girer; böylece döngünün başı kendi sonunun devamıdır
+    for _ in range(steps):
+        sequencer.render_step()
+    return np.concatenate([sequencer.render_step() for _ in range(steps)])
+
+
+class MusicStream:
+    """Sequencer'ı arka plan thread'inde sınırlı halka tampona üretir"""
+    
+    def __init__(self, sequencer: MusicSequencer, buffered_steps: int = 8):
+        self.sequencer = sequencer
+        self.ring = AudioRingBuffer(sequencer.step_samples * buffered_steps, dtype=np.float32)
+        self._scratch: Optional[np.ndarray] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = threading.Event()
+        self._wake = threading.Event()
+        self.rendered_steps = 0
+    
+    def start(self):
+        """Üretim thread'ini başlat"""
+        if self._thread is not None:
+            return
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, name='music-render', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Üretim thread'ini durdur"""
+        self._running.clear()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.ring.clear()
+    
+    def _run(self):
+        sequencer = self.sequencer
+        step_time = sequencer.step_samples / sequencer.sample_rate
+        while self._running.is_set():
+            if self.ring.capacity - self.ring.available >= sequencer.step_samples:
+                self.ring.write(sequencer.render_step())
+                self.rendered_steps += 1
+            else:
+                # Tampon dolu: okuyucu yer açınca ya da yarım adım sonra uyan
+                self._wake.wait(step_time / 2)
+                self._wake.clear()
+    
+    def mix_into(self, out: np.ndarray, gain: float):
+        """Hazır örnekleri out'a ekle (beklemez; eksik kısım sessiz)"""
+        if self._scratch is None or self._scratch.size < out.size:
+            self._scratch = np.zeros(out.size, dtype=np.float32)
+        scratch = self._scratch[:out.size]
+        count = self.ring.read(scratch)
+        self._wake.set()
+        if count and gain > 0.0:
+            out += scratch * gain
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Sayaçlar (profilleyici için)"""
+        return {
+            'rendered_steps': self.rendered_steps,
+            'buffered': self.ring.available,
+            'underruns': self.ring.underruns,
+        }
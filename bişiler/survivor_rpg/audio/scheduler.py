@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Audio/Scheduler.py - Voice sınırlı ses çalma planlayıcısı
+
+Tick boyunca gelen çalma istekleri kuyruğa alınır ve kare sonunda tek
+seferde işlenir:
+
+1. Dinleyiciye uzaklık: tüm konumlu istekler NumPy ile toplu zayıflatılır,
+   max_distance dışındakiler atılır
+2. Birleştirme: aynı karedeki aynı ses istekleri tek, daha yüksek sesli
+   bir voice'a dönüşür (enerji toplamı: sqrt(Σv²), en fazla 1)
+3. Voice sınırları: ses başına ve toplam sınır; sınır doluysa önceliği
+   eşit ya da düşük olan en zayıf voice çalınır (stealing), yoksa istek düşer
+
+Kivy'den bağımsızdır; çalma komutlarını SoundManager uygular.
+"""
+
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+class Voice:
+    """Çalmakta olan ses (havuzdaki bir slot)"""
+    
+    __slots__ = ('name', 'slot', 'priority', 'volume', 'start_time', 'end_time')
+    
+    def __init__(self, name: str, slot: int, priority: int, volume: float,
+                 start_time: float, end_time: float):
+        self.name = name
+        self.slot = slot
+        self.priority = priority
+        self.volume = volume
+        self.start_time = start_time
+        self.end_time = end_time
+
+
+class PlayCommand(NamedTuple):
+    """Kare sonunda uygulanacak çalma komutu"""
+    name: str
+    slot: int
+    volume: float
+    stolen: Optional[Tuple[str, int]]  # Durdurulacak voice (ad, slot)
+    position: Optional[Tuple[float, float]] = None  # En yüksek sesli isteğin konumu
+    attenuation: float = 1.0  # O konumun flush anındaki uzaklık çarpanı
+
+
+class SoundConfig(NamedTuple):
+    """Ses başına planlama ayarları"""
+    voices: int       # Aynı anda en fazla
+    duration: float   # Saniye (voice'un bitiş zamanı için)
+    priority: int
+
+
+class AudioScheduler:
+    """Kare başına ses isteği birleştirme, mesafe ayıklama ve voice sınırı"""
+    
+    def __init__(self, max_voices: int = 12, max_distance: float = 500.0, clock=time.monotonic):
+        self.max_voices = max_voices
+        self.max_distance = max_distance
+        self.clock = clock
+        self.sounds: Dict[str, SoundConfig] = {}
+        self.voices: List[Voice] = []
+        self._next_slot: Dict[str, int] = {}
+        
+        # Bu karenin istekleri
+        self._names: List[str] = []
+        self._volumes: List[float] = []
+        self._positions: List[Tuple[float, float]] = []
+        
+        # Sayaçlar
+        self.requested = 0
+        self.coalesced = 0   # Başka bir istekle birleşenler
+        self.culled = 0      # Çok uzak
+        self.stolen = 0      # Yer açmak için durdurulan voice'lar
+        self.dropped = 0     # Voice bulunamadığı için çalınmayanlar
+    
+    def configure(self, name: str, voices: int, duration: float, priority: int = 1):
+        """Sesi planlayıcıya tanıt"""
+        self.sounds[name] = SoundConfig(max(1, voices), duration, priority)
+    
+    def request(self, name: str, volume: float, position: Optional[Tuple[float, float]] = None):
+        """Çalma isteğini kuyruğa al (konumsuz istekler uzaklıktan etkilenmez)"""
+        if name not in self.sounds or volume <= 0:
+            return
+        self._names.append(name)
+        self._volumes.append(volume)
+        self._positions.append(position if position is not None else (np.nan, np.nan))
+        self.requested += 1
+    
+    def flush(self, listener: Tuple[float, float]) -> List[PlayCommand]:
+        """Kuyruğu işle ve bu karenin çalma komutlarını döndür"""
+        if not self._names:
+            return []
+        names = self._names
+        volumes = np.asarray(self._volumes, dtype=np.float64)
+        positions = np.asarray(self._positions, dtype=np.float64)
+        self._names, self._volumes, self._positions = [], [], []
+        
+        # 1. Toplu mesafe zayıflatma ve ayıklama
+        distance = np.hypot(positions[:, 0] - listener[0], positions[:, 1] - listener[1])
+        positional = ~np.isnan(distance)
+        factor = np.ones_like(volumes)
+        factor[positional] = 1.0 - distance[positional] / self.max_distance
+        volumes *= factor
+        audible = volumes > 0.0
+        self.culled += int(np.count_nonzero(~audible))
+        
+        # 2. Aynı sesleri birleştir (enerji toplamı)
+        energy: Dict[str, float] = {}
+        loudest: Dict[str, int] = {}
+        for index in np.flatnonzero(audible):
+            name = names[index]
+            if name in energy:
+                self.coalesced += 1
+                if volumes[index] > volumes[loudest[name]]:
+                    loudest[name] = index
+            else:
+                loudest[name] = index
+            energy[name] = energy.get(name, 0.0) + volumes[index] ** 2
+        
+        # 3. Önemli ve yüksek sesler önce voice alır
+        now = self.clock()
+        self.voices = [voice for voice in self.voices if voice.end_time > now]
+        merged = sorted(((self.sounds[name].priority, min(1.0, float(np.sqrt(total))), name)
+                         for name, total in energy.items()), reverse=True)
+        
+        commands = []
+        for priority, volume, name in merged:
+            command = self._allocate(name, priority, volume, now)
+            if command:
+                index = loudest[name]
+                if positional[index]:
+                    command = command._replace(position=tuple(positions[index]),
+                                               attenuation=float(factor[index]))
+                commands.append(command)
+            else:
+                self.dropped += 1
+        return commands
+    
+    def _allocate(self, name: str, priority: int, volume: float, now: float) -> Optional[PlayCommand]:
+        """Voice ayır; gerekirse daha önemsiz bir voice'u çal"""
+        config = self.sounds[name]
+        same = [voice for voice in self.voices if voice.name == name]
+        victim = None
+        
+        if len(same) >= config.voices:
+            # Ses başına sınır: aynı sesin en eski voice'u
+            victim = min(same, key=lambda voice: voice.start_time)
+        elif len(self.voices) >= self.max_voices:
+            # Toplam sınır: önceliği düşük, sesi zayıf, en eski voice
+            candidates = [voice for voice in self.voices if voice.priority <= priority]
+            if not candidates:
+                return None
+            victim = min(candidates, key=lambda voice: (voice.priority, voice.volume, voice.start_time))
+        
+        stolen = None
+        if victim is not None:
+            self.voices.remove(victim)
+            self.stolen += 1
+            stolen = (victim.name, victim.slot)
+        
+        if victim is not None and victim.name == name:
+            slot = victim.slot
+        else:
+            slot = self._free_slot(name, config.voices)
+        
+        self.voices.append(Voice(name, slot, priority, volume, now, now + config.duration))
+        return PlayCommand(name, slot, volume, stolen)
+    
+    def _free_slot(self, name: str, count: int) -> int:
+        """Kullanılmayan slot (varyasyonlar sırayla dönsün diye round-robin)"""
+        used = {voice.slot for voice in self.voices if voice.name == name}
+        start = self._next_slot.get(name, 0)
+        for offset in range(count):
+            slot = (start + offset) % count
+            if slot not in used:
+                self._next_slot[name] = (slot + 1) % count
+                return slot
+        return start
+    
+    def clear(self):
+        """Kuyruğu ve aktif voice'ları unut"""
+        self._names, self._volumes, self._positions = [], [], []
+        self.voices.clear()
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Sayaçlar (profilleyici için)"""
+        return {
+            'voices': len(self.voices),
+            'requested': self.requested,
+            'coalesced': self.coalesced,
+            'culled': self.culled,
+            'stolen': self.stolen,
+            'dropped': self.dropped,
+        }
@@ -2,17 +2,67 @@
 # -*- coding: utf-8 -*-
 """
 Audio/SoundManager.py - Profesyonel ses yönetim sistemi
+
+Procedural sesler NumPy ile sentezlenir (audio.synth) ve kalıcı önbellekte
+WAV olarak saklanır (services.asset_cache); sıcak başlangıçta yeniden
+üretilmez. Vuruş seslerinin perde/uzunluk varyasyonları toplu üretilir.
+
+play_sound() isteği hemen çalmaz: istekler audio.scheduler ile kare
+sonunda (update) birleştirilir, uzaklığa göre ayıklanır ve ses başına /
+toplam voice sınırları içinde dağıtılır.
+
+Çıkış akışı açılabilirse (sounddevice) sesler audio.mixer ile bellekte
+karıştırılıp tek akışa yazılır; ses başına maliyet bir dilim toplamadır.
+Açılamazsa her slot ayrı bir SoundLoader klibiyle çalınır.
+
+Müzik (audio.music) arka plan thread'inde parça parça üretilir ve mikserde
+karıştırılır. Mikser yoksa parçanın sabit yoğunluklu döngüsü bir kez WAV'a
+üretilir (önbellekte) ve döngüdeki bir SoundLoader klibiyle çalınır.
 """
 
+import inspect
 import os
-import math
-from typing import Dict, Optional, Tuple
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 from kivy.logger import Logger
 try:
     from kivy.core.audio import SoundLoader
 except ImportError:
     SoundLoader = None
 
+from services.asset_cache import asset_cache, cache_key
+from . import synth
+from .mixer import SoftwareMixer
+from .music import (LOOP_INTENSITY, MUSIC_TRACKS, MusicSequencer, MusicStream,
+                    music_intensity, render_loop)
+from .scheduler import AudioScheduler
+
+# Üreticilerin çıktısı değişince artırılır (önbellek anahtarına girer)
+GENERATOR_VERSION = 3
+
+# Procedural sesler: ad -> (ProceduralAudio sinyal üreticisi, parametreler,
+#                            örnekleme hızı, ses seviyesi, varyasyon sayısı)
+PROCEDURAL_SOUNDS = {
+    'explosion': ('explosion_signal', {'duration': 0.5}, 22050, 0.6, 3),       # Patlama
+    'pickup': ('pickup_signal', {'pitch': 1.2}, 22050, 0.4, 3),                # Pickup
+    'levelup': ('pickup_signal', {'pitch': 1.8}, 22050, 0.7, 1),               # Level up
+    'damage': ('tone_signal', {'frequency': 150.0, 'duration': 0.1}, 44100, 0.3, 4),  # Hasar
+    'fire': ('explosion_signal', {'duration': 0.1}, 22050, 0.2, 4),            # Ateş
+}
+
+# Voice ayarları: ad -> (aynı anda en fazla, öncelik); diğer sesler DEFAULT_VOICE
+VOICE_SETTINGS = {
+    'levelup': (1, 3),
+    'explosion': (3, 2),
+    'damage': (3, 1),
+    'pickup': (2, 1),
+    'fire': (2, 0),
+}
+DEFAULT_VOICE = (2, 1)
+MAX_VOICES = 12
+
 
 class AudioClip:
     """Ses klip sınıfı"""
@@ -76,90 +126,76 @@ class AudioClip:
 
 
 class ProceduralAudio:
-    """Procedural ses üretimi"""
+    """Procedural ses üretimi (audio.synth ile tek geçişte)"""
     
     @staticmethod
-    def generate_tone(frequency: float, duration: float, sample_rate: int = 44100) -> bytes:
-        """Basit ton üret"""
-        import struct
-        import math
-        
-        samples = int(sample_rate * duration)
-        data = []
-        
-        for i in range(samples):
-            t = float(i) / sample_rate
-            # Sinüs dalgası
-            sample = int(32767 * math.sin(2 * math.pi * frequency * t))
-            # Fade out efekti
-            fade = 1.0 - (i / samples)
-            sample = int(sample * fade)
-            data.append(struct.pack('<h', sample))
-        
-        return b''.join(data)
+    def tone_signal(frequency: float, duration: float, sample_rate: int = 44100) -> np.ndarray:
+        """Sinüs ton, doğrusal fade out"""
+        signal = synth.oscillator(frequency, duration, sample_rate)
+        return signal * np.linspace(1.0, 0.0, signal.size, endpoint=False)
     
     @staticmethod
-    def generate_explosion_sound(duration: float = 0.5) -> bytes:
-        """Patlama sesi üret"""
-        import struct
-        import random
-        
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
-        data = []
+    def explosion_signal(duration: float = 0.5, sample_rate: int = 22050,
+                         seed: Optional[int] = None) -> np.ndarray:
+        """Alçak geçiren gürültü, hızlı atak ve uzun sönüm"""
+        signal = synth.noise(duration, sample_rate, np.random.default_rng(seed))
         
-        for i in range(samples):
-            # Rastgele gürültü (white noise)
-            sample = random.randint(-32767, 32767)
-            
-            # Envelope (zarf)
-            t = float(i) / samples
-            if t < 0.1:  # Attack
-                envelope = t / 0.1
-            else:  # Decay
-                envelope = (1.0 - t) / 0.9
-            
-            # Düşük frekans filtresi (bass boost)
-            envelope *= (1.0 - t * 0.5)
-            
-            sample = int(sample * envelope * 0.3)  # Volume control
-            data.append(struct.pack('<h', sample))
+        # Düşük frekans filtresi (bass boost), tepe seviyesini koru
+        signal = synth.lowpass(signal, 1800.0, sample_rate)
+        peak = np.max(np.abs(signal)) if signal.size else 0.0
+        if peak > 0:
+            signal /= peak
         
-        return b''.join(data)
+        # Envelope (zarf): %10 attack, sonra decay
+        t = np.arange(signal.size, dtype=np.float64) / max(1, signal.size)
+        envelope = np.where(t < 0.1, t / 0.1, (1.0 - t) / 0.9)
+        envelope *= (1.0 - t * 0.5)
+        return signal * envelope * 0.3  # Volume control
     
     @staticmethod
-    def generate_pickup_sound(pitch: float = 1.0) -> bytes:
-        """Pickup sesi üret"""
-        import struct
-        import math
+    def pickup_signal(pitch: float = 1.0, duration: float = 0.2,
+                      sample_rate: int = 22050) -> np.ndarray:
+        """Yükselen perde, sinüs + harmonikler"""
+        t = synth.time_axis(duration, sample_rate)
+        freq = 440.0 * pitch * (1.0 + t * 2.0)  # Rising pitch
         
-        sample_rate = 22050
-        duration = 0.2
-        samples = int(sample_rate * duration)
-        data = []
-        
-        base_freq = 440.0 * pitch
-        
-        for i in range(samples):
-            t = float(i) / sample_rate
-            
-            # Rising pitch
-            freq = base_freq * (1.0 + t * 2.0)
-            
-            # Sinüs + harmonikler
-            sample1 = math.sin(2 * math.pi * freq * t)
-            sample2 = math.sin(2 * math.pi * freq * 2 * t) * 0.5
-            sample3 = math.sin(2 * math.pi * freq * 3 * t) * 0.25
-            
-            combined = (sample1 + sample2 + sample3) / 1.75
-            
-            # Envelope
-            envelope = (1.0 - t) ** 0.5
-            
-            sample = int(32767 * combined * envelope * 0.4)
-            data.append(struct.pack('<h', sample))
+        combined = (np.sin(2 * np.pi * freq * t) +
+                    np.sin(2 * np.pi * freq * 2 * t) * 0.5 +
+                    np.sin(2 * np.pi * freq * 3 * t) * 0.25) / 1.75
+        envelope = (1.0 - t) ** 0.5
+        return combined * envelope * 0.4
+    
+    @staticmethod
+    def generate_tone(frequency: float, duration: float, sample_rate: int = 44100) -> bytes:
+        """Basit ton üret (16-bit PCM)"""
+        return synth.to_pcm16(ProceduralAudio.tone_signal(frequency, duration, sample_rate))
+    
+    @staticmethod
+    def generate_explosion_sound(duration: float = 0.5, sample_rate: int = 22050) -> bytes:
+        """Patlama sesi üret (16-bit PCM)"""
+        return synth.to_pcm16(ProceduralAudio.explosion_signal(duration, sample_rate))
+    
+    @staticmethod
+    def generate_pickup_sound(pitch: float = 1.0, sample_rate: int = 22050) -> bytes:
+        """Pickup sesi üret (16-bit PCM)"""
+        return synth.to_pcm16(ProceduralAudio.pickup_signal(pitch, sample_rate=sample_rate))
+    
+    @staticmethod
+    def generate_variants(generator: str, params: Dict, sample_rate: int, count: int,
+                          seed: int = 0) -> List[bytes]:
+        """Bir sesin count perde/uzunluk varyasyonu (ilki özgün ses)
         
-        return b''.join(data)
+        Aynı seed her zaman aynı baytları üretir (gürültü dahil).
+        """
+        signal_seed, variant_seed = (int(child.generate_state(1)[0])
+                                     for child in np.random.SeedSequence(seed).spawn(2))
+        build = getattr(ProceduralAudio, generator)
+        if 'seed' in inspect.signature(build).parameters:
+            params = dict(params, seed=signal_seed)
+        signal = build(sample_rate=sample_rate, **params)
+        pitches, lengths = synth.variant_factors(count, rng=np.random.default_rng(variant_seed))
+        variants = synth.render_variants(signal, pitches, lengths, sample_rate)
+        return [synth.to_pcm16(variant) for variant in variants]
 
 
 class SoundManager:
@@ -172,14 +208,32 @@ class SoundManager:
         self.music_volume = 0.7
         self.enabled = True
         
-        # Ses havuzu (sound pooling)
-        self.sound_pools: Dict[str, list] = {}
+        # Ses havuzu (sound pooling): ses başına voice slot'ları, slot başına
+        # varyasyon klipleri; çalınan varyasyon slot'tan bağımsız döner
+        self.sound_pools: Dict[str, List[List[AudioClip]]] = {}
         self.max_pool_size = 5
+        self.variant_counts: Dict[str, int] = {}
+        self._next_variant: Dict[str, int] = {}
         
         # 3D ses özellikleri
         self.listener_pos = [0.0, 0.0]
         self.max_distance = 500.0
         
+        # Kare sonu planlayıcı (birleştirme, uzaklık, voice sınırı)
+        self.scheduler = AudioScheduler(MAX_VOICES, self.max_distance)
+        
+        # Yazılım mikseri (tek çıkış akışı); açılamazsa klip havuzları
+        self.mixer = SoftwareMixer(max_distance=self.max_distance)
+        self.use_mixer = self.mixer.start()
+        if self.use_mixer:
+            Logger.info("SoundManager: Yazılım mikseri etkin")
+        self.music: Optional[MusicStream] = None
+        self.music_clip: Optional[AudioClip] = None  # Mikser yokken döngü klibi
+        self.music_name: Optional[str] = None
+        
+        # Önbellek yazılamazsa kullanılan geçici dosyalar
+        self._temp_files: List[str] = []
+        
         self._load_default_sounds()
         
         Logger.info("SoundManager: Ses sistemi başlatıldı")
@@ -193,49 +247,89 @@ class SoundManager:
         self._load_audio_files()
     
     def _create_procedural_sounds(self):
-        """Procedural sesler oluştur"""
+        """Procedural sesleri ve varyasyonlarını önbellekten yükle (yoksa üret)"""
+        for name, (generator, params, sample_rate, volume, count) in PROCEDURAL_SOUNDS.items():
+            try:
+                paths = self._procedural_paths(name, generator, params, sample_rate, count)
+                self._create_pool(name, paths, volume)
+            except Exception as e:
+                Logger.error(f"SoundManager: Procedural ses hatası ({name}): {e}")
+    
+    def _procedural_paths(self, name: str, generator: str, params: Dict,
+                          sample_rate: int, count: int) -> List[str]:
+        """Varyasyonların WAV yolları; eksikler tek seferde toplu üretilir"""
+        variants: List[bytes] = []
+        # Kısmi önbellek kaçırmasında eksik varyasyon aynı baytlarla yeniden üretilir
+        key = cache_key(generator, dict(params, sample_rate=sample_rate, variants=count), GENERATOR_VERSION)
+        seed = zlib.crc32(f"{name}:{key}".encode('utf-8'))
+        
+        def write(path, index):
+            if not variants:
+                variants.extend(ProceduralAudio.generate_variants(generator, params, sample_rate,
+                                                                  count, seed))
+            if not self._save_wav_file(path, variants[index], sample_rate):
+                raise IOError(f"{name}.wav yazılamadı")
+        
+        paths = []
+        for index in range(count):
+            cache_params = dict(params, sample_rate=sample_rate, variant=index, variants=count)
+            path = asset_cache.cached_file(generator, cache_params, GENERATOR_VERSION, '.wav',
+                                           lambda path, index=index: write(path, index))
+            if path is None:
+                # Önbellek kullanılamıyor: geçici klasöre üret
+                import tempfile
+                path = os.path.join(tempfile.gettempdir(), f"{name}_{index}.wav")
+                write(path, index)
+                self._temp_files.append(path)
+            paths.append(path)
+        return paths
+    
+    def _create_pool(self, name: str, paths: List[str], volume: float = 1.0):
+        """Ses için voice havuzu kur (slot yalnızca voice çalmak için; varyasyon her çalışta döner)"""
+        voices, priority = VOICE_SETTINGS.get(name, DEFAULT_VOICE)
+        voices = min(voices, self.max_pool_size)
+        self.variant_counts[name] = len(paths)
+        self._next_variant[name] = 0
+        if self.use_mixer and self._load_into_mixer(name, paths, volume):
+            # Mikserde çalınır; klip gerekmez
+            self.sound_pools[name] = []
+            self.scheduler.configure(name, voices, self._clip_length(paths[0]), priority)
+            return
+        
+        pool = [[AudioClip(path, volume) for path in paths] for _ in range(voices)]
+        self.sound_pools[name] = pool
+        self.audio_clips[name] = pool[0][0]
+        self.scheduler.configure(name, voices, self._clip_length(paths[0], pool[0][0]), priority)
+    
+    def _pick_variant(self, name: str) -> int:
+        """Sıradaki varyasyon (tüm varyasyonlar sırayla çalınır)"""
+        variant = self._next_variant[name]
+        self._next_variant[name] = (variant + 1) % self.variant_counts[name]
+        return variant
+    
+    def _load_into_mixer(self, name: str, paths: List[str], volume: float) -> bool:
+        """Sesi mikser tamponlarına çöz (yalnızca 16-bit WAV)"""
+        if not all(path.endswith('.wav') for path in paths):
+            return False
         try:
-            # Geçici ses dosyaları oluştur
-            import tempfile
-            import wave
-            
-            temp_dir = tempfile.gettempdir()
-            
-            # Patlama sesi
-            explosion_data = ProceduralAudio.generate_explosion_sound(0.5)
-            explosion_path = os.path.join(temp_dir, "explosion.wav")
-            self._save_wav_file(explosion_path, explosion_data, 22050)
-            self.audio_clips['explosion'] = AudioClip(explosion_path, 0.6)
-            
-            # Pickup sesi
-            pickup_data = ProceduralAudio.generate_pickup_sound(1.2)
-            pickup_path = os.path.join(temp_dir, "pickup.wav")
-            self._save_wav_file(pickup_path, pickup_data, 22050)
-            self.audio_clips['pickup'] = AudioClip(pickup_path, 0.4)
-            
-            # Level up sesi
-            levelup_data = ProceduralAudio.generate_pickup_sound(1.8)
-            levelup_path = os.path.join(temp_dir, "levelup.wav")
-            self._save_wav_file(levelup_path, levelup_data, 22050)
-            self.audio_clips['levelup'] = AudioClip(levelup_path, 0.7)
-            
-            # Hasar sesi
-            damage_data = ProceduralAudio.generate_tone(150.0, 0.1)
-            damage_path = os.path.join(temp_dir, "damage.wav")
-            self._save_wav_file(damage_path, damage_data, 44100)
-            self.audio_clips['damage'] = AudioClip(damage_path, 0.3)
-            
-            # Ateş sesi
-            fire_data = ProceduralAudio.generate_explosion_sound(0.1)
-            fire_path = os.path.join(temp_dir, "fire.wav")
-            self._save_wav_file(fire_path, fire_data, 22050)
-            self.audio_clips['fire'] = AudioClip(fire_path, 0.2)
-            
+            self.mixer.load(name, paths, volume)
+            return True
         except Exception as e:
-            Logger.error(f"SoundManager: Procedural ses hatası: {e}")
+            Logger.warning(f"SoundManager: Mikser yükleme hatası ({name}): {e}")
+            return False
     
-    def _save_wav_file(self, file_path: str, audio_data: bytes, sample_rate: int):
-        """WAV dosyası kaydet"""
+    def _clip_length(self, file_path: str, clip: Optional[AudioClip] = None) -> float:
+        """Ses süresi (saniye); bilinmiyorsa 1 sn"""
+        try:
+            import wave
+            with wave.open(file_path, 'rb') as wav_file:
+                return wav_file.getnframes() / float(wav_file.getframerate())
+        except Exception:
+            length = getattr(clip.sound, 'length', 0) if clip and clip.sound else 0
+            return length if length and length > 0 else 1.0
+    
+    def _save_wav_file(self, file_path: str, audio_data: bytes, sample_rate: int) -> bool:
+        """WAV dosyası kaydet, başarılıysa True döndür"""
         try:
             import wave
             
@@ -244,9 +338,11 @@ class SoundManager:
                 wav_file.setsampwidth(2)  # 16-bit
                 wav_file.setframerate(sample_rate)
                 wav_file.writeframes(audio_data)
-                
+            return True
+        
         except Exception as e:
             Logger.error(f"SoundManager: WAV kaydetme hatası: {e}")
+            return False
     
     def _load_audio_files(self):
         """Ses dosyalarını yükle"""
@@ -257,33 +353,114 @@ class SoundManager:
                 if filename.endswith(('.wav', '.ogg', '.mp3')):
                     name = os.path.splitext(filename)[0]
                     file_path = os.path.join(audio_dir, filename)
-                    self.audio_clips[name] = AudioClip(file_path)
+                    self._create_pool(name, [file_path])
     
     def play_sound(self, sound_name: str, volume: float = 1.0, 
                    position: Optional[Tuple[float, float]] = None):
-        """Ses çal"""
+        """Çalma isteğini kuyruğa al (kare sonunda update() ile çalınır)"""
         if not self.enabled:
             return
         
-        if sound_name not in self.audio_clips:
+        if sound_name not in self.sound_pools:
             Logger.warning(f"SoundManager: Ses bulunamadı: {sound_name}")
             return
         
-        # 3D ses hesaplama
+        # Uzaklık zayıflatması planlayıcıda toplu yapılır
         final_volume = volume * self.sfx_volume * self.master_volume
+        self.scheduler.request(sound_name, final_volume, position)
+    
+    def update(self, dt: float = 0.0):
+        """Kare sonu: birleştirilmiş istekleri voice sınırları içinde çal"""
+        self.scheduler.max_distance = self.max_distance
+        for command in self.scheduler.flush(self.listener_pos):
+            if command.stolen:
+                self._stop_voice(*command.stolen)
+            variant = self._pick_variant(command.name)
+            if self.mixer.has_sound(command.name):
+                # Uzaklık mikserde her blokta yeniden hesaplanır
+                gain = command.volume / command.attenuation if command.attenuation > 0 else 0.0
+                self.mixer.play(command.name, command.slot, gain, command.position, variant)
+            else:
+                self._stop_voice(command.name, command.slot)
+                self.sound_pools[command.name][command.slot][variant].play(command.volume)
         
-        if position:
-            distance = self._calculate_distance(position, self.listener_pos)
-            if distance > self.max_distance:
-                return  # Çok uzak, ses çalma
-            
-            # Mesafe bazlı ses azalması
-            distance_factor = 1.0 - (distance / self.max_distance)
-            final_volume *= distance_factor
+        if self.use_mixer:
+            self.mixer.music_gain = self.music_volume * self.master_volume if self.enabled else 0.0
+            self.mixer.max_distance = self.max_distance
+            self.mixer.listener_pos = tuple(self.listener_pos)
+    
+    def _stop_voice(self, name: str, slot: int):
+        """Voice'u durdur (mikserde ya da havuzda)"""
+        if self.mixer.has_sound(name):
+            self.mixer.stop(name, slot)
+        else:
+            for clip in self.sound_pools[name][slot]:
+                clip.stop()
+    
+    # Müzik
+    def play_music(self, music_name: str = 'combat'):
+        """Procedural müziği başlat (aynı parça çalıyorsa dokunma)"""
+        if music_name == self.music_name:
+            return
+        if music_name not in MUSIC_TRACKS:
+            Logger.warning(f"SoundManager: Müzik bulunamadı: {music_name}")
+            return
+        
+        self.stop_music()
+        bpm, transpose = MUSIC_TRACKS[music_name]
+        if not self.use_mixer:
+            self._play_music_loop(music_name, bpm, transpose)
+            return
+        self.music = MusicStream(MusicSequencer(self.mixer.sample_rate, bpm, transpose))
+        self.music.start()
+        self.mixer.music = self.music
+        self.music_name = music_name
+    
+    def _play_music_loop(self, music_name: str, bpm: float, transpose: int):
+        """Mikser yedeği: parçanın döngüsünü WAV'a üret (önbellekte) ve klipte döndür"""
+        sample_rate = self.mixer.sample_rate
+        
+        def write(path):
+            loop = render_loop(sample_rate, bpm, transpose, LOOP_INTENSITY)
+            if not self._save_wav_file(path, synth.to_pcm16(loop), sample_rate):
+                raise IOError(f"{music_name} müzik döngüsü yazılamadı")
         
-        # Ses havuzundan al veya yeni oluştur
-        clip = self.audio_clips[sound_name]
-        clip.play(final_volume)
+        params = {'bpm': bpm, 'transpose': transpose, 'sample_rate': sample_rate,
+                  'intensity': LOOP_INTENSITY}
+        path = asset_cache.cached_file('music_loop', params, GENERATOR_VERSION, '.wav', write)
+        if path is None:
+            import tempfile
+            path = os.path.join(tempfile.gettempdir(), f"music_{music_name}.wav")
+            write(path)
+            self._temp_files.append(path)
+        
+        clip = AudioClip(path)
+        if not clip.loaded:
+            return
+        clip.sound.loop = True
+        clip.play(self._music_clip_volume())
+        self.music_clip = clip
+        self.music_name = music_name
+    
+    def _music_clip_volume(self) -> float:
+        """Döngü klibinin ses seviyesi"""
+        return self.music_volume * self.master_volume if self.enabled else 0.0
+    
+    def stop_music(self):
+        """Müziği durdur (üretim thread'i kapanır)"""
+        if self.music_clip is not None:
+            self.music_clip.stop()
+            self.music_clip = None
+        if self.music is not None:
+            self.mixer.music = None
+            self.music.stop()
+            self.music = None
+        self.music_name = None
+    
+    def set_music_intensity(self, game_time: float, enemy_count: int):
+        """Müzik katmanlarını oyun durumuna göre aç/kapat"""
+        if self.music is not None:
+            self.music.sequencer.set_intensity(music_intensity(game_time, enemy_count))
     
     def play_sound_3d(self, sound_name: str, x: float, y: float, volume: float = 1.0):
         """3D pozisyonlu ses çal"""
@@ -293,12 +470,6 @@ class SoundManager:
         """Dinleyici pozisyonu ayarla"""
         self.listener_pos = [x, y]
     
-    def _calculate_distance(self, pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
-        """İki nokta arası mesafe"""
-        dx = pos1[0] - pos2[0]
-        dy = pos1[1] - pos2[1]
-        return math.sqrt(dx*dx + dy*dy)
-    
     def play_explosion(self, x: float, y: float, intensity: float = 1.0):
         """Patlama sesi çal"""
         volume = 0.6 * intensity
@@ -323,6 +494,8 @@ class SoundManager:
     def set_master_volume(self, volume: float):
         """Ana ses seviyesi"""
         self.master_volume = max(0.0, min(1.0, volume))
+        if self.music_clip is not None:
+            self.music_clip.set_volume(self._music_clip_volume())
     
     def set_sfx_volume(self, volume: float):
         """Efekt ses seviyesi"""
@@ -331,32 +504,76 @@ class SoundManager:
     def set_music_volume(self, volume: float):
         """Müzik ses seviyesi"""
         self.music_volume = max(0.0, min(1.0, volume))
+        if self.music_clip is not None:
+            self.music_clip.set_volume(self._music_clip_volume())
+    
+    # Simülasyon olayları (core.events) -> ses efektleri
+    def attach(self, event_bus):
+        """Simülasyon olaylarına gözlemci olarak abone ol"""
+        event_bus.subscribe('enemy_damaged', self._on_enemy_damaged)
+        event_bus.subscribe('enemy_killed', self._on_enemy_killed)
+        event_bus.subscribe('enemy_attack', self._on_enemy_attack)
+        event_bus.subscribe('player_damaged', self._on_player_damaged)
+        event_bus.subscribe('player_killed', self._on_player_killed)
+        event_bus.subscribe('player_healed', self._on_player_pickup)
+        event_bus.subscribe('ability_added', self._on_player_pickup)
+        event_bus.subscribe('player_fired', self._on_player_fired)
+        event_bus.subscribe('player_level_up', self._on_player_level_up)
+    
+    def _on_enemy_damaged(self, enemy, amount, audible):
+        if audible:
+            self.play_damage(enemy.center_x, enemy.center_y)
+    
+    def _on_enemy_killed(self, enemy):
+        self.play_explosion(enemy.center_x, enemy.center_y, 0.8)
+    
+    def _on_enemy_attack(self, enemy, player_pos):
+        self.play_sound('fire', 0.3, (enemy.center_x, enemy.center_y))
+    
+    def _on_player_damaged(self, player, amount):
+        self.play_damage(player.center_x, player.center_y)
+    
+    def _on_player_killed(self, player):
+        self.play_explosion(player.center_x, player.center_y, 1.5)
+    
+    def _on_player_pickup(self, player, *args):
+        self.play_pickup(player.center_x, player.center_y)
+    
+    def _on_player_fired(self, player, projectile_count):
+        self.play_fire(player.center_x, player.center_y)
+    
+    def _on_player_level_up(self, player):
+        self.play_level_up()
     
     def enable_audio(self, enabled: bool):
         """Ses sistemini aç/kapat"""
         self.enabled = enabled
+        if self.music_clip is not None:
+            self.music_clip.set_volume(self._music_clip_volume())
     
     def stop_all_sounds(self):
         """Tüm sesleri durdur"""
-        for clip in self.audio_clips.values():
-            clip.stop()
+        for pool in self.sound_pools.values():
+            for slot in pool:
+                for clip in slot:
+                    clip.stop()
+        self.mixer.stop_all()
+        self.scheduler.clear()
     
     def cleanup(self):
         """Temizlik"""
         self.stop_all_sounds()
+        self.stop_music()
+        self.mixer.close()
         
-        # Geçici dosyaları temizle
-        import tempfile
-        temp_dir = tempfile.gettempdir()
-        temp_files = ['explosion.wav', 'pickup.wav', 'levelup.wav', 'damage.wav', 'fire.wav']
-        
-        for filename in temp_files:
-            file_path = os.path.join(temp_dir, filename)
+        # Geçici dosyaları temizle (önbellekteki sesler kalıcıdır)
+        for file_path in self._temp_files:
             try:
                 if os.path.exists(file_path):
                     os.remove(file_path)
             except Exception as e:
                 Logger.error(f"SoundManager: Temizlik hatası: {e}")
+        self._temp_files.clear()
 
 
 # Global ses yöneticisi
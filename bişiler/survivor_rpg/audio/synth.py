@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Audio/Synth.py - NumPy tabanlı ses sentezi
+
+Osilatörler, gürültü, ADSR zarfı ve basit filtreler tüm örnekleri tek
+seferde dizi olarak üretir; sinyaller -1..1 aralığında float64'tür ve
+to_pcm16() ile 16-bit little-endian PCM'e çevrilir. Kivy'den bağımsızdır.
+
+render_variants() bir sesin perde / uzunluk varyasyonlarını tek bir
+enterpolasyon çağrısıyla toplu üretir (vuruş seslerinin tekdüze
+duyulmaması için; çalma anında ek maliyet yoktur).
+"""
+
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+ArrayLike = Union[float, np.ndarray]
+
+OSCILLATORS = ('sine', 'square', 'saw', 'triangle')
+
+
+def sample_count(duration: float, sample_rate: int) -> int:
+    """Süredeki örnek sayısı"""
+    return int(sample_rate * duration)
+
+
+def time_axis(duration: float, sample_rate: int) -> np.ndarray:
+    """Örnek zamanları (saniye)"""
+    return np.arange(sample_count(duration, sample_rate), dtype=np.float64) / sample_rate
+
+
+def oscillator(frequency: ArrayLike, duration: float, sample_rate: int,
+               kind: str = 'sine') -> np.ndarray:
+    """Periyodik dalga; frequency sabit ya da örnek başına dizi (sweep)"""
+    samples = sample_count(duration, sample_rate)
+    frequency = np.broadcast_to(np.asarray(frequency, dtype=np.float64), (samples,))
+    # Faz = frekansın integrali (sweep'lerde kesintisiz)
+    phase = np.concatenate(([0.0], np.cumsum(frequency[:-1]))) / sample_rate if samples else frequency
+    cycle = phase % 1.0
+    
+    if kind == 'sine':
+        return np.sin(2 * np.pi * phase)
+    if kind == 'square':
+        return np.where(cycle < 0.5, 1.0, -1.0)
+    if kind == 'saw':
+        return 2.0 * cycle - 1.0
+    if kind == 'triangle':
+        return 1.0 - 4.0 * np.abs(cycle - 0.5)
+    raise ValueError(f"Bilinmeyen osilatör: {kind}")
+
+
+def noise(duration: float, sample_rate: int,
+          rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Beyaz gürültü (-1..1)"""
+    rng = rng or np.random.default_rng()
+    return rng.uniform(-1.0, 1.0, sample_count(duration, sample_rate))
+
+
+def adsr(samples: int, sample_rate: int, attack: float = 0.01, decay: float = 0.1,
+         sustain: float = 0.7, release: float = 0.1) -> np.ndarray:
+    """Doğrusal ADSR zarfı (süreler saniye, sustain seviye 0-1)
+    
+    Sustain süresi kalan örneklerdir; zarf toplam uzunluğu aşmaz.
+    """
+    attack_n = min(samples, int(attack * sample_rate))
+    decay_n = min(samples - attack_n, int(decay * sample_rate))
+    release_n = min(samples - attack_n - decay_n, int(release * sample_rate))
+    sustain_n = samples - attack_n - decay_n - release_n
+    
+    return np.concatenate((
+        np.linspace(0.0, 1.0, attack_n, endpoint=False),
+        np.linspace(1.0, sustain, decay_n, endpoint=False),
+        np.full(sustain_n, sustain),
+        np.linspace(sustain, 0.0, release_n),
+    ))
+
+
+def _sinc_kernel(cutoff: float, sample_rate: int, taps: int) -> np.ndarray:
+    """Pencereli sinc alçak geçiren FIR çekirdeği (birim kazanç)"""
+    taps |= 1  # Tek sayı: simetrik, gecikme taps // 2
+    n = np.arange(taps) - taps // 2
+    kernel = np.sinc(2 * cutoff / sample_rate * n) * np.blackman(taps)
+    return kernel / kernel.sum()
+
+
+def lowpass(signal: np.ndarray, cutoff: float, sample_rate: int, taps: int = 63) -> np.ndarray:
+    """Alçak geçiren filtre (FIR, faz kaymasız)"""
+    if cutoff >= sample_rate / 2 or signal.size == 0:
+        return signal
+    return np.convolve(signal, _sinc_kernel(cutoff, sample_rate, taps), mode='same')
+
+
+def highpass(signal: np.ndarray, cutoff: float, sample_rate: int, taps: int = 63) -> np.ndarray:
+    """Yüksek geçiren filtre (sinyal - alçak geçiren)"""
+    return signal - lowpass(signal, cutoff, sample_rate, taps)
+
+
+def fade_out(signal: np.ndarray, sample_rate: int, duration: float = 0.005) -> np.ndarray:
+    """Sondaki tıklamayı önlemek için kısa doğrusal kısma (yerinde)"""
+    count = min(signal.size, int(duration * sample_rate))
+    if count:
+        signal[-count:] *= np.linspace(1.0, 0.0, count)
+    return signal
+
+
+def to_pcm16(signal: np.ndarray, volume: float = 1.0) -> bytes:
+    """-1..1 sinyali 16-bit little-endian PCM baytlarına çevir"""
+    scaled = np.clip(signal * volume, -1.0, 1.0) * 32767
+    return scaled.astype('<i2').tobytes()
+
+
+def render_variants(signal: np.ndarray, pitches: Sequence[float], lengths: Sequence[float],
+                    sample_rate: int) -> List[np.ndarray]:
+    """Perde (yeniden örnekleme) ve uzunluk (kırpma) varyasyonları, toplu
+    
+    pitch > 1 tiz ve kısa; length < 1 sesi keser (sonu yumuşatılır).
+    Tüm varyasyonlar tek np.interp çağrısıyla hesaplanır.
+    """
+    source = np.arange(signal.size, dtype=np.float64)
+    sizes = [max(1, int(signal.size / pitch * length)) for pitch, length in zip(pitches, lengths)]
+    positions = np.concatenate([np.arange(size) * pitch for size, pitch in zip(sizes, pitches)])
+    rendered = np.interp(positions, source, signal, right=0.0)
+    
+    variants = np.split(rendered, np.cumsum(sizes)[:-1])
+    return [fade_out(variant, sample_rate) for variant in variants]
+
+
+def variant_factors(count: int, pitch_spread: float = 0.12, length_spread: float = 0.15,
+                    rng: Optional[np.random.Generator] = None):
+    """count varyasyon için (perde, uzunluk) çarpanları; ilki her zaman özgün ses"""
+    rng = rng or np.random.default_rng()
+    pitches = 1.0 + rng.uniform(-pitch_spread, pitch_spread, count)
+    lengths = 1.0 - rng.uniform(0.0, length_spread, count)
+    pitches[0] = lengths[0] = 1.0
+    return pitches, lengths
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Toplu steering çekirdeği için benchmark ve eşdeğerlik kontrolü
+
+Kullanım:
+    python bench_steering.py [--sizes 100 1000 5000] [--legacy-limit 1000]
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from entities.enhanced_enemies import AI_PATROL, EnemyFactory, enemy_columns
+from systems.steering import SteeringSystem
+
+
+def make_enemies(count: int, seed: int = 1234):
+    """Oyuncu etrafında yoğun bir düşman sürüsü oluştur"""
+    rng = random.Random(seed)
+    types = ['slime', 'goblin', 'skeleton', 'orc']
+    # Ekran başına benzer yoğunluk için alan düşman sayısıyla büyür
+    half_extent = 40.0 * (count ** 0.5)
+    enemies = []
+    for _ in range(count):
+        enemy = EnemyFactory.create_enemy(
+            rng.choice(types),
+            rng.uniform(-half_extent, half_extent),
+            rng.uniform(-half_extent, half_extent)
+        )
+        enemy.rotation = rng.uniform(-180, 180)
+        if rng.random() < 0.2:
+            enemy.ai_state = AI_PATROL
+            enemy.target_pos = [enemy.center_x + rng.uniform(-100, 100),
+                                enemy.center_y + rng.uniform(-100, 100)]
+        enemies.append(enemy)
+    return enemies
+
+
+def snapshot(enemies):
+    return np.array([(e.velocity[0], e.velocity[1], e.rotation) for e in enemies])
+
+
+def restore_rotation(enemies, rotations):
+    for enemy, rotation in zip(enemies, rotations):
+        enemy.rotation = rotation
+
+
+def run_legacy(enemies, player_pos):
+    for enemy in enemies:
+        enemy._calculate_movement(player_pos, enemies)
+
+
+def timeit(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000])
+    parser.add_argument('--legacy-limit', type=int, default=1000,
+                        help='Bu sayının üstünde O(n²) eski yol ölçülmez')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    player_pos = (0.0, 0.0)
+    batched = SteeringSystem(max_neighbors=16)
+    exact = SteeringSystem(max_neighbors=None)
+
+    print(f"{'n':>6} {'legacy ms':>10} {'batched ms':>11} {'speedup':>8} {'max |diff|':>11}")
+    for count in args.sizes:
+        enemies = make_enemies(count)
+        rotations = [e.rotation for e in enemies]
+        slots = np.array([e._slot for e in enemies], dtype=np.int64)
+
+        batched_time = timeit(lambda: batched.update(enemy_columns, slots, player_pos), args.repeat)
+
+        legacy_time = None
+        max_diff = None
+        if count <= args.legacy_limit:
+            restore_rotation(enemies, rotations)
+            run_legacy(enemies, player_pos)
+            reference = snapshot(enemies)
+
+            restore_rotation(enemies, rotations)
+            exact.update(enemy_columns, slots, player_pos)
+            max_diff = float(np.abs(snapshot(enemies) - reference).max())
+
+            legacy_time = timeit(lambda: run_legacy(enemies, player_pos), 1)
+
+        legacy_ms = f"{legacy_time * 1000:10.2f}" if legacy_time is not None else f"{'-':>10}"
+        speedup = f"{legacy_time / batched_time:7.1f}x" if legacy_time is not None else f"{'-':>8}"
+        diff = f"{max_diff:11.2e}" if max_diff is not None else f"{'-':>11}"
+        print(f"{count:>6} {legacy_ms} {batched_time * 1000:11.2f} {speedup} {diff}")
+
+
+if __name__ == '__main__':
+    main()
@@ -20,7 +20,7 @@ version = 0.1.0
 
 # (list) Application requirements
 # comma separated e.g. requirements = sqlite3,kivy
-requirements = python3,kivy
+requirements = python3,kivy,numpy
 
 # (str) Supported orientation (landscape, sensorLandscape, portrait or all)
 orientation = landscape
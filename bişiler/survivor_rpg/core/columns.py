@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Core/Columns.py - Sütun düzeninde (structure of arrays) varlık alanları
+
+Sık güncellenen alanlar (pozisyon, hız, AI durumu ...) nesne başına
+özellik yerine depo başına birer NumPy dizisinde tutulur. Her nesne
+oluşturulurken kalıcı bir slot alır; havuzdan tekrar alınsa da slotu
+değişmez. Sistemler sütunları slot dizileriyle toplu okuyup yazar,
+nesneler ise kendi satırlarına column_property() üzerinden erişir.
+
+NumPy yoksa sütunlar düz Python listeleridir (yalnızca skaler erişim).
+"""
+
+from operator import attrgetter
+from typing import Any, Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class _ListColumn(list):
+    """NumPy'sız sütun: dizilerle aynı skaler erişim (item)"""
+    
+    item = list.__getitem__
+
+
+class ColumnStore:
+    """İsimli sütunlar + slot ayırma
+    
+    columns: ad -> (tür, varsayılan); tür float / int / bool.
+    Slotlar nesneyle birlikte yaşar (serbest bırakılmaz); havuzlanan
+    nesneler tekrar kullanıldığı için slot sayısı havuzun oluşturduğu
+    nesne sayısıyla sınırlıdır.
+    """
+    
+    def __init__(self, columns: Dict[str, Tuple[type, Any]], capacity: int = 64):
+        self.specs = dict(columns)
+        self.owners: List[Any] = []  # slot -> nesne
+        self.capacity = 0
+        self._grow(max(1, capacity))
+    
+    def _grow(self, capacity: int):
+        """Sütunları capacity satıra büyüt (var olan değerler korunur)"""
+        size = self.capacity
+        for name, (kind, default) in self.specs.items():
+            if np is not None:
+                column = np.full(capacity, default, dtype=kind)
+                if size:
+                    column[:size] = getattr(self, name)
+            else:
+                column = _ListColumn(getattr(self, name) if size else [])
+                column.extend([default] * (capacity - size))
+            setattr(self, name, column)
+        self.capacity = capacity
+    
+    def allocate(self, owner: Any) -> int:
+        """owner için yeni slot ayır"""
+        slot = len(self.owners)
+        if slot >= self.capacity:
+            self._grow(self.capacity * 2)
+        self.owners.append(owner)
+        return slot
+    
+    def read(self, slots, names) -> Dict[str, List]:
+        """slots satırlarındaki names sütunları (Python listeleri)"""
+        if np is not None:
+            return {name: getattr(self, name)[slots].tolist() for name in names}
+        return {name: [getattr(self, name)[slot] for slot in slots] for name in names}
+
+    def write(self, slots, values: Dict[str, List]):
+        """read() tersi: sütunları slots satırlarına toplu yaz"""
+        if np is not None:
+            slots = np.asarray(slots, dtype=np.int64)
+        for name, column_values in values.items():
+            column = getattr(self, name)
+            if np is not None:
+                column[slots] = column_values
+            else:
+                for slot, value in zip(slots, column_values):
+                    column[slot] = value
+
+    def __len__(self) -> int:
+        return len(self.owners)
+
+
+def column_property(name: str) -> property:
+    """Nesnenin self._columns deposundaki self._slot satırına erişen özellik"""
+    get_column = attrgetter(name)
+    
+    def fget(self):
+        return get_column(self._columns).item(self._slot)
+    
+    def fset(self, value):
+        get_column(self._columns)[self._slot] = value
+    
+    return property(fget, fset)
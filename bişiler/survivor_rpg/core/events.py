@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Core/Events.py - Simülasyon olayları (observer) sistemi
+
+Simülasyon görsel/ses efektlerini doğrudan çağırmaz; olay yayınlar.
+Grafik ve ses katmanları isteğe bağlı gözlemci olarak abone olur,
+böylece simülasyon Kivy olmadan (headless) çalışabilir.
+
+Her Simulation kendi EventBus'ına (simulation.events) sahiptir ve
+varlıklarına atar; gözlemciler o bus'a bağlanır. Global event_bus yalnızca
+bir simülasyona ait olmayan varlıkların varsayılanıdır.
+
+Olaylar ve argümanları:
+    enemy_damaged    (enemy, amount, audible)
+    enemy_killed     (enemy)
+    enemy_attack     (enemy, player_pos)
+    enemy_teleport   (enemy, x, y)
+    enemy_spawned    (enemy)
+    player_damaged   (player, amount)
+    player_killed    (player)
+    player_healed    (player, amount)
+    player_fired     (player, projectile_count)
+    player_level_up  (player)
+    ability_added    (player, ability)
+    loot_collected   (player, loot_value, loot_type)
+"""
+
+from typing import Callable, Dict, List
+
+
+class EventBus:
+    """Basit olay yayınlama/abonelik sistemi"""
+    
+    def __init__(self):
+        self._listeners: Dict[str, List[Callable]] = {}
+    
+    def subscribe(self, event: str, callback: Callable):
+        """Olaya abone ol"""
+        listeners = self._listeners.setdefault(event, [])
+        if callback not in listeners:
+            listeners.append(callback)
+    
+    def unsubscribe(self, event: str, callback: Callable):
+        """Abonelikten çık"""
+        listeners = self._listeners.get(event)
+        if listeners and callback in listeners:
+            listeners.remove(callback)
+    
+    def emit(self, event: str, *args):
+        """Olayı yayınla (abone yoksa maliyeti yok denecek kadar az)"""
+        listeners = self._listeners.get(event)
+        if not listeners:
+            return
+        for callback in listeners:
+            callback(*args)
+    
+    def has_listeners(self, event: str) -> bool:
+        """Olayın abonesi var mı?"""
+        return bool(self._listeners.get(event))
+    
+    def clear(self):
+        """Tüm abonelikleri kaldır"""
+        self._listeners.clear()
+
+
+# Global olay sistemi
+event_bus = EventBus()
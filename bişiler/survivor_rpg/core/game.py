@@ -4,33 +4,34 @@
 Core/Game.py - Ana oyun döngüsü ve sahne yönetimi
 """
 
-import random
+import os
+from time import perf_counter
 from typing import Dict, List, Optional
 from kivy.uix.widget import Widget
 from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.graphics import Canvas
 from kivy.logger import Logger
 from kivy.properties import NumericProperty, ListProperty, BooleanProperty
 
-from .state import GameState, GameScene
-from .rng import GameRNG
-from entities.enhanced_player import EnhancedPlayer
-from entities.enhanced_enemies import EnhancedEnemy, EnemyFactory
-from entities.projectile import Projectile
-from entities.loot import LootOrb
-from graphics.sprite_manager import sprite_renderer
+from .state import GameScene
+from .simulation import Simulation
+from .timestep import FixedTimestep
+from .replay import ReplayRecorder
+from .snapshot import load_snapshot, save_snapshot
+from .telemetry import TelemetryRecorder
+from .profiler import FrameProfiler
+from graphics.entity_renderer import EntityRenderer
 from graphics.particle_system import particle_system
 from audio.sound_manager import sound_manager
-from systems.physics import PhysicsSystem
-from systems.spawn import SpawnSystem
-from systems.combat import CombatSystem
-from systems.movement import MovementSystem
-from systems.abilities import AbilitySystem
 from ui.hud import HUD
 from ui.levelup import LevelUpPanel
 from ui.pause_menu import PauseMenu
 from ui.game_over import GameOverScreen
+from ui.profiler_overlay import ProfilerOverlay
 from services.save import SaveService
 from services.audio import AudioService
+from services.run_history import RunRecord, run_history
 
 
 class GameScreen(Widget):
@@ -38,26 +39,20 @@ class GameScreen(Widget):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.entities = []
-        
-        # Parçacık render'ı için canvas binding
-        self.bind(size=self._update_canvas, pos=self._update_canvas)
-        
-    def _update_canvas(self, *args):
-        """Canvas güncellemesi"""
-        # Parçacık sistemini render et
-        particle_system.render(self.canvas)
-        
-    def add_entity(self, entity):
-        """Ekrana varlık ekle"""
-        self.entities.append(entity)
-        self.add_widget(entity)
-        
-    def remove_entity(self, entity):
-        """Ekrandan varlık kaldır"""
-        if entity in self.entities:
-            self.entities.remove(entity)
-            self.remove_widget(entity)
+        
+        # Varlık katmanı (katman mesh'leri her karede güncellenir)
+        self.entity_renderer = EntityRenderer()
+        self.entity_canvas = Canvas()
+        self.canvas.add(self.entity_canvas)
+        
+        # Parçacık katmanı (varlıkların üstünde, tek Mesh)
+        self.particle_canvas = Canvas()
+        self.canvas.add(self.particle_canvas)
+        
+    def render(self, simulation: Simulation, alpha: float = 1.0):
+        """Simülasyondaki varlıkları ve parçacıkları çiz"""
+        self.entity_renderer.render(self.entity_canvas, simulation, alpha)
+        particle_system.render(self.particle_canvas)
 
 
 class GameManager(Widget):
@@ -68,6 +63,13 @@ class GameManager(Widget):
     game_time = NumericProperty(0.0)
     is_paused = BooleanProperty(False)
     
+    # Sabit simülasyon adımı (Hz) ve bir karede en fazla yakalama adımı
+    sim_rate = NumericProperty(60)
+    max_catchup_steps = NumericProperty(5)
+    
+    # Kare profilleyici ve overlay'i (F3 ile açılır/kapanır)
+    profiler_enabled = BooleanProperty(False)
+    
     # Joystick
     joystick_pos = ListProperty([0.0, 0.0])
     joystick_active = BooleanProperty(False)
@@ -76,23 +78,38 @@ class GameManager(Widget):
         super().__init__(**kwargs)
         
         # Temel bileşenler
-        self.state = GameState()
-        self.rng = GameRNG()
         self.save_service = SaveService()
         self.audio_service = AudioService()
         
-        # Varlık listeleri
-        self.player: Optional[EnhancedPlayer] = None
-        self.enemies: List[EnhancedEnemy] = []
-        self.projectiles: List[Projectile] = []
-        self.loot_orbs: List[LootOrb] = []
+        # Oyun simülasyonu (Kivy'siz); grafik ve ses gözlemci olarak bağlanır
+        self.simulation = Simulation(self.width, self.height)
+        self.state = self.simulation.state
+        self.timestep = FixedTimestep(self.sim_rate, self.max_catchup_steps)
+        
+        # Son koşunun replay kaydı (seed + tick başına giriş + seçimler)
+        self.replay_file = "last_run.replay"
+        self.replay_recorder = ReplayRecorder()
+        self.simulation.recorder = self.replay_recorder
         
-        # Sistemler
-        self.physics_system = PhysicsSystem()
-        self.spawn_system = SpawnSystem(self.rng)
-        self.combat_system = CombatSystem()
-        self.movement_system = MovementSystem()
-        self.ability_system = AbilitySystem()
+        # Askıya alınan koşu (Android süreci öldürürse buradan devam edilir)
+        self.snapshot_file = "suspended_run.snapshot"
+        
+        # Son koşunun olay telemetrisi (spawn, öldürme, hasar, level-up, toplama)
+        self.telemetry_file = "last_run.telemetry"
+        self.telemetry = TelemetryRecorder()
+        
+        # Profilleyici kapalıyken None (sıcak yolda ölçüm yapılmaz)
+        self.profiler: Optional[FrameProfiler] = None
+        self.profiler_overlay: Optional[ProfilerOverlay] = None
+        
+        self.bind(sim_rate=self._on_sim_rate)
+        self.bind(max_catchup_steps=self._on_max_catchup_steps)
+        self.bind(profiler_enabled=self._on_profiler_enabled)
+        Window.bind(on_key_down=self._on_key_down)
+        particle_system.attach(self.simulation.events)
+        sound_manager.attach(self.simulation.events)
+        self.telemetry.attach(self.simulation.events)
+        self.bind(size=self._on_size)
         
         # UI bileşenleri
         self.game_screen = GameScreen()
@@ -116,91 +133,189 @@ class GameManager(Widget):
         self.add_widget(self.game_screen)
         self.add_widget(self.hud)
         
-        # Oyuncuyu oluştur
-        self.player = EnhancedPlayer()
-        self.player.pos = [self.width/2, self.height/2]
-        self.game_screen.add_entity(self.player)
+        # Askıya alınmış koşu varsa devam et, yoksa yenisini başlat
+        resumed = self._resume_snapshot()
+        if not resumed:
+            self.simulation.recorder = self.replay_recorder
+            self.simulation.resize(self.width, self.height)
+            self.simulation.start_run()
+        self.game_time = self.simulation.game_time
+        
+        # Parçacıklar koşu seed'inin 'fx' akışından çeker (simülasyon akışlarına dokunmaz)
+        particle_system.rng = self.simulation.rng.stream('fx').generator
+        self._begin_telemetry(append=resumed)
         
         # HUD'ı güncelle
         self.hud.bind_player(self.player)
         
-        # Oyun durumunu başlat
-        self.state.start_new_run(self.rng.generate_seed())
+        # Müzik (yoğunluk _update_ui'da oyuna göre ayarlanır)
+        self.audio_service.play_music('combat')
         
         Logger.info("GameManager: Oyun başlatıldı!")
-        
+        if resumed:
+            self.pause_game()
+    
+    def _resume_snapshot(self) -> bool:
+        """Askıya alınmış koşuyu geri kur (dosya tek kullanımlık)"""
+        if not os.path.exists(self.snapshot_file):
+            return False
+        try:
+            load_snapshot(self.snapshot_file, self.simulation)
+            # Koşunun başı kayıtta olmadığı için replay tutulmaz
+            self.simulation.recorder = None
+            Logger.info(f"GameManager: Koşu devam ettirildi ({self.simulation.game_time:.1f} sn)")
+            return True
+        except Exception as e:
+            Logger.error(f"GameManager: Anlık durum yüklenemedi: {e}")
+            return False
+        finally:
+            self._discard_snapshot()
+    
+    def _begin_telemetry(self, append: bool):
+        """Telemetri kaydını başlat (devam eden koşuda dosyaya eklenir)"""
+        try:
+            self.telemetry.begin(self.simulation, self.telemetry_file, append)
+        except Exception as e:
+            Logger.error(f"GameManager: Telemetri başlatılamadı: {e}")
+    
+    def _discard_snapshot(self):
+        """Askıya alma dosyasını sil"""
+        try:
+            if os.path.exists(self.snapshot_file):
+                os.remove(self.snapshot_file)
+        except OSError as e:
+            Logger.error(f"GameManager: Anlık durum silinemedi: {e}")
+        
+    @property
+    def player(self):
+        """Simülasyondaki oyuncu"""
+        return self.simulation.player
+    
+    def _on_size(self, instance, size):
+        """Pencere boyutu değişti"""
+        self.simulation.resize(*size)
+        
+    def _on_sim_rate(self, instance, rate):
+        """Simülasyon frekansı değişti"""
+        self.timestep.set_rate(rate)
+        
+    def _on_max_catchup_steps(self, instance, steps):
+        """Yakalama adımı sınırı değişti"""
+        self.timestep.max_steps = int(steps)
+        
+    def _on_profiler_enabled(self, instance, enabled):
+        """Profilleyiciyi aç/kapat"""
+        if enabled and not self.profiler:
+            self.profiler = FrameProfiler()
+            self.profiler_overlay = ProfilerOverlay(pos=self.pos, size=self.size)
+            self.bind(size=self.profiler_overlay.setter('size'))
+            self.add_widget(self.profiler_overlay)
+        elif not enabled and self.profiler:
+            self.unbind(size=self.profiler_overlay.setter('size'))
+            self.remove_widget(self.profiler_overlay)
+            self.profiler_overlay = None
+            self.profiler = None
+        self.simulation.profiler = self.profiler
+    
+    def toggle_profiler(self):
+        """Profilleyici overlay'ini aç/kapat"""
+        self.profiler_enabled = not self.profiler_enabled
+    
+    def _on_key_down(self, window, key, scancode, codepoint, modifiers):
+        """Klavye kısayolları (masaüstü)"""
+        if key == 284:  # F3
+            self.toggle_profiler()
+            return True
+        return False
+    
+    def _timed(self, stage: str, func, *args):
+        """Profilleyici açıksa aşama süresini ölç"""
+        profiler = self.profiler
+        if profiler is None:
+            return func(*args)
+        start = perf_counter()
+        result = func(*args)
+        profiler.record(stage, perf_counter() - start)
+        return result
+    
     def update(self, dt):
-        """Ana oyun döngüsü (60 FPS)"""
+        """Ana oyun döngüsü (her karede; simülasyon sabit adımla ilerler)"""
         if self.is_paused or self.current_scene != 1:  # GameScene.GAME
+            self.timestep.reset()
             return
-            
-        # Zamanı güncelle
-        self.game_time += dt
-        self.state.game_time = self.game_time
         
-        # Joystick kontrolü
-        if self.joystick_active and self.player:
-            self.player.set_movement_input(self.joystick_pos)
+        profiler = self.profiler
+        if profiler:
+            profiler.begin_frame()
+            
+        # Joystick kontrolü (bırakıldığında giriş sıfırlanır)
+        if self.joystick_active:
+            self.simulation.set_movement_input(self.joystick_pos)
+        else:
+            self.simulation.set_movement_input((0.0, 0.0))
+        
+        # Simülasyonu sabit adımlarla ilerlet
+        steps = self.timestep.advance(dt)
+        for _ in range(steps):
+            self.simulation.step(self.timestep.step_dt)
+            
+            # Level-up veya ölüm: kalan adımları atla
+            if self.simulation.needs_level_up() or self.simulation.is_game_over():
+                self.timestep.reset()
+                break
+        self.game_time = self.simulation.game_time
         
-        # Sistemleri güncelle
-        self._update_systems(dt)
+        # Parçacık sistemini güncelle (görsel, kare süresiyle)
+        self._timed('particles', particle_system.update, dt)
         
-        # Parçacık sistemini güncelle
-        particle_system.update(dt)
+        # Varlıkları çiz (son iki tick arasında interpolasyon)
+        self._timed('render', self.game_screen.render, self.simulation, self.timestep.alpha)
         
         # UI'ı güncelle
-        self._update_ui(dt)
+        self._timed('ui', self._update_ui, dt)
+        
+        # Bu karenin ses isteklerini çal (birleştirme + voice sınırı)
+        self._timed('audio', sound_manager.update, dt)
+        
+        if profiler:
+            profiler.end_frame()
+            self._update_profiler_overlay(dt)
         
         # Level-up kontrolü
-        if self.player and self.player.needs_level_up():
+        if self.simulation.needs_level_up():
             self._trigger_level_up()
             
         # Oyun bitişi kontrolü
-        if self.player and self.player.is_dead():
+        if self.simulation.is_game_over():
             self._trigger_game_over()
             
-    def _update_systems(self, dt):
-        """Tüm sistemleri güncelle"""
-        
-        # Hareket sistemi
-        self.movement_system.update(dt, self.player, self.enemies, self.projectiles)
-        
-        # Spawn sistemi
-        new_enemies = self.spawn_system.update(dt, self.game_time, self.get_spawn_bounds())
-        for enemy in new_enemies:
-            self.enemies.append(enemy)
-            self.game_screen.add_entity(enemy)
-        
-        # Düşman AI güncellemesi
-        if self.player and self.player.is_alive:
-            player_pos = (self.player.center_x, self.player.center_y)
-            for enemy in self.enemies:
-                if enemy.is_alive:
-                    enemy.update_ai(dt, player_pos, self.enemies)
-            
-        # Yetenek sistemi (auto-fire)
-        if self.player:
-            new_projectiles = self.ability_system.update(dt, self.player, self.enemies)
-            for projectile in new_projectiles:
-                self.projectiles.append(projectile)
-                self.game_screen.add_entity(projectile)
-        
-        # Fizik sistemi (çarpışma tespiti)
-        self.physics_system.update(dt, self.player, self.enemies, self.projectiles, self.loot_orbs)
-        
-        # Savaş sistemi (hasar hesaplama)
-        new_loot = self.combat_system.update(dt, self.player, self.enemies, self.projectiles)
-        for loot in new_loot:
-            self.loot_orbs.append(loot)
-            self.game_screen.add_entity(loot)
-        
-        # Ölü varlıkları temizle
-        self._cleanup_dead_entities()
-        
     def _update_ui(self, dt):
         """UI'ı güncelle"""
         if self.hud:
             self.hud.update_time(self.game_time)
+        
+        # Ses dinleyicisi oyuncuyu takip eder
+        if self.player:
+            sound_manager.set_listener_position(self.player.center_x, self.player.center_y)
+        sound_manager.set_music_intensity(self.game_time, len(self.simulation.enemies))
+    
+    def _update_profiler_overlay(self, dt):
+        """Sayaçları güncelle ve overlay'i yenile"""
+        profiler = self.profiler
+        simulation = self.simulation
+        profiler.set_counter('enemies', len(simulation.enemies))
+        profiler.set_counter('projectiles', len(simulation.projectiles))
+        profiler.set_counter('loot', len(simulation.loot_orbs))
+        profiler.set_counter('particles', particle_system.get_particle_count())
+        profiler.set_counter('voices', sound_manager.scheduler.get_stats()['voices'])
+        particle_stats = particle_system.get_stats()
+        profiler.set_counter('particles_culled', particle_stats['scaled_out'] +
+                             particle_stats['evicted'] + particle_stats['dropped'])
+        profiler.set_counter('sprites', self.game_screen.entity_renderer.get_stats()['sprites'])
+        profiler.set_counter('instructions', len(self.game_screen.canvas.children) +
+                             len(self.game_screen.entity_canvas.children) +
+                             len(self.game_screen.particle_canvas.children))
+        self.profiler_overlay.update(dt, profiler)
             
     def _trigger_level_up(self):
         """Level-up panelini göster"""
@@ -208,7 +323,7 @@ class GameManager(Widget):
             return  # Zaten açık
             
         self.is_paused = True
-        abilities = self.ability_system.get_random_abilities(3, self.player.abilities)
+        abilities = self.simulation.get_level_up_choices(3)
         
         self.level_up_panel = LevelUpPanel(abilities)
         self.level_up_panel.bind(on_ability_selected=self._on_ability_selected)
@@ -217,8 +332,7 @@ class GameManager(Widget):
     def _on_ability_selected(self, panel, ability_index):
         """Yetenek seçildiğinde"""
         selected_ability = panel.abilities[ability_index]
-        self.player.add_ability(selected_ability)
-        self.player.level_up()
+        self.simulation.apply_level_up(selected_ability)
         
         # Panel'i kapat
         self.remove_widget(self.level_up_panel)
@@ -228,6 +342,8 @@ class GameManager(Widget):
     def _trigger_game_over(self):
         """Oyun bitişi ekranını göster"""
         self.current_scene = 4  # GameScene.GAME_OVER
+        self.audio_service.play_music('menu')  # Sonuç ekranında sakin parça
+        self._discard_snapshot()
         
         # İstatistikleri hesapla
         survival_time = self.format_time(self.game_time)
@@ -237,6 +353,9 @@ class GameManager(Widget):
         # Kaydet
         self.save_service.add_meta_currency(coins_earned)
         self.save_service.save_game_data()
+        self._save_replay()
+        self.telemetry.close()
+        run_history.record_run(RunRecord.from_simulation(self.simulation, coins_earned))
         
         # Game over ekranını göster
         self.game_over_screen = GameOverScreen(
@@ -248,38 +367,6 @@ class GameManager(Widget):
         self.game_over_screen.bind(on_main_menu=self._go_to_main_menu)
         self.add_widget(self.game_over_screen)
         
-    def _cleanup_dead_entities(self):
-        """Ölü varlıkları temizle"""
-        # Düşmanlar
-        for enemy in self.enemies[:]:
-            if enemy.is_dead():
-                self.enemies.remove(enemy)
-                self.game_screen.remove_entity(enemy)
-                
-        # Mermiler
-        for projectile in self.projectiles[:]:
-            if projectile.is_dead():
-                self.projectiles.remove(projectile)
-                self.game_screen.remove_entity(projectile)
-                
-        # Loot
-        for loot in self.loot_orbs[:]:
-            if loot.is_collected():
-                self.loot_orbs.remove(loot)
-                self.game_screen.remove_entity(loot)
-    
-    def get_spawn_bounds(self):
-        """Spawn sınırlarını döndür"""
-        margin = 100
-        return {
-            'left': -margin,
-            'right': self.width + margin,
-            'top': self.height + margin,
-            'bottom': -margin,
-            'center_x': self.width / 2,
-            'center_y': self.height / 2
-        }
-    
     def format_time(self, seconds):
         """Zamanı formatla"""
         minutes = int(seconds // 60)
@@ -355,9 +442,22 @@ class GameManager(Widget):
                 self.add_widget(self.pause_menu)
     
     def resume_game(self):
-        """Oyunu devam ettir"""
+        """Oyunu devam ettir (süreç yaşıyor: anlık duruma gerek kalmadı)"""
+        self._discard_snapshot()
         self._resume_game()
     
+    def suspend(self):
+        """Uygulama arka plana geçti: duraklat, koşunun tam durumunu kaydet"""
+        self.pause_game()
+        if self.current_scene == 1 and not self.simulation.is_game_over():  # GameScene.GAME
+            try:
+                save_snapshot(self.snapshot_file, self.simulation)
+            except Exception as e:
+                Logger.error(f"GameManager: Anlık durum kaydedilemedi: {e}")
+        self.telemetry.flush()
+        self.save_game()
+        self.save_service.flush()
+    
     def _resume_game(self, *args):
         """Oyunu devam ettir (internal)"""
         self.is_paused = False
@@ -388,28 +488,36 @@ class GameManager(Widget):
         
     def _quit_game(self, *args):
         """Oyundan çık"""
-        self.save_game()
+        self.shutdown()
         Logger.info("GameManager: Oyundan çıkılıyor...")
         # App.get_running_app().stop()
     
     def _clear_all_entities(self):
         """Tüm varlıkları temizle"""
-        for enemy in self.enemies[:]:
-            self.game_screen.remove_entity(enemy)
-        for projectile in self.projectiles[:]:
-            self.game_screen.remove_entity(projectile)
-        for loot in self.loot_orbs[:]:
-            self.game_screen.remove_entity(loot)
-            
-        if self.player:
-            self.game_screen.remove_entity(self.player)
-            
-        self.enemies.clear()
-        self.projectiles.clear()
-        self.loot_orbs.clear()
-        self.player = None
+        self.simulation.clear()
+        self.game_screen.entity_renderer.clear()
+    
+    def _save_replay(self):
+        """Son koşunun replay'ini kaydet"""
+        if self.simulation.recorder is None:
+            return
+        try:
+            self.replay_recorder.save(self.replay_file)
+            Logger.info(f"GameManager: Replay kaydedildi: {self.replay_file}")
+        except Exception as e:
+            Logger.error(f"GameManager: Replay kaydetme hatası: {e}")
     
     def save_game(self):
         """Oyunu kaydet"""
         self.save_service.save_game_data()
         Logger.info("GameManager: Oyun kaydedildi.")
+
+    def shutdown(self):
+        """Çıkış: klavye bağını çöz, bekleyen kayıtları diske yaz"""
+        Window.unbind(on_key_down=self._on_key_down)
+        self.telemetry.close()
+        self.save_game()
+        if not self.save_service.flush():
+            Logger.warning("GameManager: Kayıt zamanında yazılamadı")
+        if not run_history.flush():
+            Logger.warning("GameManager: Koşu geçmişi zamanında yazılamadı")
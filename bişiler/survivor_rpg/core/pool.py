@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Core/Pool.py - Nesne havuzu (object pool)
+
+Sık oluşturulup atılan varlıklar (mermi, loot, düşman) her seferinde
+yeniden yaratılmak yerine havuzdan alınır ve işleri bitince havuza
+geri verilir. Bu, yoğun anlarda GC takılmalarını azaltır.
+
+Havuzlanan sınıflar reset(*args, **kwargs) metodu sağlamalıdır;
+acquire() aynı argümanlarla ya yeni nesne oluşturur ya da boştaki
+nesneyi reset() ile sıfırlar.
+"""
+
+from typing import Any, Callable, Dict, List
+
+
+class ObjectPool:
+    """Tipli nesne havuzu"""
+    
+    def __init__(self, factory: Callable[..., Any], max_free: int = 256):
+        self.factory = factory
+        self.max_free = max_free  # Boşta tutulacak en fazla nesne
+        self._free: List[Any] = []
+        
+        # Kapasite metrikleri
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.discarded = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+    
+    def prewarm(self, count: int, *args, **kwargs):
+        """Boştaki nesne sayısını en az count'a çıkar"""
+        count = min(count, self.max_free)
+        while len(self._free) < count:
+            obj = self.factory(*args, **kwargs)
+            obj._in_pool = True
+            self.created += 1
+            self._free.append(obj)
+    
+    def acquire(self, *args, **kwargs) -> Any:
+        """Havuzdan nesne al (reset edilmiş halde)"""
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            self.created += 1
+        obj._in_pool = False
+        
+        self.in_use += 1
+        if self.in_use > self.peak_in_use:
+            self.peak_in_use = self.in_use
+        return obj
+    
+    def acquire_blank(self, count: int, create: Callable[[], Any]) -> List[Any]:
+        """Durumu hemen geri yüklenecek count nesne al
+        
+        reset() ve factory çağrılmaz: boştaki nesneler olduğu gibi, eksikler
+        create() ile kurulumsuz alınır (anlık durumdan devam). Sayaçlar
+        acquire() ile aynı işler.
+        """
+        free = self._free
+        reused = min(count, len(free))
+        objects = [free.pop() for _ in range(reused)]
+        objects.extend(create() for _ in range(count - reused))
+        for obj in objects:
+            obj._in_pool = False
+        
+        self.reused += reused
+        self.created += count - reused
+        self.in_use += count
+        if self.in_use > self.peak_in_use:
+            self.peak_in_use = self.in_use
+        return objects
+    
+    def release(self, obj: Any):
+        """Nesneyi havuza geri ver"""
+        if getattr(obj, '_in_pool', False):
+            return  # Zaten havuzda (çift iade)
+        obj._in_pool = True
+        
+        self.in_use = max(0, self.in_use - 1)
+        self.released += 1
+        if len(self._free) < self.max_free:
+            self._free.append(obj)
+        else:
+            self.discarded += 1
+    
+    def release_all(self, objects: List[Any]):
+        """Listedeki tüm nesneleri havuza geri ver"""
+        for obj in objects:
+            self.release(obj)
+    
+    def free_count(self) -> int:
+        """Boştaki nesne sayısı"""
+        return len(self._free)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Kapasite metrikleri"""
+        return {
+            'created': self.created,
+            'reused': self.reused,
+            'released': self.released,
+            'discarded': self.discarded,
+            'in_use': self.in_use,
+            'peak_in_use': self.peak_in_use,
+            'free': len(self._free),
+        }
+    
+    def clear(self):
+        """Boştaki nesneleri bırak (dışarıdaki nesnelerin sayaçlarına dokunmaz)"""
+        self._free.clear()
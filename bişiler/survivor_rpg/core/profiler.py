@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Core/Profiler.py - Sistem başına kare profilleyici
+
+Her aşamanın (hareket, spawn, AI, fizik, savaş, parçacık, UI...) bir
+karede harcadığı süre toplanır ve kare sonunda sabit boyutlu halka
+tamponlara (ring buffer) yazılır. Overlay bu tamponlardan p50/p95/p99
+hesaplar. Profilleyici kapalıyken (None) sıcak yol hiçbir ölçüm yapmaz.
+"""
+
+from time import perf_counter
+from array import array
+from typing import Dict, List, Tuple
+
+
+class RingBuffer:
+    """Sabit boyutlu float halka tamponu"""
+    
+    def __init__(self, capacity: int = 300):
+        self.capacity = capacity
+        self._data = array('d', bytes(8 * capacity))
+        self._index = 0
+        self.count = 0
+    
+    def append(self, value: float):
+        """Değer ekle (dolunca en eskinin üzerine yazar)"""
+        self._data[self._index] = value
+        self._index = (self._index + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+    
+    def values(self) -> List[float]:
+        """Tampondaki değerler (sırasız)"""
+        return list(self._data[:self.count])
+    
+    def latest(self) -> float:
+        """Son eklenen değer"""
+        if not self.count:
+            return 0.0
+        return self._data[self._index - 1]
+    
+    def clear(self):
+        """Tamponu boşalt"""
+        self._index = 0
+        self.count = 0
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Sıralı listede en yakın sıra (nearest-rank) yüzdeliği"""
+    if not sorted_values:
+        return 0.0
+    rank = int(round(percent / 100.0 * (len(sorted_values) - 1)))
+    return sorted_values[rank]
+
+
+class FrameProfiler:
+    """Aşama başına kare süresi istatistikleri"""
+    
+    def __init__(self, capacity: int = 300):
+        self.capacity = capacity  # Saklanan kare sayısı (60 FPS'te ~5 sn)
+        self.stages: Dict[str, RingBuffer] = {}
+        self.counters: Dict[str, int] = {}
+        
+        self._frame_totals: Dict[str, float] = {}
+        self._frame_start = 0.0
+        self.frame_count = 0
+    
+    def begin_frame(self):
+        """Kare başlangıcı"""
+        self._frame_totals.clear()
+        self._frame_start = perf_counter()
+    
+    def record(self, stage: str, seconds: float):
+        """Aşama süresini bu kareye ekle (bir karede birden çok tick olabilir)"""
+        totals = self._frame_totals
+        totals[stage] = totals.get(stage, 0.0) + seconds
+    
+    def end_frame(self):
+        """Kare sonu: toplamları tamponlara yaz"""
+        totals = self._frame_totals
+        totals['frame'] = perf_counter() - self._frame_start
+        
+        for stage in totals:
+            if stage not in self.stages:
+                self.stages[stage] = RingBuffer(self.capacity)
+        
+        # Bu karede çalışmayan aşamalar 0 sayılır
+        for stage, buffer in self.stages.items():
+            buffer.append(totals.get(stage, 0.0))
+        self.frame_count += 1
+    
+    def set_counter(self, name: str, value: int):
+        """Sayaç (varlık, parçacık, canvas talimatı...) değerini ayarla"""
+        self.counters[name] = value
+    
+    def get_percentiles(self, stage: str) -> Tuple[float, float, float]:
+        """Aşamanın p50/p95/p99 değerleri (milisaniye)"""
+        buffer = self.stages.get(stage)
+        if not buffer:
+            return (0.0, 0.0, 0.0)
+        values = sorted(buffer.values())
+        return tuple(_percentile(values, p) * 1000.0 for p in (50, 95, 99))
+    
+    def get_report(self) -> List[Tuple[str, float, float, float]]:
+        """Tüm aşamalar için (ad, p50, p95, p99) listesi, 'frame' en sonda"""
+        names = [name for name in self.stages if name != 'frame']
+        if 'frame' in self.stages:
+            names.append('frame')
+        return [(name, *self.get_percentiles(name)) for name in names]
+    
+    def format_report(self) -> str:
+        """Overlay / konsol için metin tablo"""
+        lines = [f"{'aşama':<11}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+        for name, p50, p95, p99 in self.get_report():
+            lines.append(f"{name:<11}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+        if self.counters:
+            lines.append("  ".join(f"{name}={value}" for name, value in self.counters.items()))
+        return "\n".join(lines)
+    
+    def reset(self):
+        """Tüm ölçümleri sil"""
+        self.stages.clear()
+        self.counters.clear()
+        self._frame_totals.clear()
+        self.frame_count = 0
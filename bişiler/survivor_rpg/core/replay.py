@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Core/Replay.py - Deterministik replay kaydı ve oynatma
+
+Simülasyon sabit adımla ilerlediği ve tüm oyun rastgeleliği seed'li
+akışlardan geldiği için bir koşu seed + tick başına giriş + level-up
+seçimleriyle birebir yeniden üretilebilir.
+
+Dosya biçimi (tamsayılar LEB128 varint, işaretliler zigzag):
+    'SRPL', sürüm (1 bayt)
+    seed, tick_dt / genişlik / yükseklik (float64), tick sayısı
+    giriş:    [tekrar, Δx, Δy] ...   (eksenler -127..127 nicemli)
+    level-up: [Δtick, seçim sırası] ...
+    keyframe: [Δtick, uzunluk, zlib(JSON durum)] ...
+
+Keyframe'ler belirli aralıklarla tam durumu saklar; oynatma N. dakikaya
+sıfırdan simüle etmeden atlayabilir.
+"""
+
+import bisect
+import hashlib
+import json
+import struct
+import zlib
+from typing import List, Optional, Tuple
+
+from .rng import MASK64
+from .simulation import Simulation
+
+MAGIC = b'SRPL'
+VERSION = 3
+AXIS_SCALE = 127
+
+
+def _write_uvarint(buffer: bytearray, value: int):
+    """İşaretsiz varint yaz"""
+    if value < 0:
+        raise ValueError(f"Negatif değer işaretsiz yazılamaz: {value}")
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            buffer.append(byte | 0x80)
+        else:
+            buffer.append(byte)
+            return
+
+
+def _read_uvarint(data: bytes, offset: int) -> Tuple[int, int]:
+    """İşaretsiz varint oku, (değer, yeni offset) döndür"""
+    result = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, offset
+        shift += 7
+
+
+def _write_svarint(buffer: bytearray, value: int):
+    """İşaretli (zigzag) varint yaz"""
+    _write_uvarint(buffer, (value << 1) if value >= 0 else ((-value << 1) - 1))
+
+
+def _read_svarint(data: bytes, offset: int) -> Tuple[int, int]:
+    """İşaretli (zigzag) varint oku"""
+    value, offset = _read_uvarint(data, offset)
+    return (value >> 1) if not value & 1 else -((value + 1) >> 1), offset
+
+
+def state_digest(simulation: Simulation) -> str:
+    """Simülasyon durumunun özeti (birebir karşılaştırma için)"""
+    encoded = json.dumps(simulation.get_state(), sort_keys=True).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class Replay:
+    """Bir koşunun kayıt verisi"""
+    
+    def __init__(self, seed: int = 0, tick_dt: float = 1 / 60.0,
+                 width: float = 800.0, height: float = 600.0):
+        self.seed = seed & MASK64
+        self.tick_dt = tick_dt
+        self.width = width
+        self.height = height
+        self.tick_count = 0
+        
+        # Giriş: [tekrar, qx, qy] (run-length)
+        self.input_runs: List[List[int]] = []
+        # Level-up: (tick, seçim sırası)
+        self.level_ups: List[Tuple[int, int]] = []
+        # Keyframe: (tick, zlib sıkıştırılmış JSON durum)
+        self.keyframes: List[Tuple[int, bytes]] = []
+    
+    # Kodlama
+    def to_bytes(self) -> bytes:
+        """Kompakt ikili biçime çevir"""
+        buffer = bytearray(MAGIC)
+        buffer.append(VERSION)
+        _write_uvarint(buffer, self.seed)
+        buffer += struct.pack('<ddd', self.tick_dt, self.width, self.height)
+        _write_uvarint(buffer, self.tick_count)
+        
+        _write_uvarint(buffer, len(self.input_runs))
+        last_x = last_y = 0
+        for count, qx, qy in self.input_runs:
+            _write_uvarint(buffer, count)
+            _write_svarint(buffer, qx - last_x)
+            _write_svarint(buffer, qy - last_y)
+            last_x, last_y = qx, qy
+        
+        _write_uvarint(buffer, len(self.level_ups))
+        last_tick = 0
+        for tick, choice in self.level_ups:
+            _write_uvarint(buffer, tick - last_tick)
+            _write_uvarint(buffer, choice)
+            last_tick = tick
+        
+        _write_uvarint(buffer, len(self.keyframes))
+        last_tick = 0
+        for tick, blob in self.keyframes:
+            _write_uvarint(buffer, tick - last_tick)
+            _write_uvarint(buffer, len(blob))
+            buffer += blob
+            last_tick = tick
+        
+        return bytes(buffer)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Replay':
+        """to_bytes() çıktısını çöz"""
+        if data[:4] != MAGIC:
+            raise ValueError("Geçersiz replay dosyası")
+        if data[4] != VERSION:
+            raise ValueError(f"Desteklenmeyen replay sürümü: {data[4]}")
+        
+        offset = 5
+        seed, offset = _read_uvarint(data, offset)
+        tick_dt, width, height = struct.unpack_from('<ddd', data, offset)
+        offset += struct.calcsize('<ddd')
+        
+        replay = cls(seed, tick_dt, width, height)
+        replay.tick_count, offset = _read_uvarint(data, offset)
+        
+        run_count, offset = _read_uvarint(data, offset)
+        qx = qy = 0
+        for _ in range(run_count):
+            count, offset = _read_uvarint(data, offset)
+            dx, offset = _read_svarint(data, offset)
+            dy, offset = _read_svarint(data, offset)
+            qx += dx
+            qy += dy
+            replay.input_runs.append([count, qx, qy])
+        
+        level_up_count, offset = _read_uvarint(data, offset)
+        tick = 0
+        for _ in range(level_up_count):
+            delta, offset = _read_uvarint(data, offset)
+            choice, offset = _read_uvarint(data, offset)
+            tick += delta
+            replay.level_ups.append((tick, choice))
+        
+        keyframe_count, offset = _read_uvarint(data, offset)
+        tick = 0
+        for _ in range(keyframe_count):
+            delta, offset = _read_uvarint(data, offset)
+            length, offset = _read_uvarint(data, offset)
+            tick += delta
+            replay.keyframes.append((tick, data[offset:offset + length]))
+            offset += length
+        
+        return replay
+    
+    def save(self, path: str):
+        """Dosyaya yaz"""
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+    
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        """Dosyadan oku"""
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """Simülasyona bağlanıp koşuyu kaydeder (simulation.recorder)"""
+    
+    def __init__(self, keyframe_interval: float = 60.0):
+        self.keyframe_interval = keyframe_interval  # Saniye
+        self.replay = Replay()
+        self._keyframe_ticks = 0
+    
+    def begin(self, simulation: Simulation):
+        """Yeni koşu başladı"""
+        self.replay = Replay(simulation.rng.seed, width=simulation.width,
+                             height=simulation.height)
+        self._keyframe_ticks = 0
+    
+    def record_tick(self, simulation: Simulation, dt: float):
+        """Tick başında çağrılır: keyframe ve girişi kaydet"""
+        replay = self.replay
+        if replay.tick_count == 0:
+            replay.tick_dt = dt
+            self._keyframe_ticks = max(1, round(self.keyframe_interval / dt))
+        
+        tick = simulation.tick
+        if tick > 0 and tick % self._keyframe_ticks == 0:
+            self.add_keyframe(simulation)
+        
+        qx = round(simulation.movement_input[0] * AXIS_SCALE)
+        qy = round(simulation.movement_input[1] * AXIS_SCALE)
+        runs = replay.input_runs
+        if runs and runs[-1][1] == qx and runs[-1][2] == qy:
+            runs[-1][0] += 1
+        else:
+            runs.append([1, qx, qy])
+        replay.tick_count += 1
+    
+    def record_level_up(self, simulation: Simulation, choice_index: int):
+        """Level-up seçimi (sonraki tick'ten önce uygulandı)"""
+        self.replay.level_ups.append((simulation.tick, choice_index))
+    
+    def add_keyframe(self, simulation: Simulation):
+        """Tam durumu sıkıştırıp sakla"""
+        encoded = json.dumps(simulation.get_state(), separators=(',', ':'))
+        self.replay.keyframes.append((simulation.tick, zlib.compress(encoded.encode('utf-8'), 6)))
+    
+    def save(self, path: str):
+        """Kaydı dosyaya yaz"""
+        self.replay.save(path)
+
+
+class ReplayPlayer:
+    """Kaydı yeni bir simülasyonda birebir oynatır"""
+    
+    def __init__(self, replay: Replay, simulation: Optional[Simulation] = None):
+        self.replay = replay
+        self.simulation = simulation or Simulation(replay.width, replay.height)
+        
+        # Giriş run'larının başlangıç tick'leri (seek için)
+        self._run_starts: List[int] = []
+        start = 0
+        for count, _, _ in replay.input_runs:
+            self._run_starts.append(start)
+            start += count
+        
+        self._keyframe_ticks = [tick for tick, _ in replay.keyframes]
+        self.restart()
+    
+    def restart(self):
+        """Baştan başla"""
+        self.simulation.resize(self.replay.width, self.replay.height)
+        self.simulation.start_run(self.replay.seed)
+        self._level_up_index = 0
+    
+    @property
+    def tick(self) -> int:
+        return self.simulation.tick
+    
+    def is_finished(self) -> bool:
+        """Kayıt bitti mi?"""
+        return self.simulation.tick >= self.replay.tick_count
+    
+    def _input_at(self, tick: int) -> Tuple[float, float]:
+        """Tick'teki nicemli joystick girişi"""
+        index = bisect.bisect_right(self._run_starts, tick) - 1
+        _, qx, qy = self.replay.input_runs[index]
+        return (qx / AXIS_SCALE, qy / AXIS_SCALE)
+    
+    def step(self) -> bool:
+        """Bir tick oynat, kayıt bittiyse False döndür"""
+        if self.is_finished():
+            return False
+        
+        simulation = self.simulation
+        level_ups = self.replay.level_ups
+        while (self._level_up_index < len(level_ups) and
+               level_ups[self._level_up_index][0] <= simulation.tick):
+            simulation.choose_level_up(level_ups[self._level_up_index][1])
+            self._level_up_index += 1
+        
+        simulation.set_movement_input(self._input_at(simulation.tick))
+        simulation.step(self.replay.tick_dt)
+        return True
+    
+    def seek(self, tick: int):
+        """Belirtilen tick'e atla (en yakın önceki keyframe'den)"""
+        tick = max(0, min(tick, self.replay.tick_count))
+        current = self.simulation.tick
+        index = bisect.bisect_right(self._keyframe_ticks, tick) - 1
+        keyframe_tick = self._keyframe_ticks[index] if index >= 0 else None
+        
+        # Geri sarma ya da ileride daha yakın bir keyframe varsa oradan başla
+        if tick < current or (keyframe_tick is not None and keyframe_tick > current):
+            if keyframe_tick is not None:
+                blob = self.replay.keyframes[index][1]
+                self.simulation.set_state(json.loads(zlib.decompress(blob)))
+                # Keyframe'den önce uygulanmış level-up'ları atla
+                self._level_up_index = bisect.bisect_right(
+                    [t for t, _ in self.replay.level_ups], keyframe_tick)
+            else:
+                self.restart()
+        
+        while self.simulation.tick < tick and self.step():
+            pass
+    
+    def seek_time(self, seconds: float):
+        """Oyun süresine göre atla (ör. 5. dakika için 300)"""
+        self.seek(int(round(seconds / self.replay.tick_dt)))
+    
+    def run_to_end(self) -> Simulation:
+        """Kaydın sonuna kadar oynat"""
+        while self.step():
+            pass
+        return self.simulation
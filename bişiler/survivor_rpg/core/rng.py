@@ -2,21 +2,259 @@
 # -*- coding: utf-8 -*-
 """
 Core/RNG.py - Rastgele sayı üretimi ve seed yönetimi
+
+Alt sistemler koşu seed'inden türetilen isimli akışları kullanır
+(STREAM_NAMES); birinin çektiği sayılar diğerinin dizisini kaydırmaz.
+Her akış tek bir sayaç tabanlı (Philox) NumPy üreticisi taşır; skaler
+ve toplu çekimler aynı üreticiden gelir. Philox durumu küçük bir
+sayaçtır, anahtarı seed ve akış adından yeniden türetilir. Seed'ler
+64 bite maskelenir (negatif seed de geçerli bir anahtar verir).
 """
 
 import random
 import time
-from typing import List, Dict, Any, Tuple
+import zlib
+from typing import List, Dict, Any, Optional, Tuple
 import math
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bilinen akışlar
+STREAM_NAMES = ('spawn', 'ai', 'loot', 'fx', 'abilities')
+
+# Yalnızca görsel akışlar: simülasyon durumuna yazılmaz (replay'i etkilemez)
+TRANSIENT_STREAMS = ('fx',)
+
+# Seed'ler işaretsiz 64 bit
+MASK64 = (1 << 64) - 1
+
+# Skaler çekimler için bir seferde alınan 64 bitlik değer sayısı
+SCALAR_BLOCK = 256
+_RECIP_53 = 1.0 / (1 << 53)
+
+
+class RNGStream(random.Random):
+    """Seed'den türetilen isimli akış: skaler + toplu (NumPy) çekimler
+    
+    Skaler çekimler (random, randint, uniform, choice ...) toplu
+    çekimlerle aynı Philox üreticisinden gelir: üretici SCALAR_BLOCK
+    adet 64 bitlik değeri bir blokta verir, skalerler bloktan sırayla
+    okunur. Durum = blok başındaki sayaç + bloktaki konum + güncel sayaç.
+    """
+    
+    def __init__(self, seed: int, name: str):
+        self.name = name
+        self._seed = seed & MASK64
+        super().__init__(self._seed)
+    
+    def seed(self, a=None, version=2):
+        """Philox anahtarını seed ve akış adından kur; konum başa döner"""
+        if a is not None:
+            self._seed = a & MASK64
+        self._block: List[int] = []
+        self._block_state = None
+        self._pos = 0
+        self.gauss_next = None
+        if np is None:
+            # NumPy yoksa blok Mersenne Twister'dan dolar
+            super().seed(f"{self._seed}:{self.name}")
+            self._generator = None
+            return
+        key = np.random.SeedSequence(self._seed, spawn_key=(zlib.crc32(self.name.encode('utf-8')),))
+        self._generator = np.random.Generator(np.random.Philox(key))
+    
+    def reset(self):
+        """Akışı başlangıç konumuna döndür"""
+        self.seed()
+    
+    def rekey(self, seed: int):
+        """Akışı başka bir seed'den yeniden türet"""
+        seed &= MASK64
+        if seed != self._seed:
+            self.seed(seed)
+    
+    @property
+    def generator(self) -> 'np.random.Generator':
+        """Toplu çekimler için NumPy üreticisi (skalerlerle aynı bit üreticisi)"""
+        if self._generator is None:
+            raise RuntimeError("Toplu rastgele çekim için NumPy gerekli")
+        return self._generator
+    
+    # Skaler çekimler
+    def random(self) -> float:
+        """[0, 1) float (bloktaki sıradaki değerin üst 53 biti)"""
+        pos = self._pos
+        if pos >= len(self._block):
+            self._refill()
+            pos = 0
+        self._pos = pos + 1
+        return (self._block[pos] >> 11) * _RECIP_53
+    
+    def getrandbits(self, k: int) -> int:
+        """k rastgele bit (randint/choice/shuffle bunu kullanır)"""
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        value = bits = 0
+        while bits < k:
+            pos = self._pos
+            if pos >= len(self._block):
+                self._refill()
+                pos = 0
+            self._pos = pos + 1
+            value = (value << 64) | self._block[pos]
+            bits += 64
+        return value >> (bits - k)
+    
+    def _refill(self):
+        """Sıradaki SCALAR_BLOCK değeri üreticiden al"""
+        self._block_state = self._bits_state()
+        if self._generator is None:
+            fallback = random.Random.getrandbits
+            self._block = [fallback(self, 64) for _ in range(SCALAR_BLOCK)]
+        else:
+            self._block = self._generator.bit_generator.random_raw(SCALAR_BLOCK).tolist()
+        self._pos = 0
+    
+    # Toplu çekimler
+    def uniform_array(self, low: float, high: float, count: int) -> 'np.ndarray':
+        """count adet [low, high) float"""
+        return self.generator.uniform(low, high, count)
+    
+    def integers_array(self, low: int, high: int, count: int) -> 'np.ndarray':
+        """count adet [low, high) tamsayı"""
+        return self.generator.integers(low, high, count)
+    
+    def random_array(self, count: int) -> 'np.ndarray':
+        """count adet [0, 1) float"""
+        return self.generator.random(count)
+    
+    # Durum
+    def getstate(self) -> Dict[str, Any]:
+        """JSON uyumlu durum (anahtar seed ve akış adından yeniden türetilir)"""
+        return {
+            'bits': self._bits_state(),
+            'block': self._block_state,
+            'pos': self._pos,
+            'gauss_next': self.gauss_next,
+        }
+    
+    def setstate(self, state: Dict[str, Any]):
+        """getstate() çıktısını geri yükle: blok yeniden üretilir, sayaç sonra kurulur"""
+        if state['block'] is not None:
+            self._set_bits_state(state['block'])
+            self._refill()
+        else:
+            self._block, self._block_state = [], None
+        self._pos = state['pos']
+        self._set_bits_state(state['bits'])
+        self.gauss_next = state['gauss_next']
+    
+    def _bits_state(self):
+        """Bit üreticisinin durumu (Philox sayacı ya da yedek MT durumu)"""
+        if self._generator is None:
+            return _encode_random_state(random.Random.getstate(self))
+        state = self._generator.bit_generator.state
+        return {
+            'counter': [int(value) for value in state['state']['counter']],
+            'buffer': [int(value) for value in state['buffer']],
+            'buffer_pos': int(state['buffer_pos']),
+            'has_uint32': int(state['has_uint32']),
+            'uinteger': int(state['uinteger']),
+        }
+    
+    def _set_bits_state(self, data):
+        """_bits_state() tersi"""
+        if self._generator is None:
+            random.Random.setstate(self, _decode_random_state(data))
+            return
+        bit_generator = self._generator.bit_generator
+        state = bit_generator.state
+        state['state']['counter'] = np.array(data['counter'], dtype=np.uint64)
+        state['buffer'] = np.array(data['buffer'], dtype=np.uint64)
+        state['buffer_pos'] = data['buffer_pos']
+        state['has_uint32'] = data['has_uint32']
+        state['uinteger'] = data['uinteger']
+        bit_generator.state = state
+
+
+class WeightedTable:
+    """Önceden derlenmiş ağırlıklı seçim tablosu (Vose alias yöntemi)
+    
+    Kurulum O(n), çekim O(1): tek rastgele sayı bir sütun ve o sütundaki
+    eşiği belirler; eşiğin altı sütunun kendi öğesi, üstü alias öğesidir.
+    Ağırlıklar değişince (dakika, sahip olunan yetenekler) set_weights()
+    tabloyu yeniden kurar. Sıfır ağırlıklı öğeler tabloya girmez.
+    """
+    
+    def __init__(self, weights: Dict[Any, float]):
+        self.set_weights(weights)
+    
+    def set_weights(self, weights: Dict[Any, float]):
+        """Tabloyu yeni ağırlıklarla kur"""
+        items = [(item, float(weight)) for item, weight in weights.items() if weight > 0]
+        count = len(items)
+        self.items = [item for item, _ in items]
+        self._prob = [1.0] * count
+        self._alias = list(range(count))
+        self._arrays = None  # sample_many için NumPy kopyaları
+        if not count:
+            return
+        
+        total = sum(weight for _, weight in items)
+        scaled = [weight * count / total for _, weight in items]
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            self._prob[low] = scaled[low]
+            self._alias[low] = high
+            scaled[high] += scaled[low] - 1.0
+            (small if scaled[high] < 1.0 else large).append(high)
+        # Kalanlar (yuvarlama artığı) tam sütundur: olasılık 1.0
+    
+    def __len__(self) -> int:
+        return len(self.items)
+    
+    def sample(self, rng) -> Any:
+        """Tek öğe çek (rng: random.Random uyumlu; tablo boşsa None)"""
+        if not self.items:
+            return None
+        value = rng.random() * len(self.items)
+        index = int(value)
+        if value - index >= self._prob[index]:
+            index = self._alias[index]
+        return self.items[index]
+    
+    def sample_many(self, rng, count: int) -> List[Any]:
+        """count öğe çek; RNGStream ile tek toplu NumPy çekimi kullanılır"""
+        if not self.items or count <= 0:
+            return []
+        if np is None or not isinstance(rng, RNGStream):
+            return [self.sample(rng) for _ in range(count)]
+        
+        if self._arrays is None:
+            self._arrays = (np.array(self._prob), np.array(self._alias, dtype=np.int64))
+        prob, alias = self._arrays
+        value = rng.random_array(count) * len(self.items)
+        index = value.astype(np.int64)
+        index = np.where(value - index < prob[index], index, alias[index])
+        items = self.items
+        return [items[i] for i in index.tolist()]
+
 
 class GameRNG:
     """Oyun rastgele sayı üreticisi"""
     
     def __init__(self, seed: int = None):
-        self.seed = seed or self._generate_time_seed()
+        self.seed = (seed or self._generate_time_seed()) & MASK64
         self.random = random.Random(self.seed)
-        
+        self._streams: Dict[str, RNGStream] = {}
+        self._create_streams()
+    
     def _generate_time_seed(self) -> int:
         """Zamana dayalı seed üret"""
         return int(time.time() * 1000000) % (2**31)
@@ -26,9 +264,50 @@ class GameRNG:
         return self._generate_time_seed()
     
     def set_seed(self, seed: int):
-        """Seed'i değiştir"""
-        self.seed = seed
+        """Seed'i değiştir (64 bite maskelenir)"""
+        self.seed = seed & MASK64
         self.random = random.Random(seed)
+        self._streams.clear()
+        self._create_streams()
+    
+    def _create_streams(self):
+        """Bilinen akışlar baştan oluşur; durum anahtarları koşu boyunca sabit kalır"""
+        for name in STREAM_NAMES:
+            self.stream(name)
+    
+    def stream(self, name: str) -> RNGStream:
+        """Seed'den türetilen isimli bağımsız akış (ör. 'spawn', 'ai', 'fx')"""
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = RNGStream(self.seed, name)
+            self._streams[name] = stream
+        return stream
+    
+    def get_state(self) -> Dict[str, Any]:
+        """Simülasyon akışlarının durumu (replay keyframe'leri için)"""
+        streams = {name: stream for name, stream in self._streams.items()
+                   if name not in TRANSIENT_STREAMS}
+        return {
+            'seed': self.seed,
+            'main': _encode_random_state(self.random.getstate()),
+            'streams': {name: stream.getstate() for name, stream in streams.items()},
+        }
+    
+    def set_state(self, state: Dict[str, Any]):
+        """get_state() çıktısını geri yükle (akış nesneleri korunur)
+        
+        Durumda olmayan simülasyon akışları (durum alındıktan sonra
+        oluşanlar) başlangıç konumuna döner; geri sarılan replay'de
+        kayıttaki gibi ilk kez kullanılıyormuş gibi çeker.
+        """
+        self.seed = state['seed']
+        self.random.setstate(_decode_random_state(state['main']))
+        for name, stream in self._streams.items():
+            stream.rekey(self.seed)
+            if name not in state['streams'] and name not in TRANSIENT_STREAMS:
+                stream.reset()
+        for name, stream_state in state['streams'].items():
+            self.stream(name).setstate(stream_state)
     
     def random_float(self) -> float:
         """0.0 - 1.0 arası rastgele float"""
@@ -47,48 +326,51 @@ class GameRNG:
         return self.random.random() < probability
     
     def random_offscreen_position(self, screen_width: float, screen_height: float,
-                                margin: float = 100) -> Tuple[float, float]:
-        """Ekran dışında rastgele pozisyon"""
-        side = self.random.randint(0, 3)
+                                margin: float = 100,
+                                rng: Optional[random.Random] = None) -> Tuple[float, float]:
+        """Ekran dışında rastgele pozisyon (rng: çekilecek akış, yoksa ana üretici)"""
+        rng = rng or self.random
+        side = rng.randint(0, 3)
         
         if side == 0:  # Sol
             x = -margin
-            y = self.random.uniform(-margin, screen_height + margin)
+            y = rng.uniform(-margin, screen_height + margin)
         elif side == 1:  # Sağ
             x = screen_width + margin
-            y = self.random.uniform(-margin, screen_height + margin)
+            y = rng.uniform(-margin, screen_height + margin)
         elif side == 2:  # Üst
-            x = self.random.uniform(-margin, screen_width + margin)
+            x = rng.uniform(-margin, screen_width + margin)
             y = screen_height + margin
         else:  # Alt
-            x = self.random.uniform(-margin, screen_width + margin)
+            x = rng.uniform(-margin, screen_width + margin)
             y = -margin
-            
+        
         return (x, y)
     
-    def weighted_choice(self, choices: Dict[str, float]) -> str:
-        """Ağırlıklı rastgele seçim"""
+    def weighted_choice(self, choices) -> str:
+        """Ağırlıklı rastgele seçim (sık çekimlerde WeightedTable verin)"""
         if not choices:
             return None
-            
-        items = list(choices.items())
-        total_weight = sum(weight for _, weight in items)
         
-        if total_weight <= 0:
+        table = choices if isinstance(choices, WeightedTable) else WeightedTable(choices)
+        if not table:
             return self.random.choice(list(choices.keys()))
-        
-        r = self.random.uniform(0, total_weight)
-        cumulative = 0
-        
-        for item, weight in items:
-            cumulative += weight
-            if r <= cumulative:
-                return item
-                
-        return items[-1][0]
+        return table.sample(self.random)
     
     def random_choice(self, items: List[Any]) -> Any:
         """Listeden rastgele seç"""
         if not items:
             return None
-        return self.random.choice(items)
\ No newline at end of file
+        return self.random.choice(items)
+
+
+def _encode_random_state(state: Tuple) -> List:
+    """random.Random durumunu JSON uyumlu listeye çevir"""
+    version, internal, gauss_next = state
+    return [version, list(internal), gauss_next]
+
+
+def _decode_random_state(data: List) -> Tuple:
+    """_encode_random_state tersi"""
+    version, internal, gauss_next = data
+    return (version, tuple(internal), gauss_next)
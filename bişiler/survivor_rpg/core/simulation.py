@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Core/Simulation.py - Kivy'siz (headless) oyun simülasyonu
+
+Oyuncu, düşmanlar, mermiler, loot ve tüm oyun sistemleri burada
+güncellenir. Çizim ve ses bu modülü hiç import etmez; core.events
+üzerinden gözlemci olarak bağlanır. Böylece simülasyon CI veya batch
+işçilerinde ekran olmadan çalıştırılabilir.
+"""
+
+from dataclasses import asdict
+from functools import partial
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .state import GameState
+from .events import EventBus
+from .rng import GameRNG
+from .pool import ObjectPool
+from .timers import TimerWheel
+from entities.enhanced_player import EnhancedPlayer
+from entities.enhanced_enemies import EnhancedEnemy
+from entities.projectile import Projectile
+from entities.loot import LootOrb
+from systems.physics import PhysicsSystem
+from systems.spawn import SpawnSystem
+from systems.combat import CombatSystem
+from systems.movement import MovementSystem
+from systems.abilities import AbilitySystem
+from systems.spatial_hash import SpatialHash
+from systems.steering import SteeringSystem
+from systems.ai_lod import AILODSystem
+from systems.enemy_ai import EnemyAISystem
+
+
+class Simulation:
+    """Oyun mantığının tamamı (render ve ses hariç)"""
+    
+    def __init__(self, width: float = 800.0, height: float = 600.0,
+                 seed: Optional[int] = None):
+        # Dünya (ekran) boyutu - spawn sınırları için
+        self.width = float(width)
+        self.height = float(height)
+        
+        # Temel bileşenler
+        self.state = GameState()
+        self.rng = GameRNG(seed)
+        self.timers = TimerWheel()  # Oyun içi gecikmeli işler (simülasyon zamanıyla)
+        # Simülasyon başına olay bus'ı: replay/başsız koşular canlı oyunun gözlemcilerini tetiklemez
+        self.events = EventBus()
+        
+        # Varlık listeleri
+        self.player: Optional[EnhancedPlayer] = None
+        self.enemies: List[EnhancedEnemy] = []
+        self.projectiles: List[Projectile] = []
+        self.loot_orbs: List[LootOrb] = []
+        
+        # Düşman AI'ı düşman sütun deposunun sahibidir; havuz düşmanları bu depoda kurar
+        self.enemy_ai_system = EnemyAISystem()
+        
+        # Nesne havuzları (simülasyon başına; replay/başsız koşular canlı oyunla paylaşmaz)
+        self.enemy_pool = ObjectPool(partial(EnhancedEnemy, columns=self.enemy_ai_system.columns),
+                                     max_free=512)
+        self.projectile_pool = ObjectPool(Projectile, max_free=512)
+        self.loot_pool = ObjectPool(LootOrb, max_free=256)
+        
+        # Sistemler
+        self.physics_system = PhysicsSystem()
+        self.spawn_system = SpawnSystem(self.rng, self.enemy_pool)
+        self.combat_system = CombatSystem(self.loot_pool)
+        self.movement_system = MovementSystem()
+        self.ability_system = AbilitySystem(self.projectile_pool)
+        self.steering_system = SteeringSystem()
+        self.ai_lod_system = AILODSystem()
+        
+        # Tick başına bir kez kurulan ortak uzamsal indeksler
+        self.enemy_index = SpatialHash(cell_size=64.0)
+        self.loot_index = SpatialHash(cell_size=64.0)
+        
+        self.game_time = 0.0
+        self.tick = 0
+        
+        # Tick başına uygulanan hareket girişi (replay için nicemlenmiş)
+        self.movement_input: Tuple[float, float] = (0.0, 0.0)
+        
+        # Replay kaydedici (core.replay.ReplayRecorder) - isteğe bağlı
+        self.recorder = None
+        self.level_up_choices: List[Dict] = []
+        
+        # Kare profilleyici (core.profiler.FrameProfiler) - None ise ölçüm yok
+        self.profiler = None
+        
+        # Tick aşamaları (sırayla çalışır, profilleyici adlarıyla ölçer)
+        self._stages = [
+            ('timers', self._update_timers),
+            ('movement', self._update_movement),
+            ('spawn', self._update_spawn),
+            ('ai', self._update_ai),
+            ('abilities', self._update_abilities),
+            ('physics', self._update_physics),
+            ('combat', self._update_combat),
+            ('cleanup', self._update_cleanup),
+        ]
+        
+        # Havuzları önceden doldur (ilk dakikalarda tahsis takılması olmasın)
+        self.prewarm_pools()
+    
+    def prewarm_pools(self, enemies: int = 64, projectiles: int = 128, loot: int = 64):
+        """Nesne havuzlarını önceden doldur"""
+        self.enemy_pool.prewarm(enemies)
+        self.projectile_pool.prewarm(projectiles)
+        self.loot_pool.prewarm(loot)
+    
+    def get_pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """Havuz kapasite metrikleri"""
+        return {
+            'enemies': self.enemy_pool.get_stats(),
+            'projectiles': self.projectile_pool.get_stats(),
+            'loot': self.loot_pool.get_stats(),
+        }
+    
+    def start_run(self, seed: Optional[int] = None):
+        """Yeni koşu başlat"""
+        self.clear()
+        
+        self.game_time = 0.0
+        self.tick = 0
+        self.movement_input = (0.0, 0.0)
+        self.level_up_choices = []
+        self.spawn_system.spawn_timer = 0.0
+        
+        # Oyuncuyu oluştur
+        self.player = EnhancedPlayer()
+        self.player.events = self.events
+        self.player.pos = [self.width / 2, self.height / 2]
+        
+        # Oyun durumunu başlat (aynı seed + aynı girişler = aynı koşu)
+        if seed is None:
+            seed = self.rng.generate_seed()
+        self.rng.set_seed(seed)
+        self.state.start_new_run(self.rng.seed)
+        
+        if self.recorder:
+            self.recorder.begin(self)
+    
+    def resize(self, width: float, height: float):
+        """Dünya boyutunu güncelle"""
+        self.width = float(width)
+        self.height = float(height)
+    
+    def set_movement_input(self, input_vector: Tuple[float, float]):
+        """Joystick girişi (sonraki tick'lerde uygulanır)"""
+        self.movement_input = (self.quantize_axis(input_vector[0]),
+                               self.quantize_axis(input_vector[1]))
+    
+    @staticmethod
+    def quantize_axis(value: float) -> float:
+        """Eksen değerini 1/127 adımlara yuvarla (replay'de birebir saklanır)"""
+        value = max(-1.0, min(1.0, value))
+        return round(value * 127) / 127
+    
+    def step(self, dt: float):
+        """Simülasyonu dt kadar ilerlet (bir tick)"""
+        if self.recorder:
+            self.recorder.record_tick(self, dt)
+        
+        if self.player:
+            self.player.set_movement_input(self.movement_input)
+        
+        self._store_previous_positions()
+        
+        self.game_time += dt
+        self.state.game_time = self.game_time
+        self.state.current_run.current_time = self.game_time
+        
+        self._update_systems(dt)
+        self.tick += 1
+    
+    def _store_previous_positions(self):
+        """Çizim interpolasyonu için tick öncesi pozisyonları sakla"""
+        if self.player:
+            self.player.store_previous()
+        self.movement_system.store_previous(self.enemy_ai_system.columns, self.enemy_ai_system.slots)
+        for entity_list in (self.projectiles, self.loot_orbs):
+            for entity in entity_list:
+                entity.store_previous()
+    
+    def _update_systems(self, dt: float):
+        """Tüm sistemleri güncelle"""
+        profiler = self.profiler
+        if profiler is None:
+            for _, stage in self._stages:
+                stage(dt)
+            return
+        
+        # Profilleme açık: her aşamayı ayrı ölç
+        for name, stage in self._stages:
+            start = perf_counter()
+            stage(dt)
+            profiler.record(name, perf_counter() - start)
+    
+    def _update_timers(self, dt: float):
+        """Zamanı dolan zamanlayıcıları çalıştır"""
+        self.timers.advance(self.game_time)
+    
+    def _update_movement(self, dt: float):
+        """Hareket sistemi"""
+        self.movement_system.update(dt, self.player, self.enemies, self.projectiles,
+                                    self.enemy_ai_system.columns, self.enemy_ai_system.slots)
+    
+    def _update_spawn(self, dt: float):
+        """Spawn sistemi"""
+        new_enemies = self.spawn_system.update(dt, self.game_time, self.get_spawn_bounds())
+        self.ai_lod_system.register(new_enemies, len(self.enemies))
+        self.enemy_ai_system.add(new_enemies, self.game_time)
+        for enemy in new_enemies:
+            enemy.events = self.events
+        self.enemies.extend(new_enemies)
+        if new_enemies and self.events.has_listeners('enemy_spawned'):
+            for enemy in new_enemies:
+                self.events.emit('enemy_spawned', enemy)
+    
+    def _update_ai(self, dt: float):
+        """Düşman AI güncellemesi (uzaklık kademelerine göre)"""
+        if not (self.player and self.player.is_alive):
+            return
+        
+        player_pos = (self.player.center_x, self.player.center_y)
+        enemy_ai = self.enemy_ai_system
+        columns = enemy_ai.columns
+        
+        # Bu tick sırası gelenler (slotları); durum geçişleri tüm kademelerde çalışır
+        slots, distance, far = self.ai_lod_system.update(self.tick, columns,
+                                                         enemy_ai.living_slots(), player_pos)
+        enemy_ai.update_states(self.game_time, slots, distance, player_pos)
+        
+        # Çok uzak kademe düz çizgide yürür, kalanlar tam AI alır
+        if far is not None:
+            self.ai_lod_system.move_far(columns, slots[far], player_pos)
+            slots = slots[~far]
+        
+        # Toplu hareket hesaplama (seek + separation)
+        self.steering_system.update(columns, slots, player_pos)
+        
+        enemy_ai.update_specials(self.game_time, slots, player_pos, self.timers)
+    
+    def _update_abilities(self, dt: float):
+        """Yetenek sistemi (auto-fire)"""
+        if self.player:
+            new_projectiles = self.ability_system.update(dt, self.player, self.enemies)
+            self.projectiles.extend(new_projectiles)
+    
+    def _update_physics(self, dt: float):
+        """Uzamsal indeksler ve çarpışma tespiti"""
+        # Uzamsal indeksleri kur (tick başına bir kez; düşmanlar sütunlardan)
+        self.enemy_index.build_columns(self.enemies, self.enemy_ai_system.columns,
+                                       self.enemy_ai_system.slots)
+        self.loot_index.build(self.loot_orbs)
+        
+        self.physics_system.update(dt, self.player, self.enemies, self.projectiles, self.loot_orbs,
+                                   self.enemy_index, self.loot_index)
+        
+        run = self.state.current_run
+        run.add_damage_dealt(self.physics_system.damage_dealt)
+        run.add_damage_taken(self.physics_system.damage_taken)
+    
+    def _update_combat(self, dt: float):
+        """Savaş sistemi (hasar hesaplama)"""
+        owners = self.enemy_ai_system.columns.owners
+        dead_enemies = [owners[slot] for slot in self.enemy_ai_system.dead_slots()]
+        new_loot = self.combat_system.update(dt, self.player, dead_enemies, self.projectiles)
+        self.loot_orbs.extend(new_loot)
+    
+    def _update_cleanup(self, dt: float):
+        """Ölü varlıkları temizle"""
+        self._cleanup_dead_entities()
+    
+    def _cleanup_dead_entities(self):
+        """Ölü varlıkları temizle ve havuzlara geri ver"""
+        run = self.state.current_run
+        # Düşmanlar yalnızca ölen varsa taranır (ölüler sütunlardan bulunur)
+        if len(self.enemy_ai_system.dead_slots()):
+            self.enemies[:] = self._release_finished(self.enemies, self.enemy_pool, EnhancedEnemy.is_dead,
+                                                     lambda enemy: run.add_kill(enemy.enemy_type))
+            self.enemy_ai_system.set_active(self.enemies)
+        self.projectiles[:] = self._release_finished(self.projectiles, self.projectile_pool, Projectile.is_dead)
+        self.loot_orbs[:] = self._release_finished(self.loot_orbs, self.loot_pool, LootOrb.is_collected,
+                                                   lambda loot: run.add_xp(loot.xp_value))
+    
+    def _release_finished(self, entities: List, pool, is_finished, on_finished=None) -> List:
+        """Bitmiş varlıkları havuza ver (zamanlayıcıları iptal edilir), kalanları döndür"""
+        remaining = []
+        for entity in entities:
+            if is_finished(entity):
+                if on_finished is not None:
+                    on_finished(entity)
+                self.timers.cancel_owner(entity)
+                pool.release(entity)
+            else:
+                remaining.append(entity)
+        return remaining
+    
+    def get_spawn_bounds(self) -> Dict[str, float]:
+        """Spawn sınırlarını döndür"""
+        margin = 100
+        return {
+            'left': -margin,
+            'right': self.width + margin,
+            'top': self.height + margin,
+            'bottom': -margin,
+            'center_x': self.width / 2,
+            'center_y': self.height / 2
+        }
+    
+    # Level-up
+    def needs_level_up(self) -> bool:
+        """Level-up seçimi bekleniyor mu?"""
+        return bool(self.player and self.player.needs_level_up())
+    
+    def get_level_up_choices(self, count: int = 3) -> List[Dict]:
+        """Level-up için yetenek seçenekleri"""
+        self.level_up_choices = self.ability_system.get_random_abilities(
+            count, self.player.abilities, self.rng.stream('abilities'))
+        return self.level_up_choices
+    
+    def apply_level_up(self, ability: Dict):
+        """Seçilen yeteneği uygula ve level atla"""
+        if self.recorder:
+            index = next((i for i, choice in enumerate(self.level_up_choices)
+                          if choice is ability), 0)
+            self.recorder.record_level_up(self, index)
+        
+        self.player.add_ability(ability)
+        self._level_up_player()
+        self.level_up_choices = []
+    
+    def choose_level_up(self, index: int):
+        """Seçenek sırasına göre level atla (replay oynatma)"""
+        choices = self.get_level_up_choices(3)
+        if choices:
+            self.apply_level_up(choices[min(index, len(choices) - 1)])
+        else:
+            self._level_up_player()
+    
+    def _level_up_player(self):
+        """Oyuncuyu level atlat, koşu rekorunu güncelle"""
+        self.player.level_up()
+        run = self.state.current_run
+        run.highest_level = max(run.highest_level, self.player.level)
+    
+    def is_game_over(self) -> bool:
+        """Oyuncu öldü mü?"""
+        return bool(self.player and self.player.is_dead())
+    
+    # Anlık durum (replay keyframe'leri)
+    def get_state(self) -> Dict[str, Any]:
+        """Simülasyonun JSON uyumlu tam durumu"""
+        return {
+            'tick': self.tick,
+            'game_time': self.game_time,
+            'width': self.width,
+            'height': self.height,
+            'movement_input': list(self.movement_input),
+            'rng': self.rng.get_state(),
+            'timers': self.timers.get_state(self._entity_refs()),
+            'spawn': {
+                'spawn_timer': self.spawn_system.spawn_timer,
+                'spawn_interval': self.spawn_system.spawn_interval,
+                'wave_intensity': self.spawn_system.wave_intensity,
+            },
+            'run': asdict(self.state.current_run),
+            'player': self.player.get_state() if self.player else None,
+            'enemies': EnhancedEnemy.get_table(self.enemies, self.enemy_ai_system.columns,
+                                               self.enemy_ai_system.slots),
+            'projectiles': [projectile.get_state() for projectile in self.projectiles],
+            'loot_orbs': [loot.get_state() for loot in self.loot_orbs],
+        }
+    
+    def set_state(self, state: Dict[str, Any]):
+        """get_state() çıktısından simülasyonu geri kur"""
+        self.clear()
+        
+        self.tick = state['tick']
+        self.game_time = state['game_time']
+        self.state.game_time = self.game_time
+        self.width = state['width']
+        self.height = state['height']
+        self.movement_input = tuple(state['movement_input'])
+        self.level_up_choices = []
+        
+        for key, value in state['spawn'].items():
+            setattr(self.spawn_system, key, value)
+        for key, value in state['run'].items():
+            setattr(self.state.current_run, key, value)
+        
+        if state['player'] is not None:
+            self.player = EnhancedPlayer()
+            self.player.events = self.events
+            self.player.set_state(state['player'])
+        
+        # Düşmanlar sütun tablosundan toplu: reset/kurulum yok, sütunlara tek yazım
+        ai_rng = self.rng.stream('ai')
+        table = state['enemies']
+        columns = self.enemy_ai_system.columns
+        self.enemies.extend(self.enemy_pool.acquire_blank(
+            len(table['x']), partial(EnhancedEnemy.blank, columns)))
+        for enemy in self.enemies:
+            enemy.rng = ai_rng
+            enemy.events = self.events
+        EnhancedEnemy.set_table(self.enemies, columns, [enemy._slot for enemy in self.enemies], table)
+        self.enemy_ai_system.add(self.enemies)
+        for projectile_state in state['projectiles']:
+            projectile = self.projectile_pool.acquire()
+            projectile.set_state(projectile_state)
+            self.projectiles.append(projectile)
+        for loot_state in state['loot_orbs']:
+            loot = self.loot_pool.acquire()
+            loot.set_state(loot_state)
+            self.loot_orbs.append(loot)
+        
+        if 'timers' in state:
+            self.timers.set_state(state['timers'], self._resolve_entity_ref)
+        
+        # RNG en son: havuzdan alırken çekilen sayılar durumu bozmasın
+        self.rng.set_state(state['rng'])
+    
+    def _entity_refs(self):
+        """Zamanlayıcı sahibinin kalıcı referansı: varlık -> [liste adı, sıra]"""
+        refs = {id(self.player): ['player', 0]}
+        for name in ('enemies', 'projectiles', 'loot_orbs'):
+            for index, entity in enumerate(getattr(self, name)):
+                refs[id(entity)] = [name, index]
+        return lambda entity: refs[id(entity)]
+    
+    def _resolve_entity_ref(self, ref: List):
+        """_entity_refs tersi"""
+        name, index = ref
+        if name == 'player':
+            return self.player
+        return getattr(self, name)[index]
+    
+    def clear(self):
+        """Tüm varlıkları temizle"""
+        self.timers.clear()
+        self.enemy_pool.release_all(self.enemies)
+        self.projectile_pool.release_all(self.projectiles)
+        self.loot_pool.release_all(self.loot_orbs)
+        self.enemies.clear()
+        self.enemy_ai_system.set_active(self.enemies)
+        self.projectiles.clear()
+        self.loot_orbs.clear()
+        self.player = None
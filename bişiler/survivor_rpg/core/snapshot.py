@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Core/Snapshot.py - Koşu ortası anlık durum (askıya alma / devam)
+
+Simulation.get_state() çıktısı JSON yerine kompakt ikili biçimde saklanır;
+Android arka plandaki süreci öldürse bile koşu birebir geri kurulur.
+
+Dosya biçimi:
+    'SRSN', sürüm (1 bayt)
+    genel durum:   etiketli değer (oyuncu, yetenekler, RNG, spawn, süre ...)
+    varlık tablosu: (enemies, projectiles, loot_orbs sırasıyla)
+        'C' / 'D', satır sayısı, sütun sayısı, sütunlar...
+        sütun: ad, tür (1 bayt), veri
+
+Varlık tabloları sütun düzenindedir: şema (sütun adı + türü) değerlerden
+çıkarılıp dosyaya yazılır, çözücü yalnızca bu şemayı izler. Sayısal
+sütunlar struct ile tek parça paketlenir; tüm satırlarda aynı olan
+sütunlar bir kez saklanır. int / float ayrımı korunur, böylece geri
+kurulan durum özeti (replay.state_digest) özgünüyle aynıdır. Düşmanlar
+durumda zaten sütun sözlüğüdür (EnhancedEnemy.get_table); 'D' tablosu
+çözülürken de satırlara açılmaz.
+"""
+
+import struct
+from typing import Any, Dict, List, Tuple
+
+from services.atomic_file import write_atomic
+from .replay import _read_svarint, _read_uvarint, _write_svarint, _write_uvarint
+
+MAGIC = b'SRSN'
+VERSION = 3
+ENTITY_TABLES = ('enemies', 'projectiles', 'loot_orbs')
+
+# Tablo düzeni
+TABLE_COLUMNS = b'C'  # Tüm satırların alanları aynı
+TABLE_ROWS = b'R'     # Farklı alanlı satırlar: etiketli değer listesi
+TABLE_DICT = b'D'     # Sütun sözlüğü (ad -> değer listesi), öyle çözülür
+
+# Sütun türleri
+COL_CONST = b'c'    # Tüm satırlarda aynı değer
+COL_BOOL = b'?'
+COL_INT = b'q'
+COL_FLOAT = b'd'
+COL_NUMBER = b'n'   # int / float karışık: float64 + int maskesi
+COL_STRING = b's'   # Tekil dizgi tablosu + uint16 indeks
+COL_VECTOR = b'v'   # Sabit uzunluklu sayı listesi/demeti (None olabilir)
+COL_OBJECT = b'o'   # Diğer: satır başına etiketli değer
+
+INT64_RANGE = (-2 ** 63, 2 ** 63)
+EXACT_FLOAT_INT = 2 ** 53  # float64'te kayıpsız tamsayı sınırı
+NoneType = type(None)
+
+
+# Etiketli değerler (iç içe küçük yapılar)
+def _write_value(buffer: bytearray, value: Any):
+    """Değeri tür etiketiyle yaz"""
+    kind = type(value)
+    if value is None:
+        buffer += b'N'
+    elif kind is bool:
+        buffer += b'T' if value else b'F'
+    elif kind is int:
+        buffer += b'i'
+        _write_svarint(buffer, value)
+    elif kind is float:
+        buffer += b'd'
+        buffer += struct.pack('<d', value)
+    elif kind is str:
+        encoded = value.encode('utf-8')
+        buffer += b's'
+        _write_uvarint(buffer, len(encoded))
+        buffer += encoded
+    elif kind is list or kind is tuple:
+        if (len(value) >= 8 and all(type(item) is int for item in value) and
+                0 <= min(value) and max(value) < 2 ** 32):
+            # Uzun tamsayı dizisi (ör. RNG durumu): uint32 paket
+            buffer += b'A' if kind is list else b'B'
+            _write_uvarint(buffer, len(value))
+            buffer += struct.pack(f'<{len(value)}I', *value)
+        else:
+            buffer += b'l' if kind is list else b't'
+            _write_uvarint(buffer, len(value))
+            for item in value:
+                _write_value(buffer, item)
+    elif kind is dict:
+        buffer += b'm'
+        _write_uvarint(buffer, len(value))
+        for key, item in value.items():
+            _write_value(buffer, key)
+            _write_value(buffer, item)
+    else:
+        raise TypeError(f"Anlık durumda desteklenmeyen tür: {kind.__name__}")
+
+
+def _read_value(data: bytes, offset: int) -> Tuple[Any, int]:
+    """_write_value tersi, (değer, yeni offset) döndür"""
+    tag = data[offset:offset + 1]
+    offset += 1
+    if tag == b'N':
+        return None, offset
+    if tag == b'T':
+        return True, offset
+    if tag == b'F':
+        return False, offset
+    if tag == b'i':
+        return _read_svarint(data, offset)
+    if tag == b'd':
+        return struct.unpack_from('<d', data, offset)[0], offset + 8
+    if tag == b's':
+        length, offset = _read_uvarint(data, offset)
+        return data[offset:offset + length].decode('utf-8'), offset + length
+    if tag in (b'A', b'B'):
+        count, offset = _read_uvarint(data, offset)
+        items = struct.unpack_from(f'<{count}I', data, offset)
+        return (list(items) if tag == b'A' else items), offset + 4 * count
+    if tag in (b'l', b't'):
+        count, offset = _read_uvarint(data, offset)
+        items = []
+        for _ in range(count):
+            item, offset = _read_value(data, offset)
+            items.append(item)
+        return (items if tag == b'l' else tuple(items)), offset
+    if tag == b'm':
+        count, offset = _read_uvarint(data, offset)
+        result = {}
+        for _ in range(count):
+            key, offset = _read_value(data, offset)
+            result[key], offset = _read_value(data, offset)
+        return result, offset
+    raise ValueError(f"Bozuk anlık durum: bilinmeyen etiket {tag!r}")
+
+
+# Sütunlar
+def _is_number_column(values: List) -> bool:
+    """int/float karışık ve float64'e kayıpsız sığıyor mu?"""
+    return all(-EXACT_FLOAT_INT < value < EXACT_FLOAT_INT
+               for value in values if type(value) is int)
+
+
+def _column_type(values: List) -> bytes:
+    """Sütunun değerlerine uyan en kompakt tür"""
+    types = set(map(type, values))
+    if len(types) == 1 and types <= {bool, int, str}:
+        # float sabitleri paketlenince bit düzeyinde denetlenir (-0.0 != 0.0)
+        if values.count(values[0]) == len(values):
+            return COL_CONST
+    if types == {bool}:
+        return COL_BOOL
+    if types == {int}:
+        return COL_INT if INT64_RANGE[0] <= min(values) and max(values) < INT64_RANGE[1] \
+            else COL_OBJECT
+    if types == {float}:
+        return COL_FLOAT
+    if types == {int, float}:
+        return COL_NUMBER if _is_number_column(values) else COL_OBJECT
+    if types == {str}:
+        return COL_STRING
+    if types <= {list, tuple, NoneType}:
+        present = [value for value in values if value is not None]
+        if (present and len(set(map(type, present))) == 1 and
+                len(set(map(len, present))) == 1):
+            components = list(zip(*present))
+            if all(set(map(type, component)) <= {int, float} and _is_number_column(component)
+                   for component in components):
+                return COL_VECTOR
+    return COL_OBJECT
+
+
+def _pack_numbers(buffer: bytearray, values):
+    """float64 dizisi + hangi satırların int olduğu maskesi"""
+    buffer += struct.pack(f'<{len(values)}d', *values)
+    buffer += bytes(type(value) is int for value in values)
+
+
+def _unpack_numbers(data: bytes, offset: int, count: int) -> Tuple[List, int]:
+    floats = struct.unpack_from(f'<{count}d', data, offset)
+    offset += 8 * count
+    mask = data[offset:offset + count]
+    values = [int(value) if is_int else value for value, is_int in zip(floats, mask)]
+    return values, offset + count
+
+
+def _write_column(buffer: bytearray, name: str, values: List):
+    """Sütun: ad, tür, veri"""
+    column_type = _column_type(values)
+    count = len(values)
+    packed = None
+    if column_type == COL_FLOAT:
+        packed = struct.pack(f'<{count}d', *values)
+        if packed == packed[:8] * count:
+            column_type = COL_CONST
+    
+    encoded_name = name.encode('utf-8')
+    _write_uvarint(buffer, len(encoded_name))
+    buffer += encoded_name
+    buffer += column_type
+    
+    if column_type == COL_CONST:
+        _write_value(buffer, values[0])
+    elif column_type == COL_BOOL:
+        buffer += bytes(values)
+    elif column_type == COL_INT:
+        buffer += struct.pack(f'<{count}q', *values)
+    elif column_type == COL_FLOAT:
+        buffer += packed
+    elif column_type == COL_NUMBER:
+        _pack_numbers(buffer, values)
+    elif column_type == COL_STRING:
+        table = list(dict.fromkeys(values))
+        _write_value(buffer, table)
+        index = {value: i for i, value in enumerate(table)}
+        buffer += struct.pack(f'<{count}H', *[index[value] for value in values])
+    elif column_type == COL_VECTOR:
+        present = [value for value in values if value is not None]
+        buffer += b'l' if type(present[0]) is list else b't'
+        _write_uvarint(buffer, len(present[0]))
+        buffer += bytes(value is not None for value in values)
+        for component in zip(*present):
+            _pack_numbers(buffer, component)
+    else:
+        for value in values:
+            _write_value(buffer, value)
+
+
+def _read_column(data: bytes, offset: int, count: int) -> Tuple[str, List, int]:
+    """_write_column tersi, (ad, değerler, yeni offset) döndür"""
+    length, offset = _read_uvarint(data, offset)
+    name = data[offset:offset + length].decode('utf-8')
+    offset += length
+    column_type = data[offset:offset + 1]
+    offset += 1
+    
+    if column_type == COL_CONST:
+        value, offset = _read_value(data, offset)
+        return name, [value] * count, offset
+    if column_type == COL_BOOL:
+        return name, [bool(value) for value in data[offset:offset + count]], offset + count
+    if column_type in (COL_INT, COL_FLOAT):
+        code = column_type.decode('ascii')
+        values = list(struct.unpack_from(f'<{count}{code}', data, offset))
+        return name, values, offset + 8 * count
+    if column_type == COL_NUMBER:
+        values, offset = _unpack_numbers(data, offset, count)
+        return name, values, offset
+    if column_type == COL_STRING:
+        table, offset = _read_value(data, offset)
+        indices = struct.unpack_from(f'<{count}H', data, offset)
+        return name, [table[i] for i in indices], offset + 2 * count
+    if column_type == COL_VECTOR:
+        container = list if data[offset:offset + 1] == b'l' else tuple
+        width, offset = _read_uvarint(data, offset + 1)
+        mask = data[offset:offset + count]
+        offset += count
+        present = sum(mask)
+        components = []
+        for _ in range(width):
+            component, offset = _unpack_numbers(data, offset, present)
+            components.append(component)
+        rows = iter(zip(*components))
+        return name, [container(next(rows)) if is_present else None for is_present in mask], offset
+    if column_type == COL_OBJECT:
+        values = []
+        for _ in range(count):
+            value, offset = _read_value(data, offset)
+            values.append(value)
+        return name, values, offset
+    raise ValueError(f"Bozuk anlık durum: bilinmeyen sütun türü {column_type!r}")
+
+
+def _write_table(buffer: bytearray, rows):
+    """Varlık tablosu: sütun sözlüğü ya da satırlar (alanları aynıysa sütun düzeninde)"""
+    if type(rows) is dict:
+        buffer += TABLE_DICT
+        columns = rows
+        count = len(next(iter(columns.values()))) if columns else 0
+    else:
+        keys = rows[0].keys() if rows else {}.keys()
+        if any(row.keys() != keys for row in rows):
+            buffer += TABLE_ROWS
+            _write_value(buffer, rows)
+            return
+        buffer += TABLE_COLUMNS
+        columns = {name: [row[name] for row in rows] for name in keys}
+        count = len(rows)
+    
+    _write_uvarint(buffer, count)
+    _write_uvarint(buffer, len(columns))
+    for name, values in columns.items():
+        _write_column(buffer, name, values)
+
+
+def _read_table(data: bytes, offset: int) -> Tuple[Any, int]:
+    layout = data[offset:offset + 1]
+    offset += 1
+    if layout == TABLE_ROWS:
+        return _read_value(data, offset)
+    if layout not in (TABLE_COLUMNS, TABLE_DICT):
+        raise ValueError(f"Bozuk anlık durum: bilinmeyen tablo düzeni {layout!r}")
+    
+    count, offset = _read_uvarint(data, offset)
+    column_count, offset = _read_uvarint(data, offset)
+    names, columns = [], []
+    for _ in range(column_count):
+        name, values, offset = _read_column(data, offset, count)
+        names.append(name)
+        columns.append(values)
+    if layout == TABLE_DICT:
+        return dict(zip(names, columns)), offset
+    if not columns:
+        return [{} for _ in range(count)], offset
+    return [dict(zip(names, row)) for row in zip(*columns)], offset
+
+
+# Genel API
+def encode_state(state: Dict[str, Any]) -> bytes:
+    """Simulation.get_state() çıktısını ikili biçime çevir"""
+    buffer = bytearray(MAGIC)
+    buffer.append(VERSION)
+    _write_value(buffer, {key: value for key, value in state.items() if key not in ENTITY_TABLES})
+    for table in ENTITY_TABLES:
+        _write_table(buffer, state[table])
+    return bytes(buffer)
+
+
+def decode_state(data: bytes) -> Dict[str, Any]:
+    """encode_state() çıktısını çöz"""
+    if data[:4] != MAGIC:
+        raise ValueError("Geçersiz anlık durum dosyası")
+    if data[4] != VERSION:
+        raise ValueError(f"Desteklenmeyen anlık durum sürümü: {data[4]}")
+    state, offset = _read_value(data, 5)
+    for table in ENTITY_TABLES:
+        state[table], offset = _read_table(data, offset)
+    return state
+
+
+def save_snapshot(path: str, simulation):
+    """Simülasyonu dosyaya atomik yaz (geçici dosya + fsync + os.replace)"""
+    write_atomic(path, encode_state(simulation.get_state()))
+
+
+def load_snapshot(path: str, simulation):
+    """Dosyadaki anlık durumu simülasyona geri kur"""
+    with open(path, 'rb') as f:
+        simulation.set_state(decode_state(f.read()))
@@ -103,6 +103,7 @@ class RunStats:
     
     # İstatistikler
     enemies_killed: int = 0
+    kills_by_type: Dict[str, int] = field(default_factory=dict)
     damage_dealt: float = 0.0
     damage_taken: float = 0.0
     xp_gained: float = 0.0
@@ -119,6 +120,8 @@ class RunStats:
     def add_kill(self, enemy_type: str = None):
         """Düşman öldürme sayacı"""
         self.enemies_killed += 1
+        if enemy_type is not None:
+            self.kills_by_type[enemy_type] = self.kills_by_type.get(enemy_type, 0) + 1
     
     def add_damage_dealt(self, amount: float):
         """Verilen hasar sayacı"""
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Core/Telemetry.py - Koşu olaylarının sütun düzeninde kaydı
+
+TelemetryRecorder olay sistemine gözlemci olarak bağlanır ve spawn,
+öldürme, hasar, level-up ve toplama olaylarını olay türü başına önceden
+ayrılmış NumPy kayıt tamponlarına yazar (olay başına tek satır ataması).
+Dolan tampon tek blok olarak dosyaya eklenir; dosya sütun düzenindedir,
+load_telemetry() her sütunu NumPy dizisi olarak döndürür.
+
+Dosya biçimi:
+    'SRTM', sürüm (1 bayt)
+    şema: olay türü sayısı, her tür için ad + sütunlar (ad, NumPy dtype)
+    bloklar (dosya sonuna kadar):
+        'S', kod, dizgi                      dizgi tablosuna ekleme
+        'E', olay türü indeksi, satır sayısı, sütunlar (ham little-endian)
+
+Düşman/loot türleri dizgi tablosu kodu (uint16) olarak saklanır. Oyuncunun
+aynı tick'te aldığı hasarlar (temas eden her düşmandan) tek satırda
+toplanır. Çökme sırasında yarım kalmış son blok yüklemede atlanır.
+"""
+
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .replay import _read_uvarint, _write_uvarint
+
+MAGIC = b'SRTM'
+VERSION = 1
+
+BLOCK_STRING = b'S'
+BLOCK_EVENTS = b'E'
+
+PLAYER_TARGET = 'player'  # damage.target: oyuncu (diğerleri düşman türü)
+
+# Olay türü -> sütunlar
+EVENT_SCHEMAS = {
+    'spawn': [('tick', '<u4'), ('enemy_type', '<u2'), ('x', '<f4'), ('y', '<f4')],
+    'kill': [('tick', '<u4'), ('enemy_type', '<u2'), ('x', '<f4'), ('y', '<f4')],
+    'damage': [('tick', '<u4'), ('target', '<u2'), ('amount', '<f4')],
+    'level_up': [('tick', '<u4'), ('level', '<u2')],
+    'pickup': [('tick', '<u4'), ('loot_type', '<u2'), ('value', '<f4')],
+}
+
+Columns = Dict[str, Dict[str, np.ndarray]]
+
+
+def _write_text(buffer: bytearray, text: str):
+    encoded = text.encode('utf-8')
+    _write_uvarint(buffer, len(encoded))
+    buffer += encoded
+
+
+def _read_text(data: bytes, offset: int) -> Tuple[str, int]:
+    length, offset = _read_uvarint(data, offset)
+    if offset + length > len(data):
+        raise ValueError("Telemetri dosyası eksik")
+    return data[offset:offset + length].decode('utf-8'), offset + length
+
+
+def _encode_header() -> bytes:
+    buffer = bytearray(MAGIC)
+    buffer.append(VERSION)
+    _write_uvarint(buffer, len(EVENT_SCHEMAS))
+    for event, columns in EVENT_SCHEMAS.items():
+        _write_text(buffer, event)
+        _write_uvarint(buffer, len(columns))
+        for name, dtype in columns:
+            _write_text(buffer, name)
+            _write_text(buffer, dtype)
+    return bytes(buffer)
+
+
+def _scan(data: bytes) -> Tuple[Columns, List[str], int]:
+    """Dosyayı çöz: (olay -> sütun -> dizi, dizgi tablosu, geçerli son konum)"""
+    if data[:4] != MAGIC:
+        raise ValueError("Geçersiz telemetri dosyası")
+    if data[4] != VERSION:
+        raise ValueError(f"Desteklenmeyen telemetri sürümü: {data[4]}")
+    
+    offset = 5
+    schemas = []
+    count, offset = _read_uvarint(data, offset)
+    for _ in range(count):
+        event, offset = _read_text(data, offset)
+        column_count, offset = _read_uvarint(data, offset)
+        columns = []
+        for _ in range(column_count):
+            name, offset = _read_text(data, offset)
+            dtype, offset = _read_text(data, offset)
+            columns.append((name, np.dtype(dtype)))
+        schemas.append((event, columns))
+    
+    chunks = {event: {name: [] for name, _ in columns} for event, columns in schemas}
+    strings: List[str] = []
+    valid_end = offset
+    try:
+        while offset < len(data):
+            kind = data[offset:offset + 1]
+            offset += 1
+            if kind == BLOCK_STRING:
+                code, offset = _read_uvarint(data, offset)
+                text, offset = _read_text(data, offset)
+                strings[len(strings):] = [''] * (code + 1 - len(strings))
+                strings[code] = text
+            elif kind == BLOCK_EVENTS:
+                index, offset = _read_uvarint(data, offset)
+                rows, offset = _read_uvarint(data, offset)
+                event, columns = schemas[index]
+                block = []
+                for name, dtype in columns:
+                    size = rows * dtype.itemsize
+                    if offset + size > len(data):
+                        raise ValueError("Telemetri dosyası eksik")
+                    block.append((name, np.frombuffer(data, dtype, rows, offset)))
+                    offset += size
+                for name, values in block:
+                    chunks[event][name].append(values)
+            else:
+                raise ValueError(f"Bilinmeyen telemetri bloğu: {kind!r}")
+            valid_end = offset
+    except (ValueError, IndexError):
+        pass  # Yarım kalmış son blok
+    
+    columns_by_event = {}
+    for event, columns in schemas:
+        columns_by_event[event] = {
+            name: np.concatenate(chunks[event][name]) if chunks[event][name]
+            else np.zeros(0, dtype) for name, dtype in columns}
+    return columns_by_event, strings, valid_end
+
+
+def load_telemetry(path: str) -> Tuple[Columns, List[str]]:
+    """Telemetri dosyası -> (olay -> sütun -> NumPy dizisi, dizgi tablosu)
+    
+    Tür sütunları (enemy_type, target, loot_type) dizgi tablosu indeksidir:
+    strings[code].
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    columns, strings, _ = _scan(data)
+    return columns, strings
+
+
+class TelemetryRecorder:
+    """Olayları tür başına sabit kapasiteli tamponlarda biriktirip dosyaya ekler"""
+    
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self.events = list(EVENT_SCHEMAS)
+        self.buffers = {event: np.zeros(capacity, dtype=np.dtype(columns))
+                        for event, columns in EVENT_SCHEMAS.items()}
+        self.counts = dict.fromkeys(EVENT_SCHEMAS, 0)
+        
+        self.strings: Dict[str, int] = {}
+        self._pending = bytearray()  # Henüz yazılmamış dizgi tablosu blokları
+        self._file = None
+        self.simulation = None  # Kayıt yalnızca begin() ile close() arasında
+        
+        # İstatistikler
+        self.recorded = 0
+        self.blocks = 0
+        self.bytes_written = 0
+    
+    def attach(self, event_bus):
+        """Simülasyon olaylarına gözlemci olarak abone ol"""
+        event_bus.subscribe('enemy_spawned', self._on_enemy_spawned)
+        event_bus.subscribe('enemy_killed', self._on_enemy_killed)
+        event_bus.subscribe('enemy_damaged', self._on_enemy_damaged)
+        event_bus.subscribe('player_damaged', self._on_player_damaged)
+        event_bus.subscribe('player_level_up', self._on_player_level_up)
+        event_bus.subscribe('loot_collected', self._on_loot_collected)
+    
+    # Kayıt oturumu
+    def begin(self, simulation, path: str, append: bool = False):
+        """Simülasyonun olaylarını path'e kaydetmeye başla
+        
+        append: devam ettirilen koşu; mevcut dosyanın sonuna eklenir.
+        """
+        self.close()
+        self.strings = {}
+        self._pending = bytearray()
+        
+        data = b''
+        if append and os.path.exists(path):
+            with open(path, 'rb') as f:
+                data = f.read()
+        if data:
+            # Dizgi kodları sürsün; yarım kalmış son blok kesilir
+            _, strings, valid_end = _scan(data)
+            self.strings = {text: code for code, text in enumerate(strings)}
+            self._file = open(path, 'r+b')
+            self._file.truncate(valid_end)
+            self._file.seek(valid_end)
+        else:
+            self._file = open(path, 'wb')
+            self._file.write(_encode_header())
+        self.simulation = simulation
+    
+    def flush(self):
+        """Tampondaki tüm olayları dosyaya yaz"""
+        if self._file is None:
+            return
+        for event in self.events:
+            if self.counts[event]:
+                self._write_block(event)
+        self._file.flush()
+    
+    def close(self):
+        """Kalanları yaz ve dosyayı kapat"""
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+        self.simulation = None
+    
+    # Sıcak yol
+    def _code(self, text: str) -> int:
+        """Dizginin tablo kodu (ilk görülüşte eklenir)"""
+        code = self.strings.get(text)
+        if code is None:
+            code = self.strings[text] = len(self.strings)
+            self._pending += BLOCK_STRING
+            _write_uvarint(self._pending, code)
+            _write_text(self._pending, text)
+        return code
+    
+    def _append(self, event: str, row: tuple):
+        """Satırı tampona ekle; dolunca blok olarak yaz"""
+        count = self.counts[event]
+        self.buffers[event][count] = row
+        self.counts[event] = count + 1
+        self.recorded += 1
+        if count + 1 == self.capacity:
+            self._write_block(event)
+    
+    def _write_block(self, event: str):
+        """Tamponu sütun sütun tek blok olarak dosyaya ekle"""
+        count = self.counts[event]
+        rows = self.buffers[event][:count]
+        header = self._pending + BLOCK_EVENTS
+        self._pending = bytearray()
+        _write_uvarint(header, self.events.index(event))
+        _write_uvarint(header, count)
+        parts = [bytes(header)] + [rows[name].tobytes() for name in rows.dtype.names]
+        self._file.writelines(parts)
+        self.counts[event] = 0
+        self.blocks += 1
+        self.bytes_written += sum(len(part) for part in parts)
+    
+    # Olay gözlemcileri
+    def _on_enemy_spawned(self, enemy):
+        if self.simulation is not None:
+            x, y = enemy.get_center()
+            self._append('spawn', (self.simulation.tick, self._code(enemy.enemy_type), x, y))
+    
+    def _on_enemy_killed(self, enemy):
+        if self.simulation is not None:
+            x, y = enemy.get_center()
+            self._append('kill', (self.simulation.tick, self._code(enemy.enemy_type), x, y))
+    
+    def _on_enemy_damaged(self, enemy, amount, audible):
+        if self.simulation is not None:
+            self._append('damage', (self.simulation.tick, self._code(enemy.enemy_type), amount))
+    
+    def _on_player_damaged(self, player, amount):
+        if self.simulation is None:
+            return
+        tick = self.simulation.tick
+        target = self._code(PLAYER_TARGET)
+        count = self.counts['damage']
+        if count:
+            # Aynı tick'in oyuncu hasarı zaten tampondaysa üstüne ekle
+            last = self.buffers['damage'][count - 1]
+            if last['tick'] == tick and last['target'] == target:
+                last['amount'] += amount
+                return
+        self._append('damage', (tick, target, amount))
+    
+    def _on_player_level_up(self, player):
+        if self.simulation is not None:
+            self._append('level_up', (self.simulation.tick, player.level))
+    
+    def _on_loot_collected(self, player, loot_value, loot_type):
+        if self.simulation is not None:
+            self._append('pickup', (self.simulation.tick, self._code(loot_type), loot_value))
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Sayaçlar"""
+        return {
+            'recorded': self.recorded,
+            'buffered': sum(self.counts.values()),
+            'blocks': self.blocks,
+            'bytes_written': self.bytes_written,
+        }
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Core/Timers.py - Simülasyon zamanıyla ilerleyen hiyerarşik zamanlayıcı çarkı
+
+Oyun içi gecikmeli işler (özel yetenek süreleri, durum etkileri,
+bekleme süreleri) Kivy Clock yerine burada kurulur. Çark simülasyonun
+sahipliğindedir ve yalnızca Simulation.step() ile ilerler; oyun
+duraklatıldığında ya da level-up beklerken zamanlayıcılar da durur.
+
+Zamanlayıcılar kapanış (closure) değil (sahip, metot adı, argümanlar)
+üçlüsüdür: sahip varlık havuza dönünce cancel_owner() ile toplu iptal
+edilir, get_state() ile replay keyframe'lerine ve anlık duruma yazılır.
+Sahipsiz zamanlayıcılar handlers sözlüğüne kayıtlı işleyicileri çağırır.
+
+Yapı: 4 seviye x 64 yuva (seviye L'de yuva genişliği 64^L tick).
+Kurma ve iptal O(1); her tick yalnızca bir yuva işlenir, üst
+seviyelerdeki yuvalar sırası gelince alt seviyeye dağıtılır (cascade).
+Aynı tick'te dolan zamanlayıcılar kurulma sırasıyla (seq) çalışır,
+böylece sonuç çarkın iç yerleşiminden bağımsız ve deterministiktir.
+"""
+
+import math
+from typing import Any, Callable, Dict, Optional
+
+WHEEL_BITS = 6
+WHEEL_SIZE = 1 << WHEEL_BITS
+WHEEL_MASK = WHEEL_SIZE - 1
+WHEEL_LEVELS = 4
+WHEEL_SPAN = 1 << (WHEEL_BITS * WHEEL_LEVELS)  # Çarkın kapsadığı tick sayısı
+
+
+class Timer:
+    """Kurulu zamanlayıcı (iptal için tutamaç)"""
+    
+    __slots__ = ('deadline', 'seq', 'owner', 'action', 'args', '_slot')
+    
+    def __init__(self, deadline: int, seq: int, owner: Any, action: str, args: tuple):
+        self.deadline = deadline  # Dolacağı çark tick'i
+        self.seq = seq
+        self.owner = owner
+        self.action = action
+        self.args = args
+        self._slot: Optional[Dict[int, 'Timer']] = None  # Bulunduğu yuva
+    
+    @property
+    def active(self) -> bool:
+        """Henüz dolmadı ve iptal edilmedi mi?"""
+        return self._slot is not None
+
+
+class TimerWheel:
+    """Hiyerarşik zamanlayıcı çarkı"""
+    
+    def __init__(self, resolution: float = 1 / 60.0):
+        self.resolution = resolution  # Bir çark tick'i (saniye)
+        self.handlers: Dict[str, Callable] = {}  # Sahipsiz zamanlayıcı işleyicileri
+        self.clear()
+    
+    def clear(self):
+        """Tüm zamanlayıcıları at, çarkı sıfırla"""
+        self._levels = [[{} for _ in range(WHEEL_SIZE)] for _ in range(WHEEL_LEVELS)]
+        self._overflow: Dict[int, Timer] = {}
+        self._owned: Dict[int, Dict[int, Timer]] = {}  # id(sahip) -> {seq: zamanlayıcı}
+        self._next_tick = 1  # Sıradaki işlenecek tick (0 = başlangıç anı)
+        self._seq = 0
+        self.count = 0
+        self.fired = 0  # Son advance'te çalışanlar
+    
+    @property
+    def now(self) -> float:
+        """Çarkın işlediği son an (saniye)"""
+        return (self._next_tick - 1) * self.resolution
+    
+    # Kurma / iptal
+    def schedule(self, delay: float, owner: Any, action: str, *args) -> Timer:
+        """delay saniye sonra owner.action(*args) çağır
+        
+        owner None ise handlers[action](*args) çağrılır. Argümanlar
+        anlık duruma yazıldığı için JSON uyumlu olmalıdır.
+        """
+        ticks = max(1, math.ceil(delay / self.resolution - 1e-6))
+        return self._add(self._next_tick - 1 + ticks, self._seq, owner, action, args)
+    
+    def _add(self, deadline: int, seq: int, owner: Any, action: str, args: tuple) -> Timer:
+        timer = Timer(deadline, seq, owner, action, args)
+        self._seq = max(self._seq, seq + 1)
+        self._place(timer)
+        if owner is not None:
+            self._owned.setdefault(id(owner), {})[seq] = timer
+        self.count += 1
+        return timer
+    
+    def _place(self, timer: Timer):
+        """Zamanlayıcıyı kalan süresine göre yuvasına koy"""
+        deadline = timer.deadline
+        remaining = deadline - self._next_tick
+        if remaining < 0:
+            slot = self._levels[0][self._next_tick & WHEEL_MASK]
+        elif remaining >= WHEEL_SPAN:
+            slot = self._overflow
+        else:
+            level = 0
+            while remaining >= 1 << (WHEEL_BITS * (level + 1)):
+                level += 1
+            slot = self._levels[level][(deadline >> (WHEEL_BITS * level)) & WHEEL_MASK]
+        slot[timer.seq] = timer
+        timer._slot = slot
+    
+    def cancel(self, timer: Timer) -> bool:
+        """Zamanlayıcıyı iptal et (zaten dolduysa False)"""
+        if timer._slot is None:
+            return False
+        del timer._slot[timer.seq]
+        timer._slot = None
+        self._forget(timer)
+        return True
+    
+    def cancel_owner(self, owner: Any, action: Optional[str] = None) -> int:
+        """Sahibin (istenirse yalnızca action adlı) zamanlayıcılarını iptal et"""
+        owned = self._owned.get(id(owner))
+        if not owned:
+            return 0
+        timers = [timer for timer in owned.values() if action is None or timer.action == action]
+        for timer in timers:
+            self.cancel(timer)
+        return len(timers)
+    
+    def _forget(self, timer: Timer):
+        """Sayaç ve sahip indeksinden çıkar"""
+        self.count -= 1
+        if timer.owner is not None:
+            owned = self._owned[id(timer.owner)]
+            del owned[timer.seq]
+            if not owned:
+                del self._owned[id(timer.owner)]
+    
+    # İlerletme
+    def advance(self, now: float):
+        """now anına kadar dolan zamanlayıcıları çalıştır"""
+        self.fired = 0
+        target = int(now / self.resolution + 1e-6)
+        while self._next_tick <= target:
+            self._run_tick()
+    
+    def _run_tick(self):
+        """Sıradaki tick'in yuvasını işle"""
+        tick = self._next_tick
+        
+        # Alt seviye tur attıysa üst seviyenin sıradaki yuvasını aşağı dağıt
+        level = 1
+        while level < WHEEL_LEVELS and (tick >> (WHEEL_BITS * (level - 1))) & WHEEL_MASK == 0:
+            self._cascade(self._levels[level][(tick >> (WHEEL_BITS * level)) & WHEEL_MASK])
+            level += 1
+        if tick & (WHEEL_SPAN - 1) == 0 and self._overflow:
+            self._cascade(self._overflow)
+        
+        slot = self._levels[0][tick & WHEEL_MASK]
+        self._next_tick = tick + 1  # Çalışırken kurulanlar sonraki tick'lere düşer
+        if not slot:
+            return
+        
+        for timer in sorted(slot.values(), key=lambda timer: timer.seq):
+            if timer._slot is not slot:
+                continue  # Aynı tick'te daha önce çalışan bir işleyici iptal etti
+            del slot[timer.seq]
+            timer._slot = None
+            self._forget(timer)
+            self._fire(timer)
+            self.fired += 1
+    
+    def _cascade(self, slot: Dict[int, Timer]):
+        """Üst seviye yuvasını kalan sürelere göre yeniden yerleştir"""
+        if not slot:
+            return
+        timers = list(slot.values())
+        slot.clear()
+        for timer in timers:
+            self._place(timer)
+    
+    def _fire(self, timer: Timer):
+        if timer.owner is not None:
+            getattr(timer.owner, timer.action)(*timer.args)
+        else:
+            self.handlers[timer.action](*timer.args)
+    
+    def _iter_timers(self):
+        for levels in self._levels:
+            for slot in levels:
+                yield from slot.values()
+        yield from self._overflow.values()
+    
+    # Anlık durum
+    def get_state(self, owner_ref: Callable[[Any], Any]) -> Dict[str, Any]:
+        """JSON uyumlu durum; owner_ref sahibi kalıcı referansa çevirir"""
+        timers = sorted(self._iter_timers(), key=lambda timer: timer.seq)
+        return {
+            'next_tick': self._next_tick,
+            'seq': self._seq,
+            'timers': [[timer.deadline, timer.seq,
+                        None if timer.owner is None else owner_ref(timer.owner),
+                        timer.action, list(timer.args)] for timer in timers],
+        }
+    
+    def set_state(self, state: Dict[str, Any], resolve_owner: Callable[[Any], Any]):
+        """get_state() çıktısını geri kur; resolve_owner referansı sahibe çevirir"""
+        self.clear()
+        self._next_tick = state['next_tick']
+        for deadline, seq, ref, action, args in state['timers']:
+            owner = None if ref is None else resolve_owner(ref)
+            self._add(deadline, seq, owner, action, tuple(args))
+        self._seq = state['seq']
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Kurulu zamanlayıcı sayısı ve son advance'te çalışanlar"""
+        return {
+            'active': self.count,
+            'owners': len(self._owned),
+            'fired': self.fired,
+        }
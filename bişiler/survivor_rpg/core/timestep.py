@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Core/Timestep.py - Sabit adımlı simülasyon zamanlayıcısı
+
+Kivy Clock'un verdiği değişken dt bir biriktiricide (accumulator) toplanır
+ve simülasyon her zaman aynı adımla ilerletilir. Yavaş karelerde büyük
+adımlar (tünelleme, AI titremesi) oluşmaz, koşular tekrarlanabilir olur.
+Kalan kesir (alpha) çizimde önceki ve şimdiki durum arasında
+interpolasyon için kullanılır.
+"""
+
+
+class FixedTimestep:
+    """Biriktiricili sabit adım zamanlayıcısı"""
+    
+    def __init__(self, rate: float = 60.0, max_steps: int = 5):
+        self.rate = rate
+        self.step_dt = 1.0 / rate
+        self.max_steps = max_steps  # Bir karede en fazla yakalama adımı
+        self.accumulator = 0.0
+        
+        # İstatistikler
+        self.total_steps = 0
+        self.dropped_time = 0.0  # Yakalanamayıp atılan süre
+    
+    def set_rate(self, rate: float):
+        """Simülasyon frekansını değiştir (Hz)"""
+        self.rate = rate
+        self.step_dt = 1.0 / rate
+        self.accumulator = min(self.accumulator, self.step_dt)
+    
+    def advance(self, frame_dt: float) -> int:
+        """Kare süresini ekle, atılması gereken adım sayısını döndür"""
+        self.accumulator += max(0.0, frame_dt)
+        
+        # Küçük epsilon: kayan nokta hatası yüzünden adım kaçmasın
+        steps = int(self.accumulator / self.step_dt + 1e-9)
+        if steps > self.max_steps:
+            # Spiral of death koruması: fazlasını at, kesri koru
+            excess = (steps - self.max_steps) * self.step_dt
+            self.dropped_time += excess
+            self.accumulator -= excess
+            steps = self.max_steps
+        
+        self.accumulator -= steps * self.step_dt
+        self.total_steps += steps
+        return steps
+    
+    @property
+    def alpha(self) -> float:
+        """Çizim interpolasyonu için [0, 1) kesir"""
+        return min(1.0, max(0.0, self.accumulator / self.step_dt))
+    
+    def reset(self):
+        """Biriktiriciyi boşalt (pause/level-up dönüşü)"""
+        self.accumulator = 0.0
@@ -2,36 +2,143 @@
 # -*- coding: utf-8 -*-
 """
 Entities/Base.py - Temel varlık sınıfları
+
+Varlıklar Kivy'ye bağımlı değildir; çizim graphics/ katmanında yapılır.
+Pozisyon API'si (pos, size, center_x, ...) Widget ile uyumludur.
 """
 
-from kivy.uix.widget import Widget
-from kivy.graphics import Color, Ellipse, Rectangle
-from kivy.properties import ListProperty, NumericProperty, BooleanProperty
-from typing import Tuple, Optional
+from typing import Any, Dict, Tuple, Optional
 import math
 
+from core.events import EventBus, event_bus
+
 
-class BaseEntity(Widget):
+class BaseEntity:
     """Tüm oyun varlıkları için temel sınıf"""
     
-    # Pozisyon ve hareket
-    velocity = ListProperty([0.0, 0.0])
-    speed = NumericProperty(0.0)
+    # get_state() dışında tutulan (kaydedilmeyen) alanlar
+    _transient_state = ('_in_pool', 'events')
     
-    # Boyut ve çarpışma
-    radius = NumericProperty(10.0)
+    # Sütun deposunda (core.columns) tutulan, özellik olarak erişilen alanlar
+    _column_state = ()
     
-    # Durum
-    is_alive = BooleanProperty(True)
+    # Olayların yayınlandığı bus; simülasyon kendi bus'ını atar
+    events: EventBus = event_bus
     
     def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.size_hint = (None, None)
-        self.size = (self.radius * 2, self.radius * 2)
+        # Pozisyon ve boyut (sol alt köşe, Widget ile aynı)
+        self.x = 0.0
+        self.y = 0.0
+        self.prev_pos = None  # Önceki tick pozisyonu (çizim interpolasyonu)
+        
+        # Hareket
+        self.velocity = [0.0, 0.0]
+        self.speed = 0.0
+        
+        # Boyut ve çarpışma
+        self.radius = 10.0
+        self.width = self.radius * 2
+        self.height = self.radius * 2
+        
+        # Durum
+        self.is_alive = True
+        
+        if 'size' in kwargs:
+            self.size = kwargs['size']
+        if 'pos' in kwargs:
+            self.pos = kwargs['pos']
         
         # Grafik bileşenlerini başlat
         self._setup_graphics()
-        
+    
+    # Widget uyumlu pozisyon özellikleri
+    @property
+    def pos(self) -> Tuple[float, float]:
+        return (self.x, self.y)
+    
+    @pos.setter
+    def pos(self, value):
+        self.x, self.y = value[0], value[1]
+    
+    @property
+    def size(self) -> Tuple[float, float]:
+        return (self.width, self.height)
+    
+    @size.setter
+    def size(self, value):
+        self.width, self.height = value[0], value[1]
+    
+    @property
+    def center_x(self) -> float:
+        return self.x + self.width / 2
+    
+    @center_x.setter
+    def center_x(self, value: float):
+        self.x = value - self.width / 2
+    
+    @property
+    def center_y(self) -> float:
+        return self.y + self.height / 2
+    
+    @center_y.setter
+    def center_y(self, value: float):
+        self.y = value - self.height / 2
+    
+    @property
+    def center(self) -> Tuple[float, float]:
+        return (self.center_x, self.center_y)
+    
+    @center.setter
+    def center(self, value):
+        self.center_x, self.center_y = value[0], value[1]
+    
+    @property
+    def right(self) -> float:
+        return self.x + self.width
+    
+    @property
+    def top(self) -> float:
+        return self.y + self.height
+    
+    def reset(self):
+        """Havuzdan tekrar kullanım için durumu sıfırla"""
+        self.velocity = [0.0, 0.0]
+        self.speed = 0.0
+        self.is_alive = True
+        self.prev_pos = None
+    
+    def store_previous(self):
+        """Interpolasyon için mevcut pozisyonu sakla (tick başında)"""
+        self.prev_pos = (self.x, self.y)
+    
+    def get_render_pos(self, alpha: float) -> Tuple[float, float]:
+        """Önceki ve şimdiki tick arasında interpolasyonlu pozisyon"""
+        if self.prev_pos is None:
+            return (self.x, self.y)
+        prev_x, prev_y = self.prev_pos
+        return (prev_x + (self.x - prev_x) * alpha,
+                prev_y + (self.y - prev_y) * alpha)
+    
+    def get_state(self) -> Dict[str, Any]:
+        """JSON uyumlu anlık durum (replay keyframe'leri için)"""
+        state = {key: value for key, value in self.__dict__.items()
+                 if key not in self._transient_state}
+        for name in self._column_state:
+            state[name] = getattr(self, name)
+        return state
+    
+    def set_state(self, state: Dict[str, Any]):
+        """get_state() çıktısını geri yükle"""
+        column_state = self._column_state
+        if not column_state:
+            self.__dict__.update(state)
+            return
+        self.__dict__.update((key, value) for key, value in state.items()
+                             if key not in column_state)
+        for name in column_state:
+            if name in state:
+                setattr(self, name, state[name])
+    
     def _setup_graphics(self):
         """Grafik bileşenlerini ayarla (alt sınıflarda override edilmeli)"""
         pass
@@ -44,15 +151,15 @@ class BaseEntity(Widget):
         """Temel hareket fonksiyonu"""
         if not self.is_alive:
             return
-            
+        
         # Pozisyonu güncelle
         self.x += self.velocity[0] * dt
         self.y += self.velocity[1] * dt
-        
+    
     def set_position(self, x: float, y: float):
         """Pozisyon ayarla"""
         self.pos = (x - self.radius, y - self.radius)
-        
+    
     def get_center(self) -> Tuple[float, float]:
         """Merkez pozisyonunu döndür"""
         return (self.x + self.radius, self.y + self.radius)
@@ -77,7 +184,7 @@ class BaseEntity(Widget):
         distance = math.sqrt(dx*dx + dy*dy)
         if distance == 0:
             return (0, 0)
-            
+        
         return (dx / distance, dy / distance)
     
     def set_velocity_towards(self, target_x: float, target_y: float, speed: float):
@@ -94,11 +201,11 @@ class BaseEntity(Widget):
         """Ölü mü?"""
         return not self.is_alive
     
-    def is_out_of_bounds(self, screen_width: float, screen_height: float, 
+    def is_out_of_bounds(self, screen_width: float, screen_height: float,
                         margin: float = 200) -> bool:
         """Ekran sınırları dışında mı?"""
         x, y = self.get_center()
-        return (x < -margin or x > screen_width + margin or 
+        return (x < -margin or x > screen_width + margin or
                 y < -margin or y > screen_height + margin)
 
 
@@ -5,7 +5,6 @@ Entities/Enemy.py - Düşman sınıfları
 """
 
 from .base import BaseEntity
-from kivy.graphics import Color, Ellipse
 
 
 class Enemy(BaseEntity):
@@ -23,19 +22,6 @@ class Enemy(BaseEntity):
         self.move_speed = 30.0
         self.target_pos = [0, 0]
         
-    def _setup_graphics(self):
-        """Düşman grafiklerini ayarla"""
-        with self.canvas:
-            Color(1.0, 0.2, 0.2, 1.0)  # Kırmızı
-            self.graphic = Ellipse(pos=self.pos, size=self.size)
-        self.bind(pos=self._update_graphics, size=self._update_graphics)
-    
-    def _update_graphics(self, *args):
-        """Grafikleri güncelle"""
-        if hasattr(self, 'graphic'):
-            self.graphic.pos = self.pos
-            self.graphic.size = self.size
-    
     def update(self, dt: float):
         """Düşmanı güncelle"""
         if not self.is_alive:
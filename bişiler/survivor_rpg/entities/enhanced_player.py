@@ -5,15 +5,11 @@ Entities/EnhancedPlayer.py - Profesyonel oyuncu sınıfı
 """
 
 import math
+from dataclasses import asdict
 from typing import List, Dict, Any, Tuple
-from kivy.graphics import Color, PushMatrix, PopMatrix, Rotate, Scale
-from kivy.clock import Clock
 
 from .base import BaseEntity
 from core.state import PlayerStats
-from graphics.sprite_manager import sprite_renderer
-from graphics.particle_system import particle_system
-from audio.sound_manager import sound_manager
 
 
 class EnhancedPlayer(BaseEntity):
@@ -69,9 +65,6 @@ class EnhancedPlayer(BaseEntity):
         self.movement_trail = []
         self.max_trail_length = 8
         
-        # Ses pozisyonu
-        self._update_audio_position()
-        
         # Grafikleri ayarla
         self._setup_graphics()
     
@@ -80,92 +73,17 @@ class EnhancedPlayer(BaseEntity):
         # Sprite renderer kullanacağız, canvas'ı boş bırak
         pass
     
-    def _update_graphics(self, *args):
-        """Grafik güncellemesi"""
-        # Canvas'ı temizle ve yeniden çiz
-        self.canvas.clear()
-        
-        with self.canvas:
-            # Glow efekti
-            if self.glow_intensity > 0.1:
-                Color(0.5, 0.8, 1.0, self.glow_intensity * 0.3)
-                from kivy.graphics import Ellipse
-                glow_size = self.radius * 3 * self.glow_intensity
-                glow_pos = (
-                    self.center_x - glow_size / 2,
-                    self.center_y - glow_size / 2
-                )
-                Ellipse(pos=glow_pos, size=(glow_size, glow_size))
-            
-            # Ana karakter transformasyonları
-            PushMatrix()
-            
-            # Merkezi etrafında döndür
-            if self.rotation != 0:
-                Rotate(angle=self.rotation, origin=self.center)
-            
-            # Ölçeklendirme
-            if self.scale != 1.0:
-                Scale(self.scale, self.scale, 1.0)
-                Scale(origin=self.center)
-            
-            # Invulnerability flash
-            if self.invulnerable_flash > 0:
-                flash_alpha = 0.5 + 0.5 * math.sin(self.invulnerable_flash * 20)
-                Color(1, 1, 1, flash_alpha)
-            else:
-                Color(1, 1, 1, 1)
-            
-            # Ana sprite'ı render et
-            sprite_renderer.render_sprite(
-                self.canvas,
-                'player',
-                self.pos,
-                self.size,
-                color=(1, 1, 1, 1)
-            )
-            
-            PopMatrix()
-            
-            # HP bar (oyuncunun üstünde)
-            if self.current_hp < self.max_hp:
-                self._draw_health_bar()
-            
-            # Combo göstergesi
-            if self.combo_counter > 1:
-                self._draw_combo_indicator()
-    
-    def _draw_health_bar(self):
-        """Sağlık çubuğu çiz"""
-        bar_width = 40
-        bar_height = 4
-        bar_x = self.center_x - bar_width / 2
-        bar_y = self.center_y + self.radius + 8
-        
-        # Arkaplan
-        Color(0.2, 0.2, 0.2, 0.8)
-        from kivy.graphics import Rectangle
-        Rectangle(pos=(bar_x, bar_y), size=(bar_width, bar_height))
-        
-        # HP bar
-        hp_ratio = self.current_hp / self.max_hp if self.max_hp > 0 else 0
-        hp_width = bar_width * hp_ratio
-        
-        # Renk gradyanı (yeşil -> sarı -> kırmızı)
-        if hp_ratio > 0.6:
-            r, g, b = 0.2, 1.0, 0.2  # Yeşil
-        elif hp_ratio > 0.3:
-            r, g, b = 1.0, 1.0, 0.2  # Sarı
-        else:
-            r, g, b = 1.0, 0.2, 0.2  # Kırmızı
-        
-        Color(r, g, b, 0.9)
-        Rectangle(pos=(bar_x, bar_y), size=(hp_width, bar_height))
+    def get_state(self) -> Dict[str, Any]:
+        """JSON uyumlu anlık durum (istatistikler dahil)"""
+        state = super().get_state()
+        state['stats'] = asdict(self.stats)
+        return state
     
-    def _draw_combo_indicator(self):
-        """Combo göstergesi çiz"""
-        # Basit text render (gerçek implementasyonda Label kullanılır)
-        pass
+    def set_state(self, state: Dict[str, Any]):
+        """get_state() çıktısını geri yükle"""
+        state = dict(state)
+        self.stats = PlayerStats(**state.pop('stats'))
+        super().set_state(state)
     
     def set_movement_input(self, input_vector: Tuple[float, float]):
         """Hareket girişi"""
@@ -202,7 +120,7 @@ class EnhancedPlayer(BaseEntity):
                 diff_x = accel if diff_x > 0 else -accel
             if abs(diff_y) > accel:
                 diff_y = accel if diff_y > 0 else -accel
-                
+            
             self.velocity = [current_vx + diff_x, current_vy + diff_y]
         else:
             # Sürtünme
@@ -218,7 +136,7 @@ class EnhancedPlayer(BaseEntity):
         if speed > self.max_speed:
             self.velocity[0] = self.velocity[0] * self.max_speed / speed
             self.velocity[1] = self.velocity[1] * self.max_speed / speed
-            
+        
         self.speed = speed
         
         # Hareket trail efekti
@@ -280,16 +198,6 @@ class EnhancedPlayer(BaseEntity):
         
         if self.current_hp > self.max_hp:
             self.current_hp = self.max_hp
-        
-        # Ses pozisyonu güncelle
-        self._update_audio_position()
-        
-        # Grafikleri güncelle
-        self._update_graphics()
-    
-    def _update_audio_position(self):
-        """Ses pozisyonunu güncelle"""
-        sound_manager.set_listener_position(self.center_x, self.center_y)
     
     def take_damage(self, amount: float) -> bool:
         """Gelişmiş hasar alma"""
@@ -313,11 +221,8 @@ class EnhancedPlayer(BaseEntity):
         
         # Screen shake efekti (game manager'da yapılacak)
         
-        # Parçacık efektleri
-        particle_system.create_damage_numbers(self.center_x, self.center_y + 20, int(amount))
-        
-        # Ses efekti
-        sound_manager.play_damage(self.center_x, self.center_y)
+        # Parçacık ve ses efektleri (graphics/audio gözlemcileri)
+        self.events.emit('player_damaged', self, amount)
         
         if self.current_hp <= 0:
             self._trigger_death_effects()
@@ -328,8 +233,7 @@ class EnhancedPlayer(BaseEntity):
     def _trigger_death_effects(self):
         """Ölüm efektleri"""
         # Büyük patlama efekti
-        particle_system.create_explosion(self.center_x, self.center_y, 2.0)
-        sound_manager.play_explosion(self.center_x, self.center_y, 1.5)
+        self.events.emit('player_killed', self)
     
     def heal(self, amount: float):
         """İyileştirme efektleri ile"""
@@ -345,14 +249,17 @@ class EnhancedPlayer(BaseEntity):
             
             # İyileştirme efektleri
             self.glow_intensity = 0.8
-            particle_system.create_heal_effect(self.center_x, self.center_y)
-            sound_manager.play_pickup(self.center_x, self.center_y)
+            self.events.emit('player_healed', self, actual_heal)
     
     def add_xp(self, amount: float):
         """XP ekleme efektleri ile"""
         if self.stats.add_xp(amount):
             self._pending_level_up = True
     
+    def needs_level_up(self) -> bool:
+        """Level atlaması gerekiyor mu?"""
+        return self._pending_level_up
+    
     def level_up(self):
         """Level atlama efektleri"""
         if self._pending_level_up:
@@ -362,8 +269,7 @@ class EnhancedPlayer(BaseEntity):
             # Muhteşem level up efektleri
             self.glow_intensity = 2.0
             self.target_scale = 1.5
-            particle_system.create_level_up_effect(self.center_x, self.center_y)
-            sound_manager.play_level_up()
+            self.events.emit('player_level_up', self)
             
             # Tam heal
             self.current_hp = self.max_hp
@@ -377,15 +283,8 @@ class EnhancedPlayer(BaseEntity):
             self.combo_counter += 1
             self.combo_timer = self.combo_decay_time
             
-            # Muzzle flash efekti
-            for i in range(self.get_projectile_count()):
-                angle = (2 * math.pi * i) / self.get_projectile_count()
-                flash_x = self.center_x + math.cos(angle) * 20
-                flash_y = self.center_y + math.sin(angle) * 20
-                particle_system.create_muzzle_flash(flash_x, flash_y, angle)
-            
-            # Ses efekti
-            sound_manager.play_fire(self.center_x, self.center_y)
+            # Muzzle flash ve ateş sesi
+            self.events.emit('player_fired', self, self.get_projectile_count())
             
             return True
         return False
@@ -411,6 +310,10 @@ class EnhancedPlayer(BaseEntity):
                 count += ability.get('bonus_projectiles', 1)
         return min(count, 12)  # Maksimum 12 mermi
     
+    def get_magnet_range(self) -> float:
+        """Magnet menzilini döndür"""
+        return self.magnet_range
+    
     def add_ability(self, ability: Dict[str, Any]):
         """Yetenek ekleme efektleri ile"""
         self.abilities.append(ability)
@@ -418,8 +321,7 @@ class EnhancedPlayer(BaseEntity):
         
         # Yetenek alma efekti
         self.glow_intensity = 1.5
-        particle_system.create_heal_effect(self.center_x, self.center_y)
-        sound_manager.play_pickup(self.center_x, self.center_y)
+        self.events.emit('ability_added', self, ability)
     
     def _apply_ability_effects(self, ability: Dict[str, Any]):
         """Yetenek etkilerini uygula"""
@@ -450,10 +352,11 @@ class EnhancedPlayer(BaseEntity):
         """Loot toplama efektleri ile"""
         if loot_type == 'xp':
             self.add_xp(loot_value)
-            # Küçük parçacık efekti
-            particle_system.create_heal_effect(self.center_x, self.center_y)
         elif loot_type == 'health':
             self.heal(loot_value)
+        
+        # Küçük parçacık efekti
+        self.events.emit('loot_collected', self, loot_value, loot_type)
     
     def get_status_info(self) -> Dict[str, Any]:
         """Gelişmiş durum bilgileri"""
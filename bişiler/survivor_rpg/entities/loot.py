@@ -5,7 +5,7 @@ Entities/Loot.py - Loot sınıfları
 """
 
 from .base import BaseEntity
-from kivy.graphics import Color, Ellipse
+from core.pool import ObjectPool
 
 
 class LootOrb(BaseEntity):
@@ -13,6 +13,11 @@ class LootOrb(BaseEntity):
     
     def __init__(self, xp_value=1.0, **kwargs):
         super().__init__(**kwargs)
+        self.reset(xp_value)
+        
+    def reset(self, xp_value=1.0):
+        """Loot'u sıfırla (havuzdan alınırken)"""
+        super().reset()
         self.radius = 4
         self.size = (self.radius * 2, self.radius * 2)
         self.color = (0.2, 1.0, 0.2, 1.0)  # Yeşil
@@ -21,19 +26,6 @@ class LootOrb(BaseEntity):
         self.magnet_speed = 150.0
         self.is_magnetized = False
         
-    def _setup_graphics(self):
-        """Loot grafiklerini ayarla"""
-        with self.canvas:
-            Color(0.2, 1.0, 0.2, 1.0)  # Yeşil
-            self.graphic = Ellipse(pos=self.pos, size=self.size)
-        self.bind(pos=self._update_graphics, size=self._update_graphics)
-    
-    def _update_graphics(self, *args):
-        """Grafikleri güncelle"""
-        if hasattr(self, 'graphic'):
-            self.graphic.pos = self.pos
-            self.graphic.size = self.size
-    
     def update(self, dt: float):
         """Loot'u güncelle"""
         if not self.is_alive or self.collected:
@@ -56,3 +48,7 @@ class LootOrb(BaseEntity):
     def is_collected(self) -> bool:
         """Toplandı mı?"""
         return self.collected
+
+
+# Global loot havuzu
+loot_pool = ObjectPool(LootOrb, max_free=256)
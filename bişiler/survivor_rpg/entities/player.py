@@ -6,8 +6,6 @@ Entities/Player.py - Oyuncu sınıfı
 
 import math
 from typing import List, Dict, Any, Tuple
-from kivy.graphics import Color, Ellipse
-from kivy.clock import Clock
 
 from .base import BaseEntity
 from core.state import PlayerStats
@@ -51,36 +49,9 @@ class Player(BaseEntity):
         # Magnet sistemi
         self.magnet_range = 50.0
         
-        # Grafikleri ayarla
-        self._setup_graphics()
+        # Görsel (graphics katmanı kullanır)
+        self.color = (0.2, 0.8, 1.0, 1.0)
         
-    def _setup_graphics(self):
-        """Oyuncu grafiklerini ayarla"""
-        with self.canvas:
-            # Ana karakter (mavi daire)
-            Color(0.2, 0.8, 1.0, 1.0)
-            self.body = Ellipse(pos=self.pos, size=self.size)
-            
-            # İç nokta (beyaz)
-            Color(1, 1, 1, 0.8)
-            inner_size = (self.radius, self.radius)
-            inner_pos = (self.x + self.radius/2, self.y + self.radius/2)
-            self.inner = Ellipse(pos=inner_pos, size=inner_size)
-            
-        self.bind(pos=self._update_graphics, size=self._update_graphics)
-    
-    def _update_graphics(self, *args):
-        """Grafikleri güncelle"""
-        if hasattr(self, 'body'):
-            self.body.pos = self.pos
-            self.body.size = self.size
-            
-        if hasattr(self, 'inner'):
-            inner_size = (self.radius, self.radius)
-            inner_pos = (self.x + self.radius/2, self.y + self.radius/2)
-            self.inner.pos = inner_pos
-            self.inner.size = inner_size
-    
     def set_movement_input(self, input_vector: Tuple[float, float]):
         """Hareket girişi ayarla"""
         self.target_velocity = [
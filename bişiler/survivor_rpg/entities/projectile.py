@@ -5,7 +5,7 @@ Entities/Projectile.py - Mermi sınıfları
 """
 
 from .base import BaseEntity
-from kivy.graphics import Color, Ellipse
+from core.pool import ObjectPool
 
 
 class Projectile(BaseEntity):
@@ -13,6 +13,11 @@ class Projectile(BaseEntity):
     
     def __init__(self, damage=10.0, **kwargs):
         super().__init__(**kwargs)
+        self.reset(damage)
+        
+    def reset(self, damage=10.0):
+        """Mermiyi sıfırla (havuzdan alınırken)"""
+        super().reset()
         self.radius = 3
         self.size = (self.radius * 2, self.radius * 2)
         self.color = (1.0, 1.0, 0.5, 1.0)  # Sarımsı
@@ -20,19 +25,6 @@ class Projectile(BaseEntity):
         self.lifetime = 2.0  # 2 saniye yaşam süresi
         self.age = 0.0
         
-    def _setup_graphics(self):
-        """Mermi grafiklerini ayarla"""
-        with self.canvas:
-            Color(1.0, 1.0, 0.5, 1.0)  # Sarı
-            self.graphic = Ellipse(pos=self.pos, size=self.size)
-        self.bind(pos=self._update_graphics, size=self._update_graphics)
-    
-    def _update_graphics(self, *args):
-        """Grafikleri güncelle"""
-        if hasattr(self, 'graphic'):
-            self.graphic.pos = self.pos
-            self.graphic.size = self.size
-    
     def update(self, dt: float):
         """Mermiyi güncelle"""
         if not self.is_alive:
@@ -49,3 +41,7 @@ class Projectile(BaseEntity):
     def hit_target(self):
         """Hedefe çarptı"""
         self.kill()
+
+
+# Global mermi havuzu
+projectile_pool = ObjectPool(Projectile, max_free=512)
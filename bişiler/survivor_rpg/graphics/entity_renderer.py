@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Graphics/EntityRenderer.py - Simülasyon varlıklarını Kivy canvas'ına çizer
+
+Simülasyon (core.simulation) Kivy'den bağımsızdır; bu sınıf her karede
+varlıkların durumunu okuyup çizim talimatlarını üretir. Pozisyonlar son
+iki simülasyon tick'i arasında alpha ile interpole edilir.
+
+Her katman (loot, düşmanlar, mermi, HP barları, oyuncu) tek bir Mesh'tir
+(graphics.sprite_batch). Tüm düşman türleri sprite atlasından sprite başına
+UV ile tek katmanda çizilir. Canvas bir kez kurulur; karede yalnızca köşe
+tamponları güncellenir, talimat sayısı varlık sayısından bağımsızdır.
+"""
+
+import math
+from typing import Dict
+
+import numpy as np
+
+from .sprite_batch import SpriteBatchGroup, shape_texture
+from .sprite_manager import sprite_renderer
+
+# Kendi sprite'ı olan düşman türleri; diğerleri atlastaki daire ile çizilir
+ENEMY_TYPES = ('slime', 'goblin', 'skeleton', 'orc')
+OTHER_ENEMY_TINT = (1.0, 0.3, 0.3, 1.0)
+
+# HP bar renkleri (oran eşiği, renk) - yüksekten düşüğe
+ENEMY_BAR_COLORS = ((0.5, (0.2, 0.8, 0.2, 0.9)), (0.25, (0.8, 0.8, 0.2, 0.9)), (0.0, (0.8, 0.2, 0.2, 0.9)))
+PLAYER_BAR_COLORS = ((0.6, (0.2, 1.0, 0.2, 0.9)), (0.3, (1.0, 1.0, 0.2, 0.9)), (0.0, (1.0, 0.2, 0.2, 0.9)))
+
+
+def _interpolated_centers(data: np.ndarray, alpha: float):
+    """Sütunlar x, y, prev_x, prev_y, width, height -> interpole merkezler"""
+    x = data[:, 2] + (data[:, 0] - data[:, 2]) * alpha + data[:, 4] * 0.5
+    y = data[:, 3] + (data[:, 1] - data[:, 3]) * alpha + data[:, 5] * 0.5
+    return x, y
+
+
+def _position_row(entity) -> tuple:
+    """Ortak sütunlar: x, y, prev_x, prev_y, width, height"""
+    prev = entity.prev_pos or (entity.x, entity.y)
+    return (entity.x, entity.y, prev[0], prev[1], entity.width, entity.height)
+
+
+def _bar_colors(ratio: np.ndarray, thresholds) -> np.ndarray:
+    """HP oranına göre bar renkleri, (n, 4)"""
+    colors = np.empty((ratio.shape[0], 4), dtype=np.float32)
+    colors[:] = thresholds[-1][1]
+    for threshold, color in reversed(thresholds[:-1]):
+        colors[ratio > threshold] = color
+    return colors
+
+
+class EntityRenderer:
+    """Oyuncu, düşman, mermi ve loot çizimi (katman başına tek Mesh)"""
+    
+    def __init__(self):
+        self.canvas = None
+        self.group = None
+        self._enemy_uvs = None
+        self._enemy_tints = None
+        self._type_index: Dict[str, int] = {name: i for i, name in enumerate(ENEMY_TYPES)}
+    
+    def _setup(self, canvas):
+        """Katmanları canvas'a bir kez kur"""
+        canvas.clear()
+        circle = shape_texture('circle')
+        white = shape_texture('white')
+        
+        group = SpriteBatchGroup()
+        group.add_layer('loot', circle)
+        
+        # Düşmanlar: tek atlas texture'ı, tür indeksiyle UV ve tint tablosu
+        atlas = sprite_renderer.atlas
+        group.add_layer('enemies', atlas.create_texture())
+        self._enemy_uvs = atlas.uv_table(ENEMY_TYPES + ('circle',))
+        self._enemy_tints = np.ones((len(ENEMY_TYPES) + 1, 4), dtype=np.float32)
+        self._enemy_tints[-1] = OTHER_ENEMY_TINT
+        group.add_layer('enemy_bars', white)
+        group.add_layer('projectiles', circle)
+        group.add_layer('player_glow', circle, capacity=1)
+        group.add_layer('player', sprite_renderer.get_texture('player') or circle, capacity=1)
+        group.add_layer('player_bar', white, capacity=2)
+        canvas.add(group.context)
+        
+        self.canvas = canvas
+        self.group = group
+    
+    def render(self, canvas, simulation, alpha: float = 1.0):
+        """Tüm varlıkların köşe tamponlarını güncelle"""
+        if canvas is not self.canvas:
+            self._setup(canvas)
+        batches = self.group.batches
+        
+        loot = [orb for orb in simulation.loot_orbs if not orb.collected]
+        self._draw_circles(batches['loot'], loot, alpha)
+        self._draw_enemies(simulation.enemies, alpha)
+        projectiles = [projectile for projectile in simulation.projectiles if projectile.is_alive]
+        self._draw_circles(batches['projectiles'], projectiles, alpha)
+        self._draw_player(simulation.player, alpha)
+    
+    def clear(self):
+        """Tüm katmanları boşalt (canvas'taki talimatlar korunur)"""
+        if self.group:
+            self.group.clear()
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Çizim istatistikleri (profilleyici için)"""
+        if not self.group:
+            return {'sprites': 0, 'meshes': 0}
+        return {'sprites': self.group.sprite_count(), 'meshes': len(self.group.batches)}
+    
+    def _draw_circles(self, batch, entities, alpha: float):
+        """Basit renkli daireler (mermi, loot)"""
+        if not entities:
+            batch.clear()
+            return
+        
+        data = np.array([_position_row(entity) for entity in entities], dtype=np.float32)
+        colors = np.array([entity.color for entity in entities], dtype=np.float32)
+        cx, cy = _interpolated_centers(data, alpha)
+        batch.draw(cx, cy, data[:, 4] * 0.5, data[:, 5] * 0.5, rgba=colors)
+    
+    def _draw_enemies(self, enemies, alpha: float):
+        """Düşmanlar (tek atlas katmanı) ve HP barları"""
+        batches = self.group.batches
+        bar_batch = batches['enemy_bars']
+        if not enemies:
+            batches['enemies'].clear()
+            bar_batch.clear()
+            return
+        
+        other = len(ENEMY_TYPES)
+        type_index = self._type_index
+        data = np.array([
+            _position_row(enemy) + (
+                enemy.rotation, enemy.flash_timer, enemy.death_animation_timer,
+                enemy.current_hp, enemy.max_hp, type_index.get(enemy.enemy_type, other))
+            for enemy in enemies
+        ], dtype=np.float32)
+        
+        cx, cy = _interpolated_centers(data, alpha)
+        
+        # Ölüm animasyonu: merkez etrafında büyüme
+        scale = 1.0 + data[:, 8] * 2.0
+        half_w = data[:, 4] * 0.5 * scale
+        half_h = data[:, 5] * 0.5 * scale
+        
+        # Flash efekti (hasar aldığında beyaza çeker)
+        flash = np.clip(data[:, 7] / 0.2, 0.0, 1.0)
+        
+        types = data[:, 11].astype(np.int32)
+        batches['enemies'].draw(cx, cy, half_w, half_h, angle=data[:, 6],
+                                rgba=self._enemy_tints[types], flash=flash,
+                                uvs=self._enemy_uvs[types])
+        
+        # HP barları (düşük HP'de): arkaplan + doluluk
+        hp, max_hp = data[:, 9], data[:, 10]
+        low = hp < max_hp * 0.8
+        if not low.any():
+            bar_batch.clear()
+            return
+        
+        radius = data[low, 4] * 0.5
+        ratio = np.clip(hp[low] / np.maximum(max_hp[low], 1e-6), 0.0, 1.0)
+        bar_width = radius * 1.5
+        bar_left = cx[low] - bar_width * 0.5
+        bar_cy = cy[low] + radius + 6 + 1.5
+        fill_width = bar_width * ratio
+        
+        count = bar_width.shape[0]
+        colors = np.empty((count * 2, 4), dtype=np.float32)
+        colors[:count] = (0.1, 0.1, 0.1, 0.8)
+        colors[count:] = _bar_colors(ratio, ENEMY_BAR_COLORS)
+        bar_batch.draw(
+            np.concatenate((cx[low], bar_left + fill_width * 0.5)),
+            np.concatenate((bar_cy, bar_cy)),
+            np.concatenate((bar_width * 0.5, fill_width * 0.5)),
+            1.5,
+            rgba=colors,
+        )
+    
+    def _draw_player(self, player, alpha: float):
+        """Oyuncu, glow efekti ve HP barı"""
+        batches = self.group.batches
+        if not player:
+            for name in ('player_glow', 'player', 'player_bar'):
+                batches[name].clear()
+            return
+        
+        pos = player.get_render_pos(alpha)
+        cx = pos[0] + player.width / 2
+        cy = pos[1] + player.height / 2
+        
+        # Glow efekti
+        if player.glow_intensity > 0.1:
+            glow_half = player.radius * 1.5 * player.glow_intensity
+            batches['player_glow'].draw([cx], [cy], glow_half, glow_half,
+                                        rgba=(0.5, 0.8, 1.0, player.glow_intensity * 0.3))
+        else:
+            batches['player_glow'].clear()
+        
+        # Invulnerability flash (yanıp sönme)
+        if player.invulnerable_flash > 0:
+            body_alpha = 0.5 + 0.5 * math.sin(player.invulnerable_flash * 20)
+        else:
+            body_alpha = 1.0
+        batches['player'].draw([cx], [cy], player.width / 2 * player.scale,
+                               player.height / 2 * player.scale, angle=player.rotation,
+                               rgba=(1.0, 1.0, 1.0, body_alpha))
+        
+        # HP bar (oyuncunun üstünde)
+        if player.current_hp < player.max_hp:
+            ratio = player.current_hp / player.max_hp if player.max_hp > 0 else 0.0
+            ratio = min(1.0, max(0.0, ratio))
+            bar_width = 40.0
+            fill_width = bar_width * ratio
+            bar_cy = cy + player.radius + 8 + 2
+            colors = np.empty((2, 4), dtype=np.float32)
+            colors[0] = (0.2, 0.2, 0.2, 0.8)
+            colors[1] = _bar_colors(np.array([ratio], dtype=np.float32), PLAYER_BAR_COLORS)[0]
+            batches['player_bar'].draw(
+                [cx, cx - bar_width / 2 + fill_width / 2], [bar_cy, bar_cy],
+                [bar_width / 2, fill_width / 2], 2.0, rgba=colors)
+        else:
+            batches['player_bar'].clear()
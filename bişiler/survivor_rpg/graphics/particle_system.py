@@ -2,77 +2,224 @@
 # -*- coding: utf-8 -*-
 """
 Graphics/ParticleSystem.py - Profesyonel parçacık efekt sistemi
+
+Tüm parçacıklar tek bir sabit kapasiteli struct-of-arrays deposunda
+(ParticleStore) NumPy dizileri olarak tutulur. Hareket, yerçekimi, dönme,
+solma ve küçülme toplu hesaplanır; ölen parçacıkların yerine dizinin
+sonundaki canlılar taşınır (swap-compaction). Çizim tek bir vertex
+renkli Mesh ile yapılır (graphics.sprite_batch).
+
+Parçacık bütçesi (ParticleBudget): her efektin bir önceliği vardır. Depo
+doldukça ve kare kotası tükendikçe düşük öncelikli patlamalar küçültülür;
+kapasite aşılırsa yer açmak için önce düşük öncelikli (ve ömrü en az
+kalan) parçacıklar silinir.
 """
 
 import math
-import random
-from typing import List, Tuple, Optional
-from kivy.graphics import Color, Ellipse, Line, PushMatrix, PopMatrix, Scale
-from kivy.clock import Clock
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
+from .sprite_batch import SpriteBatchGroup, shape_texture
 
-class Particle:
-    """Tek bir parçacık"""
+# Efekt öncelikleri
+PRIORITY_LOW = 0      # Namlu alevi, iyileştirme parıltısı
+PRIORITY_NORMAL = 1   # Kan, hasar sayıları, ölüm patlamaları
+PRIORITY_HIGH = 2     # Level up, oyuncu ölümü (hiç küçültülmez)
+
+
+class ParticleStore:
+    """Sabit kapasiteli parçacık deposu (canlılar [0, count) aralığında)"""
     
-    def __init__(self, x: float, y: float, vel_x: float, vel_y: float,
-                 color: Tuple[float, float, float, float], size: float,
-                 lifetime: float, gravity: float = 0.0):
-        self.x = x
-        self.y = y
-        self.vel_x = vel_x
-        self.vel_y = vel_y
-        self.color = list(color)
-        self.size = size
-        self.initial_size = size
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.gravity = gravity
-        self.alive = True
+    # Parçacık başına float alanlar
+    FIELDS = ('x', 'y', 'vel_x', 'vel_y', 'size', 'initial_size',
+              'lifetime', 'max_lifetime', 'gravity', 'spin', 'spin_speed')
+    
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self.count = 0
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float32))
+        self.color = np.zeros((capacity, 4), dtype=np.float32)
+        self.base_alpha = np.ones(capacity, dtype=np.float32)
+        self.fade_out = np.ones(capacity, dtype=bool)
+        self.shrink = np.ones(capacity, dtype=bool)
+        self.priority = np.zeros(capacity, dtype=np.uint8)
         
-        # Efekt özellikleri
-        self.fade_out = True
-        self.shrink = True
-        self.spin = 0.0
-        self.spin_speed = 0.0
+        # İstatistikler
+        self.spawned = 0
+        self.dropped = 0  # Kapasite dolu olduğu için oluşturulamayanlar
+        self.evicted = 0  # Daha önemli parçacıklara yer açmak için silinenler
+    
+    @property
+    def load(self) -> float:
+        """Doluluk oranı (0-1)"""
+        return self.count / self.capacity
+    
+    def spawn(self, x, y, vel_x, vel_y, color, size, lifetime, gravity=0.0,
+              spin_speed=0.0, fade_out: bool = True, shrink: bool = True,
+              priority: int = PRIORITY_NORMAL) -> int:
+        """Parçacık ekle (dizi ya da skaler değerler), eklenen sayıyı döndür"""
+        requested = len(vel_x)
+        if requested > self.capacity - self.count:
+            self.evict(requested - (self.capacity - self.count), priority)
+        count = min(requested, self.capacity - self.count)
+        self.dropped += requested - count
+        if count <= 0:
+            return 0
+        
+        start = self.count
+        end = start + count
+        self.x[start:end] = np.broadcast_to(x, (requested,))[:count]
+        self.y[start:end] = np.broadcast_to(y, (requested,))[:count]
+        self.vel_x[start:end] = vel_x[:count]
+        self.vel_y[start:end] = vel_y[:count]
+        self.color[start:end] = np.broadcast_to(color, (requested, 4))[:count]
+        self.base_alpha[start:end] = self.color[start:end, 3]
+        self.size[start:end] = np.broadcast_to(size, (requested,))[:count]
+        self.initial_size[start:end] = self.size[start:end]
+        self.lifetime[start:end] = np.broadcast_to(lifetime, (requested,))[:count]
+        self.max_lifetime[start:end] = self.lifetime[start:end]
+        self.gravity[start:end] = gravity
+        self.spin[start:end] = 0.0
+        self.spin_speed[start:end] = np.broadcast_to(spin_speed, (requested,))[:count]
+        self.fade_out[start:end] = fade_out
+        self.shrink[start:end] = shrink
+        self.priority[start:end] = priority
+        
+        self.count = end
+        self.spawned += count
+        return count
     
     def update(self, dt: float):
-        """Parçacığı güncelle"""
-        if not self.alive:
+        """Tüm parçacıkları toplu güncelle ve ölüleri sıkıştır"""
+        n = self.count
+        if n == 0:
             return
         
-        # Pozisyon güncellemesi
-        self.x += self.vel_x * dt
-        self.y += self.vel_y * dt
+        # Pozisyon, yerçekimi ve dönme
+        self.x[:n] += self.vel_x[:n] * dt
+        self.y[:n] += self.vel_y[:n] * dt
+        self.vel_y[:n] -= self.gravity[:n] * dt
+        self.spin[:n] += self.spin_speed[:n] * dt
         
-        # Yerçekimi
-        self.vel_y -= self.gravity * dt
+        # Yaşam süresi
+        lifetime = self.lifetime[:n]
+        lifetime -= dt
         
-        # Dönme
-        self.spin += self.spin_speed * dt
+        # Yaşlanma efektleri (solma ve küçülme)
+        remaining = np.clip(lifetime / self.max_lifetime[:n], 0.0, 1.0)
+        fade = self.fade_out[:n]
+        self.color[:n, 3] = np.where(fade, self.base_alpha[:n] * remaining, self.base_alpha[:n])
+        shrink = self.shrink[:n]
+        self.size[:n] = np.where(shrink, self.initial_size[:n] * (0.2 + 0.8 * remaining),
+                                 self.initial_size[:n])
         
-        # Yaşam süresi
-        self.lifetime -= dt
-        if self.lifetime <= 0:
-            self.alive = False
+        self._compact(lifetime > 0)
+    
+    def evict(self, count: int, below_priority: int) -> int:
+        """below_priority'den düşük öncelikli en fazla count parçacığı sil
+        
+        Önce en düşük öncelik, aynı öncelikte ömrü en az kalanlar gider.
+        """
+        n = self.count
+        candidates = np.flatnonzero(self.priority[:n] < below_priority)
+        if count <= 0 or candidates.size == 0:
+            return 0
+        
+        order = np.lexsort((self.lifetime[candidates], self.priority[candidates]))
+        victims = candidates[order[:count]]
+        alive = np.ones(n, dtype=bool)
+        alive[victims] = False
+        self._compact(alive)
+        self.evicted += victims.size
+        return victims.size
+    
+    def _compact(self, alive: np.ndarray):
+        """Ölü parçacıkların yerine sondaki canlıları taşı"""
+        n = self.count
+        new_count = int(np.count_nonzero(alive))
+        if new_count == n:
             return
         
-        # Yaşlanma efektleri
-        age_ratio = 1.0 - (self.lifetime / self.max_lifetime)
+        holes = np.flatnonzero(~alive[:new_count])
+        movers = new_count + np.flatnonzero(alive[new_count:])
+        if holes.size:
+            for name in self.FIELDS:
+                array = getattr(self, name)
+                array[holes] = array[movers]
+            for array in (self.color, self.base_alpha, self.fade_out, self.shrink, self.priority):
+                array[holes] = array[movers]
+        self.count = new_count
+    
+    def clear(self):
+        """Tüm parçacıkları sil"""
+        self.count = 0
+
+
+class ParticleBudget:
+    """Kare başına emisyon kotası ve yüke göre patlama ölçekleme"""
+    
+    # Kotanın öncelik başına kullanılabilir oranı
+    QUOTA_SHARE = {PRIORITY_LOW: 0.5, PRIORITY_NORMAL: 1.0}
+    # Depo tamamen doluyken patlamanın korunan oranı
+    MIN_SCALE = {PRIORITY_LOW: 0.0, PRIORITY_NORMAL: 0.25}
+    
+    def __init__(self, frame_quota: int = 600, soft_load: float = 0.5):
+        self.frame_quota = frame_quota  # Karede oluşturulabilecek parçacık
+        self.soft_load = soft_load      # Bu doluluktan sonra ölçekleme başlar
+        self.frame_emitted = 0
         
-        if self.fade_out:
-            self.color[3] = 1.0 - age_ratio  # Alpha fade
+        # Sayaçlar
+        self.requested = 0
+        self.scaled_out = 0  # Yük / kota yüzünden hiç istenmeyenler
+    
+    def allow(self, count: int, priority: int, load: float) -> int:
+        """İstenen patlama boyutunu bütçeye göre küçült"""
+        self.requested += count
+        if priority >= PRIORITY_HIGH:
+            allowed = count
+        else:
+            # Yüke göre doğrusal ölçekleme (soft_load -> 1.0)
+            if load > self.soft_load:
+                pressure = min(1.0, (load - self.soft_load) / (1.0 - self.soft_load))
+                scale = 1.0 - pressure * (1.0 - self.MIN_SCALE[priority])
+                allowed = int(count * scale + 0.5)
+            else:
+                allowed = count
+            
+            # Kare kotası (düşük öncelik kotanın yalnızca bir kısmını kullanır)
+            quota = int(self.frame_quota * self.QUOTA_SHARE[priority]) - self.frame_emitted
+            allowed = max(0, min(allowed, quota))
         
-        if self.shrink:
-            self.size = self.initial_size * (1.0 - age_ratio * 0.8)
+        self.scaled_out += count - allowed
+        self.frame_emitted += allowed
+        return allowed
+    
+    def end_frame(self):
+        """Kare kotasını sıfırla"""
+        self.frame_emitted = 0
+    
+    def reset(self):
+        """Sayaçları sıfırla"""
+        self.frame_emitted = 0
+        self.requested = 0
+        self.scaled_out = 0
 
 
 class ParticleEmitter:
-    """Parçacık yayıcısı"""
+    """Parçacık yayıcısı (parçacıkları ortak depoya yazar)"""
     
-    def __init__(self, x: float, y: float):
+    def __init__(self, store: ParticleStore, x: float, y: float,
+                 rng: Optional[np.random.Generator] = None,
+                 budget: Optional[ParticleBudget] = None,
+                 priority: int = PRIORITY_NORMAL):
+        self.store = store
+        self.rng = rng or np.random.default_rng()
+        self.budget = budget
+        self.priority = priority
         self.x = x
         self.y = y
-        self.particles: List[Particle] = []
         self.active = True
         
         # Yayıcı özellikleri
@@ -87,51 +234,53 @@ class ParticleEmitter:
         self.particle_size = (2.0, 4.0)
         self.particle_speed = (50.0, 100.0)
         self.particle_direction = (0.0, 360.0)  # derece
-        self.particle_colors = [(1, 1, 1, 1)]
+        self.particle_colors: Sequence[Tuple[float, float, float, float]] = [(1, 1, 1, 1)]
         self.gravity = 0.0
         self.spread_angle = 360.0  # derece
+        self.spin_range = (-180.0, 180.0)  # derece/saniye
+        
+        self.emitted = 0
     
     def set_position(self, x: float, y: float):
         """Pozisyon ayarla"""
         self.x = x
         self.y = y
     
-    def emit_burst(self, count: int):
-        """Patlama halinde parçacık yay"""
-        for _ in range(count):
-            self._create_particle()
-    
-    def _create_particle(self):
-        """Yeni parçacık oluştur"""
-        # Rastgele özellikler
-        lifetime = random.uniform(*self.particle_lifetime)
-        size = random.uniform(*self.particle_size)
-        speed = random.uniform(*self.particle_speed)
+    def emit_burst(self, count: int) -> int:
+        """Patlama halinde parçacık yay (toplu), eklenen sayıyı döndür"""
+        if self.budget:
+            count = self.budget.allow(count, self.priority, self.store.load)
+        if count <= 0:
+            return 0
+        rng = self.rng
+        
+        lifetime = rng.uniform(*self.particle_lifetime, count)
+        size = rng.uniform(*self.particle_size, count)
+        speed = rng.uniform(*self.particle_speed, count)
         
         # Yön hesaplama
         if self.spread_angle >= 360:
-            angle = random.uniform(0, 2 * math.pi)
+            angle = rng.uniform(0.0, 2 * math.pi, count)
         else:
             base_angle = math.radians(self.particle_direction[0])
             spread = math.radians(self.spread_angle)
-            angle = base_angle + random.uniform(-spread/2, spread/2)
-        
-        vel_x = math.cos(angle) * speed
-        vel_y = math.sin(angle) * speed
+            angle = base_angle + rng.uniform(-spread / 2, spread / 2, count)
         
         # Renk seçimi
-        color = random.choice(self.particle_colors)
+        colors = np.asarray(self.particle_colors, dtype=np.float32)
+        color = colors[rng.integers(0, len(colors), count)]
         
-        # Parçacık oluştur
-        particle = Particle(self.x, self.y, vel_x, vel_y, color, size, lifetime, self.gravity)
-        
-        # Rastgele efektler
-        particle.spin_speed = random.uniform(-180, 180)  # derece/saniye
-        
-        self.particles.append(particle)
+        emitted = self.store.spawn(
+            self.x, self.y, np.cos(angle) * speed, np.sin(angle) * speed,
+            color, size, lifetime, self.gravity,
+            spin_speed=np.radians(rng.uniform(*self.spin_range, count)),
+            priority=self.priority,
+        )
+        self.emitted += emitted
+        return emitted
     
     def update(self, dt: float):
-        """Yayıcıyı güncelle"""
+        """Sürekli yayıcıyı güncelle"""
         if not self.active:
             return
         
@@ -146,60 +295,57 @@ class ParticleEmitter:
             self.emission_timer += dt
             particles_to_emit = int(self.emission_timer * self.emission_rate)
             if particles_to_emit > 0:
-                self.emission_timer = 0.0
-                for _ in range(particles_to_emit):
-                    self._create_particle()
-        
-        # Mevcut parçacıkları güncelle
-        for particle in self.particles[:]:
-            particle.update(dt)
-            if not particle.alive:
-                self.particles.remove(particle)
-    
-    def render(self, canvas):
-        """Parçacıkları render et"""
-        for particle in self.particles:
-            if not particle.alive:
-                continue
-            
-            with canvas:
-                Color(*particle.color)
-                
-                if particle.spin != 0:
-                    PushMatrix()
-                    # Rotation around particle center
-                    # Note: Kivy rotation is in degrees
-                    from kivy.graphics import Rotate
-                    Rotate(angle=math.degrees(particle.spin), 
-                          origin=(particle.x, particle.y))
-                
-                # Parçacığı çiz
-                size = particle.size
-                Ellipse(pos=(particle.x - size/2, particle.y - size/2), 
-                       size=(size, size))
-                
-                if particle.spin != 0:
-                    PopMatrix()
+                self.emission_timer -= particles_to_emit / self.emission_rate
+                self.emit_burst(particles_to_emit)
     
     def is_finished(self) -> bool:
-        """Yayıcı bitti mi?"""
-        return not self.active and len(self.particles) == 0
+        """Yayıcı bitti mi? (parçacıkları depoda kendi başına yaşar)"""
+        return not self.active
 
 
 class ParticleSystem:
     """Ana parçacık sistem yöneticisi"""
     
-    def __init__(self):
-        self.emitters: List[ParticleEmitter] = []
+    def __init__(self, capacity: int = 4096, frame_quota: int = 600, max_emitters: int = 16):
+        self.store = ParticleStore(capacity)
+        self.budget = ParticleBudget(frame_quota)
+        self.rng = np.random.default_rng()
+        self.emitters: List[ParticleEmitter] = []  # Sürekli (aktif) yayıcılar
+        self.max_emitters = max_emitters
+        self.emitters_replaced = 0  # Sınır aşılınca erken kapatılan yayıcılar
         
-    def create_explosion(self, x: float, y: float, intensity: float = 1.0) -> ParticleEmitter:
+        # Çizim (canvas başına bir kez kurulur)
+        self._canvas = None
+        self._batch = None
+    
+    def _new_emitter(self, x: float, y: float, priority: int = PRIORITY_NORMAL) -> ParticleEmitter:
+        """Ortak depoya bütçe dahilinde yazan yayıcı"""
+        return ParticleEmitter(self.store, x, y, self.rng, self.budget, priority)
+    
+    def _add_emitter(self, emitter: ParticleEmitter) -> ParticleEmitter:
+        """Sürekli yayıcı ekle (sınır aşılırsa en eskisi kapanır)"""
+        if len(self.emitters) >= self.max_emitters:
+            self.emitters.pop(0).active = False
+            self.emitters_replaced += 1
+        self.emitters.append(emitter)
+        return emitter
+    
+    def _finish_burst(self, emitter: ParticleEmitter, count: int) -> ParticleEmitter:
+        """Tek seferlik yayıcıyı patlat (listeye eklenmez)"""
+        emitter.emit_burst(count)
+        emitter.active = False
+        return emitter
+    
+    def create_explosion(self, x: float, y: float, intensity: float = 1.0,
+                         colors: Optional[Sequence[Tuple[float, float, float, float]]] = None,
+                         priority: int = PRIORITY_NORMAL) -> ParticleEmitter:
         """Patlama efekti oluştur"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._new_emitter(x, y, priority)
         emitter.burst_mode = True
         emitter.particle_lifetime = (0.5, 1.5)
         emitter.particle_size = (3.0 * intensity, 8.0 * intensity)
         emitter.particle_speed = (80.0 * intensity, 150.0 * intensity)
-        emitter.particle_colors = [
+        emitter.particle_colors = colors or [
             (1.0, 0.8, 0.0, 1.0),  # Sarı
             (1.0, 0.4, 0.0, 1.0),  # Turuncu
             (1.0, 0.0, 0.0, 1.0),  # Kırmızı
@@ -208,16 +354,11 @@ class ParticleSystem:
         emitter.spread_angle = 360.0
         
         # Patlamayı başlat
-        particle_count = int(20 * intensity)
-        emitter.emit_burst(particle_count)
-        emitter.active = False  # Sadece burst
-        
-        self.emitters.append(emitter)
-        return emitter
+        return self._finish_burst(emitter, int(20 * intensity))
     
     def create_heal_effect(self, x: float, y: float) -> ParticleEmitter:
         """İyileştirme efekti"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._new_emitter(x, y, PRIORITY_LOW)
         emitter.emission_rate = 30.0
         emitter.duration = 1.0
         emitter.particle_lifetime = (1.0, 2.0)
@@ -232,12 +373,11 @@ class ParticleSystem:
         emitter.spread_angle = 60.0
         emitter.particle_direction = (90.0, 90.0)  # Yukarı
         
-        self.emitters.append(emitter)
-        return emitter
+        return self._add_emitter(emitter)
     
     def create_damage_numbers(self, x: float, y: float, damage: int) -> ParticleEmitter:
         """Hasar sayıları efekti"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._new_emitter(x, y)
         emitter.burst_mode = True
         emitter.particle_lifetime = (1.5, 1.5)
         emitter.particle_size = (8.0, 8.0)
@@ -250,15 +390,11 @@ class ParticleSystem:
         emitter.particle_direction = (90.0, 90.0)
         
         # Tek parçacık (sayı için)
-        emitter.emit_burst(1)
-        emitter.active = False
-        
-        self.emitters.append(emitter)
-        return emitter
+        return self._finish_burst(emitter, 1)
     
     def create_level_up_effect(self, x: float, y: float) -> ParticleEmitter:
         """Level up efekti"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._new_emitter(x, y, PRIORITY_HIGH)
         emitter.burst_mode = True
         emitter.particle_lifetime = (2.0, 3.0)
         emitter.particle_size = (4.0, 8.0)
@@ -271,15 +407,11 @@ class ParticleSystem:
         emitter.gravity = 50.0
         emitter.spread_angle = 360.0
         
-        emitter.emit_burst(50)
-        emitter.active = False
-        
-        self.emitters.append(emitter)
-        return emitter
+        return self._finish_burst(emitter, 50)
     
     def create_muzzle_flash(self, x: float, y: float, angle: float) -> ParticleEmitter:
         """Namlu alevi efekti"""
-        emitter = ParticleEmitter(x, y)
+        emitter = self._new_emitter(x, y, PRIORITY_LOW)
         emitter.burst_mode = True
         emitter.particle_lifetime = (0.1, 0.3)
         emitter.particle_size = (2.0, 4.0)
@@ -292,31 +424,130 @@ class ParticleSystem:
         emitter.spread_angle = 30.0
         emitter.particle_direction = (math.degrees(angle), math.degrees(angle))
         
-        emitter.emit_burst(8)
-        emitter.active = False
-        
-        self.emitters.append(emitter)
-        return emitter
+        return self._finish_burst(emitter, 8)
     
     def update(self, dt: float):
-        """Tüm parçacık sistemlerini güncelle"""
-        for emitter in self.emitters[:]:
+        """Sürekli yayıcıları ve tüm parçacıkları güncelle"""
+        for emitter in self.emitters:
             emitter.update(dt)
-            if emitter.is_finished():
-                self.emitters.remove(emitter)
+        self.emitters = [emitter for emitter in self.emitters if not emitter.is_finished()]
+        
+        self.store.update(dt)
+        self.budget.end_frame()
     
     def render(self, canvas):
-        """Tüm parçacıkları render et"""
-        for emitter in self.emitters:
-            emitter.render(canvas)
+        """Tüm parçacıkları tek Mesh ile çiz (canvas'a bir kez eklenir)"""
+        if canvas is not self._canvas:
+            group = SpriteBatchGroup()
+            self._batch = group.add_layer('particles', shape_texture('circle'), self.store.capacity)
+            canvas.add(group.context)
+            self._canvas = canvas
+        
+        store = self.store
+        n = store.count
+        if n == 0:
+            self._batch.clear()
+            return
+        half = store.size[:n] * 0.5
+        self._batch.draw(store.x[:n], store.y[:n], half, half,
+                         angle=np.degrees(store.spin[:n]), rgba=store.color[:n])
     
     def clear(self):
         """Tüm parçacıkları temizle"""
         self.emitters.clear()
+        self.store.clear()
+        self.budget.end_frame()
     
     def get_particle_count(self) -> int:
         """Toplam parçacık sayısı"""
-        return sum(len(emitter.particles) for emitter in self.emitters)
+        return self.store.count
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Bütçe sayaçları (profilleyici için)"""
+        store = self.store
+        return {
+            'requested': self.budget.requested,
+            'spawned': store.spawned,
+            'scaled_out': self.budget.scaled_out,
+            'evicted': store.evicted,
+            'dropped': store.dropped,
+            'emitters_replaced': self.emitters_replaced,
+        }
+    
+    # Simülasyon olayları (core.events) -> parçacık efektleri
+    def attach(self, event_bus):
+        """Simülasyon olaylarına gözlemci olarak abone ol"""
+        event_bus.subscribe('enemy_damaged', self._on_enemy_damaged)
+        event_bus.subscribe('enemy_killed', self._on_enemy_killed)
+        event_bus.subscribe('enemy_attack', self._on_enemy_attack)
+        event_bus.subscribe('enemy_teleport', self._on_enemy_teleport)
+        event_bus.subscribe('player_damaged', self._on_player_damaged)
+        event_bus.subscribe('player_killed', self._on_player_killed)
+        event_bus.subscribe('player_healed', self._on_player_healed)
+        event_bus.subscribe('player_fired', self._on_player_fired)
+        event_bus.subscribe('player_level_up', self._on_player_level_up)
+        event_bus.subscribe('ability_added', self._on_player_healed)
+        event_bus.subscribe('loot_collected', self._on_loot_collected)
+    
+    def _on_enemy_damaged(self, enemy, amount, audible):
+        """Kan efekti ve hasar sayısı"""
+        blood_color = (0.8, 0.2, 0.2, 1.0)  # Kırmızı
+        if enemy.enemy_type == "slime":
+            blood_color = (0.2, 0.8, 0.2, 1.0)  # Yeşil
+        elif enemy.enemy_type == "skeleton":
+            blood_color = (0.9, 0.9, 0.9, 1.0)  # Beyaz
+        
+        self.create_explosion(enemy.center_x, enemy.center_y, 0.3, colors=[blood_color])
+        self.create_damage_numbers(enemy.center_x, enemy.center_y + 15, int(amount))
+    
+    def _on_enemy_killed(self, enemy):
+        """Ölüm patlaması"""
+        self.create_explosion(enemy.center_x, enemy.center_y, 1.0)
+    
+    def _on_enemy_attack(self, enemy, player_pos):
+        """Düşman saldırı efektleri"""
+        if enemy.enemy_type == "goblin":
+            # Hızlı saldırı
+            self.create_muzzle_flash(
+                enemy.center_x, enemy.center_y,
+                math.atan2(player_pos[1] - enemy.center_y, player_pos[0] - enemy.center_x)
+            )
+        elif enemy.enemy_type == "orc":
+            # Güçlü saldırı efekti
+            self.create_explosion(enemy.center_x, enemy.center_y, 0.5)
+    
+    def _on_enemy_teleport(self, enemy, x, y):
+        """Iskelet teleport efekti"""
+        self.create_explosion(x, y, 0.3)
+    
+    def _on_player_damaged(self, player, amount):
+        """Oyuncu hasar sayısı"""
+        self.create_damage_numbers(player.center_x, player.center_y + 20, int(amount))
+    
+    def _on_player_killed(self, player):
+        """Oyuncu ölüm patlaması"""
+        self.create_explosion(player.center_x, player.center_y, 2.0, priority=PRIORITY_HIGH)
+    
+    def _on_player_healed(self, player, *args):
+        """İyileştirme / yetenek alma efekti"""
+        self.create_heal_effect(player.center_x, player.center_y)
+    
+    def _on_player_fired(self, player, projectile_count):
+        """Her mermi yönü için muzzle flash"""
+        for i in range(projectile_count):
+            angle = (2 * math.pi * i) / projectile_count
+            flash_x = player.center_x + math.cos(angle) * 20
+            flash_y = player.center_y + math.sin(angle) * 20
+            self.create_muzzle_flash(flash_x, flash_y, angle)
+    
+    def _on_player_level_up(self, player):
+        """Level up efekti"""
+        self.create_level_up_effect(player.center_x, player.center_y)
+    
+    def _on_loot_collected(self, player, loot_value, loot_type):
+        """XP toplama efekti"""
+        if loot_type == 'xp':
+            self.create_heal_effect(player.center_x, player.center_y)
 
 
 # Global parçacık sistemi
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Graphics/SpriteBatch.py - Toplu (batched) sprite çizimi
+
+Aynı texture'ı kullanan tüm sprite'lar tek bir Mesh ile çizilir. Köşe
+pozisyonları, dönüş, renk (tint) ve flash NumPy ile toplu hesaplanır ve
+her karede aynı tampona yazılır; varlık sayısı artsa da canvas talimatı
+sayısı sabit kalır.
+
+Vertex başına: x, y, u, v, r, g, b, a, flash (9 float). Renk ve flash
+için özel shader gerekir; mesh'ler create_sprite_context() ile oluşturulan
+RenderContext içine eklenmelidir.
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+from kivy.graphics import Mesh, RenderContext
+from kivy.graphics.texture import Texture
+
+VERTEX_FORMAT = [
+    (b'vPosition', 2, 'float'),
+    (b'vTexCoords0', 2, 'float'),
+    (b'vColor', 4, 'float'),
+    (b'vFlash', 1, 'float'),
+]
+FLOATS_PER_VERTEX = 9
+FLOATS_PER_SPRITE = FLOATS_PER_VERTEX * 4
+MAX_SPRITES = 65536 // 4  # 16 bit indeks sınırı
+
+SPRITE_VERTEX_SHADER = '''
+#ifdef GL_ES
+    precision highp float;
+#endif
+
+attribute vec2 vPosition;
+attribute vec2 vTexCoords0;
+attribute vec4 vColor;
+attribute float vFlash;
+
+uniform mat4 modelview_mat;
+uniform mat4 projection_mat;
+
+varying vec4 frag_color;
+varying vec2 tex_coord0;
+varying float frag_flash;
+
+void main(void) {
+    frag_color = vColor;
+    tex_coord0 = vTexCoords0;
+    frag_flash = vFlash;
+    gl_Position = projection_mat * modelview_mat * vec4(vPosition, 0.0, 1.0);
+}
+'''
+
+SPRITE_FRAGMENT_SHADER = '''
+#ifdef GL_ES
+    precision highp float;
+#endif
+
+varying vec4 frag_color;
+varying vec2 tex_coord0;
+varying float frag_flash;
+
+uniform sampler2D texture0;
+
+void main(void) {
+    vec4 texel = texture2D(texture0, tex_coord0);
+    vec3 rgb = mix(texel.rgb * frag_color.rgb, vec3(1.0), frag_flash);
+    gl_FragColor = vec4(rgb, texel.a * frag_color.a);
+}
+'''
+
+# Quad köşeleri (merkeze göre, saat yönünün tersine)
+_CORNER_X = np.array([-1.0, 1.0, 1.0, -1.0], dtype=np.float32)
+_CORNER_Y = np.array([-1.0, -1.0, 1.0, 1.0], dtype=np.float32)
+
+
+def create_sprite_context() -> RenderContext:
+    """Sprite batch shader'ı ile RenderContext oluştur"""
+    context = RenderContext(use_parent_projection=True,
+                            use_parent_modelview=True,
+                            use_parent_frag_modelview=True)
+    context.shader.vs = SPRITE_VERTEX_SHADER
+    context.shader.fs = SPRITE_FRAGMENT_SHADER
+    return context
+
+
+def texture_uvs(texture: Optional[Texture]) -> np.ndarray:
+    """Texture (veya bölgesinin) 4 köşe UV'si, (4, 2)"""
+    if texture is None:
+        return np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=np.float32)
+    return np.array(texture.tex_coords, dtype=np.float32).reshape(4, 2)
+
+
+def quad_indices(count: int) -> np.ndarray:
+    """count quad için üçgen indeksleri (0,1,2, 2,3,0 ...)"""
+    base = np.arange(count, dtype=np.uint32)[:, None] * 4
+    pattern = np.array([0, 1, 2, 2, 3, 0], dtype=np.uint32)
+    return (base + pattern).astype(np.uint16).ravel()
+
+
+def _per_sprite(value, count: int, ndim: int) -> np.ndarray:
+    """Skaler/ortak değeri olduğu gibi, sprite başına diziyi count'a kırparak döndür"""
+    value = np.asarray(value, dtype=np.float32)
+    if value.ndim == ndim:
+        return value[:count]
+    return value
+
+
+def write_quads(out: np.ndarray, cx, cy, half_w, half_h, angle=0.0,
+                rgba=(1.0, 1.0, 1.0, 1.0), flash=0.0, uvs=None) -> int:
+    """Sprite'ların köşe verisini out tamponuna yaz, yazılan sprite sayısını döndür
+    
+    cx, cy: merkez dizileri; half_w, half_h, angle (derece) ve flash skaler
+    ya da dizi; rgba tek renk ya da (n, 4); uvs (4, 2) ya da (n, 4, 2).
+    Tampona sığmayan sprite'lar yazılmaz.
+    """
+    count = min(len(cx), out.shape[0] // FLOATS_PER_SPRITE)
+    if count == 0:
+        return 0
+    
+    shape = (count,)
+    cx = _per_sprite(cx, count, 1)
+    cy = _per_sprite(cy, count, 1)
+    half_w = np.broadcast_to(_per_sprite(half_w, count, 1), shape)
+    half_h = np.broadcast_to(_per_sprite(half_h, count, 1), shape)
+    
+    vertices = out[:count * FLOATS_PER_SPRITE].reshape(count, 4, FLOATS_PER_VERTEX)
+    
+    local_x = half_w[:, None] * _CORNER_X
+    local_y = half_h[:, None] * _CORNER_Y
+    
+    angle = _per_sprite(angle, count, 1)
+    if angle.ndim == 0 and angle == 0.0:
+        vertices[:, :, 0] = cx[:, None] + local_x
+        vertices[:, :, 1] = cy[:, None] + local_y
+    else:
+        radians = np.radians(np.broadcast_to(angle, shape))
+        cos_a = np.cos(radians)[:, None]
+        sin_a = np.sin(radians)[:, None]
+        vertices[:, :, 0] = cx[:, None] + local_x * cos_a - local_y * sin_a
+        vertices[:, :, 1] = cy[:, None] + local_x * sin_a + local_y * cos_a
+    
+    vertices[:, :, 2:4] = _per_sprite(uvs if uvs is not None else texture_uvs(None), count, 3)
+    
+    rgba = _per_sprite(rgba, count, 2)
+    vertices[:, :, 4:8] = rgba[:, None, :] if rgba.ndim == 2 else rgba
+    
+    flash = _per_sprite(flash, count, 1)
+    vertices[:, :, 8] = flash[:, None] if flash.ndim == 1 else flash
+    return count
+
+
+class SpriteBatch:
+    """Tek texture, tek Mesh: karede bir kez güncellenen sprite katmanı"""
+    
+    def __init__(self, texture: Optional[Texture] = None, capacity: int = 256):
+        self.texture = texture
+        self.uvs = texture_uvs(texture)
+        self.mesh = Mesh(fmt=VERTEX_FORMAT, mode='triangles', texture=texture)
+        self.capacity = 0
+        self.count = 0
+        self.dropped = 0  # MAX_SPRITES aşıldığı için çizilmeyen sprite'lar
+        self._vertices = np.zeros(0, dtype=np.float32)
+        self._indices = np.zeros(0, dtype=np.uint16)
+        self.reserve(capacity)
+    
+    def reserve(self, count: int):
+        """Kapasiteyi en az count sprite'a çıkar (ikiye katlayarak)"""
+        if count <= self.capacity:
+            return
+        capacity = max(self.capacity, 16)
+        while capacity < count:
+            capacity *= 2
+        capacity = min(capacity, MAX_SPRITES)
+        
+        vertices = np.zeros(capacity * FLOATS_PER_SPRITE, dtype=np.float32)
+        vertices[:self._vertices.shape[0]] = self._vertices
+        self._vertices = vertices
+        self._indices = quad_indices(capacity)
+        self.capacity = capacity
+    
+    def draw(self, cx, cy, half_w, half_h, angle=0.0, rgba=(1.0, 1.0, 1.0, 1.0),
+             flash=0.0, uvs=None):
+        """Bu karenin sprite'larını yaz (önceki kareyi tamamen değiştirir)"""
+        requested = len(cx)
+        self.reserve(requested)
+        self.count = write_quads(self._vertices, cx, cy, half_w, half_h, angle,
+                                 rgba, flash, self.uvs if uvs is None else uvs)
+        self.dropped += requested - self.count
+        self._upload()
+    
+    def clear(self):
+        """Tüm sprite'ları kaldır"""
+        self.count = 0
+        self._upload()
+    
+    def _upload(self):
+        """Tampon görünümlerini mesh'e ver (kopya yok; mesh yeniden kurulur)"""
+        self.mesh.vertices = self._vertices[:self.count * FLOATS_PER_SPRITE]
+        self.mesh.indices = self._indices[:self.count * 6]
+
+
+class SpriteBatchGroup:
+    """Sıralı sprite katmanları (tek RenderContext altında)"""
+    
+    def __init__(self):
+        self.context = create_sprite_context()
+        self.batches: Dict[str, SpriteBatch] = {}
+    
+    def add_layer(self, name: str, texture: Optional[Texture] = None,
+                  capacity: int = 256) -> SpriteBatch:
+        """Yeni katman ekle (en üste çizilir)"""
+        batch = SpriteBatch(texture, capacity)
+        self.batches[name] = batch
+        self.context.add(batch.mesh)
+        return batch
+    
+    def clear(self):
+        """Tüm katmanları boşalt"""
+        for batch in self.batches.values():
+            batch.clear()
+    
+    def sprite_count(self) -> int:
+        """Bu karede çizilen toplam sprite"""
+        return sum(batch.count for batch in self.batches.values())
+
+
+# Basit şekil texture'ları (tint ile renklendirilir)
+_shape_textures: Dict[str, Texture] = {}
+
+
+def _shape_alpha(name: str, size: int) -> np.ndarray:
+    """Şekil için alfa maskesi (0-1), kenarlar yumuşatılmış"""
+    coords = np.arange(size, dtype=np.float32) + 0.5 - size / 2
+    dist = np.sqrt(coords[None, :] ** 2 + coords[:, None] ** 2)
+    radius = size / 2
+    if name == 'circle':
+        return np.clip(radius - dist, 0.0, 1.0)
+    if name == 'ring':
+        thickness = size / 10
+        return np.clip(thickness / 2 - np.abs(dist - (radius - thickness / 2 - 1)), 0.0, 1.0)
+    return np.ones((size, size), dtype=np.float32)  # 'white'
+
+
+def shape_texture(name: str, size: int = 32) -> Texture:
+    """Beyaz şekil texture'ı: 'circle', 'ring' veya 'white' (önbellekli)"""
+    key = f"{name}:{size}"
+    texture = _shape_textures.get(key)
+    if texture is None:
+        pixels = np.full((size, size, 4), 255, dtype=np.uint8)
+        pixels[:, :, 3] = (_shape_alpha(name, size) * 255).astype(np.uint8)
+        texture = Texture.create(size=(size, size), colorfmt='rgba')
+        texture.blit_buffer(pixels.tobytes(), colorfmt='rgba', bufferfmt='ubyte')
+        _shape_textures[key] = texture
+    return texture
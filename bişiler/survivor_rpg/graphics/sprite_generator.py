@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Graphics/SpriteGenerator.py - Procedural sprite üretimi (NumPy)
+
+Tüm sprite'lar piksel döngüsü olmadan dizi işlemleriyle üretilir ve
+(yükseklik, genişlik, 4) uint8 RGBA dizisi olarak döndürülür. Satır 0
+texture'ın alt kenarıdır (Kivy blit_buffer düzeni). Kivy'den bağımsızdır;
+texture'a dönüştürme graphics.texture_atlas ile yapılır.
+
+Yeni düşman türü eklemek için ENEMY_COLORS'a bir renk eklemek yeterlidir.
+Önbellek verilirse (services.asset_cache) her sprite üretici adı ve
+parametreleriyle saklanır; sıcak başlangıçta hiçbir sprite üretilmez.
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+# Üreticilerin çıktısı değişince artırılır (önbellek anahtarına girer)
+GENERATOR_VERSION = 1
+
+# Düşman temel renkleri
+ENEMY_COLORS: Dict[str, Tuple[int, int, int]] = {
+    'slime': (100, 255, 100),    # Yeşil slime
+    'goblin': (255, 100, 100),   # Kırmızı goblin
+    'skeleton': (200, 200, 200), # Gri iskelet
+    'orc': (150, 100, 50),       # Kahverengi orc
+}
+
+# Efekt kareleri (kare başına renk, her karede genişler)
+EFFECT_COLORS: Dict[str, Tuple[Tuple[int, int, int], ...]] = {
+    'explosion': ((255, 255, 0), (255, 150, 0), (255, 50, 0)),
+    'heal': ((0, 255, 0), (150, 255, 150), (255, 255, 255)),
+    'damage': ((255, 0, 0), (255, 100, 100), (255, 150, 150)),
+}
+
+# Modern UI elementleri
+UI_COLORS: Dict[str, Tuple[int, int, int]] = {
+    'button': (70, 130, 180),     # Steel blue
+    'panel': (40, 40, 60),        # Dark gray
+    'health_bar': (220, 20, 60),  # Crimson
+    'mana_bar': (30, 144, 255),   # Dodger blue
+    'xp_bar': (255, 215, 0),      # Gold
+}
+
+
+def _grid(width: int, height: int, center_x: float, center_y: float):
+    """Piksel koordinatları ve merkeze uzaklık (float64)"""
+    y, x = np.mgrid[0:height, 0:width]
+    dist = np.sqrt((x - center_x) ** 2.0 + (y - center_y) ** 2.0)
+    return x, y, dist
+
+
+def _to_pixels(r, g, b, a) -> np.ndarray:
+    """Kanal dizilerini (h, w, 4) uint8'e çevir (int() gibi kırparak)"""
+    return np.stack([np.asarray(c, dtype=np.float64) for c in np.broadcast_arrays(r, g, b, a)],
+                    axis=-1).astype(np.uint8)
+
+
+def generate_player(size: int = 32) -> np.ndarray:
+    """Mavi gradient gövde, beyaz kenar"""
+    center = size // 2
+    _, _, dist = _grid(size, size, center, center)
+    body = dist <= 12
+    edge = ~body & (dist <= 14)
+    
+    intensity = 1.0 - (dist / 12)
+    r = np.where(body, 50 + intensity * 100, np.where(edge, 255, 0))
+    g = np.where(body, 150 + intensity * 100, np.where(edge, 255, 0))
+    b = np.where(body | edge, 255, 0)
+    a = np.where(body | edge, 255, 0)
+    return _to_pixels(r, g, b, a)
+
+
+def generate_enemy(base_color: Tuple[int, int, int], size: int = 24) -> np.ndarray:
+    """Radyal gövde, kırmızı gözler, koyu kenar"""
+    center = size // 2
+    x, y, dist = _grid(size, size, center, center)
+    body = dist <= 10
+    edge = ~body & (dist <= 12)
+    eyes = body & (y >= 8) & (y <= 10) & (((x >= 6) & (x <= 8)) | ((x >= 16) & (x <= 18)))
+    
+    intensity = 1.0 - (dist / 10)
+    channels = []
+    for base, eye_value in zip(base_color, (255, 0, 0)):
+        value = np.where(body, np.trunc(base * intensity), np.where(edge, np.trunc(base * 0.5), 0))
+        channels.append(np.where(eyes, eye_value, value))
+    a = np.where(body | edge, 255, 0)
+    return _to_pixels(*channels, a)
+
+
+def generate_effect(color: Tuple[int, int, int], frame: int, size: int = 16) -> np.ndarray:
+    """Genişleyen radyal efekt karesi"""
+    center = size // 2
+    _, _, dist = _grid(size, size, center, center)
+    max_radius = 6 + frame * 2
+    inside = dist <= max_radius
+    
+    intensity = np.where(inside, 1.0 - (dist / max_radius), 0.0)
+    r, g, b = (np.trunc(channel * intensity) for channel in color)
+    a = 255 * intensity * (1.0 - frame * 0.3)
+    return _to_pixels(r, g, b, a)
+
+
+def generate_ui(color: Tuple[int, int, int], width: int = 64, height: int = 64,
+                bar: bool = False) -> np.ndarray:
+    """Gradient panel / bar, vurgulu kenar"""
+    center_x, center_y = width // 2, height // 2
+    x, y, dist = _grid(width, height, center_x, center_y)
+    if bar:
+        intensity = 0.7 + 0.3 * (1.0 - y / height)  # Dikey gradient
+    else:
+        max_dist = np.sqrt(center_x ** 2 + center_y ** 2)
+        intensity = 0.5 + 0.5 * (1.0 - dist / max_dist)
+    
+    border = (x == 0) | (x == width - 1) | (y == 0) | (y == height - 1)
+    channels = []
+    for base in color:
+        value = np.trunc(base * intensity)
+        channels.append(np.where(border, np.minimum(255, value + 50), value))
+    return _to_pixels(*channels, 255)
+
+
+def generate_gradient(size: int = 32) -> np.ndarray:
+    """Yedek (fallback) gradient kare"""
+    x, y, _ = _grid(size, size, 0, 0)
+    r = 255 * (x / (size - 1))
+    g = 255 * (y / (size - 1))
+    return _to_pixels(r, g, 128, 255)
+
+
+def generate_circle(size: int = 24) -> np.ndarray:
+    """Beyaz, kenarı yumuşatılmış daire (tint ile renklendirilir)"""
+    coords = np.arange(size, dtype=np.float64) + 0.5 - size / 2
+    dist = np.sqrt(coords[None, :] ** 2 + coords[:, None] ** 2)
+    alpha = np.clip(size / 2 - dist, 0.0, 1.0) * 255
+    return _to_pixels(255, 255, 255, alpha)
+
+
+def default_sprite_specs() -> List[Tuple[str, Callable[..., np.ndarray], Dict[str, Any]]]:
+    """Varsayılan sprite'lar: (ad, üretici, parametreler)
+    
+    Efekt kareleri 'ad:kare' olarak adlandırılır (ör. 'explosion:0').
+    """
+    specs = [('player', generate_player, {}), ('circle', generate_circle, {})]
+    for name, color in ENEMY_COLORS.items():
+        specs.append((name, generate_enemy, {'base_color': list(color)}))
+    for name, colors in EFFECT_COLORS.items():
+        for frame, color in enumerate(colors):
+            specs.append((f'{name}:{frame}', generate_effect, {'color': list(color), 'frame': frame}))
+    for name, color in UI_COLORS.items():
+        bar = 'bar' in name
+        specs.append((name, generate_ui, {'color': list(color), 'width': 64,
+                                          'height': 16 if bar else 64, 'bar': bar}))
+    return specs
+
+
+def generate_default_sprites(cache=None) -> Dict[str, np.ndarray]:
+    """Oyunun tüm varsayılan sprite'ları (ad -> RGBA dizisi)
+    
+    cache: AssetCache (isteğe bağlı); varsa diziler önbellekten okunur.
+    """
+    sprites = {}
+    for name, generator, params in default_sprite_specs():
+        if cache is None:
+            sprites[name] = generator(**params)
+        else:
+            sprites[name] = cache.cached_array(
+                generator.__name__, params, GENERATOR_VERSION,
+                lambda generator=generator, params=params: generator(**params))
+    return sprites
@@ -2,15 +2,23 @@
 # -*- coding: utf-8 -*-
 """
 Graphics/SpriteManager.py - Profesyonel sprite yönetim sistemi
+
+Varsayılan sprite'lar NumPy ile üretilir (graphics.sprite_generator),
+kalıcı önbellekte saklanır (services.asset_cache) ve tek bir atlas
+texture'ına paketlenir (graphics.texture_atlas).
 """
 
 import os
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from kivy.graphics import Rectangle, PushMatrix, PopMatrix, Rotate, Color
 from kivy.graphics.texture import Texture
 from kivy.core.image import Image
 from kivy.logger import Logger
-import math
+import numpy as np
+
+from .sprite_generator import EFFECT_COLORS, generate_default_sprites, generate_gradient
+from .texture_atlas import TextureAtlas
+from services.asset_cache import asset_cache
 
 
 class SpriteSheet:
@@ -41,19 +49,9 @@ class SpriteSheet:
     
     def _create_fallback_texture(self):
         """Fallback texture oluştur"""
-        # 32x32 renkli kare oluştur
-        data = []
-        for y in range(32):
-            for x in range(32):
-                # Gradient efekti
-                r = int(255 * (x / 31))
-                g = int(255 * (y / 31))
-                b = 128
-                a = 255
-                data.extend([r, g, b, a])
-        
+        # 32x32 gradient kare oluştur
         self.texture = Texture.create(size=(32, 32))
-        self.texture.blit_buffer(bytes(data), colorfmt='rgba', bufferfmt='ubyte')
+        self.texture.blit_buffer(generate_gradient(32).tobytes(), colorfmt='rgba', bufferfmt='ubyte')
     
     def get_sprite(self, name: str, x: int, y: int) -> Texture:
         """Sprite'ı al"""
@@ -132,211 +130,46 @@ class AnimatedSprite:
         self.time_since_frame = 0.0
 
 
+class AtlasSheet:
+    """Atlas bölgelerinden oluşan sprite sheet (efektlerde birden çok kare)"""
+    
+    def __init__(self, textures: List[Texture]):
+        self.textures = textures
+        self.texture = textures[0]
+        self.current = 0
+    
+    def get_sprite(self, name: str, x: int, y: int) -> Texture:
+        """Mevcut kareyi al"""
+        return self.textures[self.current % len(self.textures)]
+
+
 class SpriteRenderer:
     """Gelişmiş sprite render sistemi"""
     
     def __init__(self):
         self.sprite_sheets: Dict[str, SpriteSheet] = {}
+        self.atlas: Optional[TextureAtlas] = None
         self._load_default_sprites()
     
     def _load_default_sprites(self):
-        """Varsayılan sprite'ları yükle"""
-        # Oyuncu sprite'ları
-        self._create_player_sprites()
-        
-        # Düşman sprite'ları
-        self._create_enemy_sprites()
-        
-        # Efekt sprite'ları
-        self._create_effect_sprites()
-        
-        # UI sprite'ları
-        self._create_ui_sprites()
-    
-    def _create_player_sprites(self):
-        """Oyuncu sprite'larını oluştur"""
-        # Procedural olarak güzel oyuncu sprite'ı oluştur
-        data = []
-        size = 32
-        center = size // 2
-        
-        for y in range(size):
-            for x in range(size):
-                # Merkeze olan mesafe
-                dist = math.sqrt((x - center)**2 + (y - center)**2)
-                
-                if dist <= 12:  # Ana gövde
-                    # Mavi gradient
-                    intensity = 1.0 - (dist / 12)
-                    r = int(50 + intensity * 100)
-                    g = int(150 + intensity * 100)
-                    b = int(255)
-                    a = 255
-                elif dist <= 14:  # Kenar çizgisi
-                    r, g, b, a = 255, 255, 255, 255
-                else:  # Şeffaf
-                    r, g, b, a = 0, 0, 0, 0
-                
-                data.extend([r, g, b, a])
-        
-        texture = Texture.create(size=(size, size))
-        texture.blit_buffer(bytes(data), colorfmt='rgba', bufferfmt='ubyte')
-        
-        # Fake sprite sheet oluştur
-        class FakeSheet:
-            def __init__(self, tex):
-                self.texture = tex
-            def get_sprite(self, name, x, y):
-                return self.texture
-        
-        self.sprite_sheets['player'] = FakeSheet(texture)
-    
-    def _create_enemy_sprites(self):
-        """Düşman sprite'larını oluştur"""
-        enemies = {
-            'slime': (100, 255, 100),    # Yeşil slime
-            'goblin': (255, 100, 100),   # Kırmızı goblin
-            'skeleton': (200, 200, 200), # Gri iskelet
-            'orc': (150, 100, 50),       # Kahverengi orc
-        }
+        """Varsayılan sprite'ları üret ve tek atlasa paketle"""
+        self.atlas = TextureAtlas(generate_default_sprites(asset_cache))
+        self.atlas.create_texture()
         
-        for enemy_name, (base_r, base_g, base_b) in enemies.items():
-            data = []
-            size = 24
-            center = size // 2
-            
-            for y in range(size):
-                for x in range(size):
-                    dist = math.sqrt((x - center)**2 + (y - center)**2)
-                    
-                    if dist <= 10:  # Ana gövde
-                        intensity = 1.0 - (dist / 10)
-                        r = int(base_r * intensity)
-                        g = int(base_g * intensity)
-                        b = int(base_b * intensity)
-                        a = 255
-                        
-                        # Göz efekti
-                        if 6 <= x <= 8 and 8 <= y <= 10:
-                            r, g, b = 255, 0, 0  # Kırmızı göz
-                        elif 16 <= x <= 18 and 8 <= y <= 10:
-                            r, g, b = 255, 0, 0  # Kırmızı göz
-                            
-                    elif dist <= 12:  # Kenar
-                        r = int(base_r * 0.5)
-                        g = int(base_g * 0.5) 
-                        b = int(base_b * 0.5)
-                        a = 255
-                    else:
-                        r, g, b, a = 0, 0, 0, 0
-                    
-                    data.extend([r, g, b, a])
-            
-            texture = Texture.create(size=(size, size))
-            texture.blit_buffer(bytes(data), colorfmt='rgba', bufferfmt='ubyte')
-            
-            class FakeSheet:
-                def __init__(self, tex):
-                    self.texture = tex
-                def get_sprite(self, name, x, y):
-                    return self.texture
-            
-            self.sprite_sheets[enemy_name] = FakeSheet(texture)
-    
-    def _create_effect_sprites(self):
-        """Efekt sprite'larını oluştur"""
-        effects = {
-            'explosion': [(255, 255, 0), (255, 150, 0), (255, 50, 0)],
-            'heal': [(0, 255, 0), (150, 255, 150), (255, 255, 255)],
-            'damage': [(255, 0, 0), (255, 100, 100), (255, 150, 150)],
+        effect_frames = {
+            f'{name}:{frame}' for name, colors in EFFECT_COLORS.items() for frame in range(len(colors))
         }
+        for name in self.atlas.regions:
+            if name not in effect_frames:
+                self.sprite_sheets[name] = AtlasSheet([self.atlas.get_texture(name)])
         
-        for effect_name, colors in effects.items():
-            textures = []
-            
-            for frame, (r, g, b) in enumerate(colors):
-                data = []
-                size = 16
-                center = size // 2
-                
-                for y in range(size):
-                    for x in range(size):
-                        dist = math.sqrt((x - center)**2 + (y - center)**2)
-                        max_radius = 6 + frame * 2  # Genişleyen efekt
-                        
-                        if dist <= max_radius:
-                            intensity = 1.0 - (dist / max_radius)
-                            final_r = int(r * intensity)
-                            final_g = int(g * intensity)
-                            final_b = int(b * intensity)
-                            alpha = int(255 * intensity * (1.0 - frame * 0.3))
-                        else:
-                            final_r = final_g = final_b = alpha = 0
-                        
-                        data.extend([final_r, final_g, final_b, alpha])
-                
-                texture = Texture.create(size=(size, size))
-                texture.blit_buffer(bytes(data), colorfmt='rgba', bufferfmt='ubyte')
-                textures.append(texture)
-            
-            class FakeSheet:
-                def __init__(self, texs):
-                    self.textures = texs
-                    self.current = 0
-                def get_sprite(self, name, x, y):
-                    return self.textures[self.current % len(self.textures)]
-            
-            self.sprite_sheets[effect_name] = FakeSheet(textures)
-    
-    def _create_ui_sprites(self):
-        """UI sprite'larını oluştur"""
-        # Modern UI elementleri
-        ui_elements = {
-            'button': (70, 130, 180),     # Steel blue
-            'panel': (40, 40, 60),        # Dark gray
-            'health_bar': (220, 20, 60),  # Crimson
-            'mana_bar': (30, 144, 255),   # Dodger blue
-            'xp_bar': (255, 215, 0),      # Gold
-        }
+        # Efektler: kare başına bir bölge
+        for name, colors in EFFECT_COLORS.items():
+            frames = [self.atlas.get_texture(f'{name}:{frame}') for frame in range(len(colors))]
+            self.sprite_sheets[name] = AtlasSheet(frames)
         
-        for ui_name, (r, g, b) in ui_elements.items():
-            data = []
-            width, height = 64, 16 if 'bar' in ui_name else 64
-            
-            for y in range(height):
-                for x in range(width):
-                    # Gradient efekti
-                    if 'bar' in ui_name:
-                        intensity = 0.7 + 0.3 * (1.0 - y / height)  # Dikey gradient
-                    else:
-                        center_x, center_y = width // 2, height // 2
-                        dist = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-                        max_dist = math.sqrt(center_x**2 + center_y**2)
-                        intensity = 0.5 + 0.5 * (1.0 - dist / max_dist)
-                    
-                    final_r = int(r * intensity)
-                    final_g = int(g * intensity)
-                    final_b = int(b * intensity)
-                    alpha = 255
-                    
-                    # Kenar vurgusu
-                    if x == 0 or x == width-1 or y == 0 or y == height-1:
-                        final_r = min(255, final_r + 50)
-                        final_g = min(255, final_g + 50)
-                        final_b = min(255, final_b + 50)
-                    
-                    data.extend([final_r, final_g, final_b, alpha])
-            
-            texture = Texture.create(size=(width, height))
-            texture.blit_buffer(bytes(data), colorfmt='rgba', bufferfmt='ubyte')
-            
-            class FakeSheet:
-                def __init__(self, tex):
-                    self.texture = tex
-                def get_sprite(self, name, x, y):
-                    return self.texture
-            
-            self.sprite_sheets[ui_name] = FakeSheet(texture)
+        Logger.info(f"SpriteRenderer: {len(self.atlas.regions)} sprite atlasa paketlendi "
+                    f"({self.atlas.size[0]}x{self.atlas.size[1]})")
     
     def render_sprite(self, canvas, sprite_name: str, pos: Tuple[float, float], 
                      size: Tuple[float, float], rotation: float = 0.0, 
@@ -368,6 +201,15 @@ class SpriteRenderer:
             if rotation != 0.0:
                 PopMatrix()
     
+    def get_texture(self, name: str) -> Optional[Texture]:
+        """Sprite'ın texture'ını al (yoksa None)"""
+        sheet = self.sprite_sheets.get(name)
+        return sheet.get_sprite(name, 0, 0) if sheet else None
+    
+    def get_uvs(self, name: str) -> Optional[np.ndarray]:
+        """Sprite'ın atlas UV'leri, (4, 2) (yoksa None)"""
+        return self.atlas.uvs.get(name) if self.atlas else None
+    
     def get_sprite_sheet(self, name: str) -> Optional[SpriteSheet]:
         """Sprite sheet'i al"""
         return self.sprite_sheets.get(name)
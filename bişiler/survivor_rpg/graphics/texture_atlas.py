@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Graphics/TextureAtlas.py - Sprite'ları tek texture'a paketleme
+
+Görüntüler raf (shelf) yöntemiyle tek bir RGBA atlasa yerleştirilir; her
+sprite için bölge (x, y, w, h) ve UV tablosu tutulur. Kenarlara sprite'ın
+kendi kenar pikselleri uzatılarak (extrude) dolgu eklenir, böylece doğrusal
+filtrelemede komşu sprite'lar birbirine taşmaz. Aynı atlası kullanan tüm
+sprite'lar tek Mesh ile çizilebilir (graphics.sprite_batch, uvs=...).
+"""
+
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+from kivy.graphics.texture import Texture
+
+Region = Tuple[int, int, int, int]
+
+
+def _next_power_of_two(value: int) -> int:
+    """value'dan büyük ya da eşit en küçük 2'nin kuvveti"""
+    return 1 << max(0, int(value - 1).bit_length())
+
+
+def pack_images(images: Dict[str, np.ndarray], padding: int = 1
+                ) -> Tuple[np.ndarray, Dict[str, Region]]:
+    """Görüntüleri tek diziye paketle, (atlas pikselleri, ad -> bölge) döndür"""
+    if not images:
+        return np.zeros((1, 1, 4), dtype=np.uint8), {}
+    
+    # Yüksekten kısaya sıralı raflar
+    order = sorted(images, key=lambda name: (-images[name].shape[0], name))
+    padded = {name: (images[name].shape[1] + 2 * padding, images[name].shape[0] + 2 * padding)
+              for name in order}
+    area = sum(w * h for w, h in padded.values())
+    widest = max(w for w, _ in padded.values())
+    width = _next_power_of_two(max(widest, int(np.ceil(np.sqrt(area)))))
+    
+    positions: Dict[str, Tuple[int, int]] = {}
+    shelf_x = shelf_y = shelf_height = 0
+    for name in order:
+        w, h = padded[name]
+        if shelf_x + w > width:
+            shelf_y += shelf_height
+            shelf_x = shelf_height = 0
+        positions[name] = (shelf_x, shelf_y)
+        shelf_x += w
+        shelf_height = max(shelf_height, h)
+    height = _next_power_of_two(shelf_y + shelf_height)
+    
+    atlas = np.zeros((height, width, 4), dtype=np.uint8)
+    regions: Dict[str, Region] = {}
+    for name in order:
+        image = images[name]
+        x, y = positions[name]
+        w, h = padded[name]
+        atlas[y:y + h, x:x + w] = np.pad(image, ((padding, padding), (padding, padding), (0, 0)),
+                                         mode='edge')
+        regions[name] = (x + padding, y + padding, image.shape[1], image.shape[0])
+    return atlas, regions
+
+
+def region_uvs(region: Region, size: Tuple[int, int]) -> np.ndarray:
+    """Bölgenin 4 köşe UV'si, (4, 2) - Kivy tex_coords sırası"""
+    x, y, w, h = region
+    atlas_w, atlas_h = size
+    u0, v0 = x / atlas_w, y / atlas_h
+    u1, v1 = (x + w) / atlas_w, (y + h) / atlas_h
+    return np.array([[u0, v0], [u1, v0], [u1, v1], [u0, v1]], dtype=np.float32)
+
+
+class TextureAtlas:
+    """Tek texture'da toplanmış sprite'lar ve UV tablosu"""
+    
+    def __init__(self, images: Dict[str, np.ndarray], padding: int = 1):
+        self.pixels, self.regions = pack_images(images, padding)
+        self.size = (self.pixels.shape[1], self.pixels.shape[0])
+        self.uvs: Dict[str, np.ndarray] = {
+            name: region_uvs(region, self.size) for name, region in self.regions.items()
+        }
+        self.texture = None
+        self._region_textures: Dict[str, Texture] = {}
+    
+    def create_texture(self) -> Texture:
+        """Atlas texture'ını GPU'ya yükle (bir kez)"""
+        if self.texture is None:
+            self.texture = Texture.create(size=self.size, colorfmt='rgba')
+            self.texture.blit_buffer(self.pixels.tobytes(), colorfmt='rgba', bufferfmt='ubyte')
+        return self.texture
+    
+    def get_texture(self, name: str):
+        """Sprite bölgesi (atlas texture'ının alt bölgesi, yoksa None)"""
+        region = self.regions.get(name)
+        if region is None:
+            return None
+        texture = self._region_textures.get(name)
+        if texture is None:
+            texture = self.create_texture().get_region(*region)
+            self._region_textures[name] = texture
+        return texture
+    
+    def uv_table(self, names: Iterable[str]) -> np.ndarray:
+        """Adların UV'leri, (k, 4, 2) - tür indeksiyle sprite başına seçmek için"""
+        return np.stack([self.uvs[name] for name in names])
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self.regions
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ekransız (headless) simülasyon çalıştırıcı
+
+Kivy, grafik veya ses yüklemeden oyunu sabit dt ile çalıştırır.
+CI, denge testleri ve toplu (batch) koşular için kullanılır.
+
+Kullanım:
+    python headless.py [--minutes 5] [--seed 42] [--dt 0.0166] [--record run.replay] [--profile]
+    python headless.py --play run.replay [--seek-minute 3]
+"""
+
+import argparse
+import sys
+import time
+
+from core.simulation import Simulation
+from core.replay import Replay, ReplayPlayer, ReplayRecorder, state_digest
+from core.profiler import FrameProfiler
+
+
+def run(minutes: float, seed: int, dt: float, width: float, height: float,
+        record: str = None, profile: bool = False):
+    """Tek koşu çalıştır, istatistikleri döndür"""
+    simulation = Simulation(width, height)
+    if record:
+        simulation.recorder = ReplayRecorder()
+    if profile:
+        # Headless'ta her tick bir kare sayılır
+        simulation.profiler = FrameProfiler(capacity=3600)
+    simulation.start_run(seed)
+    
+    kills = [0]
+    
+    def on_enemy_killed(enemy):
+        kills[0] += 1
+    
+    simulation.events.subscribe('enemy_killed', on_enemy_killed)
+    
+    max_ticks = int(minutes * 60.0 / dt)
+    peak_enemies = 0
+    ticks = 0
+    
+    start = time.perf_counter()
+    profiler = simulation.profiler
+    while ticks < max_ticks and not simulation.is_game_over():
+        if profiler:
+            profiler.begin_frame()
+        simulation.step(dt)
+        if profiler:
+            profiler.end_frame()
+        ticks += 1
+        peak_enemies = max(peak_enemies, len(simulation.enemies))
+        
+        # Level-up: ilk seçeneği otomatik al
+        if simulation.needs_level_up():
+            choices = simulation.get_level_up_choices(3)
+            if choices:
+                simulation.apply_level_up(choices[0])
+            else:
+                simulation.player.level_up()
+    elapsed = time.perf_counter() - start
+    simulation.events.unsubscribe('enemy_killed', on_enemy_killed)
+    
+    if record:
+        simulation.recorder.save(record)
+    
+    player = simulation.player
+    return {
+        'seed': seed,
+        'ticks': ticks,
+        'game_time': simulation.game_time,
+        'wall_time': elapsed,
+        'alive': player.is_alive,
+        'level': player.level,
+        'hp': player.current_hp,
+        'kills': kills[0],
+        'peak_enemies': peak_enemies,
+        'pools': simulation.get_pool_stats(),
+        'digest': state_digest(simulation),
+        'profile': profiler.format_report() if profiler else None,
+    }
+
+
+def play(path: str, seek_minute: float = None):
+    """Replay dosyasını oynat"""
+    player = ReplayPlayer(Replay.load(path))
+    
+    start = time.perf_counter()
+    if seek_minute is not None:
+        player.seek_time(seek_minute * 60.0)
+        seek_time = time.perf_counter() - start
+        print(f"seek {seek_minute} dk: tick={player.tick} ({seek_time:.2f}s)")
+    player.run_to_end()
+    elapsed = time.perf_counter() - start
+    
+    simulation = player.simulation
+    print(f"replay: ticks={simulation.tick} oyun süresi={simulation.game_time:.1f}s "
+          f"gerçek süre={elapsed:.2f}s level={simulation.player.level}")
+    print(f"durum özeti={state_digest(simulation)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--minutes', type=float, default=5.0)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--dt', type=float, default=1 / 60.0)
+    parser.add_argument('--width', type=float, default=800.0)
+    parser.add_argument('--height', type=float, default=600.0)
+    parser.add_argument('--record', help='Koşuyu bu replay dosyasına kaydet')
+    parser.add_argument('--profile', action='store_true',
+                        help='Aşama başına tick sürelerini (son 3600 tick) yazdır')
+    parser.add_argument('--play', help='Replay dosyasını oynat')
+    parser.add_argument('--seek-minute', type=float, help='Oynatmada bu dakikaya atla')
+    args = parser.parse_args()
+    
+    if args.play:
+        play(args.play, args.seek_minute)
+        return
+    
+    stats = run(args.minutes, args.seed, args.dt, args.width, args.height, args.record,
+                args.profile)
+    
+    speed = stats['game_time'] / stats['wall_time'] if stats['wall_time'] > 0 else float('inf')
+    print(f"seed={stats['seed']} ticks={stats['ticks']} "
+          f"oyun süresi={stats['game_time']:.1f}s gerçek süre={stats['wall_time']:.2f}s "
+          f"({speed:.1f}x)")
+    print(f"hayatta={stats['alive']} level={stats['level']} hp={stats['hp']:.0f} "
+          f"öldürme={stats['kills']} en fazla düşman={stats['peak_enemies']}")
+    for name, pool in stats['pools'].items():
+        print(f"havuz {name}: oluşturulan={pool['created']} tekrar kullanılan={pool['reused']} "
+              f"en yüksek kullanım={pool['peak_in_use']} boşta={pool['free']}")
+    print(f"durum özeti={stats['digest']}")
+    if stats['profile']:
+        print(stats['profile'])
+    print(f"kivy yüklendi mi: {'kivy' in sys.modules}")
+
+
+if __name__ == '__main__':
+    main()
@@ -19,6 +19,10 @@ import random
 import struct
 import tempfile
 import os
+import numpy as np
+
+from core.timestep import FixedTimestep
+from graphics.sprite_batch import SpriteBatchGroup, shape_texture
 
 class ParticleSystem:
     """Parçacık efekt sistemi"""
@@ -328,10 +332,8 @@ class EnhancedEnemy(Widget):
         self.rotation = 0.0
         self.scale_factor = 1.0
         
-        # Tür özelliklerini ayarla
+        # Tür özelliklerini ayarla (çizim WorldBatchRenderer'da)
         self._setup_enemy_type()
-        self._setup_graphics()
-        self.bind(pos=self.update_graphics)
     
     def _setup_enemy_type(self):
         """Düşman türü özelliklerini ayarla"""
@@ -373,83 +375,6 @@ class EnhancedEnemy(Widget):
             self.shoot_timer = 0.0
             self.shoot_cooldown = 2.0
     
-    def _setup_graphics(self):
-        """Grafik ayarları"""
-        pass  # update_graphics'te yapılacak
-    
-    def update_graphics(self, *args):
-        """Grafik güncelleme"""
-        self.canvas.clear()
-        
-        with self.canvas:
-            # Flash efekti
-            flash_alpha = 1.0
-            if self.flash_timer > 0:
-                flash_alpha = 0.5 + 0.5 * math.sin(self.flash_timer * 20)
-            
-            # Transformasyonlar
-            PushMatrix()
-            
-            if self.rotation != 0:
-                Rotate(angle=self.rotation, origin=(self.center_x, self.center_y))
-            
-            if self.scale_factor != 1.0:
-                Scale(self.scale_factor, self.scale_factor, 1.0)
-                Scale(origin=(self.center_x, self.center_y))
-            
-            # Ana gövde
-            r, g, b, a = self.color
-            Color(r, g, b, a * flash_alpha)
-            Ellipse(pos=self.pos, size=self.size)
-            
-            # Tür özel efektleri
-            if self.enemy_type == "tank":
-                # Zırh detayları
-                Color(0.8, 0.8, 0.8, flash_alpha * 0.8)
-                Line(circle=(self.center_x, self.center_y, self.width/2 - 2), width=2)
-                
-            elif self.enemy_type == "fast":
-                # Hız çizgileri
-                Color(1.0, 1.0, 0.0, flash_alpha * 0.6)
-                for i in range(3):
-                    angle = self.rotation + (i - 1) * 30
-                    start_x = self.center_x - math.cos(math.radians(angle)) * 15
-                    start_y = self.center_y - math.sin(math.radians(angle)) * 15
-                    end_x = self.center_x - math.cos(math.radians(angle)) * 25
-                    end_y = self.center_y - math.sin(math.radians(angle)) * 25
-                    Line(points=[start_x, start_y, end_x, end_y], width=2)
-                    
-            elif self.enemy_type == "shooter":
-                # Silah
-                Color(0.3, 0.3, 0.3, flash_alpha)
-                gun_x = self.center_x + math.cos(math.radians(self.rotation)) * 12
-                gun_y = self.center_y + math.sin(math.radians(self.rotation)) * 12
-                Ellipse(pos=(gun_x - 3, gun_y - 3), size=(6, 6))
-            
-            # HP bar (düşük HP'de)
-            if self.hp < self.max_hp * 0.7:
-                hp_ratio = self.hp / self.max_hp
-                bar_width = self.width
-                bar_height = 3
-                bar_x = self.x
-                bar_y = self.y + self.height + 5
-                
-                # Arkaplan
-                Color(0.2, 0.2, 0.2, 0.8)
-                Rectangle(pos=(bar_x, bar_y), size=(bar_width, bar_height))
-                
-                # HP
-                if hp_ratio > 0.5:
-                    Color(0.2, 0.8, 0.2, 0.9)
-                elif hp_ratio > 0.25:
-                    Color(0.8, 0.8, 0.2, 0.9)
-                else:
-                    Color(0.8, 0.2, 0.2, 0.9)
-                
-                Rectangle(pos=(bar_x, bar_y), size=(bar_width * hp_ratio, bar_height))
-            
-            PopMatrix()
-    
     def update(self, dt, player_pos, projectiles):
         """Güncelleme"""
         if not self.alive:
@@ -493,7 +418,6 @@ class EnhancedEnemy(Widget):
         else:
             self.scale_factor = 1.0 + 0.05 * math.sin(Clock.get_time() * 2)
         
-        self.update_graphics()
         return new_projectiles
     
     def _create_enemy_projectile(self, player_pos):
@@ -540,34 +464,6 @@ class EnhancedProjectile(Widget):
         else:
             self.velocity = [0, 0]
             self.angle = 0
-        
-        self._setup_graphics()
-        self.bind(pos=self.update_graphics)
-    
-    def _setup_graphics(self):
-        pass  # update_graphics'te yapılacak
-    
-    def update_graphics(self, *args):
-        """Grafik güncelleme"""
-        self.canvas.clear()
-        
-        with self.canvas:
-            # Trail efekti
-            if len(self.trail) > 1:
-                for i, (tx, ty) in enumerate(self.trail):
-                    alpha = (i + 1) / len(self.trail) * 0.3
-                    Color(1.0, 1.0, 0.5, alpha)
-                    Ellipse(pos=(tx - 2, ty - 2), size=(4, 4))
-            
-            # Ana mermi
-            Color(1.0, 1.0, 0.2, 1.0)
-            Ellipse(pos=self.pos, size=self.size)
-            
-            # Glow efekti
-            Color(1.0, 1.0, 0.8, 0.5)
-            glow_size = (12, 12)
-            glow_pos = (self.x - 2, self.y - 2)
-            Ellipse(pos=glow_pos, size=glow_size)
     
     def update(self, dt):
         """Güncelleme"""
@@ -592,8 +488,6 @@ class EnhancedProjectile(Widget):
         if (self.x < -50 or self.x > 850 or 
             self.y < -50 or self.y > 650):
             self.alive = False
-        
-        self.update_graphics()
 
 class EnemyProjectile(Widget):
     """Düşman mermisi"""
@@ -617,16 +511,6 @@ class EnemyProjectile(Widget):
             self.velocity = [(dx/distance) * speed, (dy/distance) * speed]
         else:
             self.velocity = [0, 0]
-        
-        with self.canvas:
-            Color(0.8, 0.2, 0.2, 1.0)  # Kırmızı düşman mermisi
-            self.graphic = Ellipse(pos=self.pos, size=self.size)
-        
-        self.bind(pos=self.update_graphics)
-    
-    def update_graphics(self, *args):
-        if hasattr(self, 'graphic'):
-            self.graphic.pos = self.pos
     
     def update(self, dt):
         if not self.alive:
@@ -721,12 +605,162 @@ class ParticleWidget(Widget):
         """Parçacıkları güncelle ve çiz"""
         self.particle_system.render(self.canvas)
 
+class WorldBatchRenderer:
+    """Düşman ve mermileri katman başına tek Mesh ile çizer"""
+    
+    def __init__(self, canvas):
+        circle = shape_texture('circle')
+        white = shape_texture('white')
+        
+        self.group = SpriteBatchGroup()
+        self.bodies = self.group.add_layer('bodies', circle)
+        self.armor = self.group.add_layer('armor', shape_texture('ring'))
+        self.speed_lines = self.group.add_layer('speed_lines', white)
+        self.guns = self.group.add_layer('guns', circle)
+        self.bars = self.group.add_layer('bars', white)
+        self.trails = self.group.add_layer('trails', circle)
+        self.projectiles = self.group.add_layer('projectiles', circle)
+        self.projectile_glow = self.group.add_layer('projectile_glow', circle)
+        self.enemy_projectiles = self.group.add_layer('enemy_projectiles', circle)
+        canvas.add(self.group.context)
+    
+    def render(self, enemies, projectiles, enemy_projectiles):
+        """Tüm katmanların köşe tamponlarını güncelle"""
+        self._render_enemies(enemies)
+        self._render_projectiles(projectiles)
+        self._render_circles(self.enemy_projectiles, enemy_projectiles, (0.8, 0.2, 0.2, 1.0))
+    
+    def _render_projectiles(self, projectiles):
+        """Oyuncu mermileri: iz, gövde ve glow"""
+        # Trail efekti (eski noktalar daha şeffaf)
+        trail = [
+            (tx, ty, (i + 1) / len(p.trail) * 0.3)
+            for p in projectiles if len(p.trail) > 1
+            for i, (tx, ty) in enumerate(p.trail)
+        ]
+        if trail:
+            points = np.array(trail, dtype=np.float32)
+            colors = np.empty((points.shape[0], 4), dtype=np.float32)
+            colors[:] = (1.0, 1.0, 0.5, 1.0)
+            colors[:, 3] = points[:, 2]
+            self.trails.draw(points[:, 0], points[:, 1], 2.0, 2.0, rgba=colors)
+        else:
+            self.trails.clear()
+        
+        self._render_circles(self.projectiles, projectiles, (1.0, 1.0, 0.2, 1.0))
+        self._render_circles(self.projectile_glow, projectiles, (1.0, 1.0, 0.8, 0.5), half_size=6.0)
+    
+    @staticmethod
+    def _render_circles(batch, widgets, color, half_size=None):
+        """Tek renkli daireler (widget boyutunda ya da sabit yarıçapta)"""
+        if not widgets:
+            batch.clear()
+            return
+        data = np.array([(w.center_x, w.center_y, w.width, w.height) for w in widgets],
+                        dtype=np.float32)
+        if half_size is None:
+            batch.draw(data[:, 0], data[:, 1], data[:, 2] * 0.5, data[:, 3] * 0.5, rgba=color)
+        else:
+            batch.draw(data[:, 0], data[:, 1], half_size, half_size, rgba=color)
+    
+    def _render_enemies(self, enemies):
+        """Düşmanlar: gövde, tür detayları ve HP barları"""
+        if not enemies:
+            for batch in (self.bodies, self.armor, self.speed_lines, self.guns, self.bars):
+                batch.clear()
+            return
+        
+        data = np.array([
+            (e.center_x, e.center_y, e.width, e.height, e.rotation, e.scale_factor,
+             e.flash_timer, e.hp, e.max_hp)
+            for e in enemies
+        ], dtype=np.float32)
+        cx, cy, width, height, rotation, scale, flash_timer, hp, max_hp = data.T
+        types = np.array([e.enemy_type for e in enemies])
+        
+        # Flash efekti
+        flash_alpha = np.where(flash_timer > 0, 0.5 + 0.5 * np.sin(flash_timer * 20), 1.0)
+        
+        # Ana gövde (merkez etrafında ölçeklenir)
+        colors = np.array([e.color for e in enemies], dtype=np.float32)
+        colors[:, 3] *= flash_alpha
+        self.bodies.draw(cx, cy, width * 0.5 * scale, height * 0.5 * scale, rgba=colors)
+        
+        # Tank: zırh halkası
+        tank = types == "tank"
+        self._draw_masked(self.armor, tank, cx, cy, width * 0.5 * scale, height * 0.5 * scale,
+                          0.0, (0.8, 0.8, 0.8, 0.8), flash_alpha)
+        
+        # Fast: arkada üç hız çizgisi
+        fast = types == "fast"
+        if fast.any():
+            angles = (rotation[fast, None] + np.array([-30.0, 0.0, 30.0], dtype=np.float32)).ravel()
+            radians = np.radians(angles)
+            distance = np.repeat(scale[fast], 3) * 20.0
+            line_colors = np.empty((angles.shape[0], 4), dtype=np.float32)
+            line_colors[:] = (1.0, 1.0, 0.0, 0.6)
+            line_colors[:, 3] *= np.repeat(flash_alpha[fast], 3)
+            self.speed_lines.draw(np.repeat(cx[fast], 3) - np.cos(radians) * distance,
+                                  np.repeat(cy[fast], 3) - np.sin(radians) * distance,
+                                  5.0, 1.0, angle=angles, rgba=line_colors)
+        else:
+            self.speed_lines.clear()
+        
+        # Shooter: silah (baktığı yönde)
+        shooter = types == "shooter"
+        radians = np.radians(rotation)
+        self._draw_masked(self.guns, shooter, cx + np.cos(radians) * 12, cy + np.sin(radians) * 12,
+                          3.0, 3.0, 0.0, (0.3, 0.3, 0.3, 1.0), flash_alpha)
+        
+        # HP bar (düşük HP'de): arkaplan + doluluk
+        low = hp < max_hp * 0.7
+        if not low.any():
+            self.bars.clear()
+            return
+        ratio = np.clip(hp[low] / np.maximum(max_hp[low], 1e-6), 0.0, 1.0)
+        bar_width = width[low]
+        bar_left = cx[low] - bar_width * 0.5
+        bar_cy = cy[low] + height[low] * 0.5 + 5 + 1.5
+        fill_width = bar_width * ratio
+        
+        count = bar_width.shape[0]
+        bar_colors = np.empty((count * 2, 4), dtype=np.float32)
+        bar_colors[:count] = (0.2, 0.2, 0.2, 0.8)
+        bar_colors[count:] = (0.8, 0.2, 0.2, 0.9)
+        bar_colors[count:][ratio > 0.25] = (0.8, 0.8, 0.2, 0.9)
+        bar_colors[count:][ratio > 0.5] = (0.2, 0.8, 0.2, 0.9)
+        self.bars.draw(np.concatenate((cx[low], bar_left + fill_width * 0.5)),
+                       np.concatenate((bar_cy, bar_cy)),
+                       np.concatenate((bar_width * 0.5, fill_width * 0.5)),
+                       1.5, rgba=bar_colors)
+    
+    @staticmethod
+    def _draw_masked(batch, mask, cx, cy, half_w, half_h, angle, color, flash_alpha):
+        """Maskelenen düşmanlar için tek renkli katman çiz"""
+        if not mask.any():
+            batch.clear()
+            return
+        colors = np.empty((int(mask.sum()), 4), dtype=np.float32)
+        colors[:] = color
+        colors[:, 3] *= flash_alpha[mask]
+        batch.draw(cx[mask], cy[mask], np.broadcast_to(half_w, mask.shape)[mask],
+                   np.broadcast_to(half_h, mask.shape)[mask], angle=angle, rgba=colors)
+
 class ProfessionalGame(Widget):
     """Profesyonel oyun sınıfı"""
     
+    # Sabit simülasyon adımı (Hz) ve bir karede en fazla yakalama adımı
+    sim_rate = NumericProperty(60)
+    max_catchup_steps = NumericProperty(5)
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         
+        # Sabit adımlı simülasyon zamanlayıcısı
+        self.timestep = FixedTimestep(self.sim_rate, self.max_catchup_steps)
+        self.bind(sim_rate=self._on_sim_rate)
+        self.bind(max_catchup_steps=self._on_max_catchup_steps)
+        
         # Sistemler
         self.particle_system = ParticleSystem()
         self.sound_manager = SoundManager()
@@ -739,6 +773,11 @@ class ProfessionalGame(Widget):
         self.player = EnhancedPlayer()
         self.add_widget(self.player)
         
+        # Dünya katmanı (düşman ve mermiler birkaç Mesh ile çizilir)
+        self.world_layer = Widget()
+        self.add_widget(self.world_layer)
+        self.world_renderer = WorldBatchRenderer(self.world_layer.canvas)
+        
         # Varlıklar
         self.enemies = []
         self.projectiles = []
@@ -778,6 +817,14 @@ class ProfessionalGame(Widget):
         
         Logger.info("ProfessionalGame: Profesyonel oyun başlatıldı!")
     
+    def _on_sim_rate(self, instance, rate):
+        """Simülasyon frekansı değişti"""
+        self.timestep.set_rate(rate)
+    
+    def _on_max_catchup_steps(self, instance, steps):
+        """Yakalama adımı sınırı değişti"""
+        self.timestep.max_steps = int(steps)
+    
     def _update_mouse_movement(self, mouse_x, mouse_y):
         """Mouse pozisyonuna göre hareket vektörü hesapla"""
         # Oyuncu merkez pozisyonu
@@ -876,8 +923,30 @@ class ProfessionalGame(Widget):
     def update(self, dt):
         """Ana oyun döngüsü"""
         if self.paused:
+            self.timestep.reset()
             return
         
+        # Simülasyonu sabit adımlarla ilerlet
+        steps = self.timestep.advance(dt)
+        for _ in range(steps):
+            self.simulate(self.timestep.step_dt)
+            if self.paused:
+                # Level-up seçimi bekleniyor: kalan adımları atla
+                self.timestep.reset()
+                break
+        
+        # Parçacık sistemi
+        self.particle_system.update(dt)
+        self.particle_widget.update_particles()
+        
+        # Düşman ve mermileri çiz
+        self.world_renderer.render(self.enemies, self.projectiles, self.enemy_projectiles)
+        
+        # UI güncelle
+        self.update_ui()
+    
+    def simulate(self, dt):
+        """Tek sabit simülasyon adımı"""
         self.game_time += dt
         self.difficulty_scale = 1.0 + (self.game_time / 60.0) * 0.5  # Her dakika %50 daha zor
         
@@ -917,7 +986,6 @@ class ProfessionalGame(Widget):
             new_enemy_projectiles = enemy.update(dt, player_pos, self.projectiles)
             for proj in new_enemy_projectiles:
                 self.enemy_projectiles.append(proj)
-                self.add_widget(proj)
             
             if not enemy.alive:
                 # Ölüm efektleri
@@ -929,32 +997,22 @@ class ProfessionalGame(Widget):
                 if self.player.add_xp(enemy.xp_value):
                     self.trigger_level_up()
                 
-                self.remove_widget(enemy)
                 self.enemies.remove(enemy)
         
         # Mermileri güncelle
         for projectile in self.projectiles[:]:
             projectile.update(dt)
             if not projectile.alive:
-                self.remove_widget(projectile)
                 self.projectiles.remove(projectile)
         
         # Düşman mermilerini güncelle
         for proj in self.enemy_projectiles[:]:
             proj.update(dt)
             if not proj.alive:
-                self.remove_widget(proj)
                 self.enemy_projectiles.remove(proj)
         
         # Çarpışma kontrolü
         self.check_collisions(dt)
-        
-        # Parçacık sistemi
-        self.particle_system.update(dt)
-        self.particle_widget.update_particles()
-        
-        # UI güncelle
-        self.update_ui()
     
     def spawn_enemy(self):
         """Gelişmiş düşman spawn"""
@@ -990,7 +1048,6 @@ class ProfessionalGame(Widget):
         enemy.speed *= min(2.0, 1.0 + (self.difficulty_scale - 1.0) * 0.5)
         
         self.enemies.append(enemy)
-        self.add_widget(enemy)
     
     def auto_attack(self):
         """Gelişmiş otomatik saldırı"""
@@ -1032,7 +1089,6 @@ class ProfessionalGame(Widget):
             )
             
             self.projectiles.append(projectile)
-            self.add_widget(projectile)
             
             # Muzzle flash efekti
             angle = math.atan2(
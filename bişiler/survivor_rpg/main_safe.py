@@ -66,9 +66,9 @@ class SurvivorRPGApp(App):
             )
     
     def on_pause(self):
-        """Uygulama duraklatıldığında"""
-        if self.game_manager and hasattr(self.game_manager, 'pause_game'):
-            self.game_manager.pause_game()
+        """Uygulama duraklatıldığında (süreç öldürülebilir: koşuyu kaydet)"""
+        if self.game_manager and hasattr(self.game_manager, 'suspend'):
+            self.game_manager.suspend()
         return True
     
     def on_resume(self):
@@ -78,9 +78,9 @@ class SurvivorRPGApp(App):
     
     def on_stop(self):
         """Uygulama kapatıldığında"""
-        if self.game_manager and hasattr(self.game_manager, 'save_game'):
+        if self.game_manager and hasattr(self.game_manager, 'shutdown'):
             try:
-                self.game_manager.save_game()
+                self.game_manager.shutdown()
             except Exception as e:
                 Logger.error(f"Save hatası: {e}")
         Logger.info("SurvivorRPG: Uygulama kapatılıyor...")
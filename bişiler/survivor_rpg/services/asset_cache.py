@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Services/AssetCache.py - Üretilen texture ve sesler için kalıcı önbellek
+
+Girdiler içerik adreslidir: anahtar, üretici adı + parametreler + üretici
+sürümünün SHA-256 özetidir. Üretici değişince sürümü artırmak eski
+girdileri geçersiz kılar (eskiler LRU ile silinir).
+
+- Yazma atomiktir (services.atomic_file): geçici dosya, fsync, os.replace
+- Okuma bellek eşlemelidir (mmap / np.load(mmap_mode='r'))
+- Bozuk .npy / .wav girdileri okunurken silinir ve yeniden üretilir
+- Toplam boyut max_bytes'ı aşınca en uzun süredir kullanılmayanlar silinir
+  (kullanım zamanı olarak mtime tutulur; her isabette güncellenir)
+
+Önbellek hiçbir zaman oyunu durdurmaz: disk hatasında üretime geri düşülür.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import sys
+import time
+import wave
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+from kivy.logger import Logger
+
+from services.atomic_file import TEMP_SUFFIX, write_atomic
+
+STALE_TEMP_AGE = 3600.0  # Yarım kalmış yazmalar (saniye)
+
+
+def default_cache_dir(app_name: str = 'survivor_rpg') -> str:
+    """Kullanıcı başına önbellek klasörü (platforma göre)"""
+    override = os.environ.get('SURVIVOR_CACHE_DIR')
+    if override:
+        return override
+    if 'ANDROID_PRIVATE' in os.environ:  # python-for-android
+        return os.path.join(os.environ['ANDROID_PRIVATE'], 'cache', app_name)
+    if sys.platform.startswith('win'):
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+        return os.path.join(base, app_name, 'Cache')
+    if sys.platform == 'darwin':
+        return os.path.join(os.path.expanduser('~/Library/Caches'), app_name)
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, app_name)
+
+
+def cache_key(generator: str, params: Dict[str, Any], version: int) -> str:
+    """Üretici adı, parametreler ve sürümden içerik anahtarı"""
+    encoded = json.dumps({'generator': generator, 'params': params, 'version': version},
+                         sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _valid_wav(path: str) -> bool:
+    """WAV başlığı okunuyor ve bildirilen örneklerin hepsi dosyada mı?"""
+    try:
+        with wave.open(path, 'rb') as wav_file:
+            frames = wav_file.getnframes()
+            expected = frames * wav_file.getsampwidth() * wav_file.getnchannels()
+            return frames > 0 and len(wav_file.readframes(frames)) == expected
+    except (OSError, EOFError, wave.Error):
+        return False
+
+
+class AssetCache:
+    """Diskte içerik adresli, LRU ile sınırlı önbellek"""
+    
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 64 * 1024 * 1024):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.enabled = True
+        self._size: Optional[int] = None  # İlk yazmada hesaplanır
+        
+        # İstatistikler
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def path(self, key: str, suffix: str = '.bin') -> str:
+        """Girdinin dosya yolu"""
+        return os.path.join(self.directory, key + suffix)
+    
+    # Okuma
+    def _hit(self, path: str) -> bool:
+        """Girdi var mı? Varsa kullanım zamanını güncelle (LRU)"""
+        if not self.enabled or not os.path.exists(path):
+            self.misses += 1
+            return False
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return True
+    
+    def get_path(self, key: str, suffix: str = '.bin') -> Optional[str]:
+        """Girdinin yolu (yoksa None) - dosya yolu isteyen yükleyiciler için"""
+        path = self.path(key, suffix)
+        if suffix == '.wav' and self.enabled and os.path.exists(path) and not _valid_wav(path):
+            Logger.warning(f"AssetCache: Bozuk girdi siliniyor ({path})")
+            self._remove(path)
+        return path if self._hit(path) else None
+    
+    def get_bytes(self, key: str, suffix: str = '.bin') -> Optional[mmap.mmap]:
+        """Girdiyi bellek eşlemeli oku (salt okunur, yoksa None)"""
+        path = self.get_path(key, suffix)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            Logger.warning(f"AssetCache: Okuma hatası ({path}): {e}")
+            return None
+    
+    def get_array(self, key: str) -> Optional[np.ndarray]:
+        """NumPy dizisini bellek eşlemeli oku (yoksa None)"""
+        path = self.get_path(key, '.npy')
+        if path is None:
+            return None
+        try:
+            return np.load(path, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            Logger.warning(f"AssetCache: Bozuk girdi siliniyor ({path}): {e}")
+            self._remove(path)
+            return None
+    
+    # Yazma
+    def _put(self, key: str, suffix: str, write: Callable[[str], None]) -> Optional[str]:
+        """write(geçici_yol) ile dosyayı üret, atomik olarak yerine koy"""
+        if not self.enabled:
+            return None
+        path = self.path(key, suffix)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            write_atomic(path, write)
+        except Exception as e:
+            Logger.warning(f"AssetCache: Yazma hatası ({path}): {e}")
+            return None
+        
+        if self._size is not None:
+            self._size += os.path.getsize(path)
+        self._evict()
+        return path
+    
+    def put_bytes(self, key: str, data: bytes, suffix: str = '.bin') -> Optional[str]:
+        """Bayt verisini yaz, yolunu döndür"""
+        def write(temp_path):
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+        return self._put(key, suffix, write)
+    
+    def put_array(self, key: str, array: np.ndarray) -> Optional[str]:
+        """NumPy dizisini .npy olarak yaz"""
+        def write(temp_path):
+            with open(temp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(array), allow_pickle=False)
+        return self._put(key, '.npy', write)
+    
+    # Üret ya da önbellekten al
+    def cached_array(self, generator: str, params: Dict[str, Any], version: int,
+                     build: Callable[[], np.ndarray]) -> np.ndarray:
+        """Önbellekte varsa oku, yoksa build() ile üretip yaz"""
+        key = cache_key(generator, params, version)
+        array = self.get_array(key)
+        if array is None:
+            array = build()
+            self.put_array(key, array)
+        return array
+    
+    def cached_file(self, generator: str, params: Dict[str, Any], version: int,
+                    suffix: str, write: Callable[[str], None]) -> Optional[str]:
+        """Önbellekteki dosyanın yolu; yoksa write(yol) ile üretilir"""
+        key = cache_key(generator, params, version)
+        path = self.get_path(key, suffix)
+        if path is None:
+            path = self._put(key, suffix, write)
+        return path
+    
+    # LRU temizliği
+    def _entries(self):
+        """(yol, boyut, mtime) listesi; eski geçici dosyaları siler"""
+        entries = []
+        now = time.time()
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if name.endswith(TEMP_SUFFIX):
+                if now - stat.st_mtime > STALE_TEMP_AGE:
+                    self._remove(path)
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+    
+    def _evict(self):
+        """Boyut sınırı aşıldıysa en eski kullanılanları sil"""
+        if self._size is not None and self._size <= self.max_bytes:
+            return
+        entries = self._entries()
+        self._size = sum(size for _, size, _ in entries)
+        if self._size <= self.max_bytes:
+            return
+        
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if self._size <= self.max_bytes:
+                break
+            if self._remove(path):
+                self._size -= size
+                self.evictions += 1
+    
+    def _remove(self, path: str) -> bool:
+        """Dosyayı sil (hata yutulur)"""
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+    
+    def clear(self):
+        """Tüm girdileri sil"""
+        for path, _, _ in self._entries():
+            self._remove(path)
+        self._size = 0
+    
+    def get_stats(self) -> Dict[str, int]:
+        """İsabet / kaçırma / silme sayaçları"""
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+
+# Global önbellek
+asset_cache = AssetCache()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Services/AtomicFile.py - Atomik dosya yazma
+
+Veri hedefle aynı klasördeki geçici dosyaya yazılır, fsync edilir ve
+os.replace ile yerine konur; yarıda kalan yazma eski dosyayı bozmaz.
+Kayıt (save_journal), varlık önbelleği (asset_cache) ve koşu anlık
+durumu (core.snapshot) bunu kullanır. Kivy'ye bağlı değildir.
+"""
+
+import os
+import tempfile
+from typing import Callable, Union
+
+TEMP_SUFFIX = '.tmp'  # Yarım kalmış yazmalar bu uzantıyla kalır
+
+
+def write_atomic(file_path: str, data: Union[str, bytes, Callable[[str], None]]):
+    """Metni, baytları ya da data(geçici_yol) çıktısını atomik yaz"""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(file_path),
+                                     suffix=TEMP_SUFFIX)
+    try:
+        if callable(data):
+            # Yola yazan üreticiler (np.save, wave) için
+            os.close(fd)
+            data(temp_path)
+            with open(temp_path, 'rb+') as f:
+                os.fsync(f.fileno())
+        else:
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
@@ -6,6 +6,8 @@ Services/Audio.py - Ses servisi
 
 from kivy.logger import Logger
 
+from audio.sound_manager import sound_manager
+
 
 class AudioService:
     """Ses servisi (basit implementasyon)"""
@@ -24,13 +26,14 @@ class AudioService:
             Logger.debug(f"AudioService: SFX çalınıyor: {sound_name}")
     
     def play_music(self, music_name: str):
-        """Müzik çal"""
+        """Müzik çal (procedural, audio.music)"""
         if self.enabled:
-            # TODO: Gerçek müzik çalma implementasyonu
             Logger.debug(f"AudioService: Müzik çalınıyor: {music_name}")
+            sound_manager.play_music(music_name)
     
     def stop_music(self):
         """Müziği durdur"""
+        sound_manager.stop_music()
         Logger.debug("AudioService: Müzik durduruldu")
     
     def set_sfx_volume(self, volume: float):
@@ -40,3 +43,4 @@ class AudioService:
     def set_music_volume(self, volume: float):
         """Müzik ses seviyesi"""
         self.music_volume = max(0.0, min(1.0, volume))
+        sound_manager.set_music_volume(self.music_volume)
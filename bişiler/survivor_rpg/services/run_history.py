@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Services/RunHistory.py - Biten koşuların yerel SQLite geçmişi
+
+Her biten koşu 'runs' tablosuna bir satır olarak yazılır: seed, süre,
+level, düşman türüne göre öldürmeler, seçilen yetenekler, verilen/alınan
+hasar ve coin. Türe göre öldürmeler ve yetenekler JSON metin sütunlarında
+tutulur; toplam öldürme ayrı sütundur.
+
+Yazmalar tek bir arka plan thread'inde yapılır (bağlantı o thread'e
+aittir): oyun thread'i yalnızca kuyruğa ekler, kuyrukta biriken satırlar
+tek transaction'da yazılır ve aynı transaction'da en eski koşular
+max_runs sınırına göre silinir. Şema ve WAL kipi de yazıcı thread'inde
+kurulur. Okumalar her thread'in ilk sorguda açılan salt okunur
+bağlantısıyla yapılır (oyun thread'inde şema/pragma yazması olmaz); WAL
+kipi sayesinde yazma sürerken de okunabilir.
+En iyi süre, en yüksek level ve seed sorguları indekslidir.
+"""
+
+import atexit
+import json
+import os
+import pathlib
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from kivy.logger import Logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    finished_at REAL NOT NULL,
+    seed INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    level INTEGER NOT NULL,
+    kills INTEGER NOT NULL,
+    kills_by_type TEXT NOT NULL,
+    abilities TEXT NOT NULL,
+    damage_dealt REAL NOT NULL,
+    damage_taken REAL NOT NULL,
+    coins INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_duration ON runs (duration DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_level ON runs (level DESC, duration DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_seed ON runs (seed, duration DESC);
+"""
+
+INSERT_RUN = """
+INSERT INTO runs (finished_at, seed, duration, level, kills, kills_by_type, abilities,
+                  damage_dealt, damage_taken, coins)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Sınırın üstündeki en eski koşular (id eklenme sırasıdır)
+TRIM_RUNS = "DELETE FROM runs WHERE id <= (SELECT id FROM runs ORDER BY id DESC LIMIT 1 OFFSET ?)"
+
+
+@dataclass
+class RunRecord:
+    """Biten bir koşunun özeti"""
+    seed: int
+    duration: float
+    level: int
+    kills_by_type: Dict[str, int] = field(default_factory=dict)
+    abilities: List[str] = field(default_factory=list)
+    damage_dealt: float = 0.0
+    damage_taken: float = 0.0
+    coins: int = 0
+    finished_at: float = field(default_factory=time.time)
+    id: Optional[int] = None
+    
+    @property
+    def kills(self) -> int:
+        """Toplam öldürme"""
+        return sum(self.kills_by_type.values())
+    
+    def to_row(self) -> tuple:
+        return (self.finished_at, self.seed, self.duration, self.level, self.kills,
+                json.dumps(self.kills_by_type, ensure_ascii=False),
+                json.dumps(self.abilities, ensure_ascii=False),
+                self.damage_dealt, self.damage_taken, self.coins)
+    
+    @classmethod
+    def from_simulation(cls, simulation, coins: int) -> 'RunRecord':
+        """Biten koşunun özeti (sayaçlar RunStats'tan)"""
+        run = simulation.state.current_run
+        player = simulation.player
+        return cls(seed=run.seed, duration=simulation.game_time,
+                   level=player.level if player else 1,
+                   kills_by_type=dict(run.kills_by_type),
+                   abilities=[ability.get('id', '?') for ability in player.abilities] if player else [],
+                   damage_dealt=run.damage_dealt, damage_taken=run.damage_taken, coins=coins)
+    
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> 'RunRecord':
+        return cls(seed=row['seed'], duration=row['duration'], level=row['level'],
+                   kills_by_type=json.loads(row['kills_by_type']),
+                   abilities=json.loads(row['abilities']),
+                   damage_dealt=row['damage_dealt'], damage_taken=row['damage_taken'],
+                   coins=row['coins'], finished_at=row['finished_at'], id=row['id'])
+
+
+class RunHistory:
+    """Koşu geçmişi veritabanı; yazmalar arka plan thread'inde toplu"""
+    
+    def __init__(self, db_file: str = "run_history.db", max_runs: int = 10000):
+        self.db_file = db_file
+        self.max_runs = max_runs
+        
+        self._queue: "queue.Queue[Optional[RunRecord]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()  # Thread başına okuma bağlantısı
+        
+        # İstatistikler
+        self.recorded = 0
+        self.batches = 0
+        self.write_errors = 0
+    
+    # Yazma (oyun thread'i yalnızca kuyruğa ekler)
+    def record_run(self, run: RunRecord):
+        """Koşuyu yazılmak üzere kuyruğa al"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='run-history-writer',
+                                                daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+        self._queue.put(run)
+        self.recorded += 1
+    
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Kuyruktaki koşular yazılana kadar bekle"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+    
+    def close(self):
+        """Bekleyenleri yaz ve thread'i durdur"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout=5.0)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Yazıcı bağlantısı: WAL kipi ve şema burada kurulur"""
+        connection = sqlite3.connect(self.db_file)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+        return connection
+    
+    def _run(self):
+        connection = self._connect()
+        try:
+            while True:
+                # Bir kayıt gelene kadar bekle, sonra birikenleri aynı transaction'a al
+                batch = [self._queue.get()]
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                runs = [run for run in batch if run is not None]
+                try:
+                    if runs:
+                        self._write_batch(connection, runs)
+                except Exception as e:
+                    self.write_errors += 1
+                    Logger.error(f"RunHistory: Yazma hatası: {e}")
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                if len(runs) < len(batch):
+                    return
+        finally:
+            connection.close()
+    
+    def _write_batch(self, connection: sqlite3.Connection, runs: List[RunRecord]):
+        """Koşuları ve saklama sınırını tek transaction'da uygula"""
+        with connection:
+            connection.executemany(INSERT_RUN, [run.to_row() for run in runs])
+            connection.execute(TRIM_RUNS, (self.max_runs,))
+        self.batches += 1
+    
+    # Okuma (çağıran thread'in salt okunur bağlantısı)
+    def _reader(self) -> Optional[sqlite3.Connection]:
+        """Thread'in okuma bağlantısı (veritabanı henüz yazılmadıysa None)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            if not os.path.exists(self.db_file):
+                return None
+            uri = pathlib.Path(os.path.abspath(self.db_file)).as_uri() + '?mode=ro'
+            connection = sqlite3.connect(uri, uri=True)
+            connection.row_factory = sqlite3.Row
+            self._local.connection = connection
+        return connection
+    
+    def _query(self, sql: str, params: tuple = ()) -> List[RunRecord]:
+        try:
+            reader = self._reader()
+            if reader is None:
+                return []
+            rows = reader.execute(sql, params).fetchall()
+        except Exception as e:
+            Logger.error(f"RunHistory: Sorgu hatası: {e}")
+            return []
+        return [RunRecord.from_row(row) for row in rows]
+    
+    def best_times(self, limit: int = 10) -> List[RunRecord]:
+        """En uzun hayatta kalınan koşular"""
+        return self._query("SELECT * FROM runs ORDER BY duration DESC LIMIT ?", (limit,))
+    
+    def highest_levels(self, limit: int = 10) -> List[RunRecord]:
+        """En yüksek level'a ulaşılan koşular"""
+        return self._query("SELECT * FROM runs ORDER BY level DESC, duration DESC LIMIT ?",
+                           (limit,))
+    
+    def runs_for_seed(self, seed: int, limit: int = 10) -> List[RunRecord]:
+        """Aynı seed ile oynanan koşular (en iyi süre önce)"""
+        return self._query("SELECT * FROM runs WHERE seed = ? ORDER BY duration DESC LIMIT ?",
+                           (seed, limit))
+    
+    def recent_runs(self, limit: int = 10) -> List[RunRecord]:
+        """Son biten koşular"""
+        return self._query("SELECT * FROM runs ORDER BY id DESC LIMIT ?", (limit,))
+    
+    def summary(self) -> Dict[str, Any]:
+        """Tüm koşuların toplamları"""
+        try:
+            reader = self._reader()
+            if reader is None:
+                return {}
+            row = reader.execute(
+                "SELECT COUNT(*) AS runs, MAX(duration) AS best_time, MAX(level) AS best_level, "
+                "SUM(kills) AS kills, SUM(coins) AS coins FROM runs").fetchone()
+        except Exception as e:
+            Logger.error(f"RunHistory: Sorgu hatası: {e}")
+            return {}
+        return {key: row[key] or 0 for key in row.keys()}
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Sayaçlar"""
+        return {
+            'recorded': self.recorded,
+            'batches': self.batches,
+            'pending': self._queue.unfinished_tasks,
+            'write_errors': self.write_errors,
+        }
+
+
+# Global koşu geçmişi
+run_history = RunHistory()
@@ -2,37 +2,44 @@
 # -*- coding: utf-8 -*-
 """
 Services/Save.py - Kayıt/yükleme servisi
+
+Diske yazma services.save_journal ile arka planda yapılır: küçük
+değişiklikler (ayar, meta para) günlüğe eklenir, save_game_data() tam
+kaydı atomik yazar. Çağrılar beklemez; flush() yazılana kadar bekler.
 """
 
-import json
-import os
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from kivy.logger import Logger
 
+from services.save_journal import SaveJournal
+
 
 class SaveService:
     """Kayıt/yükleme servisi"""
     
     def __init__(self, save_file: str = "survivor_save.json"):
         self.save_file = save_file
+        self.journal = SaveJournal(save_file)
         self.data = {}
         self.load_game_data()
     
     def save_game_data(self):
-        """Oyun verilerini kaydet"""
+        """Oyun verilerini kaydet (arka planda, atomik)"""
         try:
-            with open(self.save_file, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
-            Logger.info(f"SaveService: Veri kaydedildi: {self.save_file}")
+            self.journal.save(self.data)
         except Exception as e:
             Logger.error(f"SaveService: Kaydetme hatası: {e}")
     
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Bekleyen kayıtlar diske yazılana kadar bekle (çıkışta)"""
+        return self.journal.flush(timeout)
+    
     def load_game_data(self):
         """Oyun verilerini yükle"""
         try:
-            if os.path.exists(self.save_file):
-                with open(self.save_file, 'r', encoding='utf-8') as f:
-                    self.data = json.load(f)
+            data = self.journal.load(self._get_default_data())
+            if data is not None:
+                self.data = data
                 Logger.info(f"SaveService: Veri yüklendi: {self.save_file}")
             else:
                 self.data = self._get_default_data()
@@ -66,6 +73,14 @@ class SaveService:
             }
         }
     
+    def _set(self, path: Tuple[str, ...], value):
+        """Değeri ata ve günlüğe kaydet"""
+        target = self.data
+        for key in path[:-1]:
+            target = target.setdefault(key, {})
+        target[path[-1]] = value
+        self.journal.record(path, value)
+    
     def get_meta_currency(self) -> int:
         """Meta para miktarını al"""
         return self.data.get('meta_currency', 0)
@@ -73,13 +88,13 @@ class SaveService:
     def add_meta_currency(self, amount: int):
         """Meta para ekle"""
         current = self.get_meta_currency()
-        self.data['meta_currency'] = current + amount
+        self._set(('meta_currency',), current + amount)
     
     def spend_meta_currency(self, amount: int) -> bool:
         """Meta para harca"""
         current = self.get_meta_currency()
         if current >= amount:
-            self.data['meta_currency'] = current - amount
+            self._set(('meta_currency',), current - amount)
             return True
         return False
     
@@ -89,6 +104,4 @@ class SaveService:
     
     def set_setting(self, key: str, value):
         """Ayar kaydet"""
-        if 'settings' not in self.data:
-            self.data['settings'] = {}
-        self.data['settings'][key] = value
+        self._set(('settings', key), value)
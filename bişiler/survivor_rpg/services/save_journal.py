@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Services/SaveJournal.py - Arka planda atomik kayıt yazıcısı
+
+Kayıt iki dosyadan oluşur:
+- Anlık görüntü (snapshot): tüm veri, JSON. Yazma atomiktir: aynı
+  klasörde geçici dosya, fsync, os.replace; yarıda kalan yazma eski
+  kaydı bozmaz.
+- Günlük (journal): küçük değişiklikler satır başına bir JSON kaydı
+  olarak eklenir ({"gen": n, "path": [...], "value": ...}).
+
+Her anlık görüntü bir nesil numarası taşır (GENERATION_KEY); günlük
+kayıtları yazıldıkları andaki neslin numarasını alır. Yükleme: anlık
+görüntü okunur, günlük sırayla üstüne uygulanır; görüntünün neslinden
+eski kayıtlar (görüntüye zaten dahil) ve çökme sırasında yarım kalmış
+satırlar atlanır. Günlük büyüyünce ya da tam kayıt istenince
+sıkıştırılır: nesli bir artmış yeni anlık görüntü yazılır, günlük
+silinir. Bu iki adım arasında çökülürse kalan günlük eski nesilde
+kaldığı için yeni görüntünün üstüne tekrar uygulanmaz.
+
+Tüm disk işleri tek bir arka plan thread'inde yapılır; oyun thread'i
+yalnızca kuyruğa ekler. Kısa sürede gelen değişiklikler debounce süresi
+boyunca biriktirilir ve aynı yola yazılanların yalnızca sonuncusu
+yazılır. flush() bekleyen her şeyi diske yazar; çıkışta (atexit) de
+çağrılır.
+"""
+
+import atexit
+import copy
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from kivy.logger import Logger
+
+from services.atomic_file import write_atomic
+
+JOURNAL_SUFFIX = '.journal'
+GENERATION_KEY = '_journal_generation'  # Anlık görüntüdeki nesil numarası
+
+Path = Tuple[str, ...]
+
+
+def apply_change(data: Dict[str, Any], path: Path, value: Any):
+    """Değeri iç içe sözlükte yola ata (eksik ara sözlükler oluşturulur)"""
+    target = data
+    for key in path[:-1]:
+        child = target.get(key)
+        if not isinstance(child, dict):
+            child = target[key] = {}
+        target = child
+    target[path[-1]] = value
+
+
+class SaveJournal:
+    """Anlık görüntü + günlük; yazmalar arka plan thread'inde"""
+    
+    def __init__(self, save_file: str, debounce: float = 0.5, compact_after: int = 64):
+        self.save_file = save_file
+        self.journal_file = save_file + JOURNAL_SUFFIX
+        self.debounce = debounce
+        self.compact_after = compact_after  # Bu kadar günlük kaydından sonra sıkıştır
+        
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._changes: Dict[Path, Any] = {}          # Yol -> son değer
+        self._snapshot: Optional[Dict[str, Any]] = None  # Bekleyen tam kayıt
+        self._busy = False
+        self._closed = False
+        self._flushing = 0  # Bekleyen flush() çağrıları (debounce atlanır)
+        self._journal_entries = 0
+        self._generation: Optional[int] = None  # Diskteki görüntünün nesli (None = okunmadı)
+        self._default: Optional[Dict[str, Any]] = None
+        self._thread: Optional[threading.Thread] = None
+        
+        # İstatistikler
+        self.recorded = 0
+        self.coalesced = 0
+        self.appends = 0
+        self.compactions = 0
+    
+    # Yükleme
+    def load(self, default: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Anlık görüntü + günlük (hiç kayıt yoksa None)
+        
+        Anlık görüntü yoksa günlük default'un üstüne uygulanır.
+        """
+        self._default = default
+        data = self._read_snapshot()
+        if data is not None:
+            self._generation = data.pop(GENERATION_KEY, 0)
+        else:
+            self._generation = 0
+        
+        if os.path.exists(self.journal_file):
+            data = data if data is not None else copy.deepcopy(default or {})
+            self._journal_entries = 0
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        if entry.get('gen', 0) < self._generation:
+                            continue  # Görüntüye zaten dahil (sıkıştırma yarıda kaldı)
+                        apply_change(data, tuple(entry['path']), entry['value'])
+                    except (ValueError, KeyError, TypeError):
+                        # Çökme sırasında yarım kalmış satır
+                        Logger.warning("SaveJournal: Bozuk günlük satırı atlandı")
+                        continue
+                    self._journal_entries += 1
+        return data
+    
+    def _read_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Diskteki anlık görüntü (yoksa None)"""
+        if not os.path.exists(self.save_file):
+            return None
+        with open(self.save_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _current_generation(self) -> int:
+        """Diskteki görüntünün nesli (load() çağrılmadıysa dosyadan okunur)"""
+        if self._generation is None:
+            try:
+                data = self._read_snapshot()
+            except (OSError, ValueError):
+                data = None
+            self._generation = data.get(GENERATION_KEY, 0) if isinstance(data, dict) else 0
+        return self._generation
+    
+    # Kuyruğa ekleme (oyun thread'i)
+    def record(self, path: Path, value: Any):
+        """Küçük değişikliği günlüğe eklenmek üzere kuyruğa al"""
+        with self._lock:
+            if path in self._changes:
+                self.coalesced += 1
+            self._changes[path] = copy.deepcopy(value)
+            self.recorded += 1
+            self._start()
+            self._wake.notify()
+    
+    def save(self, data: Dict[str, Any]):
+        """Tam kaydı (sıkıştırma) kuyruğa al; bekleyen değişiklikler de kapsanır"""
+        with self._lock:
+            self._snapshot = copy.deepcopy(data)
+            self._changes.clear()
+            self._start()
+            self._wake.notify()
+    
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Bekleyen her şey diske yazılana kadar bekle"""
+        with self._lock:
+            if self._thread is None:
+                return True
+            self._flushing += 1
+            self._wake.notify()
+            try:
+                return self._idle.wait_for(self._is_idle, timeout)
+            finally:
+                self._flushing -= 1
+    
+    def close(self):
+        """Bekleyenleri yaz ve thread'i durdur"""
+        self.flush()
+        with self._lock:
+            self._closed = True
+            self._wake.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=1.0)
+    
+    def _is_idle(self) -> bool:
+        return not self._busy and not self._changes and self._snapshot is None
+    
+    def _start(self):
+        """Yazıcı thread'ini ilk kullanımda başlat (kilit tutulurken)"""
+        if self._thread is None and not self._closed:
+            self._thread = threading.Thread(target=self._run, name='save-writer', daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+    
+    # Yazıcı thread'i
+    def _run(self):
+        while True:
+            with self._lock:
+                self._wake.wait_for(lambda: self._closed or not self._is_idle())
+                if self._closed and self._is_idle():
+                    return
+                # Debounce: ardışık değişiklikleri biriktir (flush/close beklemez)
+                deadline = time.monotonic() + self.debounce
+                while not (self._closed or self._flushing):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wake.wait(remaining)
+                changes, self._changes = self._changes, {}
+                snapshot, self._snapshot = self._snapshot, None
+                self._busy = True
+            
+            try:
+                if snapshot is not None:
+                    # Tam kayıttan sonra gelen değişiklikler daha yenidir
+                    for path, value in changes.items():
+                        apply_change(snapshot, path, value)
+                    self._compact(snapshot)
+                elif changes:
+                    self._append(changes)
+            except Exception as e:
+                Logger.error(f"SaveJournal: Yazma hatası: {e}")
+            
+            with self._lock:
+                self._busy = False
+                self._idle.notify_all()
+    
+    def _append(self, changes: Dict[Path, Any]):
+        """Değişiklikleri günlüğe ekle; gerekirse sıkıştır"""
+        generation = self._current_generation()
+        lines = ''.join(json.dumps({'gen': generation, 'path': list(path), 'value': value},
+                                   ensure_ascii=False) + '\n'
+                        for path, value in changes.items())
+        with open(self.journal_file, 'ab+') as f:
+            # Yarım kalmış son satıra eklenmesin
+            f.seek(0, os.SEEK_END)
+            if f.tell():
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    lines = '\n' + lines
+            f.write(lines.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_entries += len(changes)
+        self.appends += 1
+        
+        if self._journal_entries >= self.compact_after:
+            self._compact(self.load(self._default) or {})
+    
+    def _compact(self, data: Dict[str, Any]):
+        """Yeni nesil anlık görüntüyü atomik yaz, günlüğü sil"""
+        generation = self._current_generation() + 1
+        data = dict(data)
+        data[GENERATION_KEY] = generation
+        write_atomic(self.save_file, json.dumps(data, indent=2, ensure_ascii=False))
+        self._generation = generation
+        # Görüntü yerindeyken günlük silinir; arada çökülürse eski nesil kayıtları atlanır
+        try:
+            os.remove(self.journal_file)
+        except FileNotFoundError:
+            pass
+        self._journal_entries = 0
+        self.compactions += 1
+        Logger.info(f"SaveJournal: Veri kaydedildi: {self.save_file}")
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Sayaçlar"""
+        return {
+            'recorded': self.recorded,
+            'coalesced': self.coalesced,
+            'appends': self.appends,
+            'compactions': self.compactions,
+        }
@@ -14,7 +14,8 @@ setup(
     packages=find_packages(),
     install_requires=[
         "kivy>=2.1.0",
-        "kivymd>=1.0.0"
+        "kivymd>=1.0.0",
+        "numpy>=1.21.0"
     ],
     python_requires=">=3.8",
     entry_points={
@@ -6,15 +6,18 @@ Systems/Abilities.py - Yetenek sistemi
 
 import math
 from typing import List, Optional, Dict, Any
+from core.rng import WeightedTable
 from entities.player import Player
 from entities.enemy import Enemy
-from entities.projectile import Projectile
+from entities.projectile import Projectile, projectile_pool
+from core.pool import ObjectPool
 
 
 class AbilitySystem:
     """Yetenek sistemi"""
     
-    def __init__(self):
+    def __init__(self, pool: ObjectPool = None):
+        self.pool = pool or projectile_pool  # Mermilerin alındığı havuz
         self.available_abilities = [
             {
                 'id': 'multishot',
@@ -59,6 +62,11 @@ class AbilitySystem:
                 'bonus': 0.2
             }
         ]
+        
+        # Teklif tablosu (ağırlık: 'weight', yoksa 1.0); yalnızca teklif
+        # edilebilir yetenekler değişince yeniden kurulur
+        self._offer_table = WeightedTable({})
+        self._offer_key = None
     
     def update(self, dt: float, player: Optional[Player], enemies: List[Enemy]) -> List[Projectile]:
         """Yetenek sistemini güncelle"""
@@ -80,7 +88,7 @@ class AbilitySystem:
             for i in range(projectile_count):
                 angle = (2 * math.pi * i) / projectile_count
                 
-                projectile = Projectile(damage=damage)
+                projectile = self.pool.acquire(damage=damage)
                 projectile.set_position(player_x, player_y)
                 
                 # Hız vektörü
@@ -93,9 +101,11 @@ class AbilitySystem:
         
         return new_projectiles
     
-    def get_random_abilities(self, count: int, current_abilities: List[Dict]) -> List[Dict]:
-        """Rastgele yetenekler seç"""
+    def get_random_abilities(self, count: int, current_abilities: List[Dict],
+                             rng=None) -> List[Dict]:
+        """Rastgele yetenekler seç (rng: seed'li akış, yoksa global random)"""
         import random
+        rng = rng or random
         
         # Mevcut yetenekleri filtrele (aynısından sadece 3 tane)
         current_counts = {}
@@ -103,12 +113,23 @@ class AbilitySystem:
             ability_id = ability.get('id', '')
             current_counts[ability_id] = current_counts.get(ability_id, 0) + 1
         
-        available = []
-        for ability in self.available_abilities:
-            if current_counts.get(ability['id'], 0) < 3:
-                available.append(ability.copy())
+        available = tuple(index for index, ability in enumerate(self.available_abilities)
+                          if current_counts.get(ability['id'], 0) < 3)
+        if available != self._offer_key:
+            self._offer_key = available
+            self._offer_table.set_weights({
+                index: self.available_abilities[index].get('weight', 1.0) for index in available
+            })
         
-        if len(available) <= count:
-            return available
+        table = self._offer_table
+        if len(table) <= count:
+            chosen = list(table.items)
+        else:
+            # Tekrarsız çekim: aynı yetenek gelirse yeniden çek
+            chosen = []
+            while len(chosen) < count:
+                index = table.sample(rng)
+                if index not in chosen:
+                    chosen.append(index)
         
-        return random.sample(available, count)
+        return [self.available_abilities[index].copy() for index in chosen]
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Systems/AILod.py - Uzaklığa göre kademeli (LOD) düşman AI güncellemesi
+
+Düşmanlar oyuncuya uzaklıklarına göre kademelere ayrılır:
+- yakın: her tick tam AI (durum makinesi, separation, özel yetenek)
+- orta / uzak: 2. / 4. tick'te bir tam AI; aradaki tick'lerde son hız
+  korunur (zamanlayıcılar simülasyon zamanı damgası olduğu için geçen
+  süre kendiliğinden hesaba katılır)
+- çok uzak: 8 tick'te bir durum geçişleri (devriye hedefi yenileme
+  dahil) ve hedefe düz çizgide yürüme; separation ve özel yetenek yok
+
+Güncelleme tick'i düşmanın ai_lod_slot değerine göre kaydırılır
+(staggered); her tick kademe başına düşmanların yalnızca bir dilimi
+işlenir, tick başına AI maliyeti sürü büyüklüğüyle değil kademe
+periyotlarıyla sınırlanır. Pozisyon, durum ve hedefler düşman sütun
+deposundan (EnemyAISystem.columns) slot dizileriyle okunur.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from entities.enhanced_enemies import AI_PATROL
+
+# Kademeler: (oyuncuya en fazla uzaklık, güncelleme periyodu - tick)
+AI_LOD_TIERS = ((300.0, 1), (450.0, 2), (600.0, 4))
+FAR_PERIOD = 8  # En dış kademe: düz çizgi yaklaşımı
+
+
+class AILODSystem:
+    """Düşman AI'ını uzaklık kademelerine göre seyreltir"""
+    
+    def __init__(self, tiers: Tuple[Tuple[float, int], ...] = AI_LOD_TIERS,
+                 far_period: int = FAR_PERIOD):
+        self.tiers = tiers
+        self.far_period = far_period
+        self.enabled = np is not None
+        if np is not None:
+            self._radii_sq = np.array([radius * radius for radius, _ in tiers])
+            self._periods = np.array([period for _, period in tiers] + [far_period])
+        
+        # Son tick'in metrikleri (profilleyici için)
+        self.tier_counts = [0] * (len(tiers) + 1)
+        self.full_updates = 0
+        self.far_updates = 0
+    
+    @staticmethod
+    def register(enemies: List, first_slot: int):
+        """Yeni düşmanlara güncelleme dilimi ver"""
+        for slot, enemy in enumerate(enemies, first_slot):
+            enemy.ai_lod_slot = slot
+    
+    def update(self, tick: int, columns, slots, player_pos: Tuple[float, float]
+               ) -> Tuple[Any, Optional['np.ndarray'], Optional['np.ndarray']]:
+        """Bu tick güncellenecek düşmanları seç
+        
+        columns: düşman sütun deposu, slots: canlı düşmanların slotları.
+        (slotlar, oyuncuya uzaklıkları, çok uzak kademe maskesi) döndürür;
+        durum geçişleri hepsine, steering ve özel yetenekler maskenin
+        dışındakilere uygulanır (maskelenenler için move_far). NumPy
+        yoksa tüm slotlar, None, None.
+        """
+        if not len(slots) or not self.enabled:
+            self.full_updates = len(slots)
+            return slots, None, None
+        
+        player_x, player_y = player_pos
+        center_x = columns.x[slots] + columns.width[slots] / 2
+        center_y = columns.y[slots] + columns.height[slots] / 2
+        dist_sq = (center_x - player_x) ** 2 + (center_y - player_y) ** 2
+        
+        tier = np.searchsorted(self._radii_sq, dist_sq)
+        due = (columns.ai_lod_slot[slots] + tick) % self._periods[tier] == 0
+        far = tier == len(self.tiers)
+        
+        self.tier_counts = np.bincount(tier, minlength=len(self.tiers) + 1).tolist()
+        
+        due = np.flatnonzero(due)
+        far = far[due]
+        self.far_updates = int(np.count_nonzero(far))
+        self.full_updates = len(due) - self.far_updates
+        return slots[due], np.sqrt(dist_sq[due]), far
+    
+    @staticmethod
+    def move_far(columns, slots: 'np.ndarray', player_pos: Tuple[float, float]):
+        """Çok uzak kademe: hedefe sabit hızla düz çizgide (separation yok)"""
+        if not len(slots):
+            return
+        center_x = columns.x[slots] + columns.width[slots] / 2
+        center_y = columns.y[slots] + columns.height[slots] / 2
+        patrol = columns.ai_state[slots] == AI_PATROL
+        delta_x = np.where(patrol, columns.target_x[slots], player_pos[0]) - center_x
+        delta_y = np.where(patrol, columns.target_y[slots], player_pos[1]) - center_y
+        
+        distance = np.hypot(delta_x, delta_y)
+        moving = distance > 1.0
+        scale = np.where(moving, columns.move_speed[slots] / np.where(moving, distance, 1.0), 0.0)
+        vel_x = delta_x * scale
+        vel_y = delta_y * scale
+        
+        columns.vel_x[slots] = vel_x
+        columns.vel_y[slots] = vel_y
+        columns.rotation[slots[moving]] = np.degrees(np.arctan2(vel_y[moving], vel_x[moving]))
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Kademe başına düşman sayısı ve son tick'te güncellenenler"""
+        stats = {f'tier_{index}': value for index, value in enumerate(self.tier_counts)}
+        stats['full_updates'] = self.full_updates
+        stats['far_updates'] = self.far_updates
+        return stats
@@ -8,14 +8,15 @@ from typing import List, Optional
 from entities.player import Player
 from entities.enemy import Enemy
 from entities.projectile import Projectile
-from entities.loot import LootOrb
+from entities.loot import LootOrb, loot_pool
+from core.pool import ObjectPool
 
 
 class CombatSystem:
     """Savaş sistemi"""
     
-    def __init__(self):
-        pass
+    def __init__(self, pool: ObjectPool = None):
+        self.pool = pool or loot_pool  # Loot'ların alındığı havuz
     
     def update(self, dt: float, player: Optional[Player], enemies: List[Enemy], 
                projectiles: List[Projectile]) -> List[LootOrb]:
@@ -27,7 +28,7 @@ class CombatSystem:
         for enemy in enemies[:]:
             if enemy.is_dead():
                 # XP orb oluştur
-                loot = LootOrb(xp_value=1.0)
+                loot = self.pool.acquire(xp_value=1.0)
                 enemy_x, enemy_y = enemy.get_center()
                 loot.set_position(enemy_x, enemy_y)
                 new_loot.append(loot)
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Systems/EnemyAI.py - Toplu (batched) düşman durum makinesi
+
+Düşman AI durumu tamsayı kodudur (AI_CHASE / AI_ATTACK / AI_PATROL).
+Geçişler düşman türü başına tablolarla tanımlanır: her durum için
+öncelik sırasıyla kurallar (koşul, eşik, sonraki durum, zamanlayıcı
+sıfırlanır mı, eylem). Koşullar mesafeyi düşmanın menzillerine oranla ya
+da durum zamanlayıcısını eşikle karşılaştırır.
+
+Durum, zamanlayıcı damgaları, hedefler ve pozisyonlar sistemin sahip
+olduğu sütun deposundadır (core.columns, ENEMY_COLUMNS); her düşman
+havuzda oluşturulurken kalıcı bir slot alır. slots dizisi simülasyonun
+düşman listesini sırasıyla tutar ve yalnızca düşman eklenip çıkınca
+değişir. Kurallar tek geçişte NumPy ile değerlendirilir, sonuçlar
+sütunlara toplu yazılır; Python tarafında yalnızca eylemi (saldırı,
+devriye hedefi) ya da özel yeteneği tetiklenen düşmanlara dokunulur.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from core.columns import ColumnStore
+from entities.enhanced_enemies import AI_ATTACK, AI_CHASE, AI_PATROL, AI_STATE_NAMES, ENEMY_COLUMNS
+
+# Koşullar
+COND_NEVER = -1
+COND_IN_ATTACK_RANGE = 0    # mesafe <= attack_range * eşik
+COND_OUT_ATTACK_RANGE = 1   # mesafe > attack_range * eşik
+COND_IN_DETECTION = 2       # mesafe <= detection_range * eşik
+COND_OUT_DETECTION = 3      # mesafe > detection_range * eşik
+COND_TIMER = 4              # durum zamanlayıcısı > eşik (saniye)
+
+# Eylemler
+ACTION_NONE = 0
+ACTION_ATTACK = 1   # EnhancedEnemy._perform_attack
+ACTION_REPATH = 2   # EnhancedEnemy._pick_patrol_target
+
+# Durum -> kurallar: (koşul, eşik, sonraki durum, zamanlayıcıyı sıfırla, eylem)
+DEFAULT_TRANSITIONS = {
+    AI_CHASE: (
+        (COND_IN_ATTACK_RANGE, 1.0, AI_ATTACK, True, ACTION_NONE),
+        (COND_OUT_DETECTION, 1.0, AI_PATROL, True, ACTION_NONE),
+    ),
+    AI_ATTACK: (
+        (COND_OUT_ATTACK_RANGE, 1.5, AI_CHASE, False, ACTION_NONE),
+        (COND_TIMER, 1.0, AI_ATTACK, True, ACTION_ATTACK),        # Saldırı aralığı
+    ),
+    AI_PATROL: (
+        (COND_IN_DETECTION, 1.0, AI_CHASE, False, ACTION_NONE),
+        (COND_TIMER, 2.0, AI_PATROL, True, ACTION_REPATH),        # Rastgele dolaşma
+    ),
+}
+
+# Düşman türü -> geçiş tablosu (listede olmayan türler varsayılanı kullanır)
+TRANSITION_TABLES = {
+    'slime': DEFAULT_TRANSITIONS,
+    'goblin': DEFAULT_TRANSITIONS,
+    'skeleton': DEFAULT_TRANSITIONS,
+    'orc': DEFAULT_TRANSITIONS,
+}
+
+
+def _condition_met(condition: int, threshold: float, distance: float, timer: float,
+                   attack_range: float, detection_range: float) -> bool:
+    """Tek kuralın koşulu (NumPy'sız yol)"""
+    if condition == COND_IN_ATTACK_RANGE:
+        return distance <= attack_range * threshold
+    if condition == COND_OUT_ATTACK_RANGE:
+        return distance > attack_range * threshold
+    if condition == COND_IN_DETECTION:
+        return distance <= detection_range * threshold
+    if condition == COND_OUT_DETECTION:
+        return distance > detection_range * threshold
+    if condition == COND_TIMER:
+        return timer > threshold
+    return False
+
+
+class EnemyAISystem:
+    """Düşman durum makinesini ve özel yetenek zamanlayıcılarını toplu işler"""
+    
+    def __init__(self, tables: Optional[Dict[str, Dict]] = None,
+                 columns: Optional[ColumnStore] = None):
+        self.tables = dict(TRANSITION_TABLES if tables is None else tables)
+        self.enabled = np is not None
+        self._type_codes: Dict[str, int] = {}
+        self._compile()
+        
+        # Düşman sütunları (havuzun fabrikası bu depoyu kullanır) ve
+        # simülasyonun düşman listesi sırasıyla slotlar
+        self.columns = columns if columns is not None else ColumnStore(ENEMY_COLUMNS)
+        self.slots = self._slot_array([])
+        
+        # Son update'in metrikleri
+        self.transitions = 0
+        self.actions = 0
+        self.specials = 0
+    
+    def _compile(self):
+        """Tabloları (tür, durum, kural) dizilerine çevir"""
+        types = list(self.tables) + ['*']  # Son satır: bilinmeyen türler
+        self._type_codes = {name: code for code, name in enumerate(types)}
+        if not self.enabled:
+            return
+        
+        state_count = len(AI_STATE_NAMES)
+        rule_count = max(len(rules) for table in list(self.tables.values()) + [DEFAULT_TRANSITIONS]
+                         for rules in table.values())
+        shape = (len(types), state_count, rule_count)
+        self._condition = np.full(shape, COND_NEVER, dtype=np.int64)
+        self._threshold = np.zeros(shape)
+        self._next_state = np.zeros(shape, dtype=np.int64)
+        self._reset = np.zeros(shape, dtype=bool)
+        self._action = np.zeros(shape, dtype=np.int64)
+        
+        for name, code in self._type_codes.items():
+            table = self.tables.get(name, DEFAULT_TRANSITIONS)
+            for state in range(state_count):
+                self._next_state[code, state, :] = state
+                for index, rule in enumerate(table.get(state, ())):
+                    condition, threshold, next_state, reset, action = rule
+                    self._condition[code, state, index] = condition
+                    self._threshold[code, state, index] = threshold
+                    self._next_state[code, state, index] = next_state
+                    self._reset[code, state, index] = reset
+                    self._action[code, state, index] = action
+    
+    # Etkin düşmanlar
+    @staticmethod
+    def _slot_array(slots: List[int]):
+        return np.array(slots, dtype=np.int64) if np is not None else list(slots)
+    
+    def add(self, enemies: List, now: Optional[float] = None):
+        """Listeye eklenen düşmanları slots'un sonuna ekle
+        
+        now verilirse durum zamanlayıcıları başlatılır (yeni spawn).
+        """
+        if not enemies:
+            return
+        type_code = self.columns.type_code
+        for enemy in enemies:
+            type_code[enemy._slot] = self._type_code(enemy.enemy_type)
+            if now is not None:
+                enemy.ai_timer_start = now
+        new_slots = [enemy._slot for enemy in enemies]
+        if np is not None:
+            self.slots = np.concatenate((self.slots, new_slots)).astype(np.int64)
+        else:
+            self.slots = self.slots + new_slots
+    
+    def set_active(self, enemies: List):
+        """slots'u düşman listesinden yeniden kur (düşman çıkınca)"""
+        self.slots = self._slot_array([enemy._slot for enemy in enemies])
+    
+    def living_slots(self):
+        """Canlı düşmanların slotları (liste sırasıyla)"""
+        is_alive = self.columns.is_alive
+        if np is not None:
+            return self.slots[is_alive[self.slots]]
+        return [slot for slot in self.slots if is_alive[slot]]
+    
+    def dead_slots(self):
+        """Ölü düşmanların slotları (EnhancedEnemy.is_dead, liste sırasıyla)"""
+        columns = self.columns
+        if np is not None:
+            slots = self.slots
+            return slots[~columns.is_alive[slots] | (columns.current_hp[slots] <= 0)]
+        return [slot for slot in self.slots
+                if not columns.is_alive[slot] or columns.current_hp[slot] <= 0]
+    
+    def _type_code(self, enemy_type: str) -> int:
+        return self._type_codes.get(enemy_type, self._type_codes['*'])
+    
+    # Durum geçişleri
+    def update_states(self, now: float, slots, distance: Optional['np.ndarray'],
+                      player_pos: Tuple[float, float]):
+        """Geçiş tablolarını uygula, eylemi tetiklenen düşmanlara gönder
+        
+        slots: bu tick güncellenecek düşmanların slotları
+        distance: oyuncuya uzaklıkları (None ise sütunlardan hesaplanır)
+        """
+        self.transitions = self.actions = 0
+        if not len(slots):
+            return
+        columns = self.columns
+        if not self.enabled:
+            for slot in slots:
+                self._update_state_scalar(now, columns.owners[slot], player_pos)
+            return
+        
+        count = len(slots)
+        state = columns.ai_state[slots]
+        timer = now - columns.ai_timer_start[slots]
+        attack_range = columns.attack_range[slots]
+        detection_range = columns.detection_range[slots]
+        types = columns.type_code[slots]  # -1: bilinmeyen tür satırı ('*', son satır)
+        if distance is None:
+            center_x = columns.x[slots] + columns.width[slots] / 2
+            center_y = columns.y[slots] + columns.height[slots] / 2
+            distance = np.hypot(center_x - player_pos[0], center_y - player_pos[1])
+        
+        # Kurallar öncelik sırasıyla; her düşmana ilk tutan kural uygulanır
+        rule = np.full(count, -1, dtype=np.int64)
+        for index in range(self._condition.shape[2]):
+            condition = self._condition[types, state, index]
+            threshold = self._threshold[types, state, index]
+            met = np.select(
+                [condition == COND_IN_ATTACK_RANGE, condition == COND_OUT_ATTACK_RANGE,
+                 condition == COND_IN_DETECTION, condition == COND_OUT_DETECTION,
+                 condition == COND_TIMER],
+                [distance <= attack_range * threshold, distance > attack_range * threshold,
+                 distance <= detection_range * threshold, distance > detection_range * threshold,
+                 timer > threshold],
+                default=False)
+            rule[(rule < 0) & met] = index
+        
+        fired = np.flatnonzero(rule >= 0)
+        if not len(fired):
+            return
+        
+        fired_rule = rule[fired]
+        fired_types = types[fired]
+        fired_state = state[fired]
+        fired_slots = slots[fired]
+        next_state = self._next_state[fired_types, fired_state, fired_rule]
+        reset = self._reset[fired_types, fired_state, fired_rule]
+        action = self._action[fired_types, fired_state, fired_rule]
+        
+        self.transitions = int(np.count_nonzero(next_state != fired_state))
+        columns.ai_state[fired_slots] = next_state
+        columns.ai_timer_start[fired_slots[reset]] = now
+        
+        # Eylemler liste sırasıyla (patrol hedefi 'ai' akışından çeker)
+        acting = np.flatnonzero(action != ACTION_NONE)
+        owners = columns.owners
+        for slot, enemy_action in zip(fired_slots[acting].tolist(), action[acting].tolist()):
+            self._act(owners[slot], enemy_action, player_pos)
+    
+    def _update_state_scalar(self, now: float, enemy, player_pos: Tuple[float, float]):
+        """Tek düşman için aynı tablolar (NumPy yoksa)"""
+        player_x, player_y = player_pos
+        distance = ((player_x - enemy.center_x) ** 2 + (player_y - enemy.center_y) ** 2) ** 0.5
+        timer = now - enemy.ai_timer_start
+        table = self.tables.get(enemy.enemy_type, DEFAULT_TRANSITIONS)
+        for condition, threshold, next_state, reset, action in table.get(enemy.ai_state, ()):
+            if _condition_met(condition, threshold, distance, timer,
+                              enemy.attack_range, enemy.detection_range):
+                self._apply(enemy, now, next_state, reset, action, player_pos)
+                return
+    
+    def _apply(self, enemy, now: float, new_state: int, reset_timer: bool, action: int,
+               player_pos: Tuple[float, float]):
+        """Kuralın sonucunu düşmana uygula"""
+        if enemy.ai_state != new_state:
+            enemy.ai_state = new_state
+            self.transitions += 1
+        if reset_timer:
+            enemy.ai_timer_start = now
+        self._act(enemy, action, player_pos)
+    
+    def _act(self, enemy, action: int, player_pos: Tuple[float, float]):
+        """Kuralın eylemini çalıştır"""
+        if action == ACTION_ATTACK:
+            enemy._perform_attack(player_pos)
+            self.actions += 1
+        elif action == ACTION_REPATH:
+            enemy._pick_patrol_target()
+            self.actions += 1
+    
+    # Özel yetenekler
+    def update_specials(self, now: float, slots, player_pos: Tuple[float, float],
+                        timers):
+        """Zamanı gelen özel yetenekleri kullan (süreli etkiler timers'a kurulur)"""
+        self.specials = 0
+        if not len(slots):
+            return
+        ready_at = self.columns.special_ready_at
+        if self.enabled:
+            ready = slots[ready_at[slots] <= now].tolist()
+        else:
+            ready = [slot for slot in slots if ready_at[slot] <= now]
+        
+        owners = self.columns.owners
+        for slot in ready:
+            enemy = owners[slot]
+            enemy._use_special_ability(player_pos, timers)
+            enemy.special_ready_at = now + enemy.special_ability_timer
+        self.specials = len(ready)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Son update'te geçiş / eylem / özel yetenek sayıları"""
+        return {
+            'transitions': self.transitions,
+            'actions': self.actions,
+            'specials': self.specials,
+        }
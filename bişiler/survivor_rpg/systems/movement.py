@@ -7,8 +7,14 @@ Systems/Movement.py - Hareket sistemi
 from typing import List, Optional
 from entities.player import Player
 from entities.enemy import Enemy
+from entities.enhanced_enemies import AI_PATROL
 from entities.projectile import Projectile
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class MovementSystem:
     """Hareket sistemi"""
@@ -17,8 +23,12 @@ class MovementSystem:
         pass
     
     def update(self, dt: float, player: Optional[Player], enemies: List[Enemy], 
-               projectiles: List[Projectile]):
-        """Hareket sistemini güncelle"""
+               projectiles: List[Projectile], enemy_columns=None, enemy_slots=None):
+        """Hareket sistemini güncelle
+        
+        enemy_columns / enemy_slots (düşman sütun deposu ve slotlar)
+        verilirse düşmanlar sütunlar üzerinden toplu güncellenir.
+        """
         
         # Oyuncu hareketi
         if player and player.is_alive:
@@ -27,12 +37,48 @@ class MovementSystem:
         # Düşman hareketi
         if player and player.is_alive:
             player_x, player_y = player.get_center()
-            for enemy in enemies:
-                if enemy.is_alive:
-                    enemy.set_target(player_x, player_y)
-                    enemy.update(dt)
+            if enemy_columns is not None and np is not None:
+                self._update_enemy_columns(dt, enemy_columns, enemy_slots, player_x, player_y)
+            else:
+                for enemy in enemies:
+                    if enemy.is_alive:
+                        enemy.set_target(player_x, player_y)
+                        enemy.update(dt)
         
         # Mermi hareketi
         for projectile in projectiles:
             if projectile.is_alive:
                 projectile.update(dt)
+
+    @staticmethod
+    def _update_enemy_columns(dt: float, columns, slots, player_x: float, player_y: float):
+        """Canlı düşmanlar için set_target + EnhancedEnemy.update, toplu"""
+        slots = slots[columns.is_alive[slots]]
+        if not len(slots):
+            return
+        
+        # Devriyede olmayanlar oyuncuyu hedefler
+        chasing = slots[columns.ai_state[slots] != AI_PATROL]
+        columns.target_x[chasing] = player_x
+        columns.target_y[chasing] = player_y
+        
+        # Flash efekti ve ses cooldown azalması
+        flash = columns.flash_timer[slots]
+        columns.flash_timer[slots] = np.where(flash > 0, np.maximum(flash - dt, 0.0), flash)
+        cooldown = columns.hurt_sound_cooldown[slots]
+        columns.hurt_sound_cooldown[slots] = np.where(cooldown > 0, cooldown - dt, cooldown)
+        
+        # Hareket
+        columns.x[slots] += columns.vel_x[slots] * dt
+        columns.y[slots] += columns.vel_y[slots] * dt
+    
+    @staticmethod
+    def store_previous(columns, slots):
+        """Düşmanların tick öncesi pozisyonları (BaseEntity.store_previous, toplu)"""
+        if np is None:
+            for slot in slots:
+                columns.owners[slot].store_previous()
+            return
+        columns.prev_x[slots] = columns.x[slots]
+        columns.prev_y[slots] = columns.y[slots]
+        columns.has_prev[slots] = True
@@ -9,43 +9,66 @@ from entities.player import Player
 from entities.enemy import Enemy
 from entities.projectile import Projectile
 from entities.loot import LootOrb
+from .spatial_hash import SpatialHash
 
 
 class PhysicsSystem:
     """Fizik ve çarpışma sistemi"""
     
     def __init__(self):
-        pass
+        # Son update'te verilen / alınan hasar (koşu istatistikleri için)
+        self.damage_dealt = 0.0
+        self.damage_taken = 0.0
     
     def update(self, dt: float, player: Optional[Player], enemies: List[Enemy], 
-               projectiles: List[Projectile], loot_orbs: List[LootOrb]):
-        """Fizik sistemini güncelle"""
+               projectiles: List[Projectile], loot_orbs: List[LootOrb],
+               enemy_index: Optional[SpatialHash] = None,
+               loot_index: Optional[SpatialHash] = None):
+        """Fizik sistemini güncelle
+
+        enemy_index / loot_index, GameManager'ın bu tick için kurduğu
+        ortak uzamsal indekslerdir. Verilmezlerse burada kurulur.
+        """
+        
+        self.damage_dealt = 0.0
+        self.damage_taken = 0.0
         
         if not player or not player.is_alive:
             return
         
+        if enemy_index is None:
+            enemy_index = SpatialHash()
+            enemy_index.build(enemies)
+        if loot_index is None:
+            loot_index = SpatialHash()
+            loot_index.build(loot_orbs)
+        
         # Oyuncu - düşman çarpışması
-        for enemy in enemies[:]:
+        player_x, player_y = player.get_center()
+        for enemy in enemy_index.query(player_x, player_y, player.radius):
             if enemy.is_alive and player.is_colliding_with(enemy):
+                hp = player.current_hp
                 if player.take_damage(enemy.damage * dt):  # DPS hasarı
-                    pass  # Hasar alındı
+                    self.damage_taken += hp - player.current_hp
         
         # Mermi - düşman çarpışması
         for projectile in projectiles[:]:
             if not projectile.is_alive:
                 continue
-                
-            for enemy in enemies[:]:
+            
+            proj_x, proj_y = projectile.get_center()
+            for enemy in enemy_index.query(proj_x, proj_y, projectile.radius):
                 if enemy.is_alive and projectile.is_colliding_with(enemy):
-                    enemy.take_damage(projectile.damage)
+                    if enemy.take_damage(projectile.damage):
+                        self.damage_dealt += projectile.damage
                     projectile.hit_target()
                     break
         
         # Oyuncu - loot çarpışması
-        player_x, player_y = player.get_center()
         magnet_range = player.get_magnet_range()
+        pickup_range = max(magnet_range, player.radius + 5)
         
-        for loot in loot_orbs[:]:
+        for loot in loot_index.query(player_x, player_y, pickup_range):
             if not loot.is_alive or loot.collected:
                 continue
                 
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Systems/SpatialHash.py - Uniform grid tabanlı uzamsal indeks
+"""
+
+import math
+from typing import Dict, List, Tuple, Iterable, Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class SpatialHash:
+    """Değişken yarıçaplı varlıklar için uniform grid (spatial hash)
+
+    Her varlık, merkezinin etrafındaki sınır kutusunun (merkez ± yarıçap)
+    kapladığı tüm hücrelere eklenir. Sorgular yalnızca ilgili hücrelere
+    bakar ve adayları ekleme sırasıyla döndürür; böylece liste üzerinde
+    yapılan kaba kuvvet taramasıyla aynı sonuç sırası korunur.
+    """
+
+    def __init__(self, cell_size: float = 64.0):
+        self.cell_size = float(cell_size)
+        self._inv_cell_size = 1.0 / self.cell_size
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        self.items: List[Any] = []
+
+    def clear(self):
+        """İndeksi temizle"""
+        self.cells.clear()
+        self.items.clear()
+
+    def build(self, entities: Iterable[Any]):
+        """Varlık listesinden indeksi baştan kur (her tick bir kez)"""
+        self.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def build_columns(self, entities: List[Any], columns, slots):
+        """build() ile aynı indeks, x / y / radius sütunlarından toplu
+
+        columns: sütun deposu (core.columns), slots: entities sırasıyla
+        slotları. Merkez get_center() gibi (x + radius, y + radius).
+        """
+        if np is None:
+            self.build(entities)
+            return
+        self.clear()
+        self.items.extend(entities)
+        if not entities:
+            return
+
+        radius = columns.radius[slots]
+        x = columns.x[slots] + radius
+        y = columns.y[slots] + radius
+        inv = self._inv_cell_size
+        min_cx = np.floor((x - radius) * inv).astype(np.int64)
+        min_cy = np.floor((y - radius) * inv).astype(np.int64)
+        span_x = np.floor((x + radius) * inv).astype(np.int64) - min_cx + 1
+        span_y = np.floor((y + radius) * inv).astype(np.int64) - min_cy + 1
+
+        # (varlık, hücre) çiftleri; varlık sırası artan
+        counts = span_x * span_y
+        index = np.repeat(np.arange(len(entities)), counts)
+        offset = np.arange(len(index)) - np.repeat(np.cumsum(counts) - counts, counts)
+        row_span = span_y[index]
+        cell_x = min_cx[index] + offset // row_span
+        cell_y = min_cy[index] + offset % row_span
+
+        # Hücreye göre kararlı sıralama: kova içinde ekleme sırası korunur
+        order = np.lexsort((cell_y, cell_x))
+        cell_x = cell_x[order]
+        cell_y = cell_y[order]
+        index = index[order].tolist()
+        starts = np.flatnonzero(np.r_[True, (cell_x[1:] != cell_x[:-1]) | (cell_y[1:] != cell_y[:-1])])
+        ends = np.r_[starts[1:], len(index)].tolist()
+        keys = zip(cell_x[starts].tolist(), cell_y[starts].tolist())
+        self.cells = {key: index[start:end]
+                      for key, start, end in zip(keys, starts.tolist(), ends)}
+
+    def insert(self, entity: Any):
+        """Varlığı kapladığı hücrelere ekle"""
+        index = len(self.items)
+        self.items.append(entity)
+
+        x, y = entity.get_center()
+        radius = entity.radius
+        inv = self._inv_cell_size
+
+        min_cx = math.floor((x - radius) * inv)
+        max_cx = math.floor((x + radius) * inv)
+        min_cy = math.floor((y - radius) * inv)
+        max_cy = math.floor((y + radius) * inv)
+
+        cells = self.cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [index]
+                else:
+                    bucket.append(index)
+
+    def query(self, x: float, y: float, radius: float) -> List[Any]:
+        """(x, y) merkezli, radius yarıçaplı daireye aday varlıkları döndür
+
+        Dönen liste bir üst kümedir: çağıran taraf kesin mesafe testini
+        yine kendisi yapmalıdır. Sonuçlar ekleme sırasına göre sıralıdır.
+        """
+        inv = self._inv_cell_size
+        min_cx = math.floor((x - radius) * inv)
+        max_cx = math.floor((x + radius) * inv)
+        min_cy = math.floor((y - radius) * inv)
+        max_cy = math.floor((y + radius) * inv)
+
+        cells = self.cells
+        found = set()
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+
+        if not found:
+            return []
+
+        items = self.items
+        return [items[i] for i in sorted(found)]
+
+    def __len__(self) -> int:
+        return len(self.items)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Systems/Steering.py - Toplu (batched) düşman yönlendirme sistemi
+
+Girdiler (pozisyon, hedef, hız, rotasyon) düşman sütun deposundan slot
+dizileriyle okunur, sonuçlar aynı sütunlara toplu yazılır.
+"""
+
+from typing import Optional, Tuple
+
+from entities.enhanced_enemies import AI_PATROL
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def steer_batch(pos: 'np.ndarray', target: 'np.ndarray', move_speed: 'np.ndarray',
+                avoid_distance: 'np.ndarray', rotation: 'np.ndarray',
+                max_neighbors: Optional[int] = 16) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Seek + separation + hız sınırı + rotasyon yumuşatma (tüm düşmanlar için)
+
+    pos, target: (n, 2) merkez ve hedef pozisyonları
+    move_speed, avoid_distance, rotation: (n,) düşman başına değerler
+    max_neighbors: separation için dikkate alınan en yakın komşu sayısı
+                   (None = sınırsız, EnhancedEnemy._calculate_movement ile aynı)
+
+    (velocity (n, 2), rotation (n,)) döndürür.
+    """
+    n = len(pos)
+    if n == 0:
+        return np.zeros((0, 2)), np.zeros(0)
+
+    px = pos[:, 0]
+    py = pos[:, 1]
+
+    # Hedefe doğru yön (seek)
+    dx = target[:, 0] - px
+    dy = target[:, 1] - py
+    distance = np.hypot(dx, dy)
+    seeking = distance > 1.0
+    safe_distance = np.where(seeking, distance, 1.0)
+    move_x = np.where(seeking, dx / safe_distance * move_speed, 0.0)
+    move_y = np.where(seeking, dy / safe_distance * move_speed, 0.0)
+
+    # Diğer düşmanlardan kaçınma (separation)
+    avoid_x = np.zeros(n)
+    avoid_y = np.zeros(n)
+    i, j, pair_dx, pair_dy, pair_dist = _neighbor_pairs(px, py, avoid_distance)
+
+    if len(i):
+        if max_neighbors is not None:
+            i, j, pair_dx, pair_dy, pair_dist = _cap_neighbors(
+                i, j, pair_dx, pair_dy, pair_dist, max_neighbors)
+
+        avoid_i = avoid_distance[i]
+        strength = (avoid_i - pair_dist) / avoid_i * 50.0
+        avoid_x = -np.bincount(i, weights=pair_dx / pair_dist * strength, minlength=n)
+        avoid_y = -np.bincount(i, weights=pair_dy / pair_dist * strength, minlength=n)
+        counts = np.bincount(i, minlength=n)
+        has_neighbors = counts > 0
+        avoid_x[has_neighbors] /= counts[has_neighbors]
+        avoid_y[has_neighbors] /= counts[has_neighbors]
+
+    # Final hareket vektörü
+    final_x = move_x + avoid_x
+    final_y = move_y + avoid_y
+
+    # Hız sınırı
+    final_speed = np.hypot(final_x, final_y)
+    too_fast = final_speed > move_speed
+    scale = np.where(too_fast, move_speed / np.where(too_fast, final_speed, 1.0), 1.0)
+    final_x = final_x * scale
+    final_y = final_y * scale
+
+    # Rotasyon (hareket yönüne doğru), sınırdan önceki hıza göre
+    new_rotation = rotation.copy()
+    turning = final_speed > 5
+    if turning.any():
+        target_rotation = np.degrees(np.arctan2(final_y[turning], final_x[turning]))
+        angle_diff = target_rotation - rotation[turning]
+        angle_diff = np.where(angle_diff > 180, angle_diff - 360,
+                              np.where(angle_diff < -180, angle_diff + 360, angle_diff))
+        new_rotation[turning] = rotation[turning] + angle_diff * 0.1
+
+    return np.column_stack((final_x, final_y)), new_rotation
+
+
+def _neighbor_pairs(px, py, avoid_distance):
+    """avoid_distance içindeki (i, j) komşu çiftlerini grid ile bul"""
+    n = len(px)
+    cell_size = float(avoid_distance.max())
+    if cell_size <= 0:
+        empty = np.zeros(0)
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), empty, empty, empty
+
+    cx = np.floor(px / cell_size).astype(np.int64)
+    cy = np.floor(py / cell_size).astype(np.int64)
+    cx -= cx.min() - 1
+    cy -= cy.min() - 1
+    width = int(cy.max()) + 2
+    keys = cx * width + cy
+
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    agent = np.arange(n)
+
+    i_parts = []
+    j_parts = []
+    for ox in (-1, 0, 1):
+        for oy in (-1, 0, 1):
+            neighbor_keys = keys + ox * width + oy
+            start = np.searchsorted(sorted_keys, neighbor_keys, 'left')
+            end = np.searchsorted(sorted_keys, neighbor_keys, 'right')
+            counts = end - start
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            i_parts.append(np.repeat(agent, counts))
+            j_parts.append(order[np.repeat(start, counts) + offsets])
+
+    if not i_parts:
+        empty = np.zeros(0)
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), empty, empty, empty
+
+    i = np.concatenate(i_parts)
+    j = np.concatenate(j_parts)
+    pair_dx = px[j] - px[i]
+    pair_dy = py[j] - py[i]
+    pair_dist = np.hypot(pair_dx, pair_dy)
+
+    close = (i != j) & (pair_dist > 0) & (pair_dist < avoid_distance[i])
+    return i[close], j[close], pair_dx[close], pair_dy[close], pair_dist[close]
+
+
+def _cap_neighbors(i, j, pair_dx, pair_dy, pair_dist, max_neighbors):
+    """Her düşman için yalnızca en yakın max_neighbors komşuyu tut"""
+    if np.bincount(i).max() <= max_neighbors:
+        return i, j, pair_dx, pair_dy, pair_dist
+
+    order = np.lexsort((pair_dist, i))
+    i = i[order]
+    first = np.searchsorted(i, i, 'left')
+    keep = (np.arange(len(i)) - first) < max_neighbors
+    order = order[keep]
+    return i[keep], j[order], pair_dx[order], pair_dy[order], pair_dist[order]
+
+
+class SteeringSystem:
+    """Tüm canlı düşmanların hareket vektörlerini tek geçişte hesaplar"""
+
+    def __init__(self, max_neighbors: Optional[int] = 16):
+        self.max_neighbors = max_neighbors
+        self.enabled = np is not None
+
+    def update(self, columns, slots, player_pos: Tuple[float, float]):
+        """Düşman hızlarını ve rotasyonlarını toplu olarak güncelle
+
+        columns: düşman sütun deposu, slots: canlı düşmanların slotları
+        """
+        if not len(slots):
+            return
+
+        if not self.enabled:
+            # NumPy yoksa düşman başına eski yola dön
+            living = [columns.owners[slot] for slot in slots]
+            for enemy in living:
+                enemy._calculate_movement(player_pos, living)
+            return
+
+        player_x, player_y = player_pos
+        pos = np.column_stack((columns.x[slots] + columns.width[slots] / 2,
+                               columns.y[slots] + columns.height[slots] / 2))
+        patrol = columns.ai_state[slots] == AI_PATROL
+        target = np.column_stack((np.where(patrol, columns.target_x[slots], player_x),
+                                  np.where(patrol, columns.target_y[slots], player_y)))
+
+        velocity, rotation = steer_batch(pos, target, columns.move_speed[slots],
+                                         columns.avoid_distance[slots], columns.rotation[slots],
+                                         self.max_neighbors)
+
+        columns.vel_x[slots] = velocity[:, 0]
+        columns.vel_y[slots] = velocity[:, 1]
+        columns.rotation[slots] = rotation
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+"""Testler proje kökünden (core, systems, services ...) import eder"""
+
+import os
+import sys
+
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+os.environ.setdefault('KIVY_NO_CONSOLELOG', '1')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
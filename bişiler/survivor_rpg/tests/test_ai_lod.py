@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Uzaklık kademeleri: çok uzak kademede durum makinesi"""
+
+from core.simulation import Simulation
+from entities.enhanced_enemies import AI_PATROL
+from systems.ai_lod import FAR_PERIOD
+
+
+def _far_enemy(simulation, offset_x):
+    enemy = simulation.enemy_pool.acquire('slime', simulation.rng.stream('ai'))
+    enemy.events = simulation.events
+    enemy.center_x = simulation.player.center_x + offset_x
+    enemy.center_y = simulation.player.center_y
+    simulation.ai_lod_system.register([enemy], len(simulation.enemies))
+    simulation.enemy_ai_system.add([enemy], simulation.game_time)
+    simulation.enemies.append(enemy)
+    return enemy
+
+
+def test_far_patrol_enemy_keeps_retargeting():
+    simulation = Simulation(800, 600)
+    simulation.start_run(3)
+    simulation.spawn_system.spawn_interval = 1e9  # Yalnızca elle eklenen düşman
+    enemy = _far_enemy(simulation, 1500.0)
+    
+    targets = set()
+    for _ in range(20 * 60):
+        simulation.step(1 / 60)
+        targets.add(tuple(enemy.target_pos))
+    
+    assert simulation.ai_lod_system.get_stats()[f'tier_{len(simulation.ai_lod_system.tiers)}'] == 1
+    assert enemy.ai_state == AI_PATROL
+    # Devriye hedefi ~2 saniyede bir yenilenir; takılıp kalmaz
+    assert len(targets) >= 8
+    assert enemy.velocity != [0.0, 0.0]
+
+
+def test_far_tier_runs_at_far_cadence():
+    simulation = Simulation(800, 600)
+    simulation.start_run(3)
+    simulation.spawn_system.spawn_interval = 1e9
+    enemy = _far_enemy(simulation, 1500.0)
+    
+    updates = 0
+    for _ in range(FAR_PERIOD * 30):
+        simulation.step(1 / 60)
+        updates += simulation.ai_lod_system.far_updates
+    assert updates == 30
+    assert enemy.ai_state == AI_PATROL
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""AssetCache: bozuk girdiler silinip yeniden üretilir"""
+
+import wave
+
+from services.asset_cache import AssetCache
+
+
+def _write_wav(path, frames=100):
+    with wave.open(path, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(22050)
+        wav_file.writeframes(b'\x01\x00' * frames)
+
+
+def test_truncated_wav_is_evicted_and_rebuilt(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    path = cache.cached_file('tone', {'frequency': 440}, 1, '.wav', _write_wav)
+    assert path is not None
+    assert cache.cached_file('tone', {'frequency': 440}, 1, '.wav', _write_wav) == path
+    assert cache.hits == 1
+    
+    # Yarım kalmış dosya: başlık 100 örnek bildiriyor, veri eksik
+    with open(path, 'rb+') as f:
+        f.truncate(60)
+    rebuilt = cache.cached_file('tone', {'frequency': 440}, 1, '.wav', _write_wav)
+    assert rebuilt == path
+    assert cache.misses == 2
+    with wave.open(rebuilt, 'rb') as wav_file:
+        assert wav_file.getnframes() == 100
+    assert not [name for name in tmp_path.iterdir() if name.suffix == '.tmp']
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""Düşman sütun deposu: slotlar, özellikler ve simülasyonun slot dizisi"""
+
+import random
+
+from core.pool import ObjectPool
+from core.simulation import Simulation
+from entities.enhanced_enemies import AI_CHASE, AI_PATROL, EnhancedEnemy
+from entities.enhanced_player import EnhancedPlayer
+from systems.enemy_ai import EnemyAISystem
+from systems.movement import MovementSystem
+
+
+def test_pooled_enemy_keeps_its_slot():
+    system = EnemyAISystem()
+    pool = ObjectPool(lambda *args: EnhancedEnemy(*args, columns=system.columns))
+    enemy = pool.acquire('orc')
+    slot = enemy._slot
+    enemy.ai_state = AI_PATROL
+    enemy.target_pos = [3.0, 4.0]
+    assert system.columns.ai_state[slot] == AI_PATROL
+    assert system.columns.target_y[slot] == 4.0
+    
+    pool.release(enemy)
+    again = pool.acquire('goblin')
+    assert again is enemy and again._slot == slot
+    assert again.ai_state != AI_PATROL and again.target_pos == [0.0, 0.0]
+    assert len(system.columns) == 1
+
+
+def test_state_round_trip_through_columns():
+    enemy = EnhancedEnemy('skeleton')
+    enemy.center_x, enemy.center_y = 120.0, -40.0
+    enemy.velocity = [1.5, -2.0]
+    enemy.prev_pos = None
+    state = enemy.get_state()
+    assert '_slot' not in state and state['velocity'] == [1.5, -2.0]
+    
+    other = EnhancedEnemy('slime')
+    other.set_state(state)
+    assert other.get_state() == state
+    assert other._slot != enemy._slot and '_columns' not in state
+
+
+def test_slots_follow_enemy_list():
+    simulation = Simulation(800, 600)
+    simulation.start_run(21)
+    columns = simulation.enemy_ai_system.columns
+    for _ in range(90 * 60):
+        simulation.step(1 / 60)
+    
+    assert simulation.state.current_run.enemies_killed > 0
+    assert simulation.enemy_ai_system.slots.tolist() == [enemy._slot for enemy in simulation.enemies]
+    for enemy in simulation.enemies:
+        assert columns.owners[enemy._slot] is enemy
+        assert enemy.ai_state == columns.ai_state[enemy._slot]
+        assert enemy.velocity == [columns.vel_x[enemy._slot], columns.vel_y[enemy._slot]]
+
+
+def test_enemy_table_restores_every_enemy():
+    """Sütun tablosundan (get_table / set_table) geri kurulan düşmanlar birebir aynı"""
+    simulation = Simulation(800, 600)
+    simulation.start_run(21)
+    for _ in range(30 * 60):
+        simulation.step(1 / 60)
+
+    restored = Simulation(800, 600)
+    restored.set_state(simulation.get_state())
+    assert [enemy.get_state() for enemy in restored.enemies] == \
+        [enemy.get_state() for enemy in simulation.enemies]
+
+    system = restored.enemy_ai_system
+    assert system.slots.tolist() == [enemy._slot for enemy in restored.enemies]
+    assert system.columns.type_code[system.slots].tolist() == \
+        simulation.enemy_ai_system.columns.type_code[simulation.enemy_ai_system.slots].tolist()
+    assert restored.enemy_pool.get_stats()['in_use'] == len(restored.enemies) > 0
+
+
+def _enemies(count, seed):
+    """Rastgele durumlu düşmanlar (ayrı sütun deposunda)"""
+    rng = random.Random(seed)
+    system = EnemyAISystem()
+    enemies = []
+    for index in range(count):
+        enemy = EnhancedEnemy(rng.choice(['slime', 'goblin', 'orc']), columns=system.columns)
+        enemy.center = (rng.uniform(-300, 300), rng.uniform(-300, 300))
+        enemy.special_ability_timer = 0.0
+        enemy.velocity = [rng.uniform(-60, 60), rng.uniform(-60, 60)]
+        enemy.flash_timer = rng.choice([0.0, 0.2, 0.01, rng.uniform(0, 0.2)])
+        enemy.hurt_sound_cooldown = rng.choice([0.0, 0.3, -0.01, rng.uniform(0, 0.3)])
+        enemy.ai_state = rng.choice([AI_CHASE, AI_PATROL])
+        enemy.target_pos = [rng.uniform(-50, 50), rng.uniform(-50, 50)]
+        if index % 7 == 0:
+            enemy.kill()
+        enemies.append(enemy)
+    system.add(enemies)
+    return system, enemies
+
+
+def test_column_movement_matches_per_enemy_update():
+    """Toplu hareket, düşman başına set_target + update ile aynı durumu üretmeli"""
+    player = EnhancedPlayer()
+    player.pos = [37.5, -12.25]
+    system, enemies = _enemies(60, 4)
+    _, reference = _enemies(60, 4)
+
+    movement = MovementSystem()
+    for _ in range(20):
+        movement.update(1 / 60, player, [], [], system.columns, system.slots)
+        movement.update(1 / 60, player, reference, [])
+    for enemy, expected in zip(enemies, reference):
+        assert enemy.get_state() == expected.get_state()
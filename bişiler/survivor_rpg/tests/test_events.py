@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Simülasyon başına olay bus'ı"""
+
+from core.events import event_bus
+from core.simulation import Simulation
+
+
+def test_simulation_events_stay_on_its_own_bus():
+    live = Simulation(800, 600)
+    other = Simulation(800, 600)
+    seen = {'live': 0, 'other': 0, 'global': 0}
+    
+    def counter(name):
+        def on_event(*args):
+            seen[name] += 1
+        return on_event
+    
+    live.events.subscribe('enemy_spawned', counter('live'))
+    other.events.subscribe('enemy_spawned', counter('other'))
+    on_global = counter('global')
+    event_bus.subscribe('enemy_spawned', on_global)
+    try:
+        other.start_run(3)
+        for _ in range(600):
+            other.step(1 / 60)
+    finally:
+        event_bus.unsubscribe('enemy_spawned', on_global)
+    
+    assert seen['other'] > 0
+    assert seen['live'] == 0 and seen['global'] == 0
+    assert all(enemy.events is other.events for enemy in other.enemies)
+    assert 'events' not in other.player.get_state()
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""ObjectPool sayaçları ve simülasyon başına havuzlar"""
+
+from core.pool import ObjectPool
+from core.simulation import Simulation
+from entities.loot import LootOrb
+
+
+def test_clear_keeps_checked_out_counters():
+    pool = ObjectPool(LootOrb)
+    pool.prewarm(4)
+    orbs = [pool.acquire(xp_value=1.0) for _ in range(3)]
+    pool.clear()
+    assert pool.free_count() == 0
+    assert pool.get_stats()['in_use'] == 3
+    pool.release_all(orbs)
+    assert pool.get_stats()['in_use'] == 0
+    assert pool.get_stats()['peak_in_use'] == 3
+
+
+def test_simulations_do_not_share_pools():
+    live = Simulation(800, 600)
+    live.start_run(7)
+    for _ in range(600):
+        live.step(1 / 60)
+    stats = live.get_pool_stats()
+    
+    headless = Simulation(800, 600)
+    headless.start_run(7)
+    for _ in range(600):
+        headless.step(1 / 60)
+    headless.clear()
+    
+    assert live.get_pool_stats() == stats
+    assert headless.get_pool_stats()['enemies']['in_use'] == 0
+    assert stats['enemies']['in_use'] == len(live.enemies) > 0
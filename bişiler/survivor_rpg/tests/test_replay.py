@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Replay kaydı, oynatma ve seek determinizmi"""
+
+import math
+
+import pytest
+
+from core.replay import Replay, ReplayPlayer, ReplayRecorder, state_digest
+from core.simulation import Simulation
+from core.snapshot import decode_state, encode_state
+
+SEED = 1234
+TICKS = 40 * 60
+LEVEL_UP_TICKS = (1200, 1800)   # İlk keyframe'lerden sonra (abilities akışı geç oluşur)
+CHECKPOINTS = (150, 700, 1500, 2100, TICKS)
+
+
+def _movement(tick):
+    """Sabit desenli joystick girişi"""
+    angle = (tick // 45) * 0.9
+    return (math.cos(angle) * 0.6, math.sin(angle) * 0.6)
+
+
+@pytest.fixture(scope='module')
+def recording():
+    """Kaydedilmiş koşu ve kontrol noktalarındaki durum özetleri"""
+    simulation = Simulation(800, 600)
+    simulation.recorder = ReplayRecorder(keyframe_interval=5.0)
+    simulation.start_run(SEED)
+    
+    digests = {}
+    while simulation.tick < TICKS:
+        simulation.set_movement_input(_movement(simulation.tick))
+        simulation.step(1 / 60)
+        if simulation.tick in CHECKPOINTS:
+            digests[simulation.tick] = state_digest(simulation)
+        if simulation.tick in LEVEL_UP_TICKS:
+            simulation.apply_level_up(simulation.get_level_up_choices(3)[0])
+    
+    # Dosya biçiminden geçir
+    replay = Replay.from_bytes(simulation.recorder.replay.to_bytes())
+    return replay, digests
+
+
+def test_playback_matches_recording(recording):
+    replay, digests = recording
+    player = ReplayPlayer(replay)
+    player.run_to_end()
+    assert state_digest(player.simulation) == digests[TICKS]
+
+
+def test_seek_forward_and_backward(recording):
+    replay, digests = recording
+    assert replay.keyframes[0][0] < LEVEL_UP_TICKS[0]
+    
+    player = ReplayPlayer(replay)
+    for tick in (2100, 700, TICKS, 150, 1500, 700):
+        player.seek(tick)
+        assert player.tick == tick
+        assert state_digest(player.simulation) == digests[tick], tick
+
+
+def test_snapshot_round_trip_continues_identically(recording):
+    """Anlık durum (bekleyen zamanlayıcılar dahil) birebir geri kurulur"""
+    replay, _ = recording
+    player = ReplayPlayer(replay)
+    player.seek(1500)
+    original = player.simulation
+    # Bekleyen bir zamanlayıcı olsun (goblin hız patlaması gibi)
+    enemy = original.enemies[0]
+    original.timers.schedule(3.0, enemy, '_pick_patrol_target')
+    
+    restored = Simulation(800, 600)
+    restored.set_state(decode_state(encode_state(original.get_state())))
+    assert state_digest(restored) == state_digest(original)
+    assert restored.timers.count == original.timers.count
+    
+    for simulation in (original, restored):
+        for _ in range(300):
+            simulation.step(1 / 60)
+    assert state_digest(restored) == state_digest(original)
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""GameRNG akışları: durum geri yükleme ve akış yalıtımı"""
+
+import numpy as np
+
+from core.replay import Replay, ReplayPlayer, ReplayRecorder, state_digest
+from core.rng import MASK64, SCALAR_BLOCK, GameRNG
+from core.simulation import Simulation
+
+
+def test_set_state_resets_streams_created_later():
+    rng = GameRNG(5)
+    state = rng.get_state()
+    rng.stream('extra').random()
+    rng.stream('abilities').random()
+    rng.stream('abilities').random_array(4)
+    rng.set_state(state)
+    
+    fresh = GameRNG(5)
+    assert rng.stream('abilities').random() == fresh.stream('abilities').random()
+    assert rng.stream('extra').random() == fresh.stream('extra').random()
+    assert (rng.stream('abilities').random_array(4) == fresh.stream('abilities').random_array(4)).all()
+
+
+def test_set_state_restores_bulk_draws():
+    rng = GameRNG(11)
+    rng.stream('ai').uniform_array(0.0, 1.0, 1000)
+    state = rng.get_state()
+    expected = rng.stream('ai').random_array(8)
+    rng.stream('ai').random_array(100)
+    rng.set_state(state)
+    assert (rng.stream('ai').random_array(8) == expected).all()
+
+
+def test_scalar_and_bulk_draws_share_philox():
+    stream = GameRNG(3).stream('spawn')
+    reference = np.random.Philox(stream.generator.bit_generator.state['state']['key'])
+    reference.state = stream.generator.bit_generator.state
+    raw = reference.random_raw(SCALAR_BLOCK + 4).tolist()
+
+    assert stream.random() == (raw[0] >> 11) / (1 << 53)
+    assert stream.getrandbits(64) == raw[1]
+    # Blok tükenmeden toplu çekim, bloğun ardından gelir
+    assert stream.random_array(1)[0] == (raw[SCALAR_BLOCK] >> 11) / (1 << 53)
+
+
+def test_set_state_mid_block_with_interleaved_draws():
+    rng = GameRNG(13)
+    stream = rng.stream('ai')
+    for _ in range(SCALAR_BLOCK - 3):
+        stream.random()
+    stream.random_array(7)
+    stream.gauss(0.0, 1.0)
+    state = rng.get_state()
+    expected = ([stream.randint(0, 10**9) for _ in range(10)], stream.random_array(5).tolist(),
+                stream.gauss(0.0, 1.0), stream.choice(range(1000)))
+    rng.set_state(state)
+    assert ([stream.randint(0, 10**9) for _ in range(10)], stream.random_array(5).tolist(),
+            stream.gauss(0.0, 1.0), stream.choice(range(1000))) == expected
+
+
+def test_negative_seed_is_masked():
+    rng = GameRNG(-5)
+    assert rng.seed == -5 & MASK64
+    assert rng.stream('loot').random() == GameRNG(-5 & MASK64).stream('loot').random()
+
+    replay = Replay(-5)
+    assert Replay.from_bytes(replay.to_bytes()).seed == -5 & MASK64
+
+
+def _run(ticks, fx_draws=0, recorder=None, level_up_tick=None):
+    simulation = Simulation(800, 600)
+    simulation.recorder = recorder
+    simulation.start_run(77)
+    digests = {}
+    while simulation.tick < ticks:
+        if fx_draws:
+            simulation.rng.stream('fx').random_array(fx_draws)
+        simulation.step(1 / 60)
+        digests[simulation.tick] = state_digest(simulation) if simulation.tick % 60 == 0 else None
+        if simulation.tick == level_up_tick:
+            simulation.apply_level_up(simulation.get_level_up_choices(3)[0])
+    return simulation, digests
+
+
+def test_fx_draws_do_not_change_simulation():
+    plain, _ = _run(600)
+    with_fx, _ = _run(600, fx_draws=500)
+    assert state_digest(plain) == state_digest(with_fx)
+
+
+def test_seek_back_before_first_level_up():
+    """Keyframe'den sonra oluşan akış geri sarınca kayıttaki gibi çekmeli"""
+    recorder = ReplayRecorder(keyframe_interval=2.0)
+    simulation, digests = _run(600, recorder=recorder, level_up_tick=240)
+    assert recorder.replay.keyframes[0][0] < 240
+    
+    player = ReplayPlayer(recorder.replay)
+    player.seek(600)
+    assert state_digest(player.simulation) == state_digest(simulation)
+    for tick in (180, 300, 600):
+        player.seek(tick)
+        assert state_digest(player.simulation) == digests[tick], tick
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""RunHistory: kayıt, sorgu ve yeniden açma (geçici veritabanı)"""
+
+import sqlite3
+
+from services.run_history import RunHistory, RunRecord
+
+
+def _run(seed, duration, level, **kwargs):
+    return RunRecord(seed=seed, duration=duration, level=level, **kwargs)
+
+
+def test_record_query_and_reopen(tmp_path):
+    db_file = str(tmp_path / 'geçmiş' / 'runs.db')
+    (tmp_path / 'geçmiş').mkdir()
+    history = RunHistory(db_file, max_runs=4)
+    
+    # Veritabanı yokken okuma boş döner, dosya oluşturmaz
+    assert history.best_times() == []
+    assert history.summary() == {}
+    
+    history.record_run(_run(1, 120.0, 3, kills_by_type={'slime': 4, 'orc': 1},
+                            abilities=['multishot'], coins=7))
+    history.record_run(_run(2, 300.0, 5, coins=3))
+    history.record_run(_run(1, 200.0, 5))
+    assert history.flush()
+    
+    assert [run.duration for run in history.best_times()] == [300.0, 200.0, 120.0]
+    assert [(run.level, run.duration) for run in history.highest_levels(2)] == [(5, 300.0), (5, 200.0)]
+    first = history.runs_for_seed(1)[-1]
+    assert first.kills_by_type == {'slime': 4, 'orc': 1}
+    assert first.kills == 5 and first.abilities == ['multishot']
+    summary = history.summary()
+    assert summary['runs'] == 3 and summary['kills'] == 5 and summary['coins'] == 10
+    history.close()
+    
+    # Yeniden aç: veriler kalıcı, saklama sınırı en eskileri siler
+    reopened = RunHistory(db_file, max_runs=4)
+    assert [run.duration for run in reopened.recent_runs()] == [200.0, 300.0, 120.0]
+    reopened.record_run(_run(3, 50.0, 1))
+    reopened.record_run(_run(4, 60.0, 2))
+    assert reopened.flush()
+    assert [run.seed for run in reopened.recent_runs()] == [4, 3, 1, 2]
+    assert reopened.get_stats()['write_errors'] == 0
+    reopened.close()
+
+
+def test_readers_are_read_only(tmp_path):
+    db_file = str(tmp_path / 'runs.db')
+    history = RunHistory(db_file)
+    history.record_run(_run(9, 10.0, 1))
+    assert history.flush()
+    reader = history._reader()
+    try:
+        reader.execute("DELETE FROM runs")
+        deleted = True
+    except sqlite3.OperationalError:
+        deleted = False
+    assert not deleted
+    assert len(history.recent_runs()) == 1
+    history.close()
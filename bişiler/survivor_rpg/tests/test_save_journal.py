@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""SaveJournal: sıkıştırma yarıda kalınca yükleme"""
+
+import os
+
+from services import save_journal
+from services.save import SaveService
+
+
+def test_crash_between_snapshot_and_journal_removal(tmp_path, monkeypatch):
+    save_file = str(tmp_path / 'save.json')
+    service = SaveService(save_file)
+    service.add_meta_currency(100)
+    assert service.flush()
+    service.spend_meta_currency(60)
+    
+    # Anlık görüntü yazıldıktan sonra, günlük silinmeden önce çökme
+    remove = os.remove
+    
+    def crash(path):
+        if path == service.journal.journal_file:
+            raise RuntimeError("çökme")
+        remove(path)
+    
+    monkeypatch.setattr(save_journal.os, 'remove', crash)
+    service.save_game_data()
+    assert service.flush()
+    monkeypatch.undo()
+    service.journal.close()
+    assert os.path.exists(save_file + save_journal.JOURNAL_SUFFIX)
+    
+    reloaded = SaveService(save_file)
+    assert reloaded.get_meta_currency() == 40
+    
+    # Yeni nesilde eklenen kayıtlar yine uygulanır
+    reloaded.add_meta_currency(5)
+    assert reloaded.flush()
+    reloaded.journal.close()
+    assert SaveService(save_file).get_meta_currency() == 45
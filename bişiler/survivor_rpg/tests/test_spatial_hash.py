@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""SpatialHash.query: kaba kuvvet mesafe filtresiyle aynı sonuç"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from core.columns import ColumnStore
+from systems.spatial_hash import SpatialHash
+
+CELL = 64.0
+
+
+class Point:
+    def __init__(self, x, y, radius):
+        self.x = x
+        self.y = y
+        self.radius = radius
+    
+    def get_center(self):
+        return self.x, self.y
+
+
+def _overlaps(entity, x, y, radius):
+    return math.hypot(entity.x - x, entity.y - y) <= radius + entity.radius
+
+
+def _points(rng, count):
+    """Rastgele, hücre kenarında ve negatif konumlu varlıklar"""
+    points = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.3:
+            # Tam hücre kenarı / köşesi (negatifler dahil)
+            x = rng.randint(-6, 6) * CELL
+            y = rng.randint(-6, 6) * CELL if rng.random() < 0.5 else rng.uniform(-400, 400)
+        else:
+            x, y = rng.uniform(-400, 400), rng.uniform(-400, 400)
+        radius = rng.choice([0.0, 1.0, 8.0, rng.uniform(0, 80), CELL])
+        points.append(Point(x, y, radius))
+    return points
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_query_matches_brute_force(seed):
+    rng = random.Random(seed)
+    points = _points(rng, 400)
+    index = SpatialHash(cell_size=CELL)
+    index.build(points)
+    
+    queries = [(rng.uniform(-450, 450), rng.uniform(-450, 450), rng.uniform(0, 200))
+               for _ in range(200)]
+    # Kenar durumları: sorgu merkezi / sınırı hücre kenarında, sıfır yarıçap
+    queries += [(0.0, 0.0, CELL), (-CELL, -CELL, 0.0), (CELL * 2, -CELL * 3, CELL),
+                (-0.0, CELL - 1e-9, 1e-9), (-200.0, -200.0, 0.0)]
+    queries += [(p.x, p.y, 0.0) for p in points[:50]]
+    
+    for x, y, radius in queries:
+        candidates = index.query(x, y, radius)
+        expected = [p for p in points if _overlaps(p, x, y, radius)]
+        assert [p for p in candidates if _overlaps(p, x, y, radius)] == expected
+        # Adaylar ekleme sırasında ve tekrarsız
+        order = [points.index(p) for p in candidates]
+        assert order == sorted(set(order))
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_build_columns_matches_build(seed):
+    rng = random.Random(seed)
+    columns = ColumnStore({'x': (float, 0.0), 'y': (float, 0.0), 'radius': (float, 0.0)})
+    points = []
+    for point in _points(rng, 300):
+        slot = columns.allocate(point)
+        # Sütunlar sol alt köşeyi tutar, merkez x + radius
+        columns.x[slot] = point.x - point.radius
+        columns.y[slot] = point.y - point.radius
+        columns.radius[slot] = point.radius
+        points.append(Point(columns.x[slot] + point.radius, columns.y[slot] + point.radius,
+                            point.radius))
+    slots = np.arange(len(points))[::-1].copy()  # Liste sırası slot sırasından farklı
+    ordered = [points[slot] for slot in slots]
+
+    expected = SpatialHash(cell_size=CELL)
+    expected.build(ordered)
+    index = SpatialHash(cell_size=CELL)
+    index.build_columns(ordered, columns, slots)
+    assert index.cells == expected.cells
+    assert index.items == ordered
+
+
+def test_rebuild_drops_old_entries():
+    index = SpatialHash(cell_size=CELL)
+    index.build([Point(-CELL, -CELL, 4.0)])
+    moved = Point(300.0, 300.0, 4.0)
+    index.build([moved])
+    assert index.query(-CELL, -CELL, 10.0) == []
+    assert index.query(300.0, 300.0, 0.0) == [moved]
+    assert len(index) == 1
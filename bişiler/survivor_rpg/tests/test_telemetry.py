@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Telemetri: sütunların dosyaya yazılıp geri okunması"""
+
+import numpy as np
+
+from core.events import EventBus
+from core.telemetry import PLAYER_TARGET, TelemetryRecorder, load_telemetry
+
+
+class FakeSimulation:
+    tick = 0
+
+
+class FakeEnemy:
+    def __init__(self, enemy_type, x, y):
+        self.enemy_type = enemy_type
+        self.center = (x, y)
+    
+    def get_center(self):
+        return self.center
+
+
+class FakePlayer:
+    level = 1
+
+
+def _record(recorder, events, simulation):
+    """Birkaç tick'lik olay akışı; beklenen satırları döndür"""
+    player = FakePlayer()
+    expected_kills = []
+    for tick in range(1, 301):
+        simulation.tick = tick
+        enemy = FakeEnemy(('slime', 'orc', 'ğoblin')[tick % 3], tick * 0.5, -tick * 0.25)
+        events.emit('enemy_spawned', enemy)
+        if tick % 4 == 0:
+            events.emit('enemy_killed', enemy)
+            expected_kills.append((tick, enemy.enemy_type, enemy.center))
+        # Üç düşman aynı tick'te temas ediyor: tek hasar satırı
+        for _ in range(3):
+            events.emit('player_damaged', player, 0.5)
+        events.emit('enemy_damaged', enemy, 2.0, True)
+        if tick % 100 == 0:
+            player.level += 1
+            events.emit('player_level_up', player)
+        events.emit('loot_collected', player, 1.0, 'xp')
+    return expected_kills
+
+
+def test_columns_round_trip(tmp_path):
+    path = str(tmp_path / 'run.telemetry')
+    events = EventBus()
+    simulation = FakeSimulation()
+    recorder = TelemetryRecorder(capacity=64)   # Küçük kapasite: çok blok
+    recorder.attach(events)
+    recorder.begin(simulation, path)
+    expected_kills = _record(recorder, events, simulation)
+    recorder.close()
+    
+    columns, strings = load_telemetry(path)
+    assert len(columns['spawn']['tick']) == 300
+    assert columns['spawn']['tick'].tolist() == list(range(1, 301))
+    
+    kills = columns['kill']
+    assert [(int(t), strings[c], (float(x), float(y)))
+            for t, c, x, y in zip(kills['tick'], kills['enemy_type'], kills['x'], kills['y'])] == \
+        [(t, kind, (np.float32(x), np.float32(y))) for t, kind, (x, y) in expected_kills]
+    
+    damage = columns['damage']
+    player = damage['target'] == strings.index(PLAYER_TARGET)
+    assert np.count_nonzero(player) == 300  # Tick başına bir satır
+    assert np.allclose(damage['amount'][player], 1.5)
+    assert np.allclose(damage['amount'][~player], 2.0)
+    assert columns['level_up']['level'].tolist() == [2, 3, 4]
+    assert set(strings[code] for code in columns['pickup']['loot_type']) == {'xp'}
+
+
+def test_append_resumes_and_drops_torn_tail(tmp_path):
+    path = str(tmp_path / 'run.telemetry')
+    events = EventBus()
+    simulation = FakeSimulation()
+    recorder = TelemetryRecorder(capacity=32)
+    recorder.attach(events)
+    recorder.begin(simulation, path)
+    _record(recorder, events, simulation)
+    recorder.close()
+    
+    # Yarım kalmış blok (çökme)
+    with open(path, 'ab') as f:
+        f.write(b'E\x00\x7f\x01\x02')
+    assert len(load_telemetry(path)[0]['spawn']['tick']) == 300
+    
+    recorder.begin(simulation, path, append=True)
+    simulation.tick = 301
+    events.emit('enemy_spawned', FakeEnemy('dragon', 1.0, 2.0))
+    recorder.close()
+    columns, strings = load_telemetry(path)
+    assert columns['spawn']['tick'][-1] == 301
+    assert strings[columns['spawn']['enemy_type'][-1]] == 'dragon'
+    assert strings[columns['spawn']['enemy_type'][0]] == 'orc'
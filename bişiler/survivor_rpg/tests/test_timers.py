@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""TimerWheel: seviye sınırlarında tam tick'te çalışma (heap referansıyla)"""
+
+import heapq
+import random
+
+import pytest
+
+from core.timers import WHEEL_SIZE, TimerWheel
+
+# Her seviye sınırının iki yanı (64, 64^2, 64^3 tick)
+BOUNDARY_DELAYS = [1, 2, 63, 64, 65, 127, 128, 129, 4095, 4096, 4097, 8191, 8192,
+                   262143, 262144, 262145]
+MAX_DELAY = 300000
+
+
+def _run(start: int, seed: int):
+    """Çarkı ve heap referansını aynı işlerle çalıştır, (tick, kimlik) listelerini döndür"""
+    rng = random.Random(seed)
+    wheel = TimerWheel(resolution=1.0)
+    wheel.set_state({'next_tick': start, 'seq': 0, 'timers': []}, None)
+    reference = []   # (deadline, seq, kimlik)
+    cancelled = set()
+    pending = {}     # kimlik -> Timer
+    fired = []
+    
+    def schedule(ident, delay):
+        tick = start - 1 if not fired else fired[-1][0]
+        timer = wheel.schedule(delay, None, 'fire', ident)
+        assert timer.deadline == tick + delay
+        heapq.heappush(reference, (timer.deadline, timer.seq, ident))
+        pending[ident] = timer
+    
+    def on_fire(ident):
+        fired.append((round(wheel.now), ident))
+        del pending[ident]
+        # Çalışırken yeniden kurma ve başka bir zamanlayıcıyı iptal etme
+        if ident % 5 == 0 and len(fired) < 400:
+            schedule(ident + 100000, rng.choice(BOUNDARY_DELAYS[:11]))
+        if ident % 7 == 0 and pending:
+            victim = rng.choice(sorted(pending))
+            wheel.cancel(pending.pop(victim))
+            cancelled.add(victim)
+    
+    wheel.handlers['fire'] = on_fire
+    delays = BOUNDARY_DELAYS + [rng.randint(1, MAX_DELAY) for _ in range(200)]
+    for ident, delay in enumerate(delays):
+        schedule(ident, delay)
+    for ident in rng.sample(range(len(delays)), 20):
+        if wheel.cancel(pending[ident]):
+            del pending[ident]
+            cancelled.add(ident)
+    
+    tick = start - 1
+    while pending:
+        tick += 1000
+        wheel.advance(tick)
+    
+    expected = []
+    while reference:
+        deadline, _, ident = heapq.heappop(reference)
+        if ident not in cancelled:
+            expected.append((deadline, ident))
+    return fired, expected, wheel
+
+
+@pytest.mark.parametrize('start', [1, WHEEL_SIZE - 3, WHEEL_SIZE ** 2 - 10, WHEEL_SIZE ** 3 - 1000])
+def test_timers_fire_on_their_exact_tick(start):
+    fired, expected, wheel = _run(start, seed=start)
+    assert fired == expected
+    assert wheel.count == 0
+    assert wheel.get_stats()['owners'] == 0
+
+
+def test_cancel_owner_and_state_round_trip():
+    class Owner:
+        def __init__(self):
+            self.calls = []
+        
+        def hit(self, value):
+            self.calls.append(value)
+    
+    wheel = TimerWheel(resolution=1.0)
+    first, second = Owner(), Owner()
+    for delay in (3, 64, 4096):
+        wheel.schedule(delay, first, 'hit', delay)
+        wheel.schedule(delay, second, 'hit', delay)
+    assert wheel.cancel_owner(first) == 3
+    wheel.advance(100)
+    
+    owners = {'a': first, 'b': second}
+    refs = {id(first): 'a', id(second): 'b'}
+    state = wheel.get_state(lambda owner: refs[id(owner)])
+    restored = TimerWheel(resolution=1.0)
+    restored.set_state(state, owners.__getitem__)
+    restored.advance(5000)
+    assert first.calls == []
+    assert second.calls == [3, 64, 4096]
+    assert restored.count == 0
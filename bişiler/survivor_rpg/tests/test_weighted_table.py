@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""WeightedTable (Vose alias): frekanslar ağırlıklarla uyumlu"""
+
+import math
+import random
+from collections import Counter
+
+from core.rng import GameRNG, WeightedTable
+
+DRAWS = 100000
+WEIGHTS = {'slime': 50, 'goblin': 25, 'skeleton': 12.5, 'orc': 7.5, 'dragon': 5, 'ghost': 0}
+
+
+def _assert_frequencies(samples, weights):
+    counts = Counter(samples)
+    total = sum(weights.values())
+    for item, weight in weights.items():
+        expected = weight / total
+        tolerance = 4.0 * math.sqrt(expected * (1.0 - expected) / len(samples)) + 1e-3
+        assert abs(counts[item] / len(samples) - expected) <= tolerance, item
+
+
+def test_scalar_draws_match_weights():
+    table = WeightedTable(WEIGHTS)
+    rng = random.Random(2024)
+    samples = [table.sample(rng) for _ in range(DRAWS)]
+    _assert_frequencies(samples, WEIGHTS)
+    assert 'ghost' not in samples
+
+
+def test_bulk_draws_match_weights():
+    table = WeightedTable(WEIGHTS)
+    samples = table.sample_many(GameRNG(2024).stream('spawn'), DRAWS)
+    assert len(samples) == DRAWS
+    _assert_frequencies(samples, WEIGHTS)
+    assert 'ghost' not in samples
+
+
+def test_zero_weights_are_never_drawn():
+    table = WeightedTable({'a': 0, 'b': 3, 'c': 0.0, 'd': 1})
+    assert sorted(table.items) == ['b', 'd']
+    rng = random.Random(7)
+    samples = [table.sample(rng) for _ in range(20000)]
+    samples += table.sample_many(GameRNG(7).stream('loot'), 20000)
+    assert set(samples) == {'b', 'd'}
+    _assert_frequencies(samples, {'b': 3, 'd': 1})
+
+
+def test_single_entry_and_empty_tables():
+    table = WeightedTable({'only': 0.25})
+    rng = random.Random(1)
+    assert {table.sample(rng) for _ in range(1000)} == {'only'}
+    assert set(table.sample_many(GameRNG(1).stream('loot'), 1000)) == {'only'}
+    
+    empty = WeightedTable({'none': 0})
+    assert len(empty) == 0
+    assert empty.sample(rng) is None
+    assert empty.sample_many(GameRNG(1).stream('loot'), 5) == []
+
+
+def test_set_weights_rebuilds_table():
+    table = WeightedTable({'a': 1, 'b': 1})
+    table.set_weights({'a': 0, 'b': 1, 'c': 3})
+    rng = random.Random(3)
+    samples = [table.sample(rng) for _ in range(DRAWS)]
+    _assert_frequencies(samples, {'a': 0, 'b': 1, 'c': 3})
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/ProfilerOverlay.py - Kare profilleyici overlay'i
+"""
+
+from kivy.uix.widget import Widget
+from kivy.properties import StringProperty, NumericProperty
+
+
+class ProfilerOverlay(Widget):
+    """Aşama başına p50/p95/p99 ve sayaç tablosu"""
+    
+    report_text = StringProperty("")
+    refresh_interval = NumericProperty(0.25)  # Saniye
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._elapsed = 0.0
+    
+    def update(self, dt: float, profiler):
+        """Belirli aralıklarla tabloyu yenile (yüzdelik hesabı sıralama gerektirir)"""
+        self._elapsed += dt
+        if self._elapsed < self.refresh_interval:
+            return
+        self._elapsed = 0.0
+        self.report_text = profiler.format_report()